@@ -7,12 +7,12 @@ Created on Mon Mar  5 12:13:33 2018
 """
 #Python dependencies
 from __future__ import division
+from functools import lru_cache
 import pandas as pd
 import numpy as np
 from scipy.constants import codata
 from pylab import *
 from scipy.optimize import curve_fit
-import mpmath as mp
 from lmfit import minimize, Minimizer, Parameters, Parameter, report_fit
 #from scipy.optimize import leastsq
 pd.options.mode.chained_assignment = None
@@ -34,14 +34,21 @@ F = codata.physical_constants['Faraday constant'][0]
 Rg = codata.physical_constants['molar gas constant'][0]
 
 ### Importing PyEIS add-ons
+from .PyEIS_Grid import *
+from .PyEIS_Hyperbolic import *
+from .PyEIS_Jacobian import *
+from .PyEIS_Backend import *
 from .PyEIS_Data_extraction import *
+from .PyEIS_Cache import *
 from .PyEIS_Lin_KK import *
+from .PyEIS_Z_HIT import *
 from .PyEIS_Advanced_tools import *
+from .PyEIS_Circuit_builder import *
 
 ### Frequency generator
 ##
 #
-def freq_gen(f_start, f_stop, pts_decade=7):
+def freq_gen(f_start, f_stop, pts_decade=7, dtype=np.complex128):
     '''
     Frequency Generator with logspaced freqencies
     
@@ -50,15 +57,18 @@ def freq_gen(f_start, f_stop, pts_decade=7):
     f_start = frequency start [Hz]
     f_stop = frequency stop [Hz]
     pts_decade = Points/decade, default 7 [-]
+    dtype = complex dtype of the simulated impedance, np.complex128 (default) or np.complex64. With np.complex64 the frequencies
+    are float32 and the simulation functions, e.g. cir_RsRQ(w, ...), return complex64 impedances, see circuit_batch() for the accuracy
     
     Output
     ----------
     [0] = frequency range [Hz]
-    [1] = Angular frequency range [1/s]
+    [1] = Angular frequency range [1/s], as a freq_grid
     '''
     f_decades = np.log10(f_start) - np.log10(f_stop)
-    f_range = np.logspace(np.log10(f_start), np.log10(f_stop), num=np.around(pts_decade*f_decades), endpoint=True)
-    w_range = 2 * np.pi * f_range
+    f_range = np.logspace(np.log10(f_start), np.log10(f_stop), num=int(np.around(pts_decade*f_decades)), endpoint=True)
+    w_range = freq_grid(2 * np.pi * f_range, dtype=dtype)
+    f_range = f_range.astype(w_range.dtype)
     return f_range, w_range
 
 ### Simulation Element Functions
@@ -76,7 +86,7 @@ def elem_L(w, L):
     w = Angular frequency [1/s]
     L = Inductance [ohm * s]
     '''
-    return 1j*w*L
+    return jw(w)*L
 
 def elem_C(w,C):
     '''
@@ -87,7 +97,7 @@ def elem_C(w,C):
     w = Angular frequency [1/s]
     C = Capacitance [F]    
     '''
-    return 1/(C*(w*1j))
+    return 1/(C*jw(w))
 
 def elem_Q(w,Q,n):
     '''
@@ -99,7 +109,7 @@ def elem_Q(w,Q,n):
     Q = Constant phase element [s^n/ohm]
     n = Constant phase elelment exponent [-]
     '''
-    return 1/(Q*(w*1j)**n)
+    return 1/(Q*jw_pow(w, n))
 
 ### Simulation Curciuts Functions
 ##
@@ -115,7 +125,7 @@ def cir_RsC(w, Rs, C):
     Rs = Series resistance [Ohm]
     C = Capacitance [F]    
     '''
-    return Rs + 1/(C*(w*1j))
+    return Rs + 1/(C*jw(w))
 
 def cir_RsQ(w, Rs, Q, n):
     '''
@@ -128,7 +138,7 @@ def cir_RsQ(w, Rs, Q, n):
     Q = Constant phase element [s^n/ohm]
     n = Constant phase elelment exponent [-]
     '''
-    return Rs + 1/(Q*(w*1j)**n)
+    return Rs + 1/(Q*jw_pow(w, n))
 
 def cir_RQ(w, R='none', Q='none', n='none', fs='none'):
     '''
@@ -151,7 +161,7 @@ def cir_RQ(w, R='none', Q='none', n='none', fs='none'):
         Q = (1/(R*(2*np.pi*fs)**n))
     elif n == 'none':
         n = np.log(Q*R)/np.log(1/(2*np.pi*fs))
-    return (R/(1+R*Q*(w*1j)**n))
+    return (R/(1+R*Q*jw_pow(w, n)))
 
 def cir_RsRQ(w, Rs='none', R='none', Q='none', n='none', fs='none'):
     '''
@@ -175,7 +185,7 @@ def cir_RsRQ(w, Rs='none', R='none', Q='none', n='none', fs='none'):
         Q = (1/(R*(2*np.pi*fs)**n))
     elif n == 'none':
         n = np.log(Q*R)/np.log(1/(2*np.pi*fs))
-    return Rs + (R/(1+R*Q*(w*1j)**n))
+    return Rs + (R/(1+R*Q*jw_pow(w, n)))
 
 def cir_RC(w, C='none', R='none', fs='none'):
     '''
@@ -229,7 +239,7 @@ def cir_RsRQRQ(w, Rs, R='none', Q='none', n='none', fs='none', R2='none', Q2='no
     elif n2 == 'none':
         n2 = np.log(Q2*R2)/np.log(1/(2*np.pi*fs2))
         
-    return Rs + (R/(1+R*Q*(w*1j)**n)) + (R2/(1+R2*Q2*(w*1j)**n2))
+    return Rs + (R/(1+R*Q*jw_pow(w, n))) + (R2/(1+R2*Q2*jw_pow(w, n2)))
 
 def cir_RsRQQ(w, Rs, Q, n, R1='none', Q1='none', n1='none', fs1='none'):
     '''
@@ -343,7 +353,7 @@ def Randles_coeff(w, n_electron, A, E='none', E0='none', D_red='none', D_ox='non
         sigma = ((4*Rg*T) / ((n_electron**2) * A * (F**2) * C_ox * ((2*D_ox)**(1/2)) )) * func_cosh2
     else:
         print('define E and E0')
-    Z_Aw = sigma*(w**(-0.5))-1j*sigma*(w**(-0.5))
+    Z_Aw = sigma*np.sqrt(2)/sqrt_jw(w)
     return Z_Aw
 
 def cir_Randles(w, n_electron, D_red, D_ox, C_red, C_ox, Rs, Rct, n, E, A, Q='none', fs='none', E0=0, F=F, Rg=Rg, T=298.15):
@@ -402,9 +412,9 @@ def cir_Randles_simplified(w, Rs, R, n, sigma, Q='none', fs='none'):
     elif n == 'none':
         n = np.log(Q*R)/np.log(1/(2*np.pi*fs))
     
-    Z_Q = 1/(Q*(w*1j)**n)
+    Z_Q = 1/(Q*jw_pow(w, n))
     Z_R = R
-    Z_w = sigma*(w**(-0.5))-1j*sigma*(w**(-0.5))
+    Z_w = sigma*np.sqrt(2)/sqrt_jw(w)
     
     return Rs + 1/(1/Z_Q + 1/(Z_R+Z_w))
 
@@ -457,12 +467,6 @@ def cir_Q_RQ_Q(w, Qe, ne, Qb='none', Rb='none', fsb='none', nb='none'):
     Z_RQ = cir_RQ(w, Q=Qb, R=Rb, fs=fsb, n=nb)
     return Z_Q + Z_RQ
 
-def tanh(x):
-    '''
-    As numpy gives errors when tanh becomes very large, above 10^250, this functions is used for np.tanh
-    '''
-    return (1-np.exp(-2*x))/(1+np.exp(-2*x))
-
 def cir_RCRCZD(w, L, D_s, u1, u2, Cb='none', Rb='none', fsb='none', Ce='none', Re='none', fse='none'):
     '''
     Simulation Function: -RC_b-RC_e-Z_D
@@ -497,7 +501,7 @@ def cir_RCRCZD(w, L, D_s, u1, u2, Cb='none', Rb='none', fsb='none', Ce='none', R
     '''
     Z_RCb = cir_RC(w, C=Cb, R=Rb, fs=fsb)
     Z_RCe = cir_RC(w, C=Ce, R=Re, fs=fse)
-    alpha = ((w*1j*L**2)/D_s)**(1/2)
+    alpha = sqrt_jw(w) * ((L**2)/D_s)**(1/2)
     Z_D = Rb * (u2/u1) * (tanh(x=alpha)/alpha)
     return Z_RCb + Z_RCe + Z_D
     
@@ -527,17 +531,13 @@ def cir_RsTLsQ(w, Rs, L, Ri, Q='none', n='none'):
     Q = Interfacial capacitance of non-faradaic interface [F/cm]
     n = exponent for the interfacial capacitance [-]
     '''    
-    Phi = 1/(Q*(w*1j)**n)
+    Phi = 1/(Q*jw_pow(w, n))
     X1 = Ri # ohm/cm
     Lam = (Phi/X1)**(1/2) #np.sqrt(Phi/X1)
 
     x = L/Lam
-    x_mp = mp.matrix(x) #x in mp.math format
-    coth_mp = []
-    for i in range(len(Lam)):
-        coth_mp.append(float(mp.coth(x_mp[i]).real)+float(mp.coth(x_mp[i]).imag)*1j)  #Handles coth with x having very large or very small numbers
 
-    Z_TLsQ = Lam * X1 * coth_mp        
+    Z_TLsQ = Lam * X1 * coth(x)
 
     return Rs + Z_TLsQ
 
@@ -576,17 +576,13 @@ def cir_RsRQTLsQ(w, Rs, R1, fs1, n1, L, Ri, Q, n, Q1='none'):
     '''    
     Z_RQ = cir_RQ(w=w, R=R1, Q=Q1, n=n1, fs=fs1)
     
-    Phi = 1/(Q*(w*1j)**n)
+    Phi = 1/(Q*jw_pow(w, n))
     X1 = Ri
     Lam = (Phi/X1)**(1/2)
     
     x = L/Lam
-    x_mp = mp.matrix(x) #x in mp.math format
-    coth_mp = []
-    for i in range(len(Lam)):
-        coth_mp.append(float(mp.coth(x_mp[i]).real)+float(mp.coth(x_mp[i]).imag)*1j)
 
-    Z_TLsQ = Lam * X1 * coth_mp
+    Z_TLsQ = Lam * X1 * coth(x)
     
     return Rs + Z_RQ + Z_TLsQ
 
@@ -625,12 +621,8 @@ def cir_RsTLs(w, Rs, L, Ri, R='none', Q='none', n='none', fs='none'):
     Lam = (Phi/X1)**(1/2)    
 
     x = L/Lam
-    x_mp = mp.matrix(x) #x in mp.math format
-    coth_mp = []
-    for i in range(len(Lam)):
-        coth_mp.append(float(mp.coth(x_mp[i]).real)+float(mp.coth(x_mp[i]).imag)*1j) #Handles coth with x having very large or very small numbers
     
-    Z_TLs = Lam * X1 * coth_mp
+    Z_TLs = Lam * X1 * coth(x)
     
     return Rs + Z_TLs
 
@@ -676,31 +668,11 @@ def cir_RsRQTLs(w, Rs, L, Ri, R1, n1, fs1, R2, n2, fs2, Q1='none', Q2='none'):
     Lam = (Phi/X1)**(1/2)    
 
     x = L/Lam
-    x_mp = mp.matrix(x) #x in mp.math format
-    coth_mp = []
-    for i in range(len(Lam)):
-        coth_mp.append(float(mp.coth(x_mp[i]).real)+float(mp.coth(x_mp[i]).imag)*1j) #Handles coth with x having very large or very small numbers
     
-    Z_TLs = Lam * X1 * coth_mp
+    Z_TLs = Lam * X1 * coth(x)
     
     return Rs + Z_RQ + Z_TLs
 
-### Support function
-
-def sinh(x):
-    '''
-    As numpy gives errors when sinh becomes very large, above 10^250, this functions is used instead of np/mp.sinh()
-    '''
-    return (1 - np.exp(-2*x))/(2*np.exp(-x))
-
-def coth(x):
-    '''
-    As numpy gives errors when coth becomes very large, above 10^250, this functions is used instead of np/mp.coth()
-    '''
-    return (1 + np.exp(-2*x))/(1 - np.exp(-2*x))
-
-###
-
 def cir_RsTLQ(w, L, Rs, Q, n, Rel, Ri):
     '''
     Simulation Function: -R-TLQ- (interfacial non-reacting, i.e. blocking electrode)
@@ -739,15 +711,8 @@ def cir_RsTLQ(w, L, Rs, Q, n, Rel, Ri):
     Lam = (Phi/(X1+X2))**(1/2)    
 
     x = L/Lam
-#    x_mp = mp.matrix(x) #x in mp.math format
-#    coth_mp = []
-#    sinh_mp = []
-#    for i in range(len(Lam)):
-#        coth_mp.append(float(mp.coth(x_mp[i]).real)+float(mp.coth(x_mp[i]).imag)*1j) #Handles coth with x having very large or very small numbers
-#        sinh_mp.append(float(mp.sinh(x_mp[i]).real)+float(mp.sinh(x_mp[i]).imag)*1j)
-#    Z_TL = ((Rel*Ri)/(Rel+Ri)) * (L+((2*Lam)/np.array(sinh_mp))) + Lam * ((Rel**2 + Ri**2)/(Rel+Ri)) * np.array(coth_mp)
 
-    Z_TL = ((Rel*Ri)/(Rel+Ri)) * (L+((2*Lam)/sinh(x))) + Lam * ((Rel**2 + Ri**2)/(Rel+Ri)) * coth(x)
+    Z_TL = ((Rel*Ri)/(Rel+Ri)) * (L+(2*Lam*csch(x))) + Lam * ((Rel**2 + Ri**2)/(Rel+Ri)) * coth(x)
     
     return Z_Rs + Z_TL
 
@@ -797,15 +762,8 @@ def cir_RsRQTLQ(w, L, Rs, Q, n, Rel, Ri, R1, n1, fs1, Q1='none'):
     Lam = (Phi/(X1+X2))**(1/2)    
 
     x = L/Lam
-#    x_mp = mp.matrix(x) #x in mp.math format
-#    coth_mp = []
-#    sinh_mp = []
-#    for i in range(len(Lam)):
-#        coth_mp.append(float(mp.coth(x_mp[i]).real)+float(mp.coth(x_mp[i]).imag)*1j) #Handles coth with x having very large or very small numbers
-#        sinh_mp.append(float(mp.sinh(x_mp[i]).real)+float(mp.sinh(x_mp[i]).imag)*1j)
-#    Z_TL = ((Rel*Ri)/(Rel+Ri)) * (L+((2*Lam)/np.array(sinh_mp))) + Lam * ((Rel**2 + Ri**2)/(Rel+Ri)) * np.array(coth_mp)
 
-    Z_TL = ((Rel*Ri)/(Rel+Ri)) * (L+((2*Lam)/sinh(x))) + Lam * ((Rel**2 + Ri**2)/(Rel+Ri)) * coth(x)
+    Z_TL = ((Rel*Ri)/(Rel+Ri)) * (L+(2*Lam*csch(x))) + Lam * ((Rel**2 + Ri**2)/(Rel+Ri)) * coth(x)
     
     return Z_Rs + Z_RQ1 + Z_TL
 
@@ -849,15 +807,8 @@ def cir_RsTL(w, L, Rs, R, fs, n, Rel, Ri, Q='none'):
     Lam = (Phi/(X1+X2))**(1/2)    
 
     x = L/Lam
-#    x_mp = mp.matrix(x) #x in mp.math format
-#    coth_mp = []
-#    sinh_mp = []
-#    for i in range(len(Lam)):
-#        coth_mp.append(float(mp.coth(x_mp[i]).real)+float(mp.coth(x_mp[i]).imag)*1j) #Handles coth with x having very large or very small numbers
-#        sinh_mp.append(float(mp.sinh(x_mp[i]).real)+float(mp.sinh(x_mp[i]).imag)*1j)
-#    Z_TL = ((Rel*Ri)/(Rel+Ri)) * (L+((2*Lam)/np.array(sinh_mp))) + Lam * ((Rel**2 + Ri**2)/(Rel+Ri)) * np.array(coth_mp)
 
-    Z_TL = ((Rel*Ri)/(Rel+Ri)) * (L+((2*Lam)/sinh(x))) + Lam * ((Rel**2 + Ri**2)/(Rel+Ri)) * coth(x)
+    Z_TL = ((Rel*Ri)/(Rel+Ri)) * (L+(2*Lam*csch(x))) + Lam * ((Rel**2 + Ri**2)/(Rel+Ri)) * coth(x)
 
     return Z_Rs + Z_TL
 
@@ -909,14 +860,7 @@ def cir_RsRQTL(w, L, Rs, R1, fs1, n1, R2, fs2, n2, Rel, Ri, Q1='none', Q2='none'
     Lam = (Phi/(X1+X2))**(1/2)    
 
     x = L/Lam
-#    x_mp = mp.matrix(x) #x in mp.math format
-#    coth_mp = []
-#    sinh_mp = []
-#    for i in range(len(Lam)):
-#        coth_mp.append(float(mp.coth(x_mp[i]).real)+float(mp.coth(x_mp[i]).imag)*1j) #Handles coth with x having very large or very small numbers
-#        sinh_mp.append(float(mp.sinh(x_mp[i]).real)+float(mp.sinh(x_mp[i]).imag)*1j)
-#    Z_TL = ((Rel*Ri)/(Rel+Ri)) * (L+((2*Lam)/np.array(sinh_mp))) + Lam * ((Rel**2 + Ri**2)/(Rel+Ri)) * np.array(coth_mp)
-    Z_TL = ((Rel*Ri)/(Rel+Ri)) * (L+((2*Lam)/sinh(x))) + Lam * ((Rel**2 + Ri**2)/(Rel+Ri)) * coth(x)
+    Z_TL = ((Rel*Ri)/(Rel+Ri)) * (L+(2*Lam*csch(x))) + Lam * ((Rel**2 + Ri**2)/(Rel+Ri)) * coth(x)
     return Z_Rs + Z_RQ1 + Z_TL
 
 # Transmission lines with solid-state transport
@@ -966,13 +910,8 @@ def cir_RsTL_1Dsolid(w, L, D, radius, Rs, R, Q, n, R_w, n_w, Rel, Ri):
     #The impedance of a 1D Warburg Element
     time_const = (radius**2)/D
     
-    x = (time_const*w*1j)**n_w
-    x_mp = mp.matrix(x)
-    warburg_coth_mp = []
-    for i in range(len(w)):
-        warburg_coth_mp.append(float(mp.coth(x_mp[i]).real)+float(mp.coth(x_mp[i]).imag)*1j)
-
-    Z_w = R_w * np.array(warburg_coth_mp)/x
+    x = time_const**n_w * jw_pow(w, n_w)
+    Z_w = R_w * coth(x)/x
     
     # The Interfacial impedance is given by a Randles Equivalent circuit with the finite space warburg element in series with R2
     Z_Rct = R
@@ -982,14 +921,7 @@ def cir_RsTL_1Dsolid(w, L, D, radius, Rs, R, Q, n, R_w, n_w, Rel, Ri):
     # The Impedance of the Transmission Line
     lamb = (Z_Randles/(Rel+Ri))**(1/2)
     x = L/lamb
-#    lamb_mp = mp.matrix(x)
-#    sinh_mp = []
-#    coth_mp = []
-#    for j in range(len(lamb_mp)):
-#        sinh_mp.append(float(mp.sinh(lamb_mp[j]).real)+float((mp.sinh(lamb_mp[j]).imag))*1j)
-#        coth_mp.append(float(mp.coth(lamb_mp[j]).real)+float(mp.coth(lamb_mp[j]).imag)*1j)        
-#    Z_TL = ((Rel*Ri)/(Rel+Ri)) * (L+((2*lamb)/np.array(sinh_mp))) + lamb * ((Rel**2 + Ri**2)/(Rel+Ri)) * np.array(coth_mp)
-    Z_TL = ((Rel*Ri)/(Rel+Ri)) * (L+((2*lamb)/sinh(x))) + lamb * ((Rel**2 + Ri**2)/(Rel+Ri)) * coth(x)
+    Z_TL = ((Rel*Ri)/(Rel+Ri)) * (L+(2*lamb*csch(x))) + lamb * ((Rel**2 + Ri**2)/(Rel+Ri)) * coth(x)
     return Z_Rs + Z_TL
 
 def cir_RsRQTL_1Dsolid(w, L, D, radius, Rs, R1, fs1, n1, R2, Q2, n2, R_w, n_w, Rel, Ri, Q1='none'):
@@ -1044,13 +976,8 @@ def cir_RsRQTL_1Dsolid(w, L, D, radius, Rs, R1, fs1, n1, R2, Q2, n2, R_w, n_w, R
     #The impedance of a 1D Warburg Element
     time_const = (radius**2)/D
     
-    x = (time_const*w*1j)**n_w
-    x_mp = mp.matrix(x)
-    warburg_coth_mp = []
-    for i in range(len(w)):
-        warburg_coth_mp.append(float(mp.coth(x_mp[i]).real)+float(mp.coth(x_mp[i]).imag)*1j)
-
-    Z_w = R_w * np.array(warburg_coth_mp)/x
+    x = time_const**n_w * jw_pow(w, n_w)
+    Z_w = R_w * coth(x)/x
     
     # The Interfacial impedance is given by a Randles Equivalent circuit with the finite space warburg element in series with R2
     Z_Rct = R2
@@ -1060,19 +987,121 @@ def cir_RsRQTL_1Dsolid(w, L, D, radius, Rs, R1, fs1, n1, R2, Q2, n2, R_w, n_w, R
     # The Impedance of the Transmission Line
     lamb = (Z_Randles/(Rel+Ri))**(1/2)
     x = L/lamb
-#    lamb_mp = mp.matrix(x)
-#    sinh_mp = []
-#    coth_mp = []
-#    for j in range(len(lamb_mp)):
-#        sinh_mp.append(float(mp.sinh(lamb_mp[j]).real)+float((mp.sinh(lamb_mp[j]).imag))*1j)
-#        coth_mp.append(float(mp.coth(lamb_mp[j]).real)+float(mp.coth(lamb_mp[j]).imag)*1j)
-#        
-#    Z_TL = ((Rel*Ri)/(Rel+Ri)) * (L+((2*lamb)/np.array(sinh_mp))) + lamb * ((Rel**2 + Ri**2)/(Rel+Ri)) * np.array(coth_mp)
 
-    Z_TL = ((Rel*Ri)/(Rel+Ri)) * (L+((2*lamb)/sinh(x))) + lamb * ((Rel**2 + Ri**2)/(Rel+Ri)) * coth(x)
+    Z_TL = ((Rel*Ri)/(Rel+Ri)) * (L+(2*lamb*csch(x))) + lamb * ((Rel**2 + Ri**2)/(Rel+Ri)) * coth(x)
     
     return Z_Rs + Z_RQ + Z_TL
 
+### Parameterization plans
+##
+#
+class RQ_plan:
+    '''
+    Parameterization plan of an -RQ- or -RC- element in a fitting circuit
+    
+    An -RQ- element is given by three of R, Q, n, and fs, the fourth is derived from the others as in cir_RQ(). Which parameter is
+    derived is resolved once from the parameter names when the plan is made, calling the plan with the parameters then returns the
+    element values without searching the parameter names on every iteration of the fit. If all four are given, fs is not used.
+    
+    Inputs
+    ----------
+    keys = names of the fitting parameters, e.g. params.keys() or params
+    R = name of the resistance [Ohm]
+    Q = name of the constant phase element [s^n/ohm] or of the capacitance [F] in -RC- elements
+    n = name of the constant phase exponent [-], use n=None for -RC- elements where n = 1
+    fs = name of the summit frequency [Hz]
+    
+    Returns
+    ----------
+    plan(params) returns (R, Q, n) for -RQ- elements and (R, C) for -RC- elements
+    '''
+    def __init__(self, keys, R='R', Q='Q', n='n', fs='fs'):
+        self.R = R
+        self.Q = Q
+        self.n = n
+        self.fs = fs
+        keys = list(keys)
+        self.derived = fs
+        for name in (R, Q, n, fs):
+            if name is not None and name not in keys:
+                self.derived = name
+                break
+        if self.derived == R:
+            self._values = self._derive_R
+        elif self.derived == Q:
+            self._values = self._derive_Q
+        elif self.derived == n:
+            self._values = self._derive_n
+        else:
+            self._values = self._given
+
+    def __call__(self, params):
+        R, Q, n = self._values(params)
+        if self.n is None:
+            return R, Q
+        return R, Q, n
+
+    def __repr__(self):
+        return 'RQ_plan('+', '.join(str(name) for name in (self.R, self.Q, self.n, self.fs))+', derived='+str(self.derived)+')'
+
+    def _get_n(self, params):
+        if self.n is None:
+            return 1
+        return params[self.n]
+
+    def _derive_R(self, params):
+        Q = params[self.Q]
+        n = self._get_n(params)
+        fs = params[self.fs]
+        return (1/(Q*(2*np.pi*fs)**n)), Q, n
+
+    def _derive_Q(self, params):
+        R = params[self.R]
+        n = self._get_n(params)
+        fs = params[self.fs]
+        return R, (1/(R*(2*np.pi*fs)**n)), n
+
+    def _derive_n(self, params):
+        R = params[self.R]
+        Q = params[self.Q]
+        fs = params[self.fs]
+        return R, Q, np.log(Q*R)/np.log(1/(2*np.pi*fs))
+
+    def _given(self, params):
+        return params[self.R], params[self.Q], self._get_n(params)
+
+circuit_plan_elements = {
+    'RC': (('R', 'C', None, 'fs'),),
+    'RQ': (('R', 'Q', 'n', 'fs'),),
+    'R-RQ': (('R', 'Q', 'n', 'fs'),),
+    'R-RQ-RQ': (('R', 'Q', 'n', 'fs'), ('R2', 'Q2', 'n2', 'fs2')),
+    'R-(Q(RW))': (('R', 'Q', 'n', 'fs'),),
+    'R-RQ-Q': (('R1', 'Q1', 'n1', 'fs1'),),
+    'R-RQ-C': (('R1', 'Q1', 'n1', 'fs1'),),
+    'C-RC-C': (('Rb', 'Cb', None, 'fsb'),),
+    'Q-RQ-Q': (('Rb', 'Qb', 'nb', 'fsb'),),
+    'RC-RC-ZD': (('Re', 'Ce', None, 'fse'), ('Rb', 'Cb', None, 'fsb')),
+    'R-RQ-TLsQ': (('R1', 'Q1', 'n1', 'fs1'),),
+    'R-TLs': (('R', 'Q', 'n', 'fs'),),
+    'R-RQ-TLs': (('R1', 'Q1', 'n1', 'fs1'), ('R2', 'Q2', 'n2', 'fs2')),
+    'R-RQ-TLQ': (('R1', 'Q1', 'n1', 'fs1'),),
+    'R-TL': (('R', 'Q', 'n', 'fs'),),
+    'R-RQ-TL': (('R1', 'Q1', 'n1', 'fs1'), ('R2', 'Q2', 'n2', 'fs2')),
+    'R-RQ-TL1Dsolid': (('R1', 'Q1', 'n1', 'fs1'),),
+    }
+
+def circuit_plan(circuit, keys):
+    '''
+    Returns the parameterization plan of a circuit, a tuple with one RQ_plan per -RQ-/-RC- element in the order of circuit_plan_elements
+
+    Inputs
+    ----------
+    circuit = circuit string, e.g. 'R-RQ-RQ'
+    keys = names of the fitting parameters, e.g. params.keys() or params
+    '''
+    keys = list(keys)
+    return tuple(RQ_plan(keys, *names) for names in circuit_plan_elements[circuit])
+
 ### Fitting Circuit Functions
 ##
 #
@@ -1082,7 +1111,7 @@ def elem_C_fit(params, w):
     Fit Function: -C-
     '''
     C = params['C']
-    return 1/(C*(w*1j))
+    return 1/(C*jw(w))
 
 def elem_Q_fit(params, w):
     '''
@@ -1092,7 +1121,7 @@ def elem_Q_fit(params, w):
     '''
     Q = params['Q']
     n = params['n']
-    return 1/(Q*(w*1j)**n)
+    return 1/(Q*jw_pow(w, n))
 
 def cir_RsC_fit(params, w):
     '''
@@ -1100,7 +1129,7 @@ def cir_RsC_fit(params, w):
     '''
     Rs = params['Rs']
     C = params['C']
-    return Rs + 1/(C*(w*1j))
+    return Rs + 1/(C*jw(w))
 
 def cir_RsQ_fit(params, w):
     '''
@@ -1109,33 +1138,20 @@ def cir_RsQ_fit(params, w):
     Rs = params['Rs']
     Q = params['Q']
     n = params['n']
-    return Rs + 1/(Q*(w*1j)**n)
+    return Rs + 1/(Q*jw_pow(w, n))
 
-def cir_RC_fit(params, w):
+def cir_RC_fit(params, w, plan=None):
     '''
     Fit Function: -RC-
     Returns the impedance of an RC circuit, using RQ definations where n=1
     '''
-    if str(params.keys())[10:].find("R") == -1: #if R == 'none':
-        Q = params['C']
-        fs = params['fs']
-        R = (1/(Q*(2*np.pi*fs)**n))
-    if str(params.keys())[10:].find("C") == -1: #elif Q == 'none':
-        R = params['R']
-        fs = params['fs']
-        Q = (1/(R*(2*np.pi*fs)**n))
-    if str(params.keys())[10:].find("n") == -1: #elif n == 'none':
-        R = params['R']
-        Q = params['C']
-        fs = params['fs']
-        n = np.log(Q*R)/np.log(1/(2*np.pi*fs))
-    if str(params.keys())[10:].find("fs") == -1: #elif fs == 'none':
-        R = params['R']
-        Q = params['C']
-    return cir_RQ(w, R=R, Q=C, n=1, fs=fs)
+    if plan is None:
+        plan = circuit_plan('RC', params)
+    R, C = plan[0](params)
+    return R/(1+R*C*jw(w))
 
 
-def cir_RQ_fit(params, w):
+def cir_RQ_fit(params, w, plan=None):
     '''
     Fit Function: -RQ-
     Return the impedance of an RQ circuit:
@@ -1143,112 +1159,45 @@ def cir_RQ_fit(params, w):
     
     See Explanation of equations under cir_RQ()
     
-    The params.keys()[10:] finds the names of the user defined parameters that should be interated over if X == -1, if the paramter is not given, it becomes equal to 'none'
+    The parameter that is not given by the user (R, Q, n or fs) is derived from the others, see RQ_plan()
     
     Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
     '''
-    if str(params.keys())[10:].find("R") == -1: #if R == 'none':
-        Q = params['Q']
-        n = params['n']
-        fs = params['fs']
-        R = (1/(Q*(2*np.pi*fs)**n))
-    if str(params.keys())[10:].find("Q") == -1: #elif Q == 'none':
-        R = params['R']
-        n = params['n']
-        fs = params['fs']
-        Q = (1/(R*(2*np.pi*fs)**n))
-    if str(params.keys())[10:].find("n") == -1: #elif n == 'none':
-        R = params['R']
-        Q = params['Q']
-        fs = params['fs']
-        n = np.log(Q*R)/np.log(1/(2*np.pi*fs))
-    if str(params.keys())[10:].find("fs") == -1: #elif fs == 'none':
-        R = params['R']
-        n = params['n']
-        Q = params['Q']
-    return R/(1+R*Q*(w*1j)**n)
+    if plan is None:
+        plan = circuit_plan('RQ', params)
+    R, Q, n = plan[0](params)
+    return R/(1+R*Q*jw_pow(w, n))
 
-def cir_RsRQ_fit(params, w):
+def cir_RsRQ_fit(params, w, plan=None):
     '''
     Fit Function: -Rs-RQ-
     Return the impedance of an Rs-RQ circuit. See details for RQ under cir_RsRQ_fit()
     
     Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
     '''
-    if str(params.keys())[10:].find("R") == -1: #if R == 'none':
-        Q = params['Q']
-        n = params['n']
-        fs = params['fs']
-        R = (1/(Q*(2*np.pi*fs)**n))
-    if str(params.keys())[10:].find("Q") == -1: #elif Q == 'none':
-        R = params['R']
-        n = params['n']
-        fs = params['fs']
-        Q = (1/(R*(2*np.pi*fs)**n))
-    if str(params.keys())[10:].find("n") == -1: #elif n == 'none':
-        R = params['R']
-        Q = params['Q']
-        fs = params['fs']
-        n = np.log(Q*R)/np.log(1/(2*np.pi*fs))
-    if str(params.keys())[10:].find("fs") == -1: #elif fs == 'none':
-        R = params['R']
-        Q = params['Q']
-        n = params['n']
-        
+    if plan is None:
+        plan = circuit_plan('R-RQ', params)
+    R, Q, n = plan[0](params)
     Rs = params['Rs']
-    return Rs + (R/(1+R*Q*(w*1j)**n))
+    return Rs + (R/(1+R*Q*jw_pow(w, n)))
 
-def cir_RsRQRQ_fit(params, w):
+def cir_RsRQRQ_fit(params, w, plan=None):
     '''
     Fit Function: -Rs-RQ-RQ-
     Return the impedance of an Rs-RQ circuit. See details under cir_RsRQRQ()
     
     Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
     '''
-    if str(params.keys())[10:].find("'R'") == -1: #if R == 'none':
-        Q = params['Q']
-        n = params['n']
-        fs = params['fs']
-        R = (1/(Q*(2*np.pi*fs)**n))
-    if str(params.keys())[10:].find("'Q'") == -1: #elif Q == 'none':
-        R = params['R']
-        n = params['n']
-        fs = params['fs']
-        Q = (1/(R*(2*np.pi*fs)**n))
-    if str(params.keys())[10:].find("'n'") == -1: #elif n == 'none':
-        R = params['R']
-        Q = params['Q']
-        fs = params['fs']
-        n = np.log(Q*R)/np.log(1/(2*np.pi*fs))
-    if str(params.keys())[10:].find("'fs'") == -1: #elif fs == 'none':
-        R = params['R']
-        Q = params['Q']
-        n = params['n']
-
-    if str(params.keys())[10:].find("'R2'") == -1: #if R == 'none':
-        Q2 = params['Q2']
-        n2 = params['n2']
-        fs2 = params['fs2']
-        R2 = (1/(Q2*(2*np.pi*fs2)**n2))
-    if str(params.keys())[10:].find("'Q2'") == -1: #elif Q == 'none':
-        R2 = params['R2']
-        n2 = params['n2']
-        fs2 = params['fs2']
-        Q2 = (1/(R2*(2*np.pi*fs2)**n2))
-    if str(params.keys())[10:].find("'n2'") == -1: #elif n == 'none':
-        R2 = params['R2']
-        Q2 = params['Q2']
-        fs2 = params['fs2']
-        n2 = np.log(Q2*R2)/np.log(1/(2*np.pi*fs2))
-    if str(params.keys())[10:].find("'fs2'") == -1: #elif fs == 'none':
-        R2 = params['R2']
-        Q2 = params['Q2']
-        n2 = params['n2']
+    if plan is None:
+        plan = circuit_plan('R-RQ-RQ', params)
+    R, Q, n = plan[0](params)
+
+    R2, Q2, n2 = plan[1](params)
 
     Rs = params['Rs']
-    return Rs + (R/(1+R*Q*(w*1j)**n)) + (R2/(1+R2*Q2*(w*1j)**n2))
+    return Rs + (R/(1+R*Q*jw_pow(w, n))) + (R2/(1+R2*Q2*jw_pow(w, n2)))
 
-def cir_Randles_simplified_Fit(params, w):
+def cir_Randles_simplified_Fit(params, w, plan=None):
     '''
     Fit Function: Randles simplified -Rs-(Q-(RW)-)-
     Return the impedance of a Randles circuit. See more under cir_Randles_simplified()
@@ -1257,99 +1206,51 @@ def cir_Randles_simplified_Fit(params, w):
     
     Kristian B. Knudsen (kknu@berkeley.edu || kristianbknudsen@gmail.com)
     '''
-    if str(params.keys())[10:].find("'R'") == -1: #if R == 'none':
-        Q = params['Q']
-        n = params['n']
-        fs = params['fs']
-        R = (1/(Q*(2*np.pi*fs)**n))
-    if str(params.keys())[10:].find("'Q'") == -1: #elif Q == 'none':
-        R = params['R']
-        n = params['n']
-        fs = params['fs']
-        Q = (1/(R*(2*np.pi*fs)**n))
-    if str(params.keys())[10:].find("'n'") == -1: #elif n == 'none':
-        R = params['R']
-        Q = params['Q']
-        fs = params['fs']
-        n = np.log(Q*R)/np.log(1/(2*np.pi*fs))
-    if str(params.keys())[10:].find("'fs'") == -1: #elif fs == 'none':
-        R = params['R']
-        Q = params['Q']
-        n = params['n']
+    if plan is None:
+        plan = circuit_plan('R-(Q(RW))', params)
+    R, Q, n = plan[0](params)
     
     Rs = params['Rs']
     sigma = params['sigma']
     
-    Z_Q = 1/(Q*(w*1j)**n)
+    Z_Q = 1/(Q*jw_pow(w, n))
     Z_R = R
-    Z_w = sigma*(w**(-0.5))-1j*sigma*(w**(-0.5))
+    Z_w = sigma*np.sqrt(2)/sqrt_jw(w)
     
     return Rs + 1/(1/Z_Q + 1/(Z_R+Z_w))
 
-def cir_RsRQQ_fit(params, w):
+def cir_RsRQQ_fit(params, w, plan=None):
     '''
     Fit Function: -Rs-RQ-Q-
     
     See cir_RsRQQ() for details
     '''
+    if plan is None:
+        plan = circuit_plan('R-RQ-Q', params)
     Rs = params['Rs']
     Q = params['Q']
     n = params['n']
-    Z_Q = 1/(Q*(w*1j)**n)
-
-    if str(params.keys())[10:].find("R1") == -1: #if R == 'none':
-        Q1 = params['Q1']
-        n1 = params['n1']
-        fs1 = params['fs1']
-        R1 = (1/(Q1*(2*np.pi*fs1)**n1))
-    if str(params.keys())[10:].find("Q1") == -1: #elif Q == 'none':
-        R1 = params['R1']
-        n1 = params['n1']
-        fs1 = params['fs1']
-        Q1 = (1/(R1*(2*np.pi*fs1)**n1))
-    if str(params.keys())[10:].find("n1") == -1: #elif n == 'none':
-        R1 = params['R1']
-        Q1 = params['Q1']
-        fs1 = params['fs1']
-        n1 = np.log(Q1*R1)/np.log(1/(2*np.pi*fs1))
-    if str(params.keys())[10:].find("fs1") == -1: #elif fs == 'none':
-        R1 = params['R1']
-        n1 = params['n1']
-        Q1 = params['Q1']
-    Z_RQ = (R1/(1+R1*Q1*(w*1j)**n1))
+    Z_Q = 1/(Q*jw_pow(w, n))
+
+    R1, Q1, n1 = plan[0](params)
+    Z_RQ = (R1/(1+R1*Q1*jw_pow(w, n1)))
     
     return Rs + Z_RQ + Z_Q
 
-def cir_RsRQC_fit(params, w):
+def cir_RsRQC_fit(params, w, plan=None):
     '''
     Fit Function: -Rs-RQ-C-
     
     See cir_RsRQC() for details
     '''
+    if plan is None:
+        plan = circuit_plan('R-RQ-C', params)
     Rs = params['Rs']
     C = params['C']
-    Z_C = 1/(C*(w*1j))
-
-    if str(params.keys())[10:].find("R1") == -1: #if R == 'none':
-        Q1 = params['Q1']
-        n1 = params['n1']
-        fs1 = params['fs1']
-        R1 = (1/(Q1*(2*np.pi*fs1)**n1))
-    if str(params.keys())[10:].find("Q1") == -1: #elif Q == 'none':
-        R1 = params['R1']
-        n1 = params['n1']
-        fs1 = params['fs1']
-        Q1 = (1/(R1*(2*np.pi*fs1)**n1))
-    if str(params.keys())[10:].find("n1") == -1: #elif n == 'none':
-        R1 = params['R1']
-        Q1 = params['Q1']
-        fs1 = params['fs1']
-        n1 = np.log(Q1*R1)/np.log(1/(2*np.pi*fs1))
-    if str(params.keys())[10:].find("fs1") == -1: #elif fs == 'none':
-        R1 = params['R1']
-        n1 = params['n1']
-        Q1 = params['Q1']
-    Z_RQ = (R1/(1+R1*Q1*(w*1j)**n1))
+    Z_C = 1/(C*jw(w))
+
+    R1, Q1, n1 = plan[0](params)
+    Z_RQ = (R1/(1+R1*Q1*jw_pow(w, n1)))
     
     return Rs + Z_RQ + Z_C
 
@@ -1363,7 +1264,7 @@ def cir_RsRCC_fit(params, w):
     R1 = params['R1']
     C1 = params['C1']
     C = params['C']
-    return Rs + cir_RC(w, C=C1, R=R1, fs='none') + elem_C(w, C=C)
+    return Rs + (R1/(1+R1*C1*jw(w))) + elem_C(w, C=C)
 
 def cir_RsRCQ_fit(params, w):
     '''
@@ -1376,11 +1277,11 @@ def cir_RsRCQ_fit(params, w):
     C1 = params['C1']
     Q = params['Q']
     n = params['n']
-    return Rs + cir_RC(w, C=C1, R=R1, fs='none') + elem_Q(w,Q,n)
+    return Rs + (R1/(1+R1*C1*jw(w))) + elem_Q(w,Q,n)
 
 # Polymer electrolytes
     
-def cir_C_RC_C_fit(params, w):
+def cir_C_RC_C_fit(params, w, plan=None):
     '''
     Fit Function: -C-(RC)-C-
     
@@ -1388,28 +1289,20 @@ def cir_C_RC_C_fit(params, w):
     
     Kristian B. Knudsen (kknu@berkeley.edu || kristianbknudsen@gmail.com)
     '''
+    if plan is None:
+        plan = circuit_plan('C-RC-C', params)
     # Interfacial impedance
     Ce = params['Ce']
-    Z_C = 1/(Ce*(w*1j))
+    Z_C = 1/(Ce*jw(w))
     
     # Bulk impendance
-    if str(params.keys())[10:].find("Rb") == -1: #if R == 'none':
-        Cb = params['Cb']
-        fsb = params['fsb']
-        Rb = (1/(Cb*(2*np.pi*fsb)))
-    if str(params.keys())[10:].find("Cb") == -1: #elif Q == 'none':
-        Rb = params['Rb']
-        fsb = params['fsb']
-        Cb = (1/(Rb*(2*np.pi*fsb)))
-    if str(params.keys())[10:].find("fsb") == -1: #elif fs == 'none':
-        Rb = params['Rb']
-        Cb = params['Cb']
-    Z_RC = (Rb/(1+Rb*Cb*(w*1j)))
+    Rb, Cb = plan[0](params)
+    Z_RC = (Rb/(1+Rb*Cb*jw(w)))
     
 
     return Z_C + Z_RC
 
-def cir_Q_RQ_Q_Fit(params, w):
+def cir_Q_RQ_Q_Fit(params, w, plan=None):
     '''
     Fit Function: -Q-(RQ)-Q-
     
@@ -1417,36 +1310,20 @@ def cir_Q_RQ_Q_Fit(params, w):
     
     Kristian B. Knudsen (kknu@berkeley.edu || kristianbknudsen@gmail.com)
     '''
+    if plan is None:
+        plan = circuit_plan('Q-RQ-Q', params)
     # Interfacial impedance
     Qe = params['Qe']
     ne = params['ne']
-    Z_Q = 1/(Qe*(w*1j)**ne)
+    Z_Q = 1/(Qe*jw_pow(w, ne))
     
     # Bulk impedance
-    if str(params.keys())[10:].find("Rb") == -1: #if R == 'none':
-        Qb = params['Qb']
-        nb = params['nb']
-        fsb = params['fsb']
-        Rb = (1/(Qb*(2*np.pi*fsb)**nb))
-    if str(params.keys())[10:].find("Qb") == -1: #elif Q == 'none':
-        Rb = params['Rb']
-        nb = params['nb']
-        fsb = params['fsb']
-        Qb = (1/(Rb*(2*np.pi*fsb)**nb))
-    if str(params.keys())[10:].find("nb") == -1: #elif n == 'none':
-        Rb = params['Rb']
-        Qb = params['Qb']
-        fsb = params['fsb']
-        nb = np.log(Qb*Rb)/np.log(1/(2*np.pi*fsb))
-    if str(params.keys())[10:].find("fsb") == -1: #elif fs == 'none':
-        Rb = params['Rb']
-        nb = params['nb']
-        Qb = params['Qb']
-    Z_RQ =  Rb/(1+Rb*Qb*(w*1j)**nb)
+    Rb, Qb, nb = plan[0](params)
+    Z_RQ =  Rb/(1+Rb*Qb*jw_pow(w, nb))
 
     return Z_Q + Z_RQ
 
-def cir_RCRCZD_fit(params, w):
+def cir_RCRCZD_fit(params, w, plan=None):
     '''
     Fit Function: -RC_b-RC_e-Z_D
     
@@ -1454,33 +1331,15 @@ def cir_RCRCZD_fit(params, w):
 
     Kristian B. Knudsen (kknu@berkeley.edu || kristianbknudsen@gmail.com)
     '''
+    if plan is None:
+        plan = circuit_plan('RC-RC-ZD', params)
     # Interfacial impendace
-    if str(params.keys())[10:].find("Re") == -1: #if R == 'none':
-        Ce = params['Ce']
-        fse = params['fse']
-        Re = (1/(Ce*(2*np.pi*fse)))
-    if str(params.keys())[10:].find("Ce") == -1: #elif Q == 'none':
-        Re = params['Rb']
-        fse = params['fsb']
-        Ce = (1/(Re*(2*np.pi*fse)))
-    if str(params.keys())[10:].find("fse") == -1: #elif fs == 'none':
-        Re = params['Re']
-        Ce = params['Ce']
-    Z_RCe = (Re/(1+Re*Ce*(w*1j)))
+    Re, Ce = plan[0](params)
+    Z_RCe = (Re/(1+Re*Ce*jw(w)))
 
     # Bulk impendance
-    if str(params.keys())[10:].find("Rb") == -1: #if R == 'none':
-        Cb = params['Cb']
-        fsb = params['fsb']
-        Rb = (1/(Cb*(2*np.pi*fsb)))
-    if str(params.keys())[10:].find("Cb") == -1: #elif Q == 'none':
-        Rb = params['Rb']
-        fsb = params['fsb']
-        Cb = (1/(Rb*(2*np.pi*fsb)))
-    if str(params.keys())[10:].find("fsb") == -1: #elif fs == 'none':
-        Rb = params['Rb']
-        Cb = params['Cb']
-    Z_RCb = (Rb/(1+Rb*Cb*(w*1j)))
+    Rb, Cb = plan[1](params)
+    Z_RCb = (Rb/(1+Rb*Cb*jw(w)))
     
     # Mass transport impendance
     L = params['L']
@@ -1488,7 +1347,7 @@ def cir_RCRCZD_fit(params, w):
     u1 = params['u1']
     u2 = params['u2']
     
-    alpha = ((w*1j*L**2)/D_s)**(1/2)
+    alpha = sqrt_jw(w) * ((L**2)/D_s)**(1/2)
     Z_D = Rb * (u2/u1) * (tanh(alpha)/alpha)
     return Z_RCb + Z_RCe + Z_D
 
@@ -1508,22 +1367,16 @@ def cir_RsTLsQ_fit(params, w):
     Q = params['Q']
     n = params['n']    
     
-    Phi = 1/(Q*(w*1j)**n)
+    Phi = 1/(Q*jw_pow(w, n))
     X1 = Ri # ohm/cm
     Lam = (Phi/X1)**(1/2) #np.sqrt(Phi/X1)
 
     x = L/Lam
-#    x_mp = mp.matrix(x) #x in mp.math format
-#    coth_mp = []
-#    for i in range(len(Lam)):
-#        coth_mp.append(float(mp.coth(x_mp[i]).real)+float(mp.coth(x_mp[i]).imag)*1j)  #Handles coth with x having very large or very small numbers
-#    
-#    Z_TLsQ = Lam * X1 * coth_mp    
     Z_TLsQ = Lam * X1 * coth(x)
 
     return Rs + Z_TLsQ
 
-def cir_RsRQTLsQ_Fit(params, w):
+def cir_RsRQTLsQ_Fit(params, w, plan=None):
     '''
     Fit Function: -Rs-RQ-TLsQ-
     TLs = Simplified Transmission Line, with a non-faradaic interfacial impedance (Q)
@@ -1531,49 +1384,29 @@ def cir_RsRQTLsQ_Fit(params, w):
     
     Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
     '''
+    if plan is None:
+        plan = circuit_plan('R-RQ-TLsQ', params)
     Rs = params['Rs']
     L = params['L']
     Ri = params['Ri']
     Q = params['Q']
     n = params['n']
 
-    if str(params.keys())[10:].find("R1") == -1: #if R == 'none':
-        Q1 = params['Q1']
-        n1 = params['n1']
-        fs1 = params['fs1']
-        R1 = (1/(Q1*(2*np.pi*fs1)**n1))
-    if str(params.keys())[10:].find("Q1") == -1: #elif Q == 'none':
-        R1 = params['R1']
-        n1 = params['n1']
-        fs1 = params['fs1']
-        Q1 = (1/(R1*(2*np.pi*fs1)**n1))
-    if str(params.keys())[10:].find("n1") == -1: #elif n == 'none':
-        R1 = params['R1']
-        Q1 = params['Q1']
-        fs1 = params['fs1']
-        n1 = np.log(Q1*R1)/np.log(1/(2*np.pi*fs1))
-    if str(params.keys())[10:].find("fs1") == -1: #elif fs == 'none':
-        R1 = params['R1']
-        n1 = params['n1']
-        Q1 = params['Q1']
-    Z_RQ = (R1/(1+R1*Q1*(w*1j)**n1))
-    
-
-    Phi = 1/(Q*(w*1j)**n)
+    R1, Q1, n1 = plan[0](params)
+    Z_RQ = (R1/(1+R1*Q1*jw_pow(w, n1)))
+    
+
+    Phi = 1/(Q*jw_pow(w, n))
     X1 = Ri
     Lam = (Phi/X1)**(1/2)
 
     x = L/Lam
-    x_mp = mp.matrix(x) #x in mp.math format
-    coth_mp = []
-    for i in range(len(Lam)):
-        coth_mp.append(float(mp.coth(x_mp[i]).real)+float(mp.coth(x_mp[i]).imag)*1j) #Handles coth with x having very large or very small numbers
 
-    Z_TLsQ = Lam * X1 * coth_mp
+    Z_TLsQ = Lam * X1 * coth(x)
     
     return Rs + Z_RQ + Z_TLsQ
 
-def cir_RsTLs_Fit(params, w):
+def cir_RsTLs_Fit(params, w, plan=None):
     '''
     Fit Function: -Rs-RQ-TLs-
     TLs = Simplified Transmission Line, with a faradaic interfacial impedance (RQ)
@@ -1581,44 +1414,24 @@ def cir_RsTLs_Fit(params, w):
     
     Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
     '''
+    if plan is None:
+        plan = circuit_plan('R-TLs', params)
     Rs = params['Rs']
     L = params['L']
     Ri = params['Ri']
     
-    if str(params.keys())[10:].find("R") == -1: #if R == 'none':
-        Q = params['Q']
-        n = params['n']
-        fs = params['fs']
-        R = (1/(Q*(2*np.pi*fs)**n))
-    if str(params.keys())[10:].find("Q") == -1: #elif Q == 'none':
-        R = params['R']
-        n = params['n']
-        fs = params['fs']
-        Q = (1/(R*(2*np.pi*fs)**n))
-    if str(params.keys())[10:].find("n") == -1: #elif n == 'none':
-        R = params['R']
-        Q = params['Q']
-        fs = params['fs']
-        n = np.log(Q*R)/np.log(1/(2*np.pi*fs))
-    if str(params.keys())[10:].find("fs") == -1: #elif fs == 'none':
-        R = params['R']
-        n = params['n']
-        Q = params['Q']
-    Phi = R/(1+R*Q*(w*1j)**n)
+    R, Q, n = plan[0](params)
+    Phi = R/(1+R*Q*jw_pow(w, n))
 
     X1 = Ri
     Lam = (Phi/X1)**(1/2)    
     x = L/Lam
-    x_mp = mp.matrix(x) #x in mp.math format
-    coth_mp = []
-    for i in range(len(Lam)):
-        coth_mp.append(float(mp.coth(x_mp[i]).real)+float(mp.coth(x_mp[i]).imag)*1j) #Handles coth with x having very large or very small numbers
 
-    Z_TLs = Lam * X1 * coth_mp
+    Z_TLs = Lam * X1 * coth(x)
     
     return Rs + Z_TLs
 
-def cir_RsRQTLs_Fit(params, w):
+def cir_RsRQTLs_Fit(params, w, plan=None):
     '''
     Fit Function: -Rs-RQ-TLs-
     TLs = Simplified Transmission Line with a faradaic interfacial impedance (RQ)
@@ -1626,61 +1439,23 @@ def cir_RsRQTLs_Fit(params, w):
     
     Kristian B. Knudsen (kknu@berkeley.edu || kristianbknudsen@gmail.com)
     '''
+    if plan is None:
+        plan = circuit_plan('R-RQ-TLs', params)
     Rs = params['Rs']
     L = params['L']
     Ri = params['Ri']
 
-    if str(params.keys())[10:].find("R1") == -1: #if R == 'none':
-        Q1 = params['Q1']
-        n1 = params['n1']
-        fs1 = params['fs1']
-        R1 = (1/(Q1*(2*np.pi*fs1)**n1))
-    if str(params.keys())[10:].find("Q1") == -1: #elif Q == 'none':
-        R1 = params['R1']
-        n1 = params['n1']
-        fs1 = params['fs1']
-        Q1 = (1/(R1*(2*np.pi*fs1)**n1))
-    if str(params.keys())[10:].find("n1") == -1: #elif n == 'none':
-        R1 = params['R1']
-        Q1 = params['Q1']
-        fs1 = params['fs1']
-        n1 = np.log(Q1*R1)/np.log(1/(2*np.pi*fs1))
-    if str(params.keys())[10:].find("fs1") == -1: #elif fs == 'none':
-        R1 = params['R1']
-        n1 = params['n1']
-        Q1 = params['Q1']
-    Z_RQ = (R1/(1+R1*Q1*(w*1j)**n1))
-
-    if str(params.keys())[10:].find("R2") == -1: #if R == 'none':
-        Q2 = params['Q2']
-        n2 = params['n2']
-        fs2 = params['fs2']
-        R2 = (1/(Q2*(2*np.pi*fs2)**n2))
-    if str(params.keys())[10:].find("Q2") == -1: #elif Q == 'none':
-        R2 = params['R2']
-        n2 = params['n2']
-        fs2 = params['fs2']
-        Q2 = (1/(R2*(2*np.pi*fs2)**n1))
-    if str(params.keys())[10:].find("n2") == -1: #elif n == 'none':
-        R2 = params['R2']
-        Q2 = params['Q2']
-        fs2 = params['fs2']
-        n2 = np.log(Q2*R2)/np.log(1/(2*np.pi*fs2))
-    if str(params.keys())[10:].find("fs2") == -1: #elif fs == 'none':
-        R2 = params['R2']
-        n2 = params['n2']
-        Q2 = params['Q2']    
-    Phi = (R2/(1+R2*Q2*(w*1j)**n2))
+    R1, Q1, n1 = plan[0](params)
+    Z_RQ = (R1/(1+R1*Q1*jw_pow(w, n1)))
+
+    R2, Q2, n2 = plan[1](params)
+    Phi = (R2/(1+R2*Q2*jw_pow(w, n2)))
     X1 = Ri
     Lam = (Phi/X1)**(1/2)    
 
     x = L/Lam
-    x_mp = mp.matrix(x) #x in mp.math format
-    coth_mp = []
-    for i in range(len(Lam)):
-        coth_mp.append(float(mp.coth(x_mp[i]).real)+float(mp.coth(x_mp[i]).imag)*1j) #Handles coth with x having very large or very small numbers
     
-    Z_TLs = Lam * X1 * coth_mp
+    Z_TLs = Lam * X1 * coth(x)
     
     return Rs + Z_RQ + Z_TLs
 
@@ -1708,25 +1483,20 @@ def cir_RsTLQ_fit(params, w):
     Lam = (Phi/(X1+X2))**(1/2)    
 
     x = L/Lam
-#    x_mp = mp.matrix(x) #x in mp.math format
-#    coth_mp = []
-#    sinh_mp = []
-#    for i in range(len(Lam)):
-#        coth_mp.append(float(mp.coth(x_mp[i]).real)+float(mp.coth(x_mp[i]).imag)*1j) #Handles coth with x having very large or very small numbers
-#        sinh_mp.append(float(mp.sinh(x_mp[i]).real)+float(mp.sinh(x_mp[i]).imag)*1j)
-#    Z_TL = ((Rel*Ri)/(Rel+Ri)) * (L+((2*Lam)/np.array(sinh_mp))) + Lam * ((Rel**2 + Ri**2)/(Rel+Ri)) * np.array(coth_mp)
 
-    Z_TL = ((Rel*Ri)/(Rel+Ri)) * (L+((2*Lam)/sinh(x))) + Lam * ((Rel**2 + Ri**2)/(Rel+Ri)) * coth(x)
+    Z_TL = ((Rel*Ri)/(Rel+Ri)) * (L+(2*Lam*csch(x))) + Lam * ((Rel**2 + Ri**2)/(Rel+Ri)) * coth(x)
 
     return Z_Rs + Z_TL
 
-def cir_RsRQTLQ_fit(params, w):
+def cir_RsRQTLQ_fit(params, w, plan=None):
     '''
     Fit Function: -R-RQ-TLQ- (interface non-reacting, i.e. blocking electrode)
     Transmission line w/ full complexity, which both includes Ri and Rel
                 
     Kristian B. Knudsen (kknu@berkeley.edu || kristianbknudsen@gmail.com)
     '''
+    if plan is None:
+        plan = circuit_plan('R-RQ-TLQ', params)
     Rs = params['Rs']
     L = params['L']
     Ri = params['Ri']
@@ -1738,26 +1508,8 @@ def cir_RsRQTLQ_fit(params, w):
     Z_Rs = Rs
     
     #The (RQ) circuit in series with the transmission line
-    if str(params.keys())[10:].find("R1") == -1: #if R == 'none':
-        Q1 = params['Q1']
-        n1 = params['n1']
-        fs1 = params['fs1']
-        R1 = (1/(Q1*(2*np.pi*fs1)**n1))
-    if str(params.keys())[10:].find("Q1") == -1: #elif Q == 'none':
-        R1 = params['R1']
-        n1 = params['n1']
-        fs1 = params['fs1']
-        Q1 = (1/(R1*(2*np.pi*fs1)**n1))
-    if str(params.keys())[10:].find("n1") == -1: #elif n == 'none':
-        R1 = params['R1']
-        Q1 = params['Q1']
-        fs1 = params['fs1']
-        n1 = np.log(Q1*R1)/np.log(1/(2*np.pi*fs1))
-    if str(params.keys())[10:].find("fs1") == -1: #elif fs == 'none':
-        R1 = params['R1']
-        n1 = params['n1']
-        Q1 = params['Q1']
-    Z_RQ1 = (R1/(1+R1*Q1*(w*1j)**n1))
+    R1, Q1, n1 = plan[0](params)
+    Z_RQ1 = (R1/(1+R1*Q1*jw_pow(w, n1)))
     
     # The Interfacial impedance is given by an -(RQ)- circuit
     Phi = elem_Q(w, Q=Q, n=n)
@@ -1766,19 +1518,12 @@ def cir_RsRQTLQ_fit(params, w):
     Lam = (Phi/(X1+X2))**(1/2)    
 
     x = L/Lam
-#    x_mp = mp.matrix(x) #x in mp.math format
-#    coth_mp = []
-#    sinh_mp = []
-#    for i in range(len(Lam)):
-#        coth_mp.append(float(mp.coth(x_mp[i]).real)+float(mp.coth(x_mp[i]).imag)*1j) #Handles coth with x having very large or very small numbers
-#        sinh_mp.append(float(mp.sinh(x_mp[i]).real)+float(mp.sinh(x_mp[i]).imag)*1j)
-#    Z_TL = ((Rel*Ri)/(Rel+Ri)) * (L+((2*Lam)/np.array(sinh_mp))) + Lam * ((Rel**2 + Ri**2)/(Rel+Ri)) * np.array(coth_mp)
 
-    Z_TL = ((Rel*Ri)/(Rel+Ri)) * (L+((2*Lam)/sinh(x))) + Lam * ((Rel**2 + Ri**2)/(Rel+Ri)) * coth(x)
+    Z_TL = ((Rel*Ri)/(Rel+Ri)) * (L+(2*Lam*csch(x))) + Lam * ((Rel**2 + Ri**2)/(Rel+Ri)) * coth(x)
 
     return Z_Rs + Z_RQ1 + Z_TL
 
-def cir_RsTL_Fit(params, w):
+def cir_RsTL_Fit(params, w, plan=None):
     '''
     Fit Function: -R-TLQ- (interface reacting, i.e. non-blocking)
     Transmission line w/ full complexity, which both includes Ri and Rel
@@ -1788,6 +1533,8 @@ def cir_RsTL_Fit(params, w):
     Kristian B. Knudsen (kknu@berkeley.edu || kristianbknudsen@gmail.com)
     
     '''
+    if plan is None:
+        plan = circuit_plan('R-TL', params)
     Rs = params['Rs']
     L = params['L']
     Ri = params['Ri']
@@ -1797,51 +1544,28 @@ def cir_RsTL_Fit(params, w):
     Z_Rs = Rs
 
     # The Interfacial impedance is given by an -(RQ)- circuit
-    if str(params.keys())[10:].find("R") == -1: #if R == 'none':
-        Q = params['Q']
-        n = params['n']
-        fs = params['fs']
-        R = (1/(Q*(2*np.pi*fs)**n))
-    if str(params.keys())[10:].find("Q") == -1: #elif Q == 'none':
-        R = params['R']
-        n = params['n']
-        fs = params['fs']
-        Q = (1/(R*(2*np.pi*fs)**n))
-    if str(params.keys())[10:].find("n") == -1: #elif n == 'none':
-        R = params['R']
-        Q = params['Q']
-        fs = params['fs']
-        n = np.log(Q*R)/np.log(1/(2*np.pi*fs))
-    if str(params.keys())[10:].find("fs") == -1: #elif fs == 'none':
-        R = params['R']
-        n = params['n']
-        Q = params['Q']
+    R, Q, n = plan[0](params)
 
-    Phi = (R/(1+R*Q*(w*1j)**n))
+    Phi = (R/(1+R*Q*jw_pow(w, n)))
     X1 = Ri
     X2 = Rel
     Lam = (Phi/(X1+X2))**(1/2)    
 
     x = L/Lam
-#    x_mp = mp.matrix(x) #x in mp.math format
-#    coth_mp = []
-#    sinh_mp = []
-#    for i in range(len(Lam)):
-#        coth_mp.append(float(mp.coth(x_mp[i]).real)+float(mp.coth(x_mp[i]).imag)*1j) #Handles coth with x having very large or very small numbers
-#        sinh_mp.append(float(mp.sinh(x_mp[i]).real)+float(mp.sinh(x_mp[i]).imag)*1j)
-#    Z_TL = ((Rel*Ri)/(Rel+Ri)) * (L+((2*Lam)/np.array(sinh_mp))) + Lam * ((Rel**2 + Ri**2)/(Rel+Ri)) * np.array(coth_mp)
 
-    Z_TL = ((Rel*Ri)/(Rel+Ri)) * (L+((2*Lam)/sinh(x))) + Lam * ((Rel**2 + Ri**2)/(Rel+Ri)) * coth(x)
+    Z_TL = ((Rel*Ri)/(Rel+Ri)) * (L+(2*Lam*csch(x))) + Lam * ((Rel**2 + Ri**2)/(Rel+Ri)) * coth(x)
 
     return Z_Rs + Z_TL
 
-def cir_RsRQTL_fit(params, w):
+def cir_RsRQTL_fit(params, w, plan=None):
     '''
     Fit Function: -R-RQ-TL- (interface reacting, i.e. non-blocking)
     Transmission line w/ full complexity including both includes Ri and Rel
                 
     Kristian B. Knudsen (kknu@berkeley.edu || kristianbknudsen@gmail.com)
     '''
+    if plan is None:
+        plan = circuit_plan('R-RQ-TL', params)
     Rs = params['Rs']
     L = params['L']
     Ri = params['Ri']
@@ -1851,64 +1575,20 @@ def cir_RsRQTL_fit(params, w):
     Z_Rs = Rs
 
     # The Interfacial impedance is given by an -(RQ)- circuit
-    if str(params.keys())[10:].find("R1") == -1: #if R == 'none':
-        Q1 = params['Q1']
-        n1 = params['n1']
-        fs1 = params['fs1']
-        R1 = (1/(Q1*(2*np.pi*fs1)**n1))
-    elif str(params.keys())[10:].find("Q1") == -1: #elif Q == 'none':
-        R1 = params['R1']
-        n1 = params['n1']
-        fs1 = params['fs1']
-        Q1 = (1/(R1*(2*np.pi*fs1)**n1))
-    elif str(params.keys())[10:].find("n1") == -1: #elif n == 'none':
-        R1 = params['R1']
-        Q1 = params['Q1']
-        fs1 = params['fs1']
-        n1 = np.log(Q1*R1)/np.log(1/(2*np.pi*fs1))
-    elif str(params.keys())[10:].find("fs1") == -1: #elif fs == 'none':
-        R1 = params['R1']
-        n1 = params['n1']
-        Q1 = params['Q1']
-    Z_RQ1 = (R1/(1+R1*Q1*(w*1j)**n1))
+    R1, Q1, n1 = plan[0](params)
+    Z_RQ1 = (R1/(1+R1*Q1*jw_pow(w, n1)))
 #    
 #    # The Interfacial impedance is given by an -(RQ)- circuit
-    if str(params.keys())[10:].find("R2") == -1: #if R == 'none':
-        Q2 = params['Q2']
-        n2 = params['n2']
-        fs2 = params['fs2']
-        R2 = (1/(Q2*(2*np.pi*fs2)**n2))
-    elif str(params.keys())[10:].find("Q2") == -1: #elif Q == 'none':
-        R2 = params['R2']
-        n2 = params['n2']
-        fs2 = params['fs2']
-        Q2 = (1/(R2*(2*np.pi*fs2)**n1))
-    elif str(params.keys())[10:].find("n2") == -1: #elif n == 'none':
-        R2 = params['R2']
-        Q2 = params['Q2']
-        fs2 = params['fs2']
-        n2 = np.log(Q2*R2)/np.log(1/(2*np.pi*fs2))
-    elif str(params.keys())[10:].find("fs2") == -1: #elif fs == 'none':
-        R2 = params['R2']
-        n2 = params['n2']
-        Q2 = params['Q2']
-    Phi = (R2/(1+R2*Q2*(w*1j)**n2))
+    R2, Q2, n2 = plan[1](params)
+    Phi = (R2/(1+R2*Q2*jw_pow(w, n2)))
 
     X1 = Ri
     X2 = Rel
     Lam = (Phi/(X1+X2))**(1/2)    
 
     x = L/Lam
-#    x_mp = mp.matrix(x) #x in mp.math format
-#    coth_mp = []
-#    sinh_mp = []
-#    for i in range(len(Lam)):
-#        coth_mp.append(float(mp.coth(x_mp[i]).real)+float((mp.coth(x_mp[i]).imag))*1j) #Handles coth with x having very large or very small numbers
-#        sinh_mp.append(float(((1-mp.exp(-2*x_mp[i]))/(2*mp.exp(-x_mp[i]))).real) + float(((1-mp.exp(-2*x_mp[i]))/(2*mp.exp(-x_mp[i]))).real)*1j)
-#        sinh_mp.append(float(mp.sinh(x_mp[i]).real)+float((mp.sinh(x_mp[i]).imag))*1j)
-#    Z_TL = ((Rel*Ri)/(Rel+Ri)) * (L+((2*Lam)/np.array(sinh_mp))) + Lam * ((Rel**2 + Ri**2)/(Rel+Ri)) * np.array(coth_mp)
 
-    Z_TL = ((Rel*Ri)/(Rel+Ri)) * (L+((2*Lam)/sinh(x))) + Lam * ((Rel**2 + Ri**2)/(Rel+Ri)) * coth(x)
+    Z_TL = ((Rel*Ri)/(Rel+Ri)) * (L+(2*Lam*csch(x))) + Lam * ((Rel**2 + Ri**2)/(Rel+Ri)) * coth(x)
 
     return Z_Rs + Z_RQ1 + Z_TL
 
@@ -1941,13 +1621,8 @@ def cir_RsTL_1Dsolid_fit(params, w):
     #The impedance of a 1D Warburg Element
     time_const = (radius**2)/D
     
-    x = (time_const*w*1j)**n_w
-    x_mp = mp.matrix(x)
-    warburg_coth_mp = []
-    for i in range(len(w)):
-        warburg_coth_mp.append(float(mp.coth(x_mp[i]).real)+float(mp.coth(x_mp[i]).imag)*1j)
-
-    Z_w = R_w * np.array(warburg_coth_mp)/x
+    x = time_const**n_w * jw_pow(w, n_w)
+    Z_w = R_w * coth(x)/x
     
     # The Interfacial impedance is given by a Randles Equivalent circuit with the finite space warburg element in series with R2
     Z_Rct = R
@@ -1957,19 +1632,12 @@ def cir_RsTL_1Dsolid_fit(params, w):
     # The Impedance of the Transmission Line
     lamb = (Z_Randles/(Rel+Ri))**(1/2)
     x = L/lamb
-#    lamb_mp = mp.matrix(x)
-#    sinh_mp = []
-#    coth_mp = []
-#    for j in range(len(lamb_mp)):
-#        sinh_mp.append(float(mp.sinh(lamb_mp[j]).real)+float((mp.sinh(lamb_mp[j]).imag))*1j)
-#        coth_mp.append(float(mp.coth(lamb_mp[j]).real)+float(mp.coth(lamb_mp[j]).imag)*1j)
-#    Z_TL = ((Rel*Ri)/(Rel+Ri)) * (L+((2*lamb)/np.array(sinh_mp))) + lamb * ((Rel**2 + Ri**2)/(Rel+Ri)) * np.array(coth_mp)
     
-    Z_TL = ((Rel*Ri)/(Rel+Ri)) * (L+((2*lamb)/sinh(x))) + lamb * ((Rel**2 + Ri**2)/(Rel+Ri)) * coth(x)
+    Z_TL = ((Rel*Ri)/(Rel+Ri)) * (L+(2*lamb*csch(x))) + lamb * ((Rel**2 + Ri**2)/(Rel+Ri)) * coth(x)
     
     return Z_Rs + Z_TL
 
-def cir_RsRQTL_1Dsolid_fit(params, w):
+def cir_RsRQTL_1Dsolid_fit(params, w, plan=None):
     '''
     Fit Function: -R-RQ-TL(Q(RW))-
     Transmission line w/ full complexity, which both includes Ri and Rel. The Warburg element is specific for 1D solid-state diffusion
@@ -1979,6 +1647,8 @@ def cir_RsRQTL_1Dsolid_fit(params, w):
     David Brown (demoryb@berkeley.edu)
     Kristian B. Knudsen (kknu@berkeley.edu || kristianbknudsen@gmail.com)
     '''
+    if plan is None:
+        plan = circuit_plan('R-RQ-TL1Dsolid', params)
     Rs = params['Rs']
     L = params['L']
     Ri = params['Ri']
@@ -1995,37 +1665,14 @@ def cir_RsRQTL_1Dsolid_fit(params, w):
     Z_Rs = Rs
     
     # The Interfacial impedance is given by an -(RQ)- circuit
-    if str(params.keys())[10:].find("R1") == -1: #if R == 'none':
-        Q1 = params['Q1']
-        n1 = params['n1']
-        fs1 = params['fs1']
-        R1 = (1/(Q1*(2*np.pi*fs1)**n1))
-    elif str(params.keys())[10:].find("Q1") == -1: #elif Q == 'none':
-        R1 = params['R1']
-        n1 = params['n1']
-        fs1 = params['fs1']
-        Q1 = (1/(R1*(2*np.pi*fs1)**n1))
-    elif str(params.keys())[10:].find("n1") == -1: #elif n == 'none':
-        R1 = params['R1']
-        Q1 = params['Q1']
-        fs1 = params['fs1']
-        n1 = np.log(Q1*R1)/np.log(1/(2*np.pi*fs1))
-    elif str(params.keys())[10:].find("fs1") == -1: #elif fs == 'none':
-        R1 = params['R1']
-        n1 = params['n1']
-        Q1 = params['Q1']
-    Z_RQ1 = (R1/(1+R1*Q1*(w*1j)**n1))
+    R1, Q1, n1 = plan[0](params)
+    Z_RQ1 = (R1/(1+R1*Q1*jw_pow(w, n1)))
 
     #The impedance of a 1D Warburg Element
     time_const = (radius**2)/D
     
-    x = (time_const*w*1j)**n_w
-    x_mp = mp.matrix(x)
-    warburg_coth_mp = []
-    for i in range(len(w)):
-        warburg_coth_mp.append(float(mp.coth(x_mp[i]).real)+float(mp.coth(x_mp[i]).imag)*1j)
-
-    Z_w = R_w * np.array(warburg_coth_mp)/x
+    x = time_const**n_w * jw_pow(w, n_w)
+    Z_w = R_w * coth(x)/x
     
     # The Interfacial impedance is given by a Randles Equivalent circuit with the finite space warburg element in series with R2
     Z_Rct = R2
@@ -2035,21 +1682,188 @@ def cir_RsRQTL_1Dsolid_fit(params, w):
     # The Impedance of the Transmission Line
     lamb = (Z_Randles/(Rel+Ri))**(1/2)
     x = L/lamb
-#    lamb_mp = mp.matrix(x)
-#    sinh_mp = []
-#    coth_mp = []
-#    for j in range(len(lamb_mp)):
-#        sinh_mp.append(float(mp.sinh(lamb_mp[j]).real)+float((mp.sinh(lamb_mp[j]).imag))*1j)
-#        coth_mp.append(float(mp.coth(lamb_mp[j]).real)+float(mp.coth(lamb_mp[j]).imag)*1j)
-#        
-#    Z_TL = ((Rel*Ri)/(Rel+Ri)) * (L+((2*lamb)/np.array(sinh_mp))) + lamb * ((Rel**2 + Ri**2)/(Rel+Ri)) * np.array(coth_mp)
 
-    Z_TL = ((Rel*Ri)/(Rel+Ri)) * (L+((2*lamb)/sinh(x))) + lamb * ((Rel**2 + Ri**2)/(Rel+Ri)) * coth(x)
+    Z_TL = ((Rel*Ri)/(Rel+Ri)) * (L+(2*lamb*csch(x))) + lamb * ((Rel**2 + Ri**2)/(Rel+Ri)) * coth(x)
     
     return Z_Rs + Z_RQ1 + Z_TL
 
+### Circuit compiler
+##
+#
+circuit_fit_functions = {
+    'C': elem_C_fit,
+    'Q': elem_Q_fit,
+    'R-C': cir_RsC_fit,
+    'R-Q': cir_RsQ_fit,
+    'RC': cir_RC_fit,
+    'RQ': cir_RQ_fit,
+    'R-RQ': cir_RsRQ_fit,
+    'R-RQ-RQ': cir_RsRQRQ_fit,
+    'R-RC-C': cir_RsRCC_fit,
+    'R-RC-Q': cir_RsRCQ_fit,
+    'R-RQ-Q': cir_RsRQQ_fit,
+    'R-RQ-C': cir_RsRQC_fit,
+    'R-(Q(RW))': cir_Randles_simplified_Fit,
+    'C-RC-C': cir_C_RC_C_fit,
+    'Q-RQ-Q': cir_Q_RQ_Q_Fit,
+    'RC-RC-ZD': cir_RCRCZD_fit,
+    'R-TLsQ': cir_RsTLsQ_fit,
+    'R-RQ-TLsQ': cir_RsRQTLsQ_Fit,
+    'R-TLs': cir_RsTLs_Fit,
+    'R-RQ-TLs': cir_RsRQTLs_Fit,
+    'R-TLQ': cir_RsTLQ_fit,
+    'R-RQ-TLQ': cir_RsRQTLQ_fit,
+    'R-TL': cir_RsTL_Fit,
+    'R-RQ-TL': cir_RsRQTL_fit,
+    'R-TL1Dsolid': cir_RsTL_1Dsolid_fit,
+    'R-RQ-TL1Dsolid': cir_RsRQTL_1Dsolid_fit,
+    }
+
+@lru_cache(maxsize=None)
+def compile_circuit(circuit, param_names=None):
+    '''
+    Compiles a circuit string, e.g. 'R-RQ-TL', into an evaluation function Z = f(params, w)
+    
+    The circuit string is parsed once into its series elements, which are looked up in circuit_fit_functions. The returned function
+    is cached, so the string dispatch is not repeated on every iteration of the CNLS fitting, and it returns the complex impedance
+    from a single evaluation of the fit function. If the parameter names are given, the parameterization plan of the -RQ- elements,
+    i.e. which of R, Q, n, and fs is derived, is also resolved once here, see RQ_plan()
+
+    Inputs
+    ------------
+    - circuit: circuit string as listed in leastsq_errorfunc(). Whitespace around the series elements is ignored, i.e. 'R - RQ' == 'R-RQ'
+    - param_names: tuple of the names of the fitting parameters, e.g. tuple(params.keys()). Default is 'None', in which case the plan is
+      resolved from the names of the parameters of the first call, and cached for each set of names
+    
+    Returns
+    ------------
+    Function of (params, w) returning the complex impedance of the circuit [ohm]. The attribute .jac(params, w) returns (Z, dZ), where dZ
+    is a dict with the analytic derivatives of Z for each parameter, see PyEIS_Jacobian.py. .plan is None if no param_names are given. Circuits built from Series() and Parallel(), see PyEIS_Circuit_builder.py, are compiled by compile_tree()
+    '''
+    if isinstance(circuit, circuit_node):
+        return compile_tree(circuit)
+    elements = [element.strip() for element in circuit.split('-')]
+    circuit_key = '-'.join(elements)
+    if circuit_key not in circuit_fit_functions:
+        raise ValueError("Circuit '"+circuit+"' is not defined, the avaliable circuits are: "+', '.join(circuit_fit_functions))
+    fit_function = circuit_fit_functions[circuit_key]
+    
+    jac_function = circuit_jac_functions[circuit_key]
+    if param_names is not None and circuit_key in circuit_plan_elements:
+        plan = circuit_plan(circuit_key, param_names)
+        def circuit_eval(params, w):
+            return fit_function(params, w, plan=plan)
+        def circuit_jac(params, w):
+            return jac_function(params, w, plan=plan)
+    elif circuit_key in circuit_plan_elements:
+        plan = None
+        plans = {} #plans resolved from the parameter names of the calls, one per set of names
+        def params_plan(params):
+            names = tuple(params.keys())
+            if names not in plans:
+                plans[names] = circuit_plan(circuit_key, names)
+            return plans[names]
+        def circuit_eval(params, w):
+            return fit_function(params, w, plan=params_plan(params))
+        def circuit_jac(params, w):
+            return jac_function(params, w, plan=params_plan(params))
+    else:
+        plan = None
+        def circuit_eval(params, w):
+            return fit_function(params, w)
+        def circuit_jac(params, w):
+            return jac_function(params, w)
+    circuit_eval.circuit = circuit_key
+    circuit_eval.elements = tuple(elements)
+    circuit_eval.plan = plan
+    circuit_eval.jac = circuit_jac
+    return circuit_eval
+
+def circuit_batch(circuit, param_names, param_sets, w, dtype=np.complex128):
+    '''
+    Batched evaluation of a circuit over many parameter sets at once, e.g. for Monte Carlo studies and parameter sweeps
+    
+    The parameter sets are broadcast against the angular frequencies in a single evaluation of the compiled circuit, i.e. one call
+    replaces n_sets calls of the simulation function. All circuits of compile_circuit() are avaliable, and the -RQ- elements can be
+    given by any three of R, Q, n, and fs as in the fitting.
+    
+    Inputs
+    ------------
+    - circuit: circuit string as listed in leastsq_errorfunc(), e.g. 'R-RQ-RQ'
+    - param_names: names of the parameters in the columns of param_sets, e.g. ['Rs', 'R', 'Q', 'n', 'R2', 'Q2', 'n2']
+    - param_sets: 2-D array of shape (n_sets, n_params), one parameter set per row
+    - w: angular frequencies [1/s] of shape (n_freq,)
+    - dtype: np.complex128 (default) or np.complex64. With np.complex64, the parameters and frequencies are cast to float32 and the
+      circuit is evaluated in single precision, which halves the memory of the returned cube and of the intermediate arrays
+    
+    Returns
+    ------------
+    Complex impedance [ohm] of shape (n_sets, n_freq)
+    
+    Accuracy of np.complex64
+    ------------
+    The largest relative error, |Z64 - Z128|/|Z128|, including the rounding of the parameters to float32, for 2000 parameter sets
+    per circuit with each parameter varied by up to a factor of 10 in both directions, n in [0.5, 1], and 10 mHz - 1 MHz:
+        - C, R-C, RC, R-RC-C, C-RC-C, RC-RC-ZD: < 4e-7
+        - R-Q, R-RQ, R-RQ-RQ, R-RC-Q, R-RQ-C, R-(Q(RW)), R-TLsQ, R-RQ-TLsQ, R-TLs, R-RQ-TLs, R-TLQ, R-RQ-TLQ, R-TL, R-RQ-TL, R-RQ-TL1Dsolid: < 1e-6
+        - Q, RQ, Q-RQ-Q, R-RQ-Q, R-TL1Dsolid: < 1.5e-6
+    The error of the constant phase elements grows with |n*ln(w)|, as (jw)^n = exp(n*ln(jw)), i.e. with the width of the frequency
+    range. Fitting is always done in double precision
+    
+    Example
+    ------------
+    >>> f, w = freq_gen(f_start=10**5, f_stop=10**-1, pts_decade=10)
+    >>> sets = np.column_stack([np.full(1000, 10), np.random.uniform(50, 150, 1000), np.full(1000, 1e-3), np.full(1000, 0.8)])
+    >>> Z = circuit_batch('R-RQ', ['Rs', 'R', 'Q', 'n'], sets, w)
+    '''
+    param_names = tuple(param_names)
+    param_sets = np.atleast_2d(np.asarray(param_sets, dtype=real_dtype(dtype)))
+    if param_sets.ndim != 2 or param_sets.shape[1] != len(param_names):
+        raise ValueError('param_sets must have the shape (n_sets, '+str(len(param_names))+'), one column per name in param_names')
+    w = freq_grid(w, dtype=dtype)
+    
+    params = {name: param_sets[:, k, None] for k, name in enumerate(param_names)} #columns of shape (n_sets, 1)
+    Z = compile_circuit(circuit, param_names)(params, w[None, :])
+    return np.broadcast_to(Z, (param_sets.shape[0], w.size)).astype(complex_dtype(dtype))
+
 ### Least-Squares error function
-def leastsq_errorfunc(params, w, re, im, circuit, weight_func):
+class residual_buffer:
+    '''
+    Preallocated output of leastsq_errorfunc(), which is reused on every iteration of a fit
+    
+    The weighted sum of squares is written in-place into a float64 buffer of shape (2, N), i.e. 2N values with the real part first
+    and the imaginary part last, so an iteration does not allocate arrays beyond the impedance of the circuit. One buffer is made
+    per fit, as lmfit keeps the last output as the residual of the fit. The buffer is only used with the analytic Jacobian, see
+    leastsq_buffer(), as the finite differences of MINPACK need each output to be a new array
+    
+    Inputs
+    ------------
+    - size: number of frequencies, N
+    '''
+    def __init__(self, size):
+        self.out = np.empty((2, size))
+        self.scratch = np.empty(size) #weights that depend on the circuit impedance
+    
+    def __repr__(self):
+        return 'residual_buffer('+str(self.scratch.size)+')'
+
+def leastsq_buffer(Dfun, size):
+    '''
+    Returns the residual_buffer() of a fit with the analytic Jacobian, or None if the Jacobian is found by finite differences
+    
+    MINPACK keeps the residual of the parameters and compares it to the residuals of the perturbed parameters, so with finite
+    differences a buffer that is overwritten by every call would give a Jacobian of zeros
+    
+    Inputs
+    ------------
+    - Dfun: Dfun of the fit, see leastsq_Dfun()
+    - size: number of frequencies
+    '''
+    if Dfun is None:
+        return None
+    return residual_buffer(size)
+
+def leastsq_errorfunc(params, w, re, im, circuit, weight_func, buffer=None):
     '''
     Sum of squares error function for the complex non-linear least-squares fitting procedure (CNLS). The fitting function (lmfit) will use this function to iterate over
     until the total sum of errors is minimized.
@@ -2069,7 +1883,7 @@ def leastsq_errorfunc(params, w, re, im, circuit, weight_func):
     - re: real impedance
     - im: Imaginary impedance
     - circuit:
-      The avaliable circuits are shown below, and this this parameter needs it as a string.
+      The avaliable circuits are shown below, and this this parameter needs it as a string. A circuit compiled with compile_circuit() is also accepted.
         - C
         - Q
         - R-C
@@ -2080,7 +1894,6 @@ def leastsq_errorfunc(params, w, re, im, circuit, weight_func):
         - R-RQ-RQ
         - R-RQ-Q
         - R-(Q(RW))
-        - R-(Q(RM))
         - R-RC-C
         - R-RC-Q
         - R-RQ-Q
@@ -2102,108 +1915,96 @@ def leastsq_errorfunc(params, w, re, im, circuit, weight_func):
         - modulus
         - unity
         - proportional
+    
+    - buffer: residual_buffer(len(w)) that the output is written into, default is 'None', in which case a new buffer is made.
+      The fitting functions pass one buffer per fit with the analytic Jacobian, so the iterations do not allocate new arrays, see leastsq_buffer()
     '''
-    if circuit == 'C':
-        re_fit = elem_C_fit(params, w).real
-        im_fit = -elem_C_fit(params, w).imag
-    elif circuit == 'Q':
-        re_fit = elem_Q_fit(params, w).real
-        im_fit = -elem_Q_fit(params, w).imag
-    elif circuit == 'R-C':
-        re_fit = cir_RsC_fit(params, w).real
-        im_fit = -cir_RsC_fit(params, w).imag
-    elif circuit == 'R-Q':
-        re_fit = cir_RsQ_fit(params, w).real
-        im_fit = -cir_RsQ_fit(params, w).imag
-    elif circuit == 'RC':
-        re_fit = cir_RC_fit(params, w).real
-        im_fit = -cir_RC_fit(params, w).imag
-    elif circuit == 'RQ':
-        re_fit = cir_RQ_fit(params, w).real
-        im_fit = -cir_RQ_fit(params, w).imag
-    elif circuit == 'R-RQ':
-        re_fit = cir_RsRQ_fit(params, w).real
-        im_fit = -cir_RsRQ_fit(params, w).imag
-    elif circuit == 'R-RQ-RQ':
-        re_fit = cir_RsRQRQ_fit(params, w).real
-        im_fit = -cir_RsRQRQ_fit(params, w).imag
-    elif circuit == 'R-RC-C':
-        re_fit = cir_RsRCC_fit(params, w).real
-        im_fit = -cir_RsRCC_fit(params, w).imag
-    elif circuit == 'R-RC-Q':
-        re_fit = cir_RsRCQ_fit(params, w).real
-        im_fit = -cir_RsRCQ_fit(params, w).imag
-    elif circuit == 'R-RQ-Q':
-        re_fit = cir_RsRQQ_fit(params, w).real
-        im_fit = -cir_RsRQQ_fit(params, w).imag
-    elif circuit == 'R-RQ-C':
-        re_fit = cir_RsRQC_fit(params, w).real
-        im_fit = -cir_RsRQC_fit(params, w).imag
-    elif circuit == 'R-(Q(RW))':
-        re_fit = cir_Randles_simplified_Fit(params, w).real
-        im_fit = -cir_Randles_simplified_Fit(params, w).imag
-    elif circuit == 'R-(Q(RM))':
-        re_fit = cir_Randles_uelectrode_fit(params, w).real
-        im_fit = -cir_Randles_uelectrode_fit(params, w).imag
-    elif circuit == 'C-RC-C':
-        re_fit = cir_C_RC_C_fit(params, w).real
-        im_fit = -cir_C_RC_C_fit(params, w).imag
-    elif circuit == 'Q-RQ-Q':
-        re_fit = cir_Q_RQ_Q_Fit(params, w).real
-        im_fit = -cir_Q_RQ_Q_Fit(params, w).imag
-    elif circuit == 'RC-RC-ZD':
-        re_fit = cir_RCRCZD_fit(params, w).real
-        im_fit = -cir_RCRCZD_fit(params, w).imag
-    elif circuit == 'R-TLsQ':
-        re_fit = cir_RsTLsQ_fit(params, w).real
-        im_fit = -cir_RsTLsQ_fit(params, w).imag
-    elif circuit == 'R-RQ-TLsQ':
-        re_fit = cir_RsRQTLsQ_Fit(params, w).real
-        im_fit = -cir_RsRQTLsQ_Fit(params, w).imag
-    elif circuit == 'R-TLs':
-        re_fit = cir_RsTLs_Fit(params, w).real
-        im_fit = -cir_RsTLs_Fit(params, w).imag
-    elif circuit == 'R-RQ-TLs':
-        re_fit = cir_RsRQTLs_Fit(params, w).real
-        im_fit = -cir_RsRQTLs_Fit(params, w).imag
-    elif circuit == 'R-TLQ':
-        re_fit = cir_RsTLQ_fit(params, w).real
-        im_fit = -cir_RsTLQ_fit(params, w).imag
-    elif circuit == 'R-RQ-TLQ':
-        re_fit = cir_RsRQTLQ_fit(params, w).real
-        im_fit = -cir_RsRQTLQ_fit(params, w).imag
-    elif circuit == 'R-TL':
-        re_fit = cir_RsTL_Fit(params, w).real
-        im_fit = -cir_RsTL_Fit(params, w).imag
-    elif circuit == 'R-RQ-TL':
-        re_fit = cir_RsRQTL_fit(params, w).real
-        im_fit = -cir_RsRQTL_fit(params, w).imag
-    elif circuit == 'R-TL1Dsolid':
-        re_fit = cir_RsTL_1Dsolid_fit(params, w).real
-        im_fit = -cir_RsTL_1Dsolid_fit(params, w).imag
-    elif circuit == 'R-RQ-TL1Dsolid':
-        re_fit = cir_RsRQTL_1Dsolid_fit(params, w).real
-        im_fit = -cir_RsRQTL_1Dsolid_fit(params, w).imag
-    else:
-        print('Circuit is not defined in leastsq_errorfunc()')
-        
-    error = [(re-re_fit)**2, (im-im_fit)**2] #sum of squares
+    if not callable(circuit):
+        circuit = compile_circuit(circuit, tuple(params.keys()))
+    Z_fit = circuit(params, w) #evaluates the circuit once per iteration
+    if buffer is None:
+        buffer = residual_buffer(len(re))
+    S = buffer.out
+    
+    #sum of squares, with re_fit = Z_fit.real and im_fit = -Z_fit.imag
+    np.subtract(re, Z_fit.real, out=S[0])
+    np.add(im, Z_fit.imag, out=S[1])
+    np.square(S, out=S)
     
     #Different Weighing options, see Lasia
     if weight_func == 'modulus':
-        weight = [1/((re_fit**2 + im_fit**2)**(1/2)), 1/((re_fit**2 + im_fit**2)**(1/2))]
+        np.abs(Z_fit, out=buffer.scratch) #(re_fit**2 + im_fit**2)**(1/2)
+        np.divide(S, buffer.scratch, out=S)
     elif weight_func == 'proportional':
-        weight = [1/(re_fit**2), 1/(im_fit**2)]
+        np.square(Z_fit.real, out=buffer.scratch)
+        np.divide(S[0], buffer.scratch, out=S[0])
+        np.square(Z_fit.imag, out=buffer.scratch)
+        np.divide(S[1], buffer.scratch, out=S[1])
     elif weight_func == 'unity':
-        unity_1s = []
-        for k in range(len(re)):
-            unity_1s.append(1) #makes an array of [1]'s, so that the weighing is == 1 * sum of squres.
-        weight = [unity_1s, unity_1s]
+        pass #the weight is 1
     else:
         print('weight not defined in leastsq_errorfunc()')
-        
-    S = np.array(weight) * error #weighted sum of squares 
-    return S
+    return S #weighted sum of squares
+
+def leastsq_jacobian(params, w, re, im, circuit, weight_func, buffer=None):
+    '''
+    Analytic Jacobian of leastsq_errorfunc() for the CNLS fitting, passed to lmfit as Dfun
+    
+    The derivatives of the circuit impedance are found with circuit.jac() and are propagated through the weighted sum of squares.
+    The inputs are the same as for leastsq_errorfunc()
+    
+    Returns
+    ------------
+    Jacobian of shape (2*len(w), number of varying parameters), the rows follow the flattened output of leastsq_errorfunc()
+    '''
+    if not callable(circuit):
+        circuit = compile_circuit(circuit, tuple(params.keys()))
+    var_names = [name for name, par in params.items() if par.vary and par.expr is None]
+    Z_fit, dZ = circuit.jac(params.valuesdict(), w)
+    re_fit = Z_fit.real
+    im_fit = -Z_fit.imag
+    dZ = np.array([np.broadcast_to(dZ.get(name, 0), Z_fit.shape) for name in var_names])
+    d_re = dZ.real
+    d_im = -dZ.imag
+
+    error = [(re-re_fit)**2, (im-im_fit)**2]
+    d_error = [-2*(re-re_fit)*d_re, -2*(im-im_fit)*d_im]
+    if weight_func == 'modulus':
+        modulus = (re_fit**2 + im_fit**2)**(1/2)
+        d_weight = -(re_fit*d_re + im_fit*d_im)/modulus**3
+        weight = [1/modulus, 1/modulus]
+        d_weight = [d_weight, d_weight]
+    elif weight_func == 'proportional':
+        weight = [1/(re_fit**2), 1/(im_fit**2)]
+        d_weight = [-2*d_re/re_fit**3, -2*d_im/im_fit**3]
+    elif weight_func == 'unity':
+        weight = [1, 1]
+        d_weight = [0, 0]
+    else:
+        print('weight not defined in leastsq_jacobian()')
+
+    J = [d_weight[k]*error[k] + weight[k]*d_error[k] for k in range(2)] #d(weight*error)
+    return np.concatenate(J, axis=1).T
+
+def leastsq_Dfun(circuit, params, jacobian='analytic', nan_policy='raise'):
+    '''
+    Returns the Dfun for lmfit's leastsq, leastsq_jacobian() if the analytic Jacobian can be used otherwise None (finite differences)
+    
+    The analytic Jacobian is not used for parameters constrained by expressions, or with nan_policy='omit' where lmfit drops points from the residual
+    
+    Inputs
+    ------------
+    - circuit: circuit compiled with compile_circuit()
+    - params: fitting parameters
+    - jacobian: 'analytic' (default) or 'numerical'
+    - nan_policy: nan_policy of the fit
+    '''
+    if jacobian != 'analytic' or nan_policy == 'omit' or circuit.jac is None:
+        return None
+    for par in params.values():
+        if par.expr is not None:
+            return None
+    return leastsq_jacobian
 
 ### Fitting Class
 class EIS_exp:
@@ -2222,21 +2023,28 @@ class EIS_exp:
     Inputs
     -----------
         - path: path of datafile(s) as a string
-        - data: datafile(s) including extension, e.g. ['EIS_data1', 'EIS_data2']
+        - data: datafile(s) including extension, e.g. ['EIS_data1', 'EIS_data2']. Supported are EC-Lab's .mpt and .mpr, Gamry's .DTA, and Solartron's .z files
         - cycle: Specific cycle numbers can be extracted using the cycle function. Default is 'none', which includes all cycle numbers.
         Specific cycles can be extracted using this parameter, insert cycle numbers in brackets, e.g. cycle number 1,4, and 6 are wanted. cycle=[1,4,6]
         - mask: ['high frequency' , 'low frequency'], if only a high- or low-frequency is desired use 'none' for the other, e.g. maks=[10**4,'none']
+        or 'auto', which trims the high- and low-frequency points of each spectrum that fail the Lin-KK test, see KK_auto_mask(). The mask of
+        each spectrum is stored in self.KK_mask
+        - mask_threshold: limit of the relative KK residuals of mask='auto', default 0.01 (1%)
+        - columns: coloumns read from the data files, default 'analysis' reads f, re, im, E_avg, and cycle_number, 'all' reads all coloumns, see select_columns()
+        - cache: directory of the on-disk cache of the parsed data files, e.g. user_cache_dir (~/.cache/PyEIS). Default 'default' uses the directory of set_cache(), which is 'none', i.e. no cache, unless set_cache() was called, see extract_cached()
     '''
-    def __init__(self, path, data, cycle='off', mask=['none','none']):
+    def __init__(self, path, data, cycle='off', mask=['none','none'], mask_threshold=0.01, columns='analysis', cache='default'):
         self.df_raw0 = []
         self.cycleno = []
         for j in range(len(data)):
             if data[j].find(".mpt") != -1: #file is a .mpt file
-                self.df_raw0.append(extract_mpt(path=path, EIS_name=data[j])) #reads all datafiles
+                self.df_raw0.append(extract_cached(extract_mpt, path=path, EIS_name=data[j], columns=columns, cache=cache)) #reads all datafiles
+            elif data[j].find(".mpr") != -1: #file is a binary .mpr file
+                self.df_raw0.append(extract_cached(extract_mpr, path=path, EIS_name=data[j], columns=columns, cache=cache)) #reads all datafiles
             elif data[j].find(".DTA") != -1: #file is a .dta file
-                self.df_raw0.append(extract_dta(path=path, EIS_name=data[j])) #reads all datafiles
+                self.df_raw0.append(extract_cached(extract_dta, path=path, EIS_name=data[j], columns=columns, cache=cache)) #reads all datafiles
             elif data[j].find(".z") != -1: #file is a .z file
-                self.df_raw0.append(extract_solar(path=path, EIS_name=data[j])) #reads all datafiles
+                self.df_raw0.append(extract_cached(extract_solar, path=path, EIS_name=data[j], columns=columns, cache=cache)) #reads all datafiles
             else:
                 print('Data file(s) could not be identified')
 
@@ -2285,6 +2093,9 @@ class EIS_exp:
         self.df_raw = self.df_raw.assign(w = 2*np.pi*self.df_raw.f) #creats a new coloumn with the angular frequency
 
         #Masking data to each cycle
+        auto_mask = mask == 'auto'
+        if auto_mask: #cut-offs from the Lin-KK residuals of each spectrum, see below
+            mask = ['none','none']
         self.df_pre = []
         self.df_limited = []
         self.df_limited2 = []
@@ -2325,9 +2136,45 @@ class EIS_exp:
                 self.df.append(self.df_limited[self.df_limited2.cycle_number == self.df_raw.cycle_number.unique()[i]])
         else:
             print('__init__ error (#2)')
+        if auto_mask:
+            self.KK_mask = KK_auto_mask(w=[self.df[i].w.values for i in range(len(self.df))], re=[self.df[i].re.values for i in range(len(self.df))], im=[self.df[i].im.values for i in range(len(self.df))], threshold=mask_threshold)
+            self.df = [self.df[i][self.KK_mask[i]] for i in range(len(self.df))]
+        self.w_grid = [freq_grid(self.df[i].w.values) for i in range(len(self.df))] #angular frequency grid of each spectrum, see freq_grid()
+
 
+    def lin_kk_results(self, num_RC='auto', weight_func='Boukamp', num_RC_max=80, n_jobs=1, executor='thread', representation='Z'):
+        '''
+        Linear Kramers-Kronig (KK) Validity Test of all spectra without plotting or printing, see Lin_KK() for the plots
+
+        Returns a KK_results with, for each spectrum, the number of RC-elements (.M), mu (.mu), the fitted Rs (.Rs), R_k (.R_values),
+        time constants (.t_values), and the relative residuals (.residual_real, .residual_imag), see KK_test()
+
+        Optional Inputs
+        -----------------
+        - num_RC: 'auto' or the number of RC-elements/decade, see Lin_KK()
+        - weight_func: see KK_weights(), default 'Boukamp'
+        - num_RC_max: largest number of RC-elements of the 'auto' search, default 80
+        - n_jobs: number of spectra chunks tested concurrently, default 1, -1 uses all CPUs
+        - executor: 'thread' (default), 'process', or a concurrent.futures.Executor, see KK_executor()
+        - representation: 'Z' (default) tests the impedance, 'Y' the admittance, and 'both' tests Z and Y in one pass and reports the
+          representation with the smallest residuals for each spectrum (.representation), see KK_admittance()
+        '''
+        return KK_test(w=[self.df[i].w.values for i in range(len(self.df))], re=[self.df[i].re.values for i in range(len(self.df))], im=[self.df[i].im.values for i in range(len(self.df))], num_RC=num_RC, weight_func=weight_func, num_RC_max=num_RC_max, n_jobs=n_jobs, executor=executor, representation=representation)
 
-    def Lin_KK(self, num_RC='auto', legend='on', plot='residuals', bode='off', nyq_xlim='none', nyq_ylim='none', weight_func='Boukamp', savefig='none'):
+    def z_hit_results(self, ref_range='none'):
+        '''
+        Z-HIT check of all spectra, i.e. |Z| reconstructed from the phase, without plotting or printing, see Z_HIT()
+
+        Returns a Z_HIT_results with, for each spectrum, the reconstructed modulus (.modulus) and the relative residuals (.residual_real,
+        .residual_imag, .residual_modulus), see Z_HIT_test(). As no fitting is needed, it can be used to screen spectra before Lin_KK()
+
+        Optional Inputs
+        -----------------
+        - ref_range: [f_min, f_max] frequency range [Hz] in which the reconstructed |Z| is matched to the data, default 'none' uses all points
+        '''
+        return Z_HIT_test(w=[self.df[i].w.values for i in range(len(self.df))], re=[self.df[i].re.values for i in range(len(self.df))], im=[self.df[i].im.values for i in range(len(self.df))], ref_range=ref_range)
+
+    def Lin_KK(self, num_RC='auto', legend='on', plot='residuals', bode='off', nyq_xlim='none', nyq_ylim='none', weight_func='Boukamp', savefig='none', num_RC_max=80, n_jobs=1, executor='thread', representation='Z'):
         '''
         Plots the Linear Kramers-Kronig (KK) Validity Test
         The script is based on Boukamp and Schōnleber et al.'s papers for fitting the resistances of multiple -(RC)- circuits
@@ -2339,7 +2186,8 @@ class EIS_exp:
         
         The function performs the KK analysis and as default the relative residuals in each subplot        
     
-        Note, that weigh_func should be equal to 'Boukamp'.
+        Note, that weigh_func should be equal to 'Boukamp'. As the time constants are fixed, the resistances are found directly by
+        weighted linear least-squares, see KK_linear_solve(), and the weights are found from the data, see KK_weights().
         
         Kristian B. Knudsen (kknu@berkeley.edu || kristianbknudsen@gmail.com)
         
@@ -2350,6 +2198,14 @@ class EIS_exp:
             that ensures no under- or over-fitting occurs
             - can be hardwired by inserting any number (RC-elements/decade)
 
+        - num_RC_max: largest number of RC-elements of the 'auto' search, default 80. The explored mu(M) curves are stored in
+          self.KK_M_search and self.KK_u_search, see KK_auto_M()
+
+        - n_jobs/executor: number of workers and 'thread' or 'process' pool of the KK tests, see lin_kk_results()
+
+        - representation: 'Z' (default), 'Y' = 1/Z, or 'both', which tests Z and Y in one pass and plots the one with the smallest
+          residuals for each spectrum. The fit is shown as impedance and the residuals are those of the tested representation
+
         - plot: 
             - 'residuals' = plots the relative residuals in subplots correspoding to the cycle numbers picked
             - 'w_data' = plots the relative residuals with the experimental data, in Nyquist and bode plot if desired, see 'bode =' in description
@@ -2371,271 +2227,52 @@ class EIS_exp:
             'im' = im vs. log(freq)
             'log_im' = log(im) vs. log(freq)
         '''
+        self.KK_results = self.lin_kk_results(num_RC=num_RC, weight_func=weight_func, num_RC_max=num_RC_max, n_jobs=n_jobs, executor=executor, representation=representation)
+        self.decade = []
+        for i in range(len(self.df)):
+            self.decade.append(np.log10(np.max(self.df[i].f))-np.log10(np.min(self.df[i].f))) #number of decades measured
+        self.Lin_KK_Fit = self.KK_results.fits #direct linear least-squares fits
+        self.t_const = self.KK_results.t_values #time constants values of the -(RC)- circuits
+        self.R_names = [fit.R_names for fit in self.KK_results.fits]
+        self.KK_R = self.KK_results.R_values
+        self.KK_R0 = []
+        self.KK_Rgreater = []
+        self.KK_Rminor = []
+        for i in range(len(self.df)):
+            self.KK_R0.extend(self.KK_R[i])
+            elements = KK_elements(self.Lin_KK_Fit[i], self.KK_results.representation[i]) #conductances for Y
+            self.KK_Rgreater.append(np.where(elements >= 0, elements, 0))
+            self.KK_Rminor.append(np.where(elements < 0, elements, 0))
+        self.KK_u = list(self.KK_results.mu)
+        if representation == 'both':
+            print('cycle || representation')
+            for i in range(len(self.df)):
+                print('['+str(i+1)+']'+'       '+self.KK_results.representation[i])
         if num_RC == 'auto':
             print('cycle || No. RC-elements ||   u')
-            self.decade = []
-            self.Rparam = []
-            self.t_const = []
-            self.Lin_KK_Fit = []
-            self.R_names = []
-            self.KK_R0 = []
-            self.KK_R = []
-            self.number_RC = []
-            self.number_RC_sort = []
-    
-            self.KK_u = []
-            self.KK_Rgreater = []
-            self.KK_Rminor = []
-            M = 2
+            self.number_RC = list(self.KK_results.M)
+            self.KK_M_search = self.KK_results.M_search #the explored mu(M) curve of each spectrum
+            self.KK_u_search = self.KK_results.u_search
             for i in range(len(self.df)):
-                self.decade.append(np.log10(np.max(self.df[i].f))-np.log10(np.min(self.df[i].f))) #determine the number of RC circuits based on the number of decades measured and num_RC
-                self.number_RC.append(M)
-                self.number_RC_sort.append(M) #needed for self.KK_R
-                self.Rparam.append(KK_Rnam_val(re=self.df[i].re, re_start=self.df[i].re.idxmin(), num_RC=int(self.number_RC[i]))[0]) #Creates intial guesses for R's
-                self.t_const.append(KK_timeconst(w=self.df[i].w, num_RC=int(self.number_RC[i]))) #Creates time constants values for self.number_RC -(RC)- circuits
-                
-                self.Lin_KK_Fit.append(minimize(KK_errorfunc, self.Rparam[i], method='leastsq', args=(self.df[i].w.values, self.df[i].re.values, self.df[i].im.values, self.number_RC[i], weight_func, self.t_const[i]) )) #maxfev=99
-                self.R_names.append(KK_Rnam_val(re=self.df[i].re, re_start=self.df[i].re.idxmin(), num_RC=int(self.number_RC[i]))[1]) #creates R names
-                for j in range(len(self.R_names[i])):
-                    self.KK_R0.append(self.Lin_KK_Fit[i].params.get(self.R_names[i][j]).value)
-            self.number_RC_sort.insert(0,0) #needed for self.KK_R
-            for i in range(len(self.df)):
-                self.KK_R.append(self.KK_R0[int(np.cumsum(self.number_RC_sort)[i]):int(np.cumsum(self.number_RC_sort)[i+1])]) #assigns resistances from each spectra to their respective df
-                self.KK_Rgreater.append(np.where(np.array(self.KK_R)[i] >= 0, np.array(self.KK_R)[i], 0) )
-                self.KK_Rminor.append(np.where(np.array(self.KK_R)[i] < 0, np.array(self.KK_R)[i], 0) )
-                self.KK_u.append(1-(np.abs(np.sum(self.KK_Rminor[i]))/np.abs(np.sum(self.KK_Rgreater[i]))))
-            
-            for i in range(len(self.df)):
-                while self.KK_u[i] <= 0.75 or self.KK_u[i] >= 0.88:
-                    self.number_RC_sort0 = []
-                    self.KK_R_lim = []
-                    self.number_RC[i] = self.number_RC[i] + 1
-                    self.number_RC_sort0.append(self.number_RC)
-                    self.number_RC_sort = np.insert(self.number_RC_sort0, 0,0)
-                    self.Rparam[i] = KK_Rnam_val(re=self.df[i].re, re_start=self.df[i].re.idxmin(), num_RC=int(self.number_RC[i]))[0] #Creates intial guesses for R's
-                    self.t_const[i] = KK_timeconst(w=self.df[i].w, num_RC=int(self.number_RC[i])) #Creates time constants values for self.number_RC -(RC)- circuits
-                    self.Lin_KK_Fit[i] = minimize(KK_errorfunc, self.Rparam[i], method='leastsq', args=(self.df[i].w.values, self.df[i].re.values, self.df[i].im.values, self.number_RC[i], weight_func, self.t_const[i]) ) #maxfev=99
-                    self.R_names[i] = KK_Rnam_val(re=self.df[i].re, re_start=self.df[i].re.idxmin(), num_RC=int(self.number_RC[i]))[1] #creates R names
-                    self.KK_R0 = np.delete(np.array(self.KK_R0), np.s_[0:len(self.KK_R0)])
-                    self.KK_R0 = []
-                    for q in range(len(self.df)):
-                        for j in range(len(self.R_names[q])):
-                            self.KK_R0.append(self.Lin_KK_Fit[q].params.get(self.R_names[q][j]).value)
-                    self.KK_R_lim = np.cumsum(self.number_RC_sort) #used for KK_R[i]
-    
-                    self.KK_R[i] = self.KK_R0[self.KK_R_lim[i]:self.KK_R_lim[i+1]] #assigns resistances from each spectra to their respective df
-                    self.KK_Rgreater[i] = np.where(np.array(self.KK_R[i]) >= 0, np.array(self.KK_R[i]), 0)
-                    self.KK_Rminor[i] = np.where(np.array(self.KK_R[i]) < 0, np.array(self.KK_R[i]), 0)
-                    self.KK_u[i] = 1-(np.abs(np.sum(self.KK_Rminor[i]))/np.abs(np.sum(self.KK_Rgreater[i])))
-                else:
+                if 0.75 < self.KK_u[i] < 0.88:
                     print('['+str(i+1)+']'+'            '+str(self.number_RC[i]),'           '+str(np.round(self.KK_u[i],2)))
-
-        elif num_RC != 'auto': #hardwired number of RC-elements/decade
+                else:
+                    print('['+str(i+1)+']'+'            '+str(self.number_RC[i]),'           '+str(np.round(self.KK_u[i],2)), '  (u not in [0.75, 0.88] for num_RC <= '+str(num_RC_max)+')')
+        else: #hardwired number of RC-elements/decade
             print('cycle ||   u')
-            self.decade = []
-            self.number_RC0 = []
-            self.number_RC = []
-            self.Rparam = []
-            self.t_const = []
-            self.Lin_KK_Fit = []
-            self.R_names = []
-            self.KK_R0 = []
-            self.KK_R = []
-            for i in range(len(self.df)):
-                self.decade.append(np.log10(np.max(self.df[i].f))-np.log10(np.min(self.df[i].f))) #determine the number of RC circuits based on the number of decades measured and num_RC
-                self.number_RC0.append(np.round(num_RC * self.decade[i]))
-                self.number_RC.append(np.round(num_RC * self.decade[i])) #Creats the the number of -(RC)- circuits
-                self.Rparam.append(KK_Rnam_val(re=self.df[i].re, re_start=self.df[i].re.idxmin(), num_RC=int(self.number_RC0[i]))[0]) #Creates intial guesses for R's
-                self.t_const.append(KK_timeconst(w=self.df[i].w, num_RC=int(self.number_RC0[i]))) #Creates time constants values for self.number_RC -(RC)- circuits
-                self.Lin_KK_Fit.append(minimize(KK_errorfunc, self.Rparam[i], method='leastsq', args=(self.df[i].w.values, self.df[i].re.values, self.df[i].im.values, self.number_RC0[i], weight_func, self.t_const[i]) )) #maxfev=99
-                self.R_names.append(KK_Rnam_val(re=self.df[i].re, re_start=self.df[i].re.idxmin(), num_RC=int(self.number_RC0[i]))[1]) #creates R names            
-                for j in range(len(self.R_names[i])):
-                    self.KK_R0.append(self.Lin_KK_Fit[i].params.get(self.R_names[i][j]).value)
-            self.number_RC0.insert(0,0)
-    
-    #        print(report_fit(self.Lin_KK_Fit[i])) # prints fitting report
-    
-            self.KK_circuit_fit = []
-            self.KK_rr_re = []
-            self.KK_rr_im = []
-            self.KK_Rgreater = []
-            self.KK_Rminor = []
-            self.KK_u = []
+            self.number_RC = [np.round(num_RC * self.decade[i]) for i in range(len(self.df))] #Creats the the number of -(RC)- circuits
+            self.number_RC0 = [0] + self.number_RC
             for i in range(len(self.df)):
-                self.KK_R.append(self.KK_R0[int(np.cumsum(self.number_RC0)[i]):int(np.cumsum(self.number_RC0)[i+1])]) #assigns resistances from each spectra to their respective df
-                self.KK_Rx = np.array(self.KK_R)
-                self.KK_Rgreater.append(np.where(self.KK_Rx[i] >= 0, self.KK_Rx[i], 0) )
-                self.KK_Rminor.append(np.where(self.KK_Rx[i] < 0, self.KK_Rx[i], 0) )
-                self.KK_u.append(1-(np.abs(np.sum(self.KK_Rminor[i]))/np.abs(np.sum(self.KK_Rgreater[i])))) #currently gives incorrect values
                 print('['+str(i+1)+']'+'       '+str(np.round(self.KK_u[i],2)))
-        else:
-            print('num_RC incorrectly defined')
 
-        self.KK_circuit_fit = []
+        self.KK_circuit_fit = self.KK_results.Z_fit
         self.KK_rr_re = []
         self.KK_rr_im = []
         for i in range(len(self.df)):
-            if int(self.number_RC[i]) == 2:
-                self.KK_circuit_fit.append(KK_RC2(w=self.df[i].w, Rs=self.Lin_KK_Fit[i].params.get('Rs').value, R_values=self.KK_R[i], t_values=self.t_const[i]))
-            elif int(self.number_RC[i]) == 3:
-                self.KK_circuit_fit.append(KK_RC3(w=self.df[i].w, Rs=self.Lin_KK_Fit[i].params.get('Rs').value, R_values=self.KK_R[i], t_values=self.t_const[i]))
-            elif int(self.number_RC[i]) == 4:
-                self.KK_circuit_fit.append(KK_RC4(w=self.df[i].w, Rs=self.Lin_KK_Fit[i].params.get('Rs').value, R_values=self.KK_R[i], t_values=self.t_const[i]))
-            elif int(self.number_RC[i]) == 5:
-                self.KK_circuit_fit.append(KK_RC5(w=self.df[i].w, Rs=self.Lin_KK_Fit[i].params.get('Rs').value, R_values=self.KK_R[i], t_values=self.t_const[i]))
-            elif int(self.number_RC[i]) == 6:
-                self.KK_circuit_fit.append(KK_RC6(w=self.df[i].w, Rs=self.Lin_KK_Fit[i].params.get('Rs').value, R_values=self.KK_R[i], t_values=self.t_const[i]))
-            elif int(self.number_RC[i]) == 7:
-                self.KK_circuit_fit.append(KK_RC7(w=self.df[i].w, Rs=self.Lin_KK_Fit[i].params.get('Rs').value, R_values=self.KK_R[i], t_values=self.t_const[i]))
-            elif int(self.number_RC[i]) == 8:
-                self.KK_circuit_fit.append(KK_RC8(w=self.df[i].w, Rs=self.Lin_KK_Fit[i].params.get('Rs').value, R_values=self.KK_R[i], t_values=self.t_const[i]))
-            elif int(self.number_RC[i]) == 9:
-                self.KK_circuit_fit.append(KK_RC9(w=self.df[i].w, Rs=self.Lin_KK_Fit[i].params.get('Rs').value, R_values=self.KK_R[i], t_values=self.t_const[i]))
-            elif int(self.number_RC[i]) == 10:
-                self.KK_circuit_fit.append(KK_RC10(w=self.df[i].w, Rs=self.Lin_KK_Fit[i].params.get('Rs').value, R_values=self.KK_R[i], t_values=self.t_const[i]))
-            elif int(self.number_RC[i]) == 11:
-                self.KK_circuit_fit.append(KK_RC11(w=self.df[i].w, Rs=self.Lin_KK_Fit[i].params.get('Rs').value, R_values=self.KK_R[i], t_values=self.t_const[i]))
-            elif int(self.number_RC[i]) == 12:
-                self.KK_circuit_fit.append(KK_RC12(w=self.df[i].w, Rs=self.Lin_KK_Fit[i].params.get('Rs').value, R_values=self.KK_R[i], t_values=self.t_const[i]))
-            elif int(self.number_RC[i]) == 13:
-                self.KK_circuit_fit.append(KK_RC13(w=self.df[i].w, Rs=self.Lin_KK_Fit[i].params.get('Rs').value, R_values=self.KK_R[i], t_values=self.t_const[i]))
-            elif int(self.number_RC[i]) == 14:
-                self.KK_circuit_fit.append(KK_RC14(w=self.df[i].w, Rs=self.Lin_KK_Fit[i].params.get('Rs').value, R_values=self.KK_R[i], t_values=self.t_const[i]))
-            elif int(self.number_RC[i]) == 15:
-                self.KK_circuit_fit.append(KK_RC15(w=self.df[i].w, Rs=self.Lin_KK_Fit[i].params.get('Rs').value, R_values=self.KK_R[i], t_values=self.t_const[i]))
-            elif int(self.number_RC[i]) == 16:
-                self.KK_circuit_fit.append(KK_RC16(w=self.df[i].w, Rs=self.Lin_KK_Fit[i].params.get('Rs').value, R_values=self.KK_R[i], t_values=self.t_const[i]))
-            elif int(self.number_RC[i]) == 17:
-                self.KK_circuit_fit.append(KK_RC17(w=self.df[i].w, Rs=self.Lin_KK_Fit[i].params.get('Rs').value, R_values=self.KK_R[i], t_values=self.t_const[i]))
-            elif int(self.number_RC[i]) == 18:
-                self.KK_circuit_fit.append(KK_RC18(w=self.df[i].w, Rs=self.Lin_KK_Fit[i].params.get('Rs').value, R_values=self.KK_R[i], t_values=self.t_const[i]))
-            elif int(self.number_RC[i]) == 19:
-                self.KK_circuit_fit.append(KK_RC19(w=self.df[i].w, Rs=self.Lin_KK_Fit[i].params.get('Rs').value, R_values=self.KK_R[i], t_values=self.t_const[i]))
-            elif int(self.number_RC[i]) == 20:
-                self.KK_circuit_fit.append(KK_RC20(w=self.df[i].w, Rs=self.Lin_KK_Fit[i].params.get('Rs').value, R_values=self.KK_R[i], t_values=self.t_const[i]))
-            elif int(self.number_RC[i]) == 21:
-                self.KK_circuit_fit.append(KK_RC21(w=self.df[i].w, Rs=self.Lin_KK_Fit[i].params.get('Rs').value, R_values=self.KK_R[i], t_values=self.t_const[i]))
-            elif int(self.number_RC[i]) == 22:
-                self.KK_circuit_fit.append(KK_RC22(w=self.df[i].w, Rs=self.Lin_KK_Fit[i].params.get('Rs').value, R_values=self.KK_R[i], t_values=self.t_const[i]))
-            elif int(self.number_RC[i]) == 23:
-                self.KK_circuit_fit.append(KK_RC23(w=self.df[i].w, Rs=self.Lin_KK_Fit[i].params.get('Rs').value, R_values=self.KK_R[i], t_values=self.t_const[i]))
-            elif int(self.number_RC[i]) == 24:
-                self.KK_circuit_fit.append(KK_RC24(w=self.df[i].w, Rs=self.Lin_KK_Fit[i].params.get('Rs').value, R_values=self.KK_R[i], t_values=self.t_const[i]))
-            elif int(self.number_RC[i]) == 25:
-                self.KK_circuit_fit.append(KK_RC25(w=self.df[i].w, Rs=self.Lin_KK_Fit[i].params.get('Rs').value, R_values=self.KK_R[i], t_values=self.t_const[i]))
-            elif int(self.number_RC[i]) == 26:
-                self.KK_circuit_fit.append(KK_RC26(w=self.df[i].w, Rs=self.Lin_KK_Fit[i].params.get('Rs').value, R_values=self.KK_R[i], t_values=self.t_const[i]))
-            elif int(self.number_RC[i]) == 27:
-                self.KK_circuit_fit.append(KK_RC27(w=self.df[i].w, Rs=self.Lin_KK_Fit[i].params.get('Rs').value, R_values=self.KK_R[i], t_values=self.t_const[i]))
-            elif int(self.number_RC[i]) == 28:
-                self.KK_circuit_fit.append(KK_RC28(w=self.df[i].w, Rs=self.Lin_KK_Fit[i].params.get('Rs').value, R_values=self.KK_R[i], t_values=self.t_const[i]))
-            elif int(self.number_RC[i]) == 29:
-                self.KK_circuit_fit.append(KK_RC29(w=self.df[i].w, Rs=self.Lin_KK_Fit[i].params.get('Rs').value, R_values=self.KK_R[i], t_values=self.t_const[i]))
-            elif int(self.number_RC[i]) == 30:
-                self.KK_circuit_fit.append(KK_RC30(w=self.df[i].w, Rs=self.Lin_KK_Fit[i].params.get('Rs').value, R_values=self.KK_R[i], t_values=self.t_const[i]))
-            elif int(self.number_RC[i]) == 31:
-                self.KK_circuit_fit.append(KK_RC31(w=self.df[i].w, Rs=self.Lin_KK_Fit[i].params.get('Rs').value, R_values=self.KK_R[i], t_values=self.t_const[i]))
-            elif int(self.number_RC[i]) == 32:
-                self.KK_circuit_fit.append(KK_RC32(w=self.df[i].w, Rs=self.Lin_KK_Fit[i].params.get('Rs').value, R_values=self.KK_R[i], t_values=self.t_const[i]))
-            elif int(self.number_RC[i]) == 33:
-                self.KK_circuit_fit.append(KK_RC33(w=self.df[i].w, Rs=self.Lin_KK_Fit[i].params.get('Rs').value, R_values=self.KK_R[i], t_values=self.t_const[i]))
-            elif int(self.number_RC[i]) == 34:
-                self.KK_circuit_fit.append(KK_RC34(w=self.df[i].w, Rs=self.Lin_KK_Fit[i].params.get('Rs').value, R_values=self.KK_R[i], t_values=self.t_const[i]))
-            elif int(self.number_RC[i]) == 35:
-                self.KK_circuit_fit.append(KK_RC35(w=self.df[i].w, Rs=self.Lin_KK_Fit[i].params.get('Rs').value, R_values=self.KK_R[i], t_values=self.t_const[i]))
-            elif int(self.number_RC[i]) == 36:
-                self.KK_circuit_fit.append(KK_RC36(w=self.df[i].w, Rs=self.Lin_KK_Fit[i].params.get('Rs').value, R_values=self.KK_R[i], t_values=self.t_const[i]))
-            elif int(self.number_RC[i]) == 37:
-                self.KK_circuit_fit.append(KK_RC37(w=self.df[i].w, Rs=self.Lin_KK_Fit[i].params.get('Rs').value, R_values=self.KK_R[i], t_values=self.t_const[i]))
-            elif int(self.number_RC[i]) == 38:
-                self.KK_circuit_fit.append(KK_RC38(w=self.df[i].w, Rs=self.Lin_KK_Fit[i].params.get('Rs').value, R_values=self.KK_R[i], t_values=self.t_const[i]))
-            elif int(self.number_RC[i]) == 39:
-                self.KK_circuit_fit.append(KK_RC39(w=self.df[i].w, Rs=self.Lin_KK_Fit[i].params.get('Rs').value, R_values=self.KK_R[i], t_values=self.t_const[i]))
-            elif int(self.number_RC[i]) == 40:
-                self.KK_circuit_fit.append(KK_RC40(w=self.df[i].w, Rs=self.Lin_KK_Fit[i].params.get('Rs').value, R_values=self.KK_R[i], t_values=self.t_const[i]))
-            elif int(self.number_RC[i]) == 41:
-                self.KK_circuit_fit.append(KK_RC41(w=self.df[i].w, Rs=self.Lin_KK_Fit[i].params.get('Rs').value, R_values=self.KK_R[i], t_values=self.t_const[i]))
-            elif int(self.number_RC[i]) == 42:
-                self.KK_circuit_fit.append(KK_RC42(w=self.df[i].w, Rs=self.Lin_KK_Fit[i].params.get('Rs').value, R_values=self.KK_R[i], t_values=self.t_const[i]))
-            elif int(self.number_RC[i]) == 43:
-                self.KK_circuit_fit.append(KK_RC43(w=self.df[i].w, Rs=self.Lin_KK_Fit[i].params.get('Rs').value, R_values=self.KK_R[i], t_values=self.t_const[i]))
-            elif int(self.number_RC[i]) == 44:
-                self.KK_circuit_fit.append(KK_RC44(w=self.df[i].w, Rs=self.Lin_KK_Fit[i].params.get('Rs').value, R_values=self.KK_R[i], t_values=self.t_const[i]))
-            elif int(self.number_RC[i]) == 45:
-                self.KK_circuit_fit.append(KK_RC45(w=self.df[i].w, Rs=self.Lin_KK_Fit[i].params.get('Rs').value, R_values=self.KK_R[i], t_values=self.t_const[i]))
-            elif int(self.number_RC[i]) == 46:
-                self.KK_circuit_fit.append(KK_RC46(w=self.df[i].w, Rs=self.Lin_KK_Fit[i].params.get('Rs').value, R_values=self.KK_R[i], t_values=self.t_const[i]))
-            elif int(self.number_RC[i]) == 47:
-                self.KK_circuit_fit.append(KK_RC47(w=self.df[i].w, Rs=self.Lin_KK_Fit[i].params.get('Rs').value, R_values=self.KK_R[i], t_values=self.t_const[i]))
-            elif int(self.number_RC[i]) == 48:
-                self.KK_circuit_fit.append(KK_RC48(w=self.df[i].w, Rs=self.Lin_KK_Fit[i].params.get('Rs').value, R_values=self.KK_R[i], t_values=self.t_const[i]))
-            elif int(self.number_RC[i]) == 49:
-                self.KK_circuit_fit.append(KK_RC49(w=self.df[i].w, Rs=self.Lin_KK_Fit[i].params.get('Rs').value, R_values=self.KK_R[i], t_values=self.t_const[i]))
-            elif int(self.number_RC[i]) == 50:
-                self.KK_circuit_fit.append(KK_RC50(w=self.df[i].w, Rs=self.Lin_KK_Fit[i].params.get('Rs').value, R_values=self.KK_R[i], t_values=self.t_const[i]))
-            elif int(self.number_RC[i]) == 51:
-                self.KK_circuit_fit.append(KK_RC51(w=self.df[i].w, Rs=self.Lin_KK_Fit[i].params.get('Rs').value, R_values=self.KK_R[i], t_values=self.t_const[i]))
-            elif int(self.number_RC[i]) == 52:
-                self.KK_circuit_fit.append(KK_RC52(w=self.df[i].w, Rs=self.Lin_KK_Fit[i].params.get('Rs').value, R_values=self.KK_R[i], t_values=self.t_const[i]))
-            elif int(self.number_RC[i]) == 53:
-                self.KK_circuit_fit.append(KK_RC53(w=self.df[i].w, Rs=self.Lin_KK_Fit[i].params.get('Rs').value, R_values=self.KK_R[i], t_values=self.t_const[i]))
-            elif int(self.number_RC[i]) == 54:
-                self.KK_circuit_fit.append(KK_RC54(w=self.df[i].w, Rs=self.Lin_KK_Fit[i].params.get('Rs').value, R_values=self.KK_R[i], t_values=self.t_const[i]))
-            elif int(self.number_RC[i]) == 55:
-                self.KK_circuit_fit.append(KK_RC55(w=self.df[i].w, Rs=self.Lin_KK_Fit[i].params.get('Rs').value, R_values=self.KK_R[i], t_values=self.t_const[i]))
-            elif int(self.number_RC[i]) == 56:
-                self.KK_circuit_fit.append(KK_RC56(w=self.df[i].w, Rs=self.Lin_KK_Fit[i].params.get('Rs').value, R_values=self.KK_R[i], t_values=self.t_const[i]))
-            elif int(self.number_RC[i]) == 57:
-                self.KK_circuit_fit.append(KK_RC57(w=self.df[i].w, Rs=self.Lin_KK_Fit[i].params.get('Rs').value, R_values=self.KK_R[i], t_values=self.t_const[i]))
-            elif int(self.number_RC[i]) == 58:
-                self.KK_circuit_fit.append(KK_RC58(w=self.df[i].w, Rs=self.Lin_KK_Fit[i].params.get('Rs').value, R_values=self.KK_R[i], t_values=self.t_const[i]))
-            elif int(self.number_RC[i]) == 59:
-                self.KK_circuit_fit.append(KK_RC59(w=self.df[i].w, Rs=self.Lin_KK_Fit[i].params.get('Rs').value, R_values=self.KK_R[i], t_values=self.t_const[i]))
-            elif int(self.number_RC[i]) == 60:
-                self.KK_circuit_fit.append(KK_RC60(w=self.df[i].w, Rs=self.Lin_KK_Fit[i].params.get('Rs').value, R_values=self.KK_R[i], t_values=self.t_const[i]))
-            elif int(self.number_RC[i]) == 61:
-                self.KK_circuit_fit.append(KK_RC61(w=self.df[i].w, Rs=self.Lin_KK_Fit[i].params.get('Rs').value, R_values=self.KK_R[i], t_values=self.t_const[i]))
-            elif int(self.number_RC[i]) == 62:
-                self.KK_circuit_fit.append(KK_RC62(w=self.df[i].w, Rs=self.Lin_KK_Fit[i].params.get('Rs').value, R_values=self.KK_R[i], t_values=self.t_const[i]))
-            elif int(self.number_RC[i]) == 63:
-                self.KK_circuit_fit.append(KK_RC63(w=self.df[i].w, Rs=self.Lin_KK_Fit[i].params.get('Rs').value, R_values=self.KK_R[i], t_values=self.t_const[i]))
-            elif int(self.number_RC[i]) == 64:
-                self.KK_circuit_fit.append(KK_RC64(w=self.df[i].w, Rs=self.Lin_KK_Fit[i].params.get('Rs').value, R_values=self.KK_R[i], t_values=self.t_const[i]))
-            elif int(self.number_RC[i]) == 65:
-                self.KK_circuit_fit.append(KK_RC65(w=self.df[i].w, Rs=self.Lin_KK_Fit[i].params.get('Rs').value, R_values=self.KK_R[i], t_values=self.t_const[i]))
-            elif int(self.number_RC[i]) == 66:
-                self.KK_circuit_fit.append(KK_RC66(w=self.df[i].w, Rs=self.Lin_KK_Fit[i].params.get('Rs').value, R_values=self.KK_R[i], t_values=self.t_const[i]))
-            elif int(self.number_RC[i]) == 67:
-                self.KK_circuit_fit.append(KK_RC67(w=self.df[i].w, Rs=self.Lin_KK_Fit[i].params.get('Rs').value, R_values=self.KK_R[i], t_values=self.t_const[i]))
-            elif int(self.number_RC[i]) == 68:
-                self.KK_circuit_fit.append(KK_RC68(w=self.df[i].w, Rs=self.Lin_KK_Fit[i].params.get('Rs').value, R_values=self.KK_R[i], t_values=self.t_const[i]))
-            elif int(self.number_RC[i]) == 69:
-                self.KK_circuit_fit.append(KK_RC69(w=self.df[i].w, Rs=self.Lin_KK_Fit[i].params.get('Rs').value, R_values=self.KK_R[i], t_values=self.t_const[i]))
-            elif int(self.number_RC[i]) == 70:
-                self.KK_circuit_fit.append(KK_RC70(w=self.df[i].w, Rs=self.Lin_KK_Fit[i].params.get('Rs').value, R_values=self.KK_R[i], t_values=self.t_const[i]))
-            elif int(self.number_RC[i]) == 71:
-                self.KK_circuit_fit.append(KK_RC71(w=self.df[i].w, Rs=self.Lin_KK_Fit[i].params.get('Rs').value, R_values=self.KK_R[i], t_values=self.t_const[i]))
-            elif int(self.number_RC[i]) == 72:
-                self.KK_circuit_fit.append(KK_RC72(w=self.df[i].w, Rs=self.Lin_KK_Fit[i].params.get('Rs').value, R_values=self.KK_R[i], t_values=self.t_const[i]))
-            elif int(self.number_RC[i]) == 73:
-                self.KK_circuit_fit.append(KK_RC73(w=self.df[i].w, Rs=self.Lin_KK_Fit[i].params.get('Rs').value, R_values=self.KK_R[i], t_values=self.t_const[i]))
-            elif int(self.number_RC[i]) == 74:
-                self.KK_circuit_fit.append(KK_RC74(w=self.df[i].w, Rs=self.Lin_KK_Fit[i].params.get('Rs').value, R_values=self.KK_R[i], t_values=self.t_const[i]))
-            elif int(self.number_RC[i]) == 75:
-                self.KK_circuit_fit.append(KK_RC75(w=self.df[i].w, Rs=self.Lin_KK_Fit[i].params.get('Rs').value, R_values=self.KK_R[i], t_values=self.t_const[i]))
-            elif int(self.number_RC[i]) == 76:
-                self.KK_circuit_fit.append(KK_RC76(w=self.df[i].w, Rs=self.Lin_KK_Fit[i].params.get('Rs').value, R_values=self.KK_R[i], t_values=self.t_const[i]))
-            elif int(self.number_RC[i]) == 77:
-                self.KK_circuit_fit.append(KK_RC77(w=self.df[i].w, Rs=self.Lin_KK_Fit[i].params.get('Rs').value, R_values=self.KK_R[i], t_values=self.t_const[i]))
-            elif int(self.number_RC[i]) == 78:
-                self.KK_circuit_fit.append(KK_RC78(w=self.df[i].w, Rs=self.Lin_KK_Fit[i].params.get('Rs').value, R_values=self.KK_R[i], t_values=self.t_const[i]))
-            elif int(self.number_RC[i]) == 79:
-                self.KK_circuit_fit.append(KK_RC79(w=self.df[i].w, Rs=self.Lin_KK_Fit[i].params.get('Rs').value, R_values=self.KK_R[i], t_values=self.t_const[i]))
-            elif int(self.number_RC[i]) == 80:
-                self.KK_circuit_fit.append(KK_RC80(w=self.df[i].w, Rs=self.Lin_KK_Fit[i].params.get('Rs').value, R_values=self.KK_R[i], t_values=self.t_const[i]))
-            else:
-                print('RC simulation circuit not defined')
-                print('   Number of RC = ', self.number_RC)
+            if self.KK_results.representation[i] == 'Y': #relative residuals of the admittance
+                self.KK_rr_re.append(pd.Series(self.KK_results.residual_real[i], index=self.df[i].index))
+                self.KK_rr_im.append(pd.Series(self.KK_results.residual_imag[i], index=self.df[i].index))
+                continue
             self.KK_rr_re.append(residual_real(re=self.df[i].re, fit_re=self.KK_circuit_fit[i].real, fit_im=-self.KK_circuit_fit[i].imag)) #relative residuals for the real part
             self.KK_rr_im.append(residual_imag(im=self.df[i].im, fit_re=self.KK_circuit_fit[i].real, fit_im=-self.KK_circuit_fit[i].imag)) #relative residuals for the imag part
 
@@ -3973,7 +3610,7 @@ class EIS_exp:
             else:
                 print('Too many spectras, cannot plot all. Maximum spectras allowed = 9')
 
-    def EIS_fit(self, params, circuit, weight_func='modulus', nan_policy='raise'):
+    def EIS_fit(self, params, circuit, weight_func='modulus', nan_policy='raise', jacobian='analytic'):
         '''
         EIS_fit() fits experimental data to an equivalent circuit model using complex non-linear least-squares (CNLS) fitting procedure and allows for batch fitting.
         
@@ -4003,6 +3640,7 @@ class EIS_exp:
             - R-RQ-TL
             - R-TL1Dsolid (reactive interface with 1D solid-state diffusion)
             - R-RQ-TL1Dsolid
+          or a circuit built from Series() and Parallel(), e.g. Series(R('Rs'), Parallel(R('R'), Q('Q','n'))), see PyEIS_Circuit_builder.py
 
         - weight_func
           The weight function to which the CNLS fitting is performed
@@ -4015,6 +3653,11 @@ class EIS_exp:
             - ‘raise’ = raise a value error (default)
             - ‘propagate’ = do nothing
             - ‘omit’ = drops missing data
+
+        - jacobian
+        How the Jacobian of the CNLS fitting is found
+            - 'analytic' = analytic derivatives of the circuit, see PyEIS_Jacobian.py (default)
+            - 'numerical' = finite differences
         
         Returns
         ------------
@@ -4023,8 +3666,10 @@ class EIS_exp:
         self.Fit = []
         self.circuit_fit = []
         self.fit_E = []
+        circuit_eval = compile_circuit(circuit, tuple(params.keys()))
+        Dfun = leastsq_Dfun(circuit_eval, params, jacobian=jacobian, nan_policy=nan_policy)
         for i in range(len(self.df)):
-            self.Fit.append(minimize(leastsq_errorfunc, params, method='leastsq', args=(self.df[i].w.values, self.df[i].re.values, self.df[i].im.values, circuit, weight_func), nan_policy=nan_policy, maxfev=9999990))
+            self.Fit.append(minimize(leastsq_errorfunc, params, method='leastsq', args=(self.w_grid[i], self.df[i].re.values, self.df[i].im.values, circuit_eval, weight_func, leastsq_buffer(Dfun, len(self.w_grid[i]))), nan_policy=nan_policy, maxfev=9999990, Dfun=Dfun))
             print(report_fit(self.Fit[i]))
             
             self.fit_E.append(np.average(self.df[i].E_avg))
@@ -4612,6 +4257,13 @@ class EIS_exp:
                     self.fit_Rb.append(self.Fit[i].params.get('Rb').value)                    
                     self.fit_Qb.append(self.Fit[i].params.get('Qb').value)
                     self.fit_nb.append(self.Fit[i].params.get('nb').value)
+        elif isinstance(circuit, circuit_node):
+            for name in circuit_eval.param_names:
+                setattr(self, 'fit_'+name, [])
+            for i in range(len(self.df)):
+                self.circuit_fit.append(circuit_eval(self.Fit[i].params.valuesdict(), self.df[i].w.values))
+                for name in circuit_eval.param_names:
+                    getattr(self, 'fit_'+name).append(self.Fit[i].params.get(name).value)
         else:
             print('Circuit was not properly defined, see details described in definition')
 
@@ -5043,7 +4695,7 @@ class EIS_sim:
     '''
     def __init__(self, circuit, frange, bode='off', nyq_xlim='none', nyq_ylim='none', legend='on', savefig='none'):
         self.f = frange
-        self.w = 2*np.pi*frange
+        self.w = freq_grid(2*np.pi*frange)
         self.re = circuit.real
         self.im = -circuit.imag
 
@@ -5125,7 +4777,7 @@ class EIS_sim:
             fig.savefig(savefig) #saves figure if fix text is given
 
         
-    def EIS_sim_fit(self, params, circuit, weight_func='modulus', nan_policy='raise', bode='on', nyq_xlim='none', nyq_ylim='none', legend='on', savefig='none'):
+    def EIS_sim_fit(self, params, circuit, weight_func='modulus', nan_policy='raise', jacobian='analytic', bode='on', nyq_xlim='none', nyq_ylim='none', legend='on', savefig='none'):
         '''
         This function fits simulations with a selected circuit. This function is mainly used to test fitting functions prior to being used on experimental data
         
@@ -5154,11 +4806,16 @@ class EIS_sim:
             - R-RQ-TL
             - R-TL1Dsolid (reactive interface with 1D solid-state diffusion)
             - R-RQ-TL1Dsolid
+          or a circuit built from Series() and Parallel(), e.g. Series(R('Rs'), Parallel(R('R'), Q('Q','n'))), see PyEIS_Circuit_builder.py
 
         - weight_func = Weight function, Three options:
             - modulus (default)
             - unity
             - proportional
+
+        - jacobian = Jacobian of the CNLS fitting:
+            - analytic (default)
+            - numerical = finite differences
                 
         - nyq_xlim/nyq_xlim: x/y-axis on nyquist plot, if not equal to 'none' state [min,max] value
         
@@ -5179,7 +4836,9 @@ class EIS_sim:
         ------------
         The fitted impedance spectra(s) but also the fitted parameters that were used in the initial guesses. To call these use e.g. self.fit_Rs
         '''
-        self.Fit = minimize(leastsq_errorfunc, params, method='leastsq', args=(self.w, self.re, self.im, circuit, weight_func), maxfev=9999990, nan_policy=nan_policy)
+        circuit_eval = compile_circuit(circuit, tuple(params.keys()))
+        Dfun = leastsq_Dfun(circuit_eval, params, jacobian=jacobian, nan_policy=nan_policy)
+        self.Fit = minimize(leastsq_errorfunc, params, method='leastsq', args=(self.w, self.re, self.im, circuit_eval, weight_func, leastsq_buffer(Dfun, len(self.w))), maxfev=9999990, nan_policy=nan_policy, Dfun=Dfun)
         print(report_fit(self.Fit))
 
         if circuit == 'C':
@@ -5937,6 +5596,10 @@ class EIS_sim:
                 self.fit_Re.append(self.Fit.params.get('Re').value)
                 self.fit_fsb.append(self.Fit.params.get('fsb').value)
                 self.fit_Ce.append(self.Fit.params.get('Ce').value)  
+        elif isinstance(circuit, circuit_node):
+            self.circuit_fit = circuit_eval(self.Fit.params.valuesdict(), self.w)
+            for name in circuit_eval.param_names:
+                setattr(self, 'fit_'+name, [self.Fit.params.get(name).value])
         else:
             print('Circuit is not properly defined, see details described in definition')
 
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+This script contains the optional Numba backend of the circuit builder and the linear Kramers-Kronig RC sum
+
+For small spectra (50-100 frequencies), the evaluation of a circuit is dominated by the call overhead of the many small numpy
+operations, one per term of the circuit. With the 'numba' backend, compile_tree() fuses the R, C, L, Q, Warburg, and transmission
+line terms of a circuit into a single JIT-compiled loop over the frequencies, and KK_RC_sum() evaluates the Lin-KK RC sum in a
+compiled double loop. Numba is not a dependency of PyEIS; if it is not installed, the 'numpy' backend is used.
+
+The backend is selected globally with set_backend() or per call with the backend argument, e.g. compile_tree(tree, backend='numba')
+"""
+import cmath
+import math
+import numpy as np
+from .PyEIS_Hyperbolic import asymptotic_limit
+
+try:
+    import numba
+    numba_available = True
+except ImportError:
+    numba = None
+    numba_available = False
+
+__all__ = ['numba_available', 'backends', 'set_backend', 'get_backend', 'resolve_backend', 'KK_RC_sum']
+
+backends = ('numpy', 'numba')
+_backend = 'numpy'
+
+def set_backend(backend):
+    '''
+    Sets the default backend of compile_tree() and KK_RC_sum()
+
+    Inputs
+    ----------
+    backend = 'numpy' (default) or 'numba'. If numba is not installed, 'numpy' is used
+    '''
+    global _backend
+    if backend not in backends:
+        raise ValueError("backend must be one of "+', '.join(repr(name) for name in backends)+", not "+repr(backend))
+    _backend = backend
+
+def get_backend():
+    '''
+    Returns the default backend set by set_backend()
+    '''
+    return _backend
+
+def resolve_backend(backend='default'):
+    '''
+    Returns the backend to use, i.e. the default backend for backend='default', and 'numpy' if numba is requested but not installed
+    '''
+    if backend == 'default':
+        backend = _backend
+    if backend not in backends:
+        raise ValueError("backend must be 'default' or one of "+', '.join(repr(name) for name in backends)+", not "+repr(backend))
+    if backend == 'numba' and not numba_available:
+        return 'numpy'
+    return backend
+
+def jit(function):
+    '''
+    Compiles a function with numba.njit(), or returns None if numba is not installed
+    '''
+    if not numba_available:
+        return None
+    return numba.njit(cache=False)(function)
+
+### Scalar kernels
+##
+#
+def _expm1(z):
+    #complex exp(z) - 1, accurate for small |z|, as cmath has no expm1()
+    sin_half = math.sin(z.imag/2)
+    return complex(math.expm1(z.real)*math.cos(z.imag) - 2*sin_half*sin_half, math.exp(z.real)*math.sin(z.imag))
+
+def scalar_jw(w):
+    return 1j*w
+
+def scalar_jw_pow(w, n):
+    return cmath.exp(n*complex(math.log(w), math.pi/2))
+
+def scalar_sqrt_jw(w):
+    return cmath.sqrt(1j*w)
+
+def scalar_coth(x):
+    '''
+    coth(x) of a complex scalar, see PyEIS_Hyperbolic.coth()
+    '''
+    sign = 1.0
+    if x.real < 0:
+        x = -x
+        sign = -1.0
+    if x.real > asymptotic_limit:
+        return complex(sign, 0.0)
+    em1 = _expm1(-2*x)
+    return -sign*(2 + em1)/em1
+
+def scalar_csch(x):
+    '''
+    csch(x) of a complex scalar, see PyEIS_Hyperbolic.csch()
+    '''
+    sign = 1.0
+    if x.real < 0:
+        x = -x
+        sign = -1.0
+    if x.real > asymptotic_limit:
+        return sign*2*cmath.exp(-x)
+    return -sign*2*cmath.exp(-x)/_expm1(-2*x)
+
+if numba_available:
+    _expm1 = jit(_expm1)
+    scalar_jw = jit(scalar_jw)
+    scalar_jw_pow = jit(scalar_jw_pow)
+    scalar_sqrt_jw = jit(scalar_sqrt_jw)
+    scalar_coth = jit(scalar_coth)
+    scalar_csch = jit(scalar_csch)
+
+### Linear Kramers-Kronig RC sum
+##
+#
+def _KK_RC_sum_numpy(w, Rs, R_values, t_values):
+    return Rs + (1/(1 + 1j*np.multiply.outer(w, t_values))) @ R_values
+
+def _KK_RC_sum_loop(w, Rs, R_values, t_values):
+    Z = np.empty(w.shape[0], dtype=np.complex128)
+    for i in range(w.shape[0]):
+        Z_i = complex(Rs, 0.0)
+        for k in range(t_values.shape[0]):
+            Z_i += R_values[k]/(1 + 1j*w[i]*t_values[k])
+        Z[i] = Z_i
+    return Z
+
+_KK_RC_sum_numba = jit(_KK_RC_sum_loop)
+
+def KK_RC_sum(w, Rs, R_values, t_values, backend='default'):
+    '''
+    Impedance of the Lin-KK circuit, Z = Rs + sum_k R_k/(1 + jw*t_k)
+
+    Inputs
+    ----------
+    w = angular frequency [1/s]
+    Rs = series resistance [ohm]
+    R_values = resistances of the -RC- elements [ohm]
+    t_values = time constants of the -RC- elements [s]
+    backend = 'default', 'numpy', or 'numba', see set_backend()
+    '''
+    w = np.asarray(w, dtype=float)
+    R_values = np.asarray(R_values, dtype=float)
+    t_values = np.asarray(t_values, dtype=float)
+    if resolve_backend(backend) == 'numba' and w.ndim == 1:
+        return _KK_RC_sum_numba(w, float(Rs), R_values, t_values)
+    return _KK_RC_sum_numpy(w, Rs, R_values, t_values)
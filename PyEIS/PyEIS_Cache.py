@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+This script contains the on-disk cache of parsed data files used by EIS_exp()
+
+The first time a data file is read, the DataFrame of the extract function is stored as an '.npz' file in the cache directory, one
+array per coloumn. When the file is read again, the arrays are loaded instead of parsing the text, which makes re-opening a data set
+close to free. An entry is used when the size and modification time of the data file are unchanged, or, if the modification time
+changed, when the content hash of the file is unchanged, so edited data files are parsed again automatically.
+
+The cache is off by default, as it writes to disk. It is switched on with set_cache(), e.g. set_cache(user_cache_dir) for
+~/.cache/PyEIS, or per data set with the cache argument of EIS_exp(), e.g. EIS_exp(path, data, cache=user_cache_dir). The cache is
+bounded in size, the least recently used entries are removed when it grows beyond max_size
+"""
+import hashlib
+import os
+import tempfile
+import types
+import warnings
+import numpy as np
+import pandas as pd
+
+__all__ = ['user_cache_dir', 'set_cache', 'get_cache', 'clear_cache', 'cache_key', 'extract_signature', 'file_hash', 'extract_cached']
+
+cache_version = 1 #increase when the functions called by the extract functions change their output, see extract_signature()
+user_cache_dir = os.path.join(os.environ.get('XDG_CACHE_HOME', os.path.join(os.path.expanduser('~'), '.cache')), 'PyEIS')
+_cache_dir = 'none' #off until set by set_cache()
+_cache_max_size = 2**30
+
+def set_cache(directory='default', max_size='default'):
+    '''
+    Sets the cache directory and size of extract_cached(), e.g. set_cache(user_cache_dir) switches the cache on in ~/.cache/PyEIS
+
+    Inputs
+    ----------
+    directory = cache directory, 'none' switches the cache off, default 'default' keeps the current directory ('none' at import)
+    max_size = largest size of the cache [bytes], default 'default' keeps the current size (1 GiB)
+    '''
+    global _cache_dir, _cache_max_size
+    if directory != 'default':
+        _cache_dir = directory
+    if max_size != 'default':
+        _cache_max_size = int(max_size)
+
+def get_cache():
+    '''
+    Returns the cache directory and size set by set_cache()
+    '''
+    return _cache_dir, _cache_max_size
+
+def clear_cache(directory='default'):
+    '''
+    Removes all entries of the cache
+    '''
+    if directory == 'default':
+        directory = _cache_dir
+    if directory == 'none' or not os.path.isdir(directory):
+        return
+    for name in os.listdir(directory):
+        if name.endswith('.npz'):
+            os.remove(os.path.join(directory, name))
+
+def file_hash(file_path, chunk_size=2**20):
+    '''
+    Returns the BLAKE2b hash of the content of a file as a hex string
+    '''
+    digest = hashlib.blake2b(digest_size=16)
+    with open(file_path, 'rb') as file:
+        for chunk in iter(lambda: file.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def code_hash(code, digest):
+    #adds the bytecode, names, and constants of a code object and of its nested functions to digest
+    digest.update(code.co_code)
+    digest.update(repr(code.co_names).encode('utf-8'))
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            code_hash(const, digest)
+        else:
+            digest.update(repr(const).encode('utf-8'))
+
+def extract_signature(extract):
+    '''
+    Returns the module and name of an extract function with a hash of its code, so entries of a changed extract function are not
+    used. Changes of the functions it calls, e.g. correct_text_EIS(), are not seen, for these cache_version is increased
+    '''
+    digest = hashlib.blake2b(digest_size=8)
+    code = getattr(extract, '__code__', None)
+    if code is not None:
+        code_hash(code, digest)
+    return getattr(extract, '__module__', '')+'.'+getattr(extract, '__qualname__', type(extract).__name__)+':'+digest.hexdigest()
+
+def cache_key(file_path, extract, columns='analysis', aux_dtype=np.float64):
+    '''
+    Returns the name of the cache entry of a data file read by extract() with columns and aux_dtype
+
+    The key holds the absolute path of the file, the extract function, see extract_signature(), the coloumns, aux_dtype, and
+    cache_version, the content of the file is validated by cache_read()
+    '''
+    if not isinstance(columns, str):
+        columns = list(columns)
+    text = repr((os.path.abspath(file_path), extract_signature(extract), columns, np.dtype(aux_dtype).str, cache_version))
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()+'.npz'
+
+def cache_read(entry, stat, file_path):
+    '''
+    Returns the DataFrame of a cache entry, or None if the entry is missing or the data file has changed
+    '''
+    try:
+        with np.load(entry, allow_pickle=False) as npz:
+            arrays = dict(npz)
+        size, mtime = arrays['stat']
+    except (OSError, ValueError, KeyError, EOFError): #missing or written by another version
+        return None
+    if size != stat.st_size:
+        return None
+    if mtime != stat.st_mtime_ns:
+        if str(arrays['hash']) != file_hash(file_path):
+            return None
+        arrays['stat'] = np.array([stat.st_size, stat.st_mtime_ns], dtype=np.int64)
+        try:
+            cache_write(entry, arrays) #touched, but not changed
+        except OSError:
+            pass
+    names = [str(name) for name in arrays['names']]
+    return pd.DataFrame(dict((name, arrays['column_'+str(j)]) for j, name in enumerate(names)), columns=names)
+
+def cache_write(entry, arrays):
+    '''
+    Writes a cache entry through a temporary file, so readers never see a partly written entry. The temporary file has a unique
+    name, so processes and threads writing the same entry do not write into the same file
+    '''
+    with tempfile.NamedTemporaryFile(dir=os.path.dirname(entry), prefix=os.path.basename(entry)+'.', suffix='.tmp', delete=False) as file:
+        temp = file.name
+        try:
+            np.savez(file, **arrays)
+        except BaseException:
+            file.close()
+            os.remove(temp)
+            raise
+    os.replace(temp, entry)
+
+def cache_evict(directory, max_size):
+    '''
+    Removes the least recently used entries until the cache is smaller than max_size, entries are marked as used by their mtime
+    '''
+    entries = []
+    for name in os.listdir(directory):
+        if name.endswith('.npz'):
+            try:
+                stat = os.stat(os.path.join(directory, name))
+            except OSError: #removed by another process
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, name))
+    size = sum(entry[1] for entry in entries)
+    for mtime, entry_size, name in sorted(entries):
+        if size <= max_size:
+            break
+        try:
+            os.remove(os.path.join(directory, name))
+        except OSError:
+            pass
+        size -= entry_size
+
+def extract_cached(extract, path, EIS_name, columns='analysis', aux_dtype=np.float64, cache='default'):
+    '''
+    Reads a data file with extract(), e.g. extract_mpt(), through the on-disk cache
+
+    Inputs
+    ----------
+    extract = extract function of the file type
+    path, EIS_name, columns, aux_dtype = see extract_mpt()
+    cache = cache directory, default 'default' uses the directory of set_cache(), which is 'none' unless set, 'none' reads the
+    file without the cache
+
+    Only local files are cached, other paths, e.g. URLs, and DataFrames with coloumns that are not numeric, e.g. text, are read by
+    extract() without the cache
+    '''
+    if cache == 'default':
+        cache = _cache_dir
+    file_path = path+EIS_name
+    if cache == 'none' or not os.path.isfile(file_path): #e.g. URLs, which have no size and modification time to validate an entry
+        return extract(path=path, EIS_name=EIS_name, columns=columns, aux_dtype=aux_dtype)
+    stat = os.stat(file_path)
+    entry = os.path.join(cache, cache_key(file_path, extract, columns, aux_dtype))
+    data = cache_read(entry, stat, file_path)
+    if data is not None:
+        try:
+            os.utime(entry) #marks the entry as recently used
+        except OSError: #e.g. read-only or shared cache directory, the entry is still valid
+            pass
+        return data
+
+    content_hash = file_hash(file_path) #before parsing, so a file changed while parsed is parsed again next time
+    data = extract(path=path, EIS_name=EIS_name, columns=columns, aux_dtype=aux_dtype)
+    if any(data[name].dtype.kind not in 'biuf' for name in data.columns):
+        return data
+    arrays = dict(('column_'+str(j), data[name].to_numpy()) for j, name in enumerate(data.columns))
+    arrays['names'] = np.array([str(name) for name in data.columns])
+    arrays['stat'] = np.array([stat.st_size, stat.st_mtime_ns], dtype=np.int64)
+    arrays['hash'] = np.array(content_hash)
+    try:
+        os.makedirs(cache, exist_ok=True)
+        cache_write(entry, arrays)
+        cache_evict(cache, _cache_max_size)
+    except OSError as error: #e.g. read-only file system, the data is still returned
+        warnings.warn('Data file '+EIS_name+' could not be cached: '+str(error))
+    return data
@@ -0,0 +1,452 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+This script contains the circuit builder, which defines equivalent circuits from series and parallel connections of elements
+
+A circuit is built as a tree, e.g. Series(R('Rs'), Parallel(R('R1'), Q('Q1','n1'))), and compiled by compile_tree() into a single
+vectorized evaluation function Z = f(params, w) with the same call signature as the circuits of compile_circuit(). The compiler
+simplifies the tree before the function is generated: nested connections are flattened, resistors, capacitors, and inductors in
+series or in parallel are merged into one term, constant phase elements in parallel with a shared exponent are merged, and
+identical subexpressions, e.g. (jw)^n of elements sharing n or repeated subcircuits, are evaluated once.
+
+The elements R, C, L, Q, and W are not imported into PyEIS by "from PyEIS import *", as R is the molar gas constant of
+PyEIS_Advanced_tools.py, import them from PyEIS.PyEIS_Circuit_builder
+"""
+from functools import lru_cache
+import numpy as np
+from .PyEIS_Hyperbolic import coth, csch
+from .PyEIS_Grid import jw, jw_pow, sqrt_jw
+from .PyEIS_Jacobian import jac_series, jac_parallel, jac_R, jac_C, jac_L, jac_Q, jac_W, jac_TLs, jac_TL
+from .PyEIS_Backend import resolve_backend, jit, scalar_jw, scalar_jw_pow, scalar_sqrt_jw, scalar_coth, scalar_csch
+
+__all__ = ['circuit_node', 'Series', 'Parallel', 'TLs', 'TL', 'compile_tree']
+
+### Circuit Elements
+##
+#
+class circuit_node:
+    '''
+    Base class of the circuit elements and connections
+
+    Nodes are compared by their structure, i.e. Series(R('Rs'), C('C')) == Series(C('C'), R('Rs')), and can be used as
+    the circuit of EIS_exp.EIS_fit(), EIS_sim.EIS_sim_fit(), and compile_circuit()
+    '''
+    kind = None
+    children = ()
+    names = ()
+
+    @property
+    def key(self):
+        return self.kind+'('+','.join(self.names)+')'
+
+    def param_names(self):
+        '''
+        Returns the names of the parameters of the node, in the order they appear in the circuit
+        '''
+        names = []
+        for name in self._param_names():
+            if name not in names:
+                names.append(name)
+        return tuple(names)
+
+    def _param_names(self):
+        for child in self.children:
+            yield from child._param_names()
+        yield from self.names
+
+    def __hash__(self):
+        return hash(self.key)
+
+    def __eq__(self, other):
+        if not isinstance(other, circuit_node):
+            return NotImplemented
+        return self.key == other.key
+
+    def __repr__(self):
+        return self.kind+'('+', '.join(repr(name) for name in self.names)+')'
+
+class R(circuit_node):
+    '''
+    Element: -R-, Z = R
+
+    Inputs
+    ----------
+    R = name of the resistance [ohm]
+    '''
+    kind = 'R'
+    def __init__(self, R='R'):
+        self.names = (R,)
+
+class C(circuit_node):
+    '''
+    Element: -C-, Z = 1/(C*jw)
+
+    Inputs
+    ----------
+    C = name of the capacitance [F]
+    '''
+    kind = 'C'
+    def __init__(self, C='C'):
+        self.names = (C,)
+
+class L(circuit_node):
+    '''
+    Element: -L-, Z = L*jw
+
+    Inputs
+    ----------
+    L = name of the inductance [H]
+    '''
+    kind = 'L'
+    def __init__(self, L='L'):
+        self.names = (L,)
+
+class Q(circuit_node):
+    '''
+    Element: -Q-, constant phase element, Z = 1/(Q*(jw)^n)
+
+    Inputs
+    ----------
+    Q = name of the constant phase element [s^n/ohm]
+    n = name of the exponent of the constant phase element [-]
+    '''
+    kind = 'Q'
+    def __init__(self, Q='Q', n='n'):
+        self.names = (Q, n)
+
+class W(circuit_node):
+    '''
+    Element: -W-, semi-infinite linear Warburg, Z = sigma*w^(-1/2) - j*sigma*w^(-1/2)
+
+    Inputs
+    ----------
+    sigma = name of the Warburg constant [ohm/s^1/2]
+    '''
+    kind = 'W'
+    def __init__(self, sigma='sigma'):
+        self.names = (sigma,)
+
+class TLs(circuit_node):
+    '''
+    Element: simplified transmission line, Z = Lam*Ri*coth(L/Lam) with Lam = (Phi/Ri)^(1/2), see cir_RsTLs()
+
+    Inputs
+    ----------
+    Phi = circuit of the interfacial impedance, e.g. Q('Q','n') or Parallel(R('R'), Q('Q','n'))
+    Ri = name of the ionic resistance [ohm/cm]
+    L = name of the thickness of the electrode [cm]
+    '''
+    kind = 'TLs'
+    def __init__(self, Phi, Ri='Ri', L='L'):
+        self.children = (Phi,)
+        self.names = (Ri, L)
+
+    @property
+    def key(self):
+        return self.kind+'('+self.children[0].key+','+','.join(self.names)+')'
+
+    def __repr__(self):
+        return self.kind+'('+repr(self.children[0])+', '+', '.join(repr(name) for name in self.names)+')'
+
+class TL(TLs):
+    '''
+    Element: transmission line with both Ri and Rel, see cir_RsTL()
+
+    Inputs
+    ----------
+    Phi = circuit of the interfacial impedance, e.g. Q('Q','n') or Parallel(R('R'), Q('Q','n'))
+    Rel = name of the electronic resistance [ohm/cm]
+    Ri = name of the ionic resistance [ohm/cm]
+    L = name of the thickness of the electrode [cm]
+    '''
+    kind = 'TL'
+    def __init__(self, Phi, Rel='Rel', Ri='Ri', L='L'):
+        self.children = (Phi,)
+        self.names = (Rel, Ri, L)
+
+class Series(circuit_node):
+    '''
+    Series connection of circuits, Z = Z1 + Z2 + ...
+    '''
+    kind = 'Series'
+    def __init__(self, *children):
+        if len(children) == 0:
+            raise ValueError('Series() needs at least one circuit')
+        for child in children:
+            if not isinstance(child, circuit_node):
+                raise TypeError('The circuits of '+self.kind+'() must be circuit elements or connections, not '+repr(child))
+        self.children = tuple(children)
+
+    @property
+    def key(self):
+        #connections are commutative, so the children are sorted
+        return self.kind+'('+','.join(sorted(child.key for child in self.children))+')'
+
+    def __repr__(self):
+        return self.kind+'('+', '.join(repr(child) for child in self.children)+')'
+
+class Parallel(Series):
+    '''
+    Parallel connection of circuits, 1/Z = 1/Z1 + 1/Z2 + ...
+    '''
+    kind = 'Parallel'
+
+### Tree simplification
+##
+#
+def _flatten(node):
+    '''
+    Flattens nested connections of the same kind and removes connections of a single circuit
+    '''
+    if isinstance(node, Series):
+        children = []
+        for child in node.children:
+            child = _flatten(child)
+            if type(child) is type(node):
+                children.extend(child.children)
+            else:
+                children.append(child)
+        if len(children) == 1:
+            return children[0]
+        return type(node)(*children)
+    if isinstance(node, TLs):
+        return type(node)(_flatten(node.children[0]), *node.names)
+    return node
+
+### Code generation
+##
+#
+class _emitter:
+    '''
+    Collects the lines of the generated function. Each expression is assigned to a local variable once, so repeated
+    subexpressions are reused (common subexpression elimination)
+    '''
+    def __init__(self):
+        self.lines = []
+        self.memo = {}
+        self.params = {}
+        self.uses_w = False
+
+    def param(self, name):
+        if name not in self.params:
+            self.params[name] = '_p'+str(len(self.params))
+        return self.params[name]
+
+    def __call__(self, expr, uses_w=False):
+        if expr not in self.memo:
+            variable = '_t'+str(len(self.memo))
+            self.lines.append('    '+variable+' = '+expr)
+            self.memo[expr] = variable
+        if uses_w:
+            self.uses_w = True
+        return self.memo[expr]
+
+    def jw(self):
+        return self('jw(w)', uses_w=True)
+
+def _sum(terms):
+    return ' + '.join(sorted(terms))
+
+def _impedance(node, emit):
+    '''
+    Emits the impedance of a flattened node and returns its variable name
+    '''
+    if isinstance(node, Parallel):
+        return emit('1/('+_admittance(node, emit)+')')
+    if isinstance(node, Series):
+        Rs, Ls, Cs, terms = [], [], [], []
+        for child in node.children:
+            if child.kind == 'R':
+                Rs.append(emit.param(child.names[0]))
+            elif child.kind == 'L':
+                Ls.append(emit.param(child.names[0]))
+            elif child.kind == 'C':
+                Cs.append('1/'+emit.param(child.names[0]))
+            else:
+                terms.append(_impedance(child, emit))
+        if Rs:
+            terms.append(emit(_sum(Rs)) if len(Rs) > 1 else Rs[0])
+        if Ls:
+            terms.append(emit('('+_sum(Ls)+')*'+emit.jw()))
+        if Cs:
+            terms.append(emit('('+_sum(Cs)+')/'+emit.jw()))
+        if len(terms) == 1:
+            return terms[0]
+        return emit(_sum(terms))
+    if node.kind == 'R':
+        return emit.param(node.names[0])
+    if node.kind == 'L':
+        return emit(emit.param(node.names[0])+'*'+emit.jw())
+    if node.kind == 'C':
+        return emit('1/('+emit.param(node.names[0])+'*'+emit.jw()+')')
+    if node.kind == 'Q':
+        return emit('1/('+emit.param(node.names[0])+'*'+_jw_pow(node.names[1], emit)+')')
+    if node.kind == 'W':
+        return emit(emit.param(node.names[0])+'*np.sqrt(2)/'+emit('sqrt_jw(w)', uses_w=True))
+    Phi = _impedance(node.children[0], emit)
+    if node.kind == 'TLs':
+        Ri, L_ = (emit.param(name) for name in node.names)
+        Lam = emit('('+Phi+'/'+Ri+')**(1/2)')
+        return emit(Lam+'*'+Ri+'*coth('+L_+'/'+Lam+')')
+    Rel, Ri, L_ = (emit.param(name) for name in node.names)
+    R_sum = emit(_sum([Rel, Ri]))
+    Lam = emit('('+Phi+'/'+R_sum+')**(1/2)')
+    x = emit(L_+'/'+Lam)
+    a = emit(Rel+'*'+Ri+'/'+R_sum)
+    b = emit('('+Rel+'**2 + '+Ri+'**2)/'+R_sum)
+    return emit(a+'*('+L_+' + 2*'+Lam+'*csch('+x+')) + '+Lam+'*'+b+'*coth('+x+')')
+
+def _admittance(node, emit):
+    '''
+    Emits the admittance of a flattened node and returns its variable name
+    '''
+    if not isinstance(node, Parallel):
+        if node.kind == 'C':
+            return emit(emit.param(node.names[0])+'*'+emit.jw())
+        if node.kind == 'Q':
+            return emit(emit.param(node.names[0])+'*'+_jw_pow(node.names[1], emit))
+        return emit('1/'+_impedance(node, emit))
+    Rs, Ls, Cs, terms = [], [], [], []
+    Qs = {}
+    for child in node.children:
+        if child.kind == 'R':
+            Rs.append('1/'+emit.param(child.names[0]))
+        elif child.kind == 'L':
+            Ls.append('1/'+emit.param(child.names[0]))
+        elif child.kind == 'C':
+            Cs.append(emit.param(child.names[0]))
+        elif child.kind == 'Q':
+            Qs.setdefault(child.names[1], []).append(emit.param(child.names[0]))
+        else:
+            terms.append(_admittance(child, emit))
+    if Rs:
+        terms.append(emit(_sum(Rs)))
+    if Ls:
+        terms.append(emit('('+_sum(Ls)+')/'+emit.jw()))
+    if Cs:
+        terms.append(emit('('+_sum(Cs)+')*'+emit.jw()))
+    for n, Q_sum in Qs.items():
+        #constant phase elements in parallel with the same exponent, Y = (Q1 + Q2)*(jw)^n
+        terms.append(emit('('+_sum(Q_sum)+')*'+_jw_pow(n, emit)))
+    if len(terms) == 1:
+        return terms[0]
+    return emit(_sum(terms))
+
+def _jw_pow(n, emit):
+    return emit('jw_pow(w, '+emit.param(n)+')', uses_w=True)
+
+def _jac_term(node, params, w):
+    '''
+    Returns the term (Z, dZ) of a flattened node, see PyEIS_Jacobian.py
+    '''
+    if isinstance(node, Parallel):
+        return jac_parallel(*(_jac_term(child, params, w) for child in node.children))
+    if isinstance(node, Series):
+        return jac_series(*(_jac_term(child, params, w) for child in node.children))
+    values = [params[name] for name in node.names]
+    if node.kind == 'R':
+        return jac_R(values[0], node.names[0])
+    if node.kind == 'L':
+        return jac_L(w, values[0], node.names[0])
+    if node.kind == 'C':
+        return jac_C(w, values[0], node.names[0])
+    if node.kind == 'Q':
+        return jac_Q(w, values[0], values[1], *node.names)
+    if node.kind == 'W':
+        return jac_W(w, values[0], node.names[0])
+    Phi_term = _jac_term(node.children[0], params, w)
+    if node.kind == 'TLs':
+        return jac_TLs(Phi_term, *values, *node.names)
+    return jac_TL(Phi_term, *values, *node.names)
+
+### Compiler
+##
+#
+@lru_cache(maxsize=None)
+def compile_tree(tree, backend='default'):
+    '''
+    Compiles a circuit tree, e.g. Series(R('Rs'), Parallel(R('R1'), Q('Q1','n1'))), into an evaluation function Z = f(params, w)
+
+    The tree is simplified and generated as straight-line numpy code, i.e. one vectorized expression per term, which is compiled
+    once and cached. Series resistors, inductors, and capacitors are merged into one term each, parallel resistors, inductors,
+    capacitors, and constant phase elements with a shared exponent are merged in the admittance, and each subexpression is
+    evaluated once, e.g. (jw)^n is shared by all constant phase elements with the same n.
+
+    With the 'numba' backend, the same code is generated as a single loop over the frequencies, which is JIT-compiled on the first
+    call. It is used for scalar parameters and 1-D float64 w, e.g. in the fitting, while arrays of parameters, e.g. circuit_batch(),
+    and float32 grids are evaluated with numpy.
+
+    Inputs
+    ------------
+    - tree: circuit of elements R(), C(), L(), Q(), W(), TLs(), and TL() connected by Series() and Parallel()
+    - backend: 'default', 'numpy', or 'numba', see PyEIS_Backend.py. 'default' follows set_backend() at the time of the call
+
+    Returns
+    ------------
+    Function of (params, w) returning the complex impedance of the circuit [ohm], with the attributes of compile_circuit(), and:
+    - .param_names: names of the parameters of the circuit, e.g. for building the lmfit Parameters()
+    - .source: the generated numpy code
+    '''
+    if not isinstance(tree, circuit_node):
+        raise TypeError('compile_tree() needs a circuit of elements and connections, not '+repr(tree))
+    resolve_backend(backend) #validates the backend
+    flat = _flatten(tree)
+    emit = _emitter()
+    Z = _impedance(flat, emit)
+    param_names = tuple(emit.params)
+
+    lines = ['def circuit_eval(params, w):']
+    lines += ['    '+variable+' = params['+repr(name)+']' for name, variable in emit.params.items()]
+    lines += emit.lines
+    if emit.uses_w:
+        lines.append('    return '+Z)
+    else: #purely resistive circuit
+        lines.append('    return '+Z+' + np.zeros(np.shape(w), dtype=complex)')
+    source = '\n'.join(lines)+'\n'
+    namespace = {'np': np, 'jw': jw, 'jw_pow': jw_pow, 'sqrt_jw': sqrt_jw, 'coth': coth, 'csch': csch}
+    exec(compile(source, '<circuit '+repr(tree)+'>', 'exec'), namespace)
+    numpy_eval = namespace['circuit_eval']
+
+    #the loop of the numba backend evaluates the same lines for one frequency, w, at a time
+    loop_lines = ['def circuit_kernel(w_array, '+', '.join(emit.params.values())+'):',
+                  '    Z = np.empty(w_array.shape[0], dtype=np.complex128)',
+                  '    for k in range(w_array.shape[0]):',
+                  '        w = w_array[k]']
+    loop_lines += ['    '+line for line in emit.lines]
+    loop_lines += ['        Z[k] = '+Z, '    return Z']
+    loop_source = '\n'.join(loop_lines)+'\n'
+    kernel = []
+
+    def numba_kernel():
+        if not kernel:
+            loop_namespace = {'np': np, 'jw': scalar_jw, 'jw_pow': scalar_jw_pow, 'sqrt_jw': scalar_sqrt_jw, 'coth': scalar_coth, 'csch': scalar_csch}
+            exec(compile(loop_source, '<circuit kernel '+repr(tree)+'>', 'exec'), loop_namespace)
+            kernel.append(jit(loop_namespace['circuit_kernel']))
+        return kernel[0]
+
+    def circuit_eval(params, w):
+        if resolve_backend(backend) == 'numba' and np.ndim(w) == 1 and np.result_type(w) != np.float32:
+            values = [params[name] for name in param_names]
+            for value in values:
+                if not isinstance(value, (float, int)):
+                    return numpy_eval(params, w)
+            return numba_kernel()(np.asarray(w, dtype=float), *values)
+        return numpy_eval(params, w)
+
+    def circuit_jac(params, w):
+        return _jac_term(flat, params, w)
+
+    circuit_eval.circuit = repr(tree)
+    circuit_eval.elements = tuple(_elements(flat))
+    circuit_eval.plan = None
+    circuit_eval.jac = circuit_jac
+    circuit_eval.param_names = tree.param_names()
+    circuit_eval.source = source
+    return circuit_eval
+
+def _elements(node):
+    if isinstance(node, Series):
+        for child in node.children:
+            yield from _elements(child)
+    else:
+        yield node.key
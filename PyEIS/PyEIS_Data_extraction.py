@@ -4,13 +4,17 @@
 Created on Fri Jun  8 10:23:40 2018
 
 This script contains tools for extracting impedance data from data files. Currently following data files are supported
-    - Bio-Logic '.mpt' files
+    - Bio-Logic '.mpt' and '.mpr' files
     - Gamry's '.DTA' files
 
 @author: Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
 """
 #Python dependencies
 from __future__ import division
+import io
+import os
+from urllib.parse import urlparse
+from urllib.request import urlopen
 import pandas as pd
 import numpy as np
 from scipy.constants import codata
@@ -87,44 +91,134 @@ def correct_text_EIS(text_header):
     else:
         return text_header
     
-def extract_mpt(path, EIS_name):
+analysis_columns = ['f', 're', 'im', 'E_avg', 'cycle_number'] #coloumns used by EIS_exp()
+
+def select_columns(names, columns='analysis', added=[]):
+    '''
+    Returns the coloumn names, in the order of the file, that are parsed by the extract functions
+
+    Inputs
+    ----------
+    names = coloumn names of the file, following correct_text_EIS()
+    columns = 'analysis' (default) for the coloumns present of analysis_columns, 'all' for all coloumns, or a list of coloumn names
+    added = coloumns added by the extract function, e.g. cycle_number of '.DTA' files, which are allowed in columns
+    '''
+    if columns == 'all':
+        return list(names)
+    if columns == 'analysis':
+        return [name for name in names if name in analysis_columns]
+    missing = [name for name in columns if name not in names and name not in added]
+    if len(missing) > 0:
+        raise ValueError('coloumns '+str(missing)+' are not in the file, the coloumns are '+str(list(names)))
+    return [name for name in names if name in columns]
+
+def aux_astype(data, aux_dtype=np.float64):
+    '''
+    Converts the float coloumns of data that are not in analysis_columns, e.g. |Ewe| or Y_re, to aux_dtype, e.g. np.float32
+    '''
+    if np.dtype(aux_dtype) == np.dtype(np.float64):
+        return data
+    aux = {}
+    for name in data.columns:
+        if name not in analysis_columns and data[name].dtype.kind == 'f':
+            aux[name] = aux_dtype
+    return data.astype(aux)
+
+def header_names(line):
+    '''
+    Returns the column names of a tab separated header line following correct_text_EIS(), empty names are named as by pandas,
+    i.e. 'Unnamed: j'
+    '''
+    names = []
+    for j, text in enumerate(line.rstrip('\r\n').split('\t')):
+        if text == '':
+            names.append('Unnamed: '+str(j))
+        else:
+            names.append(correct_text_EIS(text)) #reads coloumn text
+    return names
+
+def open_data_file(path, EIS_name):
+    '''
+    Opens the data file path+EIS_name for binary reading. Local files are opened directly, URLs, e.g. the raw GitHub path of the
+    tutorials, are downloaded into memory
+    '''
+    file_path = path+EIS_name
+    if not os.path.isfile(file_path) and urlparse(file_path).scheme in ('http', 'https', 'ftp', 'file'):
+        with urlopen(file_path) as response:
+            return io.BytesIO(response.read())
+    return open(file_path, 'rb')
+
+def extract_mpt(path, EIS_name, columns='analysis', aux_dtype=np.float64):
     '''
     Extracting PEIS and GEIS data files from EC-lab '.mpt' format, coloums are renames following correct_text_EIS()
+
+    The file is read in one pass: the number of header lines is read from the second line, the header lines are skipped to the
+    coloumn line, and the data block below it is parsed by pandas from the same file handle. URLs are read from memory, see
+    open_data_file()
+
+    Only the coloumns in columns are parsed, see select_columns(), by default f, re, im, E_avg, and cycle_number. The other
+    float coloumns, e.g. with columns='all', can be stored as float32 by aux_dtype=np.float32
     
     Kristian B. Knudsen (kknu@berkeley.edu || kristianbknudsen@gmail.com)
     '''
-    EIS_init = pd.read_csv(path+EIS_name, sep='\t', nrows=1,header=0,names=['err'], encoding='latin1') #findes line that states skiplines
-#    EIS_test_header_names = pd.read_csv(path+EIS_name, sep='\t', skiprows=int(EIS_init.err[0][18:20])-1, encoding='latin1') #locates number of skiplines
-    EIS_test_header_names = pd.read_csv(path+EIS_name, sep='\t', skiprows=int(EIS_init.err[0][18:-1])-1, encoding='latin1') #locates number of skiplines
-    names_EIS = []
-    for j in range(len(EIS_test_header_names.columns)):
-        names_EIS.append(correct_text_EIS(EIS_test_header_names.columns[j])) #reads coloumn text
-#    return pd.read_csv(path+EIS_name, sep='\t', skiprows=int(EIS_init.err[0][18:20]), names=names_EIS, encoding='latin1')
-    return pd.read_csv(path+EIS_name, sep='\t', skiprows=int(EIS_init.err[0][18:-1]), names=names_EIS, encoding='latin1')
+    with open_data_file(path, EIS_name) as file:
+        file.readline() #EC-Lab ASCII FILE
+        skiplines = int(file.readline().split(b':')[1]) #Nb header lines : xx
+        for j in range(skiplines-3):
+            file.readline()
+        names_EIS = header_names(file.readline().decode('latin1'))
+        start = file.tell()
+        names_data = names_EIS[:len(file.readline().split(b'\t'))] #the header can end with a tab that the data rows do not have
+        file.seek(start)
+        data = pd.read_csv(file, sep='\t', header=None, names=names_data, usecols=select_columns(names_data, columns), encoding='latin1')
+    for name in select_columns(names_EIS, columns):
+        if name not in data.columns: #empty coloumn of the header
+            data[name] = np.nan
+    return aux_astype(data, aux_dtype)
 
-def extract_dta(path, EIS_name):
+def extract_dta(path, EIS_name, columns='analysis', aux_dtype=np.float64):
     '''
     Extracting data files from Gamry '.DTA' format, coloums are renames following correct_text_EIS()
+
+    Only the coloumns in columns are parsed, see select_columns() and extract_mpt()
+
+    The file is scanned line by line for 'ZCURVE' tables. The header and unit rows below 'ZCURVE' are consumed, and the rows of the
+    table, which start with a tab, are collected and parsed by pandas in one go. Files with several 'ZCURVE' tables give one cycle
+    number per table, in the order of the file. URLs are read from memory, see open_data_file()
     
     Kristian B. Knudsen (kknu@berkeley.edu || kristianbknudsen@gmail.com)
     '''
-    dummy_col = ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'I','J','K','L','M','N','O','P']
-    init = pd.read_csv(path+EIS_name, encoding='latin1', sep='\t', names=dummy_col)
-    ZC = pd.Index(init.A)
-    header_loc = ZC.get_loc('ZCURVE')+1  ##ZC.get_loc('ZCURVE')+3
-    
-    header_names_raw = pd.read_csv(path+EIS_name, sep='\t', skiprows=header_loc, encoding='latin1') #locates number of skiplines
-    header_names = []
-    for j in range(len(header_names_raw.columns)):
-        header_names.append(correct_text_EIS(header_names_raw.columns[j])) #reads coloumn text
-    data = pd.read_csv(path+EIS_name, sep='\t', skiprows=ZC.get_loc('ZCURVE')+3, names=header_names, encoding='latin1')
-    data.update({'im': np.abs(data.im)})
-    data = data.assign(cycle_number = 1.0)
-    return data
+    tables = []
+    with open_data_file(path, EIS_name) as file:
+        line = file.readline()
+        while line:
+            if line.split(b'\t', 1)[0].strip() != b'ZCURVE':
+                line = file.readline()
+                continue
+            header_names_dta = header_names(file.readline().decode('latin1'))
+            file.readline() #units
+            rows = []
+            line = file.readline()
+            while line.startswith(b'\t'): #rows of the table
+                rows.append(line)
+                line = file.readline()
+            usecols = select_columns(header_names_dta, columns, added=['cycle_number'])
+            data = pd.read_csv(io.BytesIO(b''.join(rows)), sep='\t', header=None, names=header_names_dta, usecols=usecols, encoding='latin1')
+            if columns in ('analysis', 'all') or 'cycle_number' in columns:
+                data = data.assign(cycle_number = float(len(tables)+1))
+            tables.append(data)
+    if len(tables) == 0:
+        raise ValueError("no 'ZCURVE' table in "+path+EIS_name)
+    data = pd.concat(tables, axis=0, ignore_index=True)
+    if 'im' in data.columns:
+        data.update({'im': np.abs(data.im)})
+    return aux_astype(data, aux_dtype)
 
-def extract_solar(path, EIS_name):
+def extract_solar(path, EIS_name, columns='analysis', aux_dtype=np.float64):
     '''
     Extracting data files from Solartron's '.z' format, coloums are renames following correct_text_EIS()
+
+    Only the coloumns in columns are parsed, see select_columns() and extract_mpt()
     
     Kristian B. Knudsen (kknu@berkeley.edu || kristianbknudsen@gmail.com)
     '''
@@ -137,9 +231,203 @@ def extract_solar(path, EIS_name):
     header_names = []
     for j in range(len(header_names_raw.columns)):
         header_names.append(correct_text_EIS(header_names_raw.columns[j])) #reads coloumn text
-    data = pd.read_csv(path+EIS_name, sep='\t', skiprows=header_loc+2, names=header_names, encoding='latin1')
-    data.update({'im': -data.im})
-    data = data.assign(cycle_number = 1.0)
+    usecols = select_columns(header_names, columns, added=['cycle_number'])
+    data = pd.read_csv(path+EIS_name, sep='\t', skiprows=header_loc+2, names=header_names, usecols=usecols, encoding='latin1')
+    if 'im' in data.columns:
+        data.update({'im': -data.im})
+    if columns in ('analysis', 'all') or 'cycle_number' in columns:
+        data = data.assign(cycle_number = 1.0)
+    return aux_astype(data, aux_dtype)
+
+#### Extracting EC-Lab binary .mpr files
+mpr_magic = b'BIO-LOGIC MODULAR FILE\x1a'.ljust(48) + b'\x00\x00\x00\x00'
+mpr_module_header = np.dtype([('shortname', 'S10'), ('longname', 'S25'), ('length', '<u4'), ('version', '<u4'), ('date', 'S8')])
+mpr_module_header_v2 = np.dtype([('shortname', 'S10'), ('longname', 'S25'), ('max_length', '<u4'), ('length', '<u4'), ('version', '<u4'), ('unknown', '<u4'), ('date', 'S8')]) #EC-Lab >= 11.50
+
+mpr_flag_columns = [1, 2, 3, 21, 31, 65] #mode, ox/red, error, control changes, Ns changes, counter inc., bits of one 'flags' byte
+mpr_column_types = { #coloumn ID: (name as in '.mpt' files, dtype)
+    4: ('time/s', '<f8'),
+    5: ('control/V/mA', '<f4'),
+    6: ('Ewe/V', '<f4'),
+    7: ('dQ/mA.h', '<f8'),
+    8: ('I/mA', '<f4'),
+    9: ('Ece/V', '<f4'),
+    11: ('I/mA', '<f8'),
+    13: ('(Q-Qo)/mA.h', '<f8'),
+    16: ('Analog IN 1/V', '<f4'),
+    17: ('Analog IN 2/V', '<f4'),
+    19: ('control/V', '<f4'),
+    20: ('control/mA', '<f4'),
+    23: ('dQ/mA.h', '<f8'),
+    24: ('cycle number', '<f8'),
+    26: ('Rapp/Ohm', '<f4'),
+    27: ('Ewe-Ece/V', '<f4'),
+    32: ('freq/Hz', '<f4'),
+    33: ('|Ewe|/V', '<f4'),
+    34: ('|I|/A', '<f4'),
+    35: ('Phase(Z)/deg', '<f4'),
+    36: ('|Z|/Ohm', '<f4'),
+    37: ('Re(Z)/Ohm', '<f4'),
+    38: ('-Im(Z)/Ohm', '<f4'),
+    39: ('I Range', '<u2'),
+    69: ('R/Ohm', '<f4'),
+    70: ('P/W', '<f4'),
+    74: ('Energy/W.h', '<f8'),
+    75: ('Analog OUT/V', '<f4'),
+    76: ('<I>/mA', '<f4'),
+    77: ('<Ewe>/V', '<f4'),
+    78: ('Cs-2/µF-2', '<f4'),
+    96: ('|Ece|/V', '<f4'),
+    98: ('Phase(Zce)/deg', '<f4'),
+    99: ('|Zce|/Ohm', '<f4'),
+    100: ('Re(Zce)/Ohm', '<f4'),
+    101: ('-Im(Zce)/Ohm', '<f4'),
+    123: ('Energy charge/W.h', '<f8'),
+    124: ('Energy discharge/W.h', '<f8'),
+    125: ('Capacitance charge/µF', '<f8'),
+    126: ('Capacitance discharge/µF', '<f8'),
+    131: ('Ns', '<u2'),
+    163: ('|Estack|/V', '<f4'),
+    168: ('Rcmp/Ohm', '<f4'),
+    169: ('Cs/µF', '<f4'),
+    172: ('Cp/µF', '<f4'),
+    173: ('Cp-2/µF-2', '<f4'),
+    174: ('<Ewe>/V', '<f4'),
+    241: ('|E1|/V', '<f4'), #coloumns of the second and third electrode of stack and CE measurements
+    242: ('|E2|/V', '<f4'),
+    271: ('Phase(Z1)/deg', '<f4'),
+    272: ('Phase(Z2)/deg', '<f4'),
+    301: ('|Z1|/Ohm', '<f4'),
+    302: ('|Z2|/Ohm', '<f4'),
+    331: ('Re(Z1)/Ohm', '<f4'),
+    332: ('Re(Z2)/Ohm', '<f4'),
+    361: ('-Im(Z1)/Ohm', '<f4'),
+    362: ('-Im(Z2)/Ohm', '<f4'),
+    391: ('<E1>/V', '<f4'),
+    392: ('<E2>/V', '<f4'),
+    422: ('Phase(Zstack)/deg', '<f4'),
+    423: ('|Zstack|/Ohm', '<f4'),
+    424: ('Re(Zstack)/Ohm', '<f4'),
+    425: ('-Im(Zstack)/Ohm', '<f4'),
+    426: ('<Estack>/V', '<f4'),
+    430: ('Phase(Zwe-ce)/deg', '<f4'),
+    431: ('|Zwe-ce|/Ohm', '<f4'),
+    432: ('Re(Zwe-ce)/Ohm', '<f4'),
+    433: ('-Im(Zwe-ce)/Ohm', '<f4'),
+    434: ('(Q-Qo)/C', '<f4'),
+    435: ('dQ/C', '<f4'),
+    441: ('<Ecv>/V', '<f4'),
+    462: ('Temperature/°C', '<f4'),
+    467: ('Q charge/discharge/mA.h', '<f8'),
+    468: ('half cycle', '<u4'),
+    469: ('z cycle', '<u4'),
+    471: ('<Ece>/V', '<f4'),
+    473: ('THD Ewe/%', '<f4'), #harmonics of PEIS and GEIS with the quality indicators of EC-Lab
+    474: ('THD I/%', '<f4'),
+    476: ('NSD Ewe/%', '<f4'),
+    477: ('NSD I/%', '<f4'),
+    479: ('NSR Ewe/%', '<f4'),
+    480: ('NSR I/%', '<f4'),
+    486: ('|Ewe h2|/V', '<f4'),
+    487: ('|Ewe h3|/V', '<f4'),
+    488: ('|Ewe h4|/V', '<f4'),
+    489: ('|Ewe h5|/V', '<f4'),
+    490: ('|Ewe h6|/V', '<f4'),
+    491: ('|Ewe h7|/V', '<f4'),
+    492: ('|I h2|/A', '<f4'),
+    493: ('|I h3|/A', '<f4'),
+    494: ('|I h4|/A', '<f4'),
+    495: ('|I h5|/A', '<f4'),
+    496: ('|I h6|/A', '<f4'),
+    497: ('|I h7|/A', '<f4'),
+    498: ('Q charge/mA.h', '<f8'),
+    499: ('Q discharge/mA.h', '<f8'),
+    501: ('Efficiency/%', '<f8'),
+    502: ('Capacity/mA.h', '<f8'),
+    505: ('Rdc/Ohm', '<f4'),
+}
+
+def mpr_modules(buffer):
+    '''
+    Returns the modules of an EC-Lab '.mpr' file as a list of dicts with the module header and the module data as a memoryview
+
+    Ref.:
+        - The module layout follows the reverse engineered description of the galvani package (github.com/echemdata/galvani)
+    '''
+    if bytes(buffer[:len(mpr_magic)]) != mpr_magic:
+        raise ValueError('not an EC-Lab .mpr file')
+    modules = []
+    position = len(mpr_magic)
+    while position < len(buffer):
+        if bytes(buffer[position:position+6]) != b'MODULE':
+            raise ValueError('expected a MODULE at byte '+str(position)+' of the .mpr file')
+        position += 6
+        header_dtype = mpr_module_header
+        if bytes(buffer[position+35:position+39]) == b'\xff\xff\xff\xff':
+            header_dtype = mpr_module_header_v2
+        header = np.frombuffer(buffer, dtype=header_dtype, count=1, offset=position)[0]
+        position += header_dtype.itemsize
+        module = dict((name, header[name]) for name in header_dtype.names)
+        module['data'] = buffer[position:position+int(module['length'])]
+        position += int(module['length'])
+        modules.append(module)
+    return modules
+
+def mpr_dtype(column_ids):
+    '''
+    Returns the numpy dtype of a data row of an EC-Lab '.mpr' file from the coloumn IDs, see mpr_column_types
+    '''
+    unknown = [column_id for column_id in column_ids if column_id not in mpr_flag_columns and column_id not in mpr_column_types]
+    if len(unknown) > 0: #the width of an unknown coloumn is not known, so the rows cannot be decoded
+        raise ValueError('coloumn IDs '+str(unknown)+' of the .mpr file are unknown, export the file to .mpt')
+    fields = []
+    names = []
+    for column_id in column_ids:
+        if column_id in mpr_flag_columns:
+            if 'flags' not in names: #the flags share one byte
+                fields.append(('flags', 'u1'))
+                names.append('flags')
+        else:
+            name, dtype = mpr_column_types[column_id]
+            names.append(name)
+            if names.count(name) > 1: #e.g. dQ/mA.h of two coloumn IDs, named as by pandas
+                name = name+'.'+str(names.count(name)-1)
+            fields.append((name, dtype))
+    return np.dtype(fields)
+
+def extract_mpr(path, EIS_name, columns='analysis', aux_dtype=np.float64):
+    '''
+    Extracting PEIS and GEIS data files from EC-lab's binary '.mpr' format, coloums are renames following correct_text_EIS()
+
+    The data module is decoded by np.frombuffer() with the coloumn layout found from the coloumn IDs of the module, see mpr_dtype(),
+    so the coloumns are the same as those of the '.mpt' export by extract_mpt(). Only the coloumns in columns are converted, see
+    select_columns(). Files without a cycle number coloumn are given cycle_number = 1
+    '''
+    with open_data_file(path, EIS_name) as file:
+        buffer = memoryview(file.read())
+    modules = [module for module in mpr_modules(buffer) if module['shortname'].strip() == b'VMP data']
+    if len(modules) != 1:
+        raise ValueError('expected one data module in '+path+EIS_name+', found '+str(len(modules)))
+    data_module = modules[0]['data']
+    n_points = int(np.frombuffer(data_module, dtype='<u4', count=1)[0])
+    n_columns = int(np.frombuffer(data_module, dtype='u1', count=1, offset=4)[0])
+    version = int(modules[0]['version'])
+    if version == 0:
+        column_ids = np.frombuffer(data_module, dtype='u1', count=n_columns, offset=5)
+        offset = 100
+    elif version in (2, 3):
+        column_ids = np.frombuffer(data_module, dtype='<u2', count=n_columns, offset=5)
+        offset = 405 if version == 2 else 406
+    else:
+        raise ValueError('data module version '+str(version)+' of the .mpr file is not supported, export the file to .mpt')
+    rows = np.frombuffer(data_module, dtype=mpr_dtype(column_ids.tolist()), count=n_points, offset=offset)
+
+    names = [correct_text_EIS(name) for name in rows.dtype.names]
+    usecols = select_columns(names, columns, added=['cycle_number'])
+    data = pd.DataFrame(dict((name, rows[field]) for name, field in zip(names, rows.dtype.names) if name in usecols), columns=usecols)
+    data = data.astype(dict((name, np.float64 if name in analysis_columns else aux_dtype) for name in data.columns if data[name].dtype.kind == 'f')) #float32 in the file
+    if 'cycle_number' not in data.columns and (columns in ('analysis', 'all') or 'cycle_number' in columns):
+        data = data.assign(cycle_number = 1.0)
     return data
 
 #
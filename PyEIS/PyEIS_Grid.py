@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+This script contains the frequency grid used by the simulation, fitting, and Jacobian functions
+
+A freq_grid holds the angular frequencies of one spectrum and caches jw, log(jw), and sqrt(jw) the first time they are needed, so a
+constant phase element becomes (jw)^n = exp(n*log(jw)) without a complex power of jw on every iteration of a fit. As the grid is a
+numpy array, it can be given wherever w is given today, and the helpers below also accept plain arrays of w.
+"""
+import numpy as np
+
+class freq_grid(np.ndarray):
+    '''
+    Angular frequency grid [1/s] of a spectrum with cached jw, log(jw), and sqrt(jw)
+
+    Slices of the grid, e.g. w[None, :] or w[mask], are grids with their own cache, while arithmetic on the grid returns plain
+    numpy arrays. The grid must not be changed in-place after the cached values have been used.
+
+    Inputs
+    ----------
+    w = Angular frequency [1/s]
+    dtype = complex dtype of the impedance, np.complex128 (default) or np.complex64, see real_dtype(). With np.complex64 the grid is
+    float32, and jw, log(jw), and sqrt(jw) are complex64, so the circuit functions evaluate in single precision
+    '''
+    def __new__(cls, w, dtype=np.complex128):
+        return np.asarray(w, dtype=real_dtype(dtype)).view(cls)
+
+    def __array_wrap__(self, obj, context=None, return_scalar=False):
+        if obj.shape == ():
+            return obj[()]
+        return obj.view(np.ndarray)
+
+    def __reduce__(self):
+        return (freq_grid, (self.view(np.ndarray), complex_dtype(self.dtype)))
+
+    @property
+    def jw(self):
+        if '_jw' not in self.__dict__:
+            self._jw = 1j*self.view(np.ndarray)
+        return self._jw
+
+    @property
+    def log_jw(self):
+        if '_log_jw' not in self.__dict__:
+            self._log_jw = np.log(self.jw)
+        return self._log_jw
+
+    @property
+    def sqrt_jw(self):
+        if '_sqrt_jw' not in self.__dict__:
+            self._sqrt_jw = np.sqrt(self.jw)
+        return self._sqrt_jw
+
+def real_dtype(dtype):
+    '''
+    Returns the real dtype of the frequencies for a complex dtype of the impedance, i.e. float32 for complex64 and float64 otherwise
+    '''
+    if np.dtype(dtype) in (np.dtype(np.complex64), np.dtype(np.float32)):
+        return np.dtype(np.float32)
+    return np.dtype(np.float64)
+
+def complex_dtype(dtype):
+    '''
+    Returns the complex dtype of the impedance for a real dtype of the frequencies, i.e. complex64 for float32 and complex128 otherwise
+    '''
+    if np.dtype(dtype) in (np.dtype(np.complex64), np.dtype(np.float32)):
+        return np.dtype(np.complex64)
+    return np.dtype(np.complex128)
+
+def jw(w):
+    '''
+    Returns jw, cached if w is a freq_grid
+    '''
+    if isinstance(w, freq_grid):
+        return w.jw
+    return w*1j
+
+def log_jw(w):
+    '''
+    Returns log(jw), cached if w is a freq_grid
+    '''
+    if isinstance(w, freq_grid):
+        return w.log_jw
+    return np.log(w*1j)
+
+def sqrt_jw(w):
+    '''
+    Returns sqrt(jw), cached if w is a freq_grid
+    '''
+    if isinstance(w, freq_grid):
+        return w.sqrt_jw
+    return np.sqrt(w*1j)
+
+def jw_pow(w, n):
+    '''
+    Returns (jw)^n, as exp(n*log(jw)) from the cached log(jw) if w is a freq_grid
+    '''
+    if isinstance(w, freq_grid):
+        return np.exp(n*w.log_jw)
+    return (w*1j)**n
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+This script contains vectorized complex hyperbolic functions used by the transmission line and 1D solid-state diffusion models
+
+The arguments of coth(), csch(), tanh() and sinh() in these models span from ~10^-6 to well above 10^3, where np.sinh, np.tanh and
+np.cosh overflow (|x| > ~710) and the ratios of exponentials lose precision for small |x|. The functions below use the odd symmetry
+to work with Re(x) >= 0, where exp(-2x) never overflows, expm1() to retain precision for small |x|, and asymptotic branches for
+Re(x) > 19, where exp(-2x) is below the double precision machine epsilon.
+"""
+import numpy as np
+
+asymptotic_limit = 19 #Re(x) above which exp(-2x) < 2.2e-16 and coth(x) == tanh(x) == 1 to machine precision
+
+def _reflect(x):
+    '''
+    Returns (z, sign) with z = sign*x and Re(z) >= 0, used by the odd hyperbolic functions
+    '''
+    x = np.asarray(x)
+    if not np.iscomplexobj(x):
+        x = x.astype(np.result_type(x.dtype, np.complex64))
+    sign = np.where(x.real < 0, -1, 1).astype(x.real.dtype)
+    return x*sign, sign
+
+def coth(x):
+    '''
+    Complex hyperbolic cotangent, coth(x) = (1 + exp(-2x))/(1 - exp(-2x))
+
+    Overflow-safe for any |x| and vectorized over arrays of any shape
+    '''
+    z, sign = _reflect(x)
+    em1 = np.expm1(-2*z) #exp(-2z) - 1
+    with np.errstate(divide='ignore', invalid='ignore'):
+        out = -(2 + em1)/em1
+    out = np.where(z.real > asymptotic_limit, 1, out)
+    return sign*out
+
+def tanh(x):
+    '''
+    Complex hyperbolic tangent, tanh(x) = (1 - exp(-2x))/(1 + exp(-2x))
+
+    Overflow-safe for any |x| and vectorized over arrays of any shape
+    '''
+    z, sign = _reflect(x)
+    em1 = np.expm1(-2*z)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        out = -em1/(2 + em1)
+    out = np.where(z.real > asymptotic_limit, 1, out)
+    return sign*out
+
+def csch(x):
+    '''
+    Complex hyperbolic cosecant, csch(x) = 1/sinh(x) = 2*exp(-x)/(1 - exp(-2x))
+
+    Overflow-safe for any |x|, csch(x) underflows to 0 where sinh(x) would overflow
+    '''
+    z, sign = _reflect(x)
+    with np.errstate(divide='ignore', invalid='ignore', under='ignore'):
+        out = -2*np.exp(-z)/np.expm1(-2*z)
+        out = np.where(z.real > asymptotic_limit, 2*np.exp(-z), out)
+    return sign*out
+
+def sinh(x):
+    '''
+    Complex hyperbolic sine, sinh(x) = (1 - exp(-2x))/(2*exp(-x))
+
+    Vectorized over arrays of any shape. sinh(x) itself overflows to +-inf for Re(x) > ~710, use csch() where 1/sinh(x) is needed.
+    Above asymptotic_limit, sinh(x) = exp(Re(x) - log(2))*(cos(Im(x)) + j*sin(Im(x))), so the modulus only overflows where the
+    result does, and a zero imaginary part stays zero instead of inf*0 = nan
+    '''
+    z, sign = _reflect(x)
+    with np.errstate(over='ignore', invalid='ignore'):
+        out = -np.expm1(-2*z)*np.exp(z)/2
+        modulus = np.exp(z.real - np.log(2))
+        asymptotic = modulus*np.cos(z.imag) + 1j*np.where(z.imag == 0, 0, modulus*np.sin(z.imag))
+        out = np.where(z.real > asymptotic_limit, asymptotic, out).astype(z.dtype)
+        return np.where(sign < 0, -out, out) #-out, as sign*out gives nan for infinite out
@@ -0,0 +1,447 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+This script contains the analytic Jacobians of the equivalent circuits used in the CNLS fitting
+
+Each element returns a term (Z, dZ), where Z is the complex impedance and dZ is a dict with the derivatives of Z with respect to the
+named parameters. Terms are combined by the chain rule through series (jac_series) and parallel (jac_parallel) connections, and
+through the interfacial impedance of the transmission lines (jac_TL, jac_TLs). The -RQ-/-RC- elements are differentiated with
+respect to R, Q, and n, and jac_plan() moves the derivative of the derived parameter onto the parameters given in the fit.
+"""
+import numpy as np
+from .PyEIS_Hyperbolic import coth, csch, tanh
+from .PyEIS_Grid import jw, log_jw, sqrt_jw, jw_pow
+
+### Composition rules
+##
+#
+def _add_derivative(dZ, name, d):
+    if name is None:
+        return
+    if name in dZ:
+        dZ[name] = dZ[name] + d
+    else:
+        dZ[name] = d
+
+def jac_series(*terms):
+    '''
+    Series connection, Z = Z1 + Z2 + ..., dZ/dp = dZ1/dp + dZ2/dp + ...
+    '''
+    Z = 0
+    dZ = {}
+    for Z_i, dZ_i in terms:
+        Z = Z + Z_i
+        for name, d in dZ_i.items():
+            _add_derivative(dZ, name, d)
+    return Z, dZ
+
+def jac_parallel(*terms):
+    '''
+    Parallel connection, 1/Z = 1/Z1 + 1/Z2 + ..., dZ/dp = Z^2 * (dZ1/dp / Z1^2 + dZ2/dp / Z2^2 + ...)
+    '''
+    Y = 0
+    for Z_i, dZ_i in terms:
+        Y = Y + 1/Z_i
+    Z = 1/Y
+    dZ = {}
+    for Z_i, dZ_i in terms:
+        scale = (Z/Z_i)**2
+        for name, d in dZ_i.items():
+            _add_derivative(dZ, name, scale*d)
+    return Z, dZ
+
+def jac_plan(term, plan, params):
+    '''
+    Chain rule for the parameterization plan of an -RQ- or -RC- element, see RQ_plan()
+
+    The term must be differentiated with respect to the names plan.R, plan.Q, and plan.n. The derivative with respect to the derived
+    parameter is replaced by its contributions to the derivatives with respect to the three given parameters
+
+    Inputs
+    ----------
+    term = (Z, dZ)
+    plan = RQ_plan of the element
+    params = parameter values
+    '''
+    Z, dZ = term
+    derived = plan.derived
+    if derived == plan.fs: #R, Q, and n are all given
+        return term
+    values = plan(params)
+    R, Q = values[0], values[1]
+    n = values[2] if len(values) == 3 else 1
+    fs = params[plan.fs]
+    log_wfs = np.log(2*np.pi*fs)
+    if derived == plan.R: #R = 1/(Q*(2*pi*fs)^n)
+        partials = {plan.Q: -R/Q, plan.n: -R*log_wfs, plan.fs: -n*R/fs}
+    elif derived == plan.Q: #Q = 1/(R*(2*pi*fs)^n)
+        partials = {plan.R: -Q/R, plan.n: -Q*log_wfs, plan.fs: -n*Q/fs}
+    else: #n = ln(Q*R)/ln(1/(2*pi*fs))
+        partials = {plan.R: -1/(R*log_wfs), plan.Q: -1/(Q*log_wfs), plan.fs: np.log(Q*R)/(fs*log_wfs**2)}
+    dZ = dict(dZ)
+    d_derived = dZ.pop(derived, 0)
+    for name, partial in partials.items():
+        _add_derivative(dZ, name, d_derived*partial)
+    return Z, dZ
+
+### Element Jacobians
+##
+#
+def jac_R(R, R_name='R'):
+    '''
+    Jacobian Function: -R-
+    '''
+    return R, {R_name: 1.0}
+
+def jac_L(w, L, L_name='L'):
+    '''
+    Jacobian Function: -L-
+    '''
+    return jw(w)*L, {L_name: jw(w)}
+
+def jac_C(w, C, C_name='C'):
+    '''
+    Jacobian Function: -C-, Z = 1/(C*jw)
+    '''
+    Z = 1/(C*jw(w))
+    return Z, {C_name: -Z/C}
+
+def jac_Q(w, Q, n, Q_name='Q', n_name='n'):
+    '''
+    Jacobian Function: -Q-, Z = 1/(Q*(jw)^n)
+
+    Inputs
+    ----------
+    n_name = name of the exponent, use n_name=None for a fixed exponent
+    '''
+    Z = 1/(Q*jw_pow(w, n))
+    dZ = {Q_name: -Z/Q}
+    _add_derivative(dZ, n_name, -Z*log_jw(w))
+    return Z, dZ
+
+def jac_W(w, sigma, sigma_name='sigma'):
+    '''
+    Jacobian Function: semi-infinite linear Warburg, Z = sigma*w^(-1/2) - j*sigma*w^(-1/2)
+    '''
+    Z = sigma*np.sqrt(2)/sqrt_jw(w)
+    return Z, {sigma_name: Z/sigma}
+
+def jac_W_1Dsolid(w, R_w, n_w, radius, D, R_w_name='R_w', n_w_name='n_w', radius_name='radius', D_name='D'):
+    '''
+    Jacobian Function: 1D solid-state diffusion Warburg, Z = R_w*coth(x)/x with x = (tau*jw)^n_w and tau = radius^2/D
+    '''
+    time_const = (radius**2)/D
+    x = time_const**n_w * jw_pow(w, n_w)
+    coth_x = coth(x)
+    Z = R_w * coth_x/x
+    dZ_dx = -R_w * (csch(x)**2/x + coth_x/x**2)
+    dZ = {R_w_name: coth_x/x,
+          n_w_name: dZ_dx*x*(np.log(time_const) + log_jw(w)),
+          radius_name: dZ_dx*2*n_w*x/radius,
+          D_name: -dZ_dx*n_w*x/D}
+    return Z, dZ
+
+def jac_RQ(w, R, Q, n, R_name='R', Q_name='Q', n_name='n'):
+    '''
+    Jacobian Function: -RQ-, with respect to R, Q, and n. Use n=1 and n_name=None for -RC-
+    '''
+    return jac_parallel(jac_R(R, R_name), jac_Q(w, Q, n, Q_name, n_name))
+
+def jac_TLs(Phi_term, Ri, L, Ri_name='Ri', L_name='L'):
+    '''
+    Jacobian Function: simplified transmission line, Z = Lam*Ri*coth(x) with Lam = (Phi/Ri)^(1/2) and x = L/Lam
+
+    The interfacial impedance, Phi, is given as a term (Phi, dPhi), which is chained into the derivatives
+    '''
+    Phi, dPhi = Phi_term
+    Lam = (Phi/Ri)**(1/2)
+    x = L/Lam
+    coth_x = coth(x)
+    csch2_x = csch(x)**2
+    Z = Lam * Ri * coth_x
+    dZ_dLam = Ri * (coth_x + x*csch2_x)
+    dZ_dPhi = dZ_dLam * Lam/(2*Phi)
+    dZ = {name: dZ_dPhi*d for name, d in dPhi.items()}
+    _add_derivative(dZ, Ri_name, Lam*coth_x - dZ_dLam*Lam/(2*Ri))
+    _add_derivative(dZ, L_name, -Ri*csch2_x)
+    return Z, dZ
+
+def jac_TL(Phi_term, Rel, Ri, L, Rel_name='Rel', Ri_name='Ri', L_name='L'):
+    '''
+    Jacobian Function: transmission line with both Ri and Rel
+    Z = a*(L + 2*Lam*csch(x)) + Lam*b*coth(x), a = Rel*Ri/(Rel+Ri), b = (Rel^2+Ri^2)/(Rel+Ri), Lam = (Phi/(Rel+Ri))^(1/2), x = L/Lam
+
+    The interfacial impedance, Phi, is given as a term (Phi, dPhi), which is chained into the derivatives
+    '''
+    Phi, dPhi = Phi_term
+    R_sum = Rel+Ri
+    a = (Rel*Ri)/R_sum
+    b = (Rel**2 + Ri**2)/R_sum
+    Lam = (Phi/R_sum)**(1/2)
+    x = L/Lam
+    coth_x = coth(x)
+    csch_x = csch(x)
+    Z = a * (L+(2*Lam*csch_x)) + Lam * b * coth_x
+
+    dZ_da = L + 2*Lam*csch_x
+    dZ_db = Lam*coth_x
+    dZ_dLam = 2*a*csch_x*(1 + x*coth_x) + b*(coth_x + x*csch_x**2)
+    dLam_dR = -Lam/(2*R_sum) #identical for Rel and Ri
+    dZ = {name: dZ_dLam*Lam/(2*Phi)*d for name, d in dPhi.items()}
+    _add_derivative(dZ, Ri_name, dZ_da*Rel**2/R_sum**2 + dZ_db*(Ri**2 + 2*Ri*Rel - Rel**2)/R_sum**2 + dZ_dLam*dLam_dR)
+    _add_derivative(dZ, Rel_name, dZ_da*Ri**2/R_sum**2 + dZ_db*(Rel**2 + 2*Rel*Ri - Ri**2)/R_sum**2 + dZ_dLam*dLam_dR)
+    _add_derivative(dZ, L_name, a*(1 - 2*csch_x*coth_x) - b*csch_x**2)
+    return Z, dZ
+
+def jac_ZD(w, Rb, L, D_s, u1, u2, Rb_name='Rb', L_name='L', D_s_name='D_s', u1_name='u1', u2_name='u2'):
+    '''
+    Jacobian Function: mass transport impedance of cir_RCRCZD(), Z_D = Rb*(u2/u1)*tanh(alpha)/alpha with alpha = (jw*L^2/D_s)^(1/2)
+    '''
+    alpha = sqrt_jw(w) * ((L**2)/D_s)**(1/2)
+    tanh_a = tanh(alpha)
+    Z = Rb * (u2/u1) * (tanh_a/alpha)
+    dZ_dalpha = Rb * (u2/u1) * ((1 - tanh_a**2)/alpha - tanh_a/alpha**2)
+    dZ = {Rb_name: Z/Rb,
+          u2_name: Z/u2,
+          u1_name: -Z/u1,
+          L_name: dZ_dalpha*alpha/L,
+          D_s_name: -dZ_dalpha*alpha/(2*D_s)}
+    return Z, dZ
+
+### Circuit Jacobians
+##
+#
+def elem_C_jac(params, w, plan=None):
+    '''
+    Jacobian Function: -C-
+    '''
+    return jac_C(w, params['C'])
+
+def elem_Q_jac(params, w, plan=None):
+    '''
+    Jacobian Function: -Q-
+    '''
+    return jac_Q(w, params['Q'], params['n'])
+
+def cir_RsC_jac(params, w, plan=None):
+    '''
+    Jacobian Function: -Rs-C-
+    '''
+    return jac_series(jac_R(params['Rs'], 'Rs'), jac_C(w, params['C']))
+
+def cir_RsQ_jac(params, w, plan=None):
+    '''
+    Jacobian Function: -Rs-Q-
+    '''
+    return jac_series(jac_R(params['Rs'], 'Rs'), jac_Q(w, params['Q'], params['n']))
+
+def cir_RC_jac(params, w, plan):
+    '''
+    Jacobian Function: -RC-
+    '''
+    R, C = plan[0](params)
+    return jac_plan(jac_RQ(w, R, C, 1, 'R', 'C', None), plan[0], params)
+
+def cir_RQ_jac(params, w, plan):
+    '''
+    Jacobian Function: -RQ-
+    '''
+    R, Q, n = plan[0](params)
+    return jac_plan(jac_RQ(w, R, Q, n), plan[0], params)
+
+def cir_RsRQ_jac(params, w, plan):
+    '''
+    Jacobian Function: -Rs-RQ-
+    '''
+    R, Q, n = plan[0](params)
+    term = jac_series(jac_R(params['Rs'], 'Rs'), jac_RQ(w, R, Q, n))
+    return jac_plan(term, plan[0], params)
+
+def cir_RsRQRQ_jac(params, w, plan):
+    '''
+    Jacobian Function: -Rs-RQ-RQ-
+    '''
+    R, Q, n = plan[0](params)
+    R2, Q2, n2 = plan[1](params)
+    term = jac_series(jac_R(params['Rs'], 'Rs'), jac_RQ(w, R, Q, n), jac_RQ(w, R2, Q2, n2, 'R2', 'Q2', 'n2'))
+    return jac_plan(jac_plan(term, plan[0], params), plan[1], params)
+
+def cir_RsRCC_jac(params, w, plan=None):
+    '''
+    Jacobian Function: -Rs-RC-C-
+    '''
+    RC = jac_RQ(w, params['R1'], params['C1'], 1, 'R1', 'C1', None)
+    return jac_series(jac_R(params['Rs'], 'Rs'), RC, jac_C(w, params['C']))
+
+def cir_RsRCQ_jac(params, w, plan=None):
+    '''
+    Jacobian Function: -Rs-RC-Q-
+    '''
+    RC = jac_RQ(w, params['R1'], params['C1'], 1, 'R1', 'C1', None)
+    return jac_series(jac_R(params['Rs'], 'Rs'), RC, jac_Q(w, params['Q'], params['n']))
+
+def cir_RsRQQ_jac(params, w, plan):
+    '''
+    Jacobian Function: -Rs-RQ-Q-
+    '''
+    R1, Q1, n1 = plan[0](params)
+    term = jac_series(jac_R(params['Rs'], 'Rs'), jac_RQ(w, R1, Q1, n1, 'R1', 'Q1', 'n1'), jac_Q(w, params['Q'], params['n']))
+    return jac_plan(term, plan[0], params)
+
+def cir_RsRQC_jac(params, w, plan):
+    '''
+    Jacobian Function: -Rs-RQ-C-
+    '''
+    R1, Q1, n1 = plan[0](params)
+    term = jac_series(jac_R(params['Rs'], 'Rs'), jac_RQ(w, R1, Q1, n1, 'R1', 'Q1', 'n1'), jac_C(w, params['C']))
+    return jac_plan(term, plan[0], params)
+
+def cir_Randles_simplified_jac(params, w, plan):
+    '''
+    Jacobian Function: Randles simplified -Rs-(Q-(RW)-)-
+    '''
+    R, Q, n = plan[0](params)
+    Z_RW = jac_series(jac_R(R), jac_W(w, params['sigma']))
+    term = jac_series(jac_R(params['Rs'], 'Rs'), jac_parallel(jac_Q(w, Q, n), Z_RW))
+    return jac_plan(term, plan[0], params)
+
+def cir_C_RC_C_jac(params, w, plan):
+    '''
+    Jacobian Function: -C-(RC)-C-
+    '''
+    Rb, Cb = plan[0](params)
+    term = jac_series(jac_C(w, params['Ce'], 'Ce'), jac_RQ(w, Rb, Cb, 1, 'Rb', 'Cb', None))
+    return jac_plan(term, plan[0], params)
+
+def cir_Q_RQ_Q_jac(params, w, plan):
+    '''
+    Jacobian Function: -Q-(RQ)-Q-
+    '''
+    Rb, Qb, nb = plan[0](params)
+    term = jac_series(jac_Q(w, params['Qe'], params['ne'], 'Qe', 'ne'), jac_RQ(w, Rb, Qb, nb, 'Rb', 'Qb', 'nb'))
+    return jac_plan(term, plan[0], params)
+
+def cir_RCRCZD_jac(params, w, plan):
+    '''
+    Jacobian Function: -RC_b-RC_e-Z_D
+    '''
+    Re, Ce = plan[0](params)
+    Rb, Cb = plan[1](params)
+    Z_D = jac_ZD(w, Rb, params['L'], params['D_s'], params['u1'], params['u2'])
+    term = jac_series(jac_RQ(w, Rb, Cb, 1, 'Rb', 'Cb', None), jac_RQ(w, Re, Ce, 1, 'Re', 'Ce', None), Z_D)
+    return jac_plan(jac_plan(term, plan[0], params), plan[1], params)
+
+def cir_RsTLsQ_jac(params, w, plan=None):
+    '''
+    Jacobian Function: -Rs-TLsQ-
+    '''
+    Phi = jac_Q(w, params['Q'], params['n'])
+    return jac_series(jac_R(params['Rs'], 'Rs'), jac_TLs(Phi, params['Ri'], params['L']))
+
+def cir_RsRQTLsQ_jac(params, w, plan):
+    '''
+    Jacobian Function: -Rs-RQ-TLsQ-
+    '''
+    R1, Q1, n1 = plan[0](params)
+    Phi = jac_Q(w, params['Q'], params['n'])
+    term = jac_series(jac_R(params['Rs'], 'Rs'), jac_RQ(w, R1, Q1, n1, 'R1', 'Q1', 'n1'), jac_TLs(Phi, params['Ri'], params['L']))
+    return jac_plan(term, plan[0], params)
+
+def cir_RsTLs_jac(params, w, plan):
+    '''
+    Jacobian Function: -Rs-TLs-
+    '''
+    R, Q, n = plan[0](params)
+    term = jac_series(jac_R(params['Rs'], 'Rs'), jac_TLs(jac_RQ(w, R, Q, n), params['Ri'], params['L']))
+    return jac_plan(term, plan[0], params)
+
+def cir_RsRQTLs_jac(params, w, plan):
+    '''
+    Jacobian Function: -Rs-RQ-TLs-
+    '''
+    R1, Q1, n1 = plan[0](params)
+    R2, Q2, n2 = plan[1](params)
+    Phi = jac_RQ(w, R2, Q2, n2, 'R2', 'Q2', 'n2')
+    term = jac_series(jac_R(params['Rs'], 'Rs'), jac_RQ(w, R1, Q1, n1, 'R1', 'Q1', 'n1'), jac_TLs(Phi, params['Ri'], params['L']))
+    return jac_plan(jac_plan(term, plan[0], params), plan[1], params)
+
+def cir_RsTLQ_jac(params, w, plan=None):
+    '''
+    Jacobian Function: -R-TLQ-
+    '''
+    Phi = jac_Q(w, params['Q'], params['n'])
+    return jac_series(jac_R(params['Rs'], 'Rs'), jac_TL(Phi, params['Rel'], params['Ri'], params['L']))
+
+def cir_RsRQTLQ_jac(params, w, plan):
+    '''
+    Jacobian Function: -R-RQ-TLQ-
+    '''
+    R1, Q1, n1 = plan[0](params)
+    Phi = jac_Q(w, params['Q'], params['n'])
+    term = jac_series(jac_R(params['Rs'], 'Rs'), jac_RQ(w, R1, Q1, n1, 'R1', 'Q1', 'n1'), jac_TL(Phi, params['Rel'], params['Ri'], params['L']))
+    return jac_plan(term, plan[0], params)
+
+def cir_RsTL_jac(params, w, plan):
+    '''
+    Jacobian Function: -R-TL-
+    '''
+    R, Q, n = plan[0](params)
+    term = jac_series(jac_R(params['Rs'], 'Rs'), jac_TL(jac_RQ(w, R, Q, n), params['Rel'], params['Ri'], params['L']))
+    return jac_plan(term, plan[0], params)
+
+def cir_RsRQTL_jac(params, w, plan):
+    '''
+    Jacobian Function: -R-RQ-TL-
+    '''
+    R1, Q1, n1 = plan[0](params)
+    R2, Q2, n2 = plan[1](params)
+    Phi = jac_RQ(w, R2, Q2, n2, 'R2', 'Q2', 'n2')
+    term = jac_series(jac_R(params['Rs'], 'Rs'), jac_RQ(w, R1, Q1, n1, 'R1', 'Q1', 'n1'), jac_TL(Phi, params['Rel'], params['Ri'], params['L']))
+    return jac_plan(jac_plan(term, plan[0], params), plan[1], params)
+
+def cir_RsTL_1Dsolid_jac(params, w, plan=None):
+    '''
+    Jacobian Function: -R-TL(Q(RW))-
+    '''
+    Z_w = jac_W_1Dsolid(w, params['R_w'], params['n_w'], params['radius'], params['D'])
+    Z_Randles = jac_parallel(jac_Q(w, params['Q'], params['n']), jac_series(jac_R(params['R']), Z_w))
+    return jac_series(jac_R(params['Rs'], 'Rs'), jac_TL(Z_Randles, params['Rel'], params['Ri'], params['L']))
+
+def cir_RsRQTL_1Dsolid_jac(params, w, plan):
+    '''
+    Jacobian Function: -R-RQ-TL(Q(RW))-
+    '''
+    R1, Q1, n1 = plan[0](params)
+    Z_w = jac_W_1Dsolid(w, params['R_w'], params['n_w'], params['radius'], params['D'])
+    Z_Randles = jac_parallel(jac_Q(w, params['Q2'], params['n2'], 'Q2', 'n2'), jac_series(jac_R(params['R2'], 'R2'), Z_w))
+    term = jac_series(jac_R(params['Rs'], 'Rs'), jac_RQ(w, R1, Q1, n1, 'R1', 'Q1', 'n1'), jac_TL(Z_Randles, params['Rel'], params['Ri'], params['L']))
+    return jac_plan(term, plan[0], params)
+
+circuit_jac_functions = {
+    'C': elem_C_jac,
+    'Q': elem_Q_jac,
+    'R-C': cir_RsC_jac,
+    'R-Q': cir_RsQ_jac,
+    'RC': cir_RC_jac,
+    'RQ': cir_RQ_jac,
+    'R-RQ': cir_RsRQ_jac,
+    'R-RQ-RQ': cir_RsRQRQ_jac,
+    'R-RC-C': cir_RsRCC_jac,
+    'R-RC-Q': cir_RsRCQ_jac,
+    'R-RQ-Q': cir_RsRQQ_jac,
+    'R-RQ-C': cir_RsRQC_jac,
+    'R-(Q(RW))': cir_Randles_simplified_jac,
+    'C-RC-C': cir_C_RC_C_jac,
+    'Q-RQ-Q': cir_Q_RQ_Q_jac,
+    'RC-RC-ZD': cir_RCRCZD_jac,
+    'R-TLsQ': cir_RsTLsQ_jac,
+    'R-RQ-TLsQ': cir_RsRQTLsQ_jac,
+    'R-TLs': cir_RsTLs_jac,
+    'R-RQ-TLs': cir_RsRQTLs_jac,
+    'R-TLQ': cir_RsTLQ_jac,
+    'R-RQ-TLQ': cir_RsRQTLQ_jac,
+    'R-TL': cir_RsTL_jac,
+    'R-RQ-TL': cir_RsRQTL_jac,
+    'R-TL1Dsolid': cir_RsTL_1Dsolid_jac,
+    'R-RQ-TL1Dsolid': cir_RsRQTL_1Dsolid_jac,
+    }
@@ -5,4625 +5,46 @@ Created on Mon Jun 4 18:23:35 2018
 
 This script contains the core for the linear Kramer-Kronig analysis
 
-@author: Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-"""
-import numpy as np
-from lmfit import minimize, Minimizer, Parameters, Parameter, report_fit
-
-### Simulation Functions
-##
-#
-
-def KK_RC2(w, Rs, R_values, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    return Rs + (R_values[0]/(1+w*1j*t_values[0])) + (R_values[1] /(1+w*1j*t_values[1]))
-
-def KK_RC3(w, Rs, R_values, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    return Rs + (R_values[0]/(1+w*1j*t_values[0])) + (R_values[1] /(1+w*1j*t_values[1])) + (R_values[2] /(1+w*1j*t_values[2]))
-
-def KK_RC4(w, Rs, R_values, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    return Rs + (R_values[0]/(1+w*1j*t_values[0])) + (R_values[1] /(1+w*1j*t_values[1])) + (R_values[2] /(1+w*1j*t_values[2])) + (R_values[3] /(1+w*1j*t_values[3]))
-
-def KK_RC5(w, Rs, R_values, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    return Rs + (R_values[0]/(1+w*1j*t_values[0])) + (R_values[1] /(1+w*1j*t_values[1])) + (R_values[2] /(1+w*1j*t_values[2])) + (R_values[3] /(1+w*1j*t_values[3])) + (R_values[4] /(1+w*1j*t_values[4]))
-
-def KK_RC6(w, Rs, R_values, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    return Rs + (R_values[0]/(1+w*1j*t_values[0])) + (R_values[1] /(1+w*1j*t_values[1])) + (R_values[2] /(1+w*1j*t_values[2])) + (R_values[3] /(1+w*1j*t_values[3])) + (R_values[4] /(1+w*1j*t_values[4])) + (R_values[5] /(1+w*1j*t_values[5]))
-
-def KK_RC7(w, Rs, R_values, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    return Rs + (R_values[0]/(1+w*1j*t_values[0])) + (R_values[1] /(1+w*1j*t_values[1])) + (R_values[2] /(1+w*1j*t_values[2])) + (R_values[3] /(1+w*1j*t_values[3])) + (R_values[4] /(1+w*1j*t_values[4])) + (R_values[5] /(1+w*1j*t_values[5])) + (R_values[6] /(1+w*1j*t_values[6]))
-
-def KK_RC8(w, Rs, R_values, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    return Rs + (R_values[0]/(1+w*1j*t_values[0])) + (R_values[1] /(1+w*1j*t_values[1])) + (R_values[2] /(1+w*1j*t_values[2])) + (R_values[3] /(1+w*1j*t_values[3])) + (R_values[4] /(1+w*1j*t_values[4])) + (R_values[5] /(1+w*1j*t_values[5])) + (R_values[6] /(1+w*1j*t_values[6])) + (R_values[7] /(1+w*1j*t_values[7]))
-
-def KK_RC9(w, Rs, R_values, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    return Rs + (R_values[0]/(1+w*1j*t_values[0])) + (R_values[1] /(1+w*1j*t_values[1])) + (R_values[2] /(1+w*1j*t_values[2])) + (R_values[3] /(1+w*1j*t_values[3])) + (R_values[4] /(1+w*1j*t_values[4])) + (R_values[5] /(1+w*1j*t_values[5])) + (R_values[6] /(1+w*1j*t_values[6])) + (R_values[7] /(1+w*1j*t_values[7])) + (R_values[8] /(1+w*1j*t_values[8]))
-
-def KK_RC10(w, Rs, R_values, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    return Rs + (R_values[0]/(1+w*1j*t_values[0])) + (R_values[1] /(1+w*1j*t_values[1])) + (R_values[2] /(1+w*1j*t_values[2])) + (R_values[3] /(1+w*1j*t_values[3])) + (R_values[4] /(1+w*1j*t_values[4])) + (R_values[5] /(1+w*1j*t_values[5])) + (R_values[6] /(1+w*1j*t_values[6])) + (R_values[7] /(1+w*1j*t_values[7])) + (R_values[8] /(1+w*1j*t_values[8])) + (R_values[9] /(1+w*1j*t_values[9]))
-
-def KK_RC11(w, Rs, R_values, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    return Rs + (R_values[0]/(1+w*1j*t_values[0])) + (R_values[1] /(1+w*1j*t_values[1])) + (R_values[2] /(1+w*1j*t_values[2])) + (R_values[3] /(1+w*1j*t_values[3])) + (R_values[4] /(1+w*1j*t_values[4])) + (R_values[5] /(1+w*1j*t_values[5])) + (R_values[6] /(1+w*1j*t_values[6])) + (R_values[7] /(1+w*1j*t_values[7])) + (R_values[8] /(1+w*1j*t_values[8])) + (R_values[9] /(1+w*1j*t_values[9])) + (R_values[10] /(1+w*1j*t_values[10]))
-
-def KK_RC12(w, Rs, R_values, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    return Rs + (R_values[0]/(1+w*1j*t_values[0])) + (R_values[1] /(1+w*1j*t_values[1])) + (R_values[2] /(1+w*1j*t_values[2])) + (R_values[3] /(1+w*1j*t_values[3])) + (R_values[4] /(1+w*1j*t_values[4])) + (R_values[5] /(1+w*1j*t_values[5])) + (R_values[6] /(1+w*1j*t_values[6])) + (R_values[7] /(1+w*1j*t_values[7])) + (R_values[8] /(1+w*1j*t_values[8])) + (R_values[9] /(1+w*1j*t_values[9])) + (R_values[10] /(1+w*1j*t_values[10])) + (R_values[11] /(1+w*1j*t_values[11]))
-
-def KK_RC13(w, Rs, R_values, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    return Rs + (R_values[0]/(1+w*1j*t_values[0])) + (R_values[1] /(1+w*1j*t_values[1])) + (R_values[2] /(1+w*1j*t_values[2])) + (R_values[3] /(1+w*1j*t_values[3])) + (R_values[4] /(1+w*1j*t_values[4])) + (R_values[5] /(1+w*1j*t_values[5])) + (R_values[6] /(1+w*1j*t_values[6])) + (R_values[7] /(1+w*1j*t_values[7])) + (R_values[8] /(1+w*1j*t_values[8])) + (R_values[9] /(1+w*1j*t_values[9])) + (R_values[10] /(1+w*1j*t_values[10])) + (R_values[11] /(1+w*1j*t_values[11])) + (R_values[12] /(1+w*1j*t_values[12]))
-
-def KK_RC14(w, Rs, R_values, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    return Rs + (R_values[0]/(1+w*1j*t_values[0])) + (R_values[1] /(1+w*1j*t_values[1])) + (R_values[2] /(1+w*1j*t_values[2])) + (R_values[3] /(1+w*1j*t_values[3])) + (R_values[4] /(1+w*1j*t_values[4])) + (R_values[5] /(1+w*1j*t_values[5])) + (R_values[6] /(1+w*1j*t_values[6])) + (R_values[7] /(1+w*1j*t_values[7])) + (R_values[8] /(1+w*1j*t_values[8])) + (R_values[9] /(1+w*1j*t_values[9])) + (R_values[10] /(1+w*1j*t_values[10])) + (R_values[11] /(1+w*1j*t_values[11])) + (R_values[12] /(1+w*1j*t_values[12])) + (R_values[13] /(1+w*1j*t_values[13]))
-
-def KK_RC15(w, Rs, R_values, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    return Rs + (R_values[0]/(1+w*1j*t_values[0])) + (R_values[1] /(1+w*1j*t_values[1])) + (R_values[2] /(1+w*1j*t_values[2])) + (R_values[3] /(1+w*1j*t_values[3])) + (R_values[4] /(1+w*1j*t_values[4])) + (R_values[5] /(1+w*1j*t_values[5])) + (R_values[6] /(1+w*1j*t_values[6])) + (R_values[7] /(1+w*1j*t_values[7])) + (R_values[8] /(1+w*1j*t_values[8])) + (R_values[9] /(1+w*1j*t_values[9])) + (R_values[10] /(1+w*1j*t_values[10])) + (R_values[11] /(1+w*1j*t_values[11])) + (R_values[12] /(1+w*1j*t_values[12])) + (R_values[13] /(1+w*1j*t_values[13])) + (R_values[14] /(1+w*1j*t_values[14]))
-
-def KK_RC16(w, Rs, R_values, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    return Rs + (R_values[0]/(1+w*1j*t_values[0])) + (R_values[1] /(1+w*1j*t_values[1])) + (R_values[2] /(1+w*1j*t_values[2])) + (R_values[3] /(1+w*1j*t_values[3])) + (R_values[4] /(1+w*1j*t_values[4])) + (R_values[5] /(1+w*1j*t_values[5])) + (R_values[6] /(1+w*1j*t_values[6])) + (R_values[7] /(1+w*1j*t_values[7])) + (R_values[8] /(1+w*1j*t_values[8])) + (R_values[9] /(1+w*1j*t_values[9])) + (R_values[10] /(1+w*1j*t_values[10])) + (R_values[11] /(1+w*1j*t_values[11])) + (R_values[12] /(1+w*1j*t_values[12])) + (R_values[13] /(1+w*1j*t_values[13])) + (R_values[14] /(1+w*1j*t_values[14])) + (R_values[15] /(1+w*1j*t_values[15]))
-
-def KK_RC17(w, Rs, R_values, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    return Rs + (R_values[0]/(1+w*1j*t_values[0])) + (R_values[1] /(1+w*1j*t_values[1])) + (R_values[2] /(1+w*1j*t_values[2])) + (R_values[3] /(1+w*1j*t_values[3])) + (R_values[4] /(1+w*1j*t_values[4])) + (R_values[5] /(1+w*1j*t_values[5])) + (R_values[6] /(1+w*1j*t_values[6])) + (R_values[7] /(1+w*1j*t_values[7])) + (R_values[8] /(1+w*1j*t_values[8])) + (R_values[9] /(1+w*1j*t_values[9])) + (R_values[10] /(1+w*1j*t_values[10])) + (R_values[11] /(1+w*1j*t_values[11])) + (R_values[12] /(1+w*1j*t_values[12])) + (R_values[13] /(1+w*1j*t_values[13])) + (R_values[14] /(1+w*1j*t_values[14])) + (R_values[15] /(1+w*1j*t_values[15])) + (R_values[16] /(1+w*1j*t_values[16]))
-
-def KK_RC18(w, Rs, R_values, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    return Rs + (R_values[0]/(1+w*1j*t_values[0])) + (R_values[1] /(1+w*1j*t_values[1])) + (R_values[2] /(1+w*1j*t_values[2])) + (R_values[3] /(1+w*1j*t_values[3])) + (R_values[4] /(1+w*1j*t_values[4])) + (R_values[5] /(1+w*1j*t_values[5])) + (R_values[6] /(1+w*1j*t_values[6])) + (R_values[7] /(1+w*1j*t_values[7])) + (R_values[8] /(1+w*1j*t_values[8])) + (R_values[9] /(1+w*1j*t_values[9])) + (R_values[10] /(1+w*1j*t_values[10])) + (R_values[11] /(1+w*1j*t_values[11])) + (R_values[12] /(1+w*1j*t_values[12])) + (R_values[13] /(1+w*1j*t_values[13])) + (R_values[14] /(1+w*1j*t_values[14])) + (R_values[15] /(1+w*1j*t_values[15])) + (R_values[16] /(1+w*1j*t_values[16])) + (R_values[17] /(1+w*1j*t_values[17]))
-
-def KK_RC19(w, Rs, R_values, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    return Rs + (R_values[0]/(1+w*1j*t_values[0])) + (R_values[1] /(1+w*1j*t_values[1])) + (R_values[2] /(1+w*1j*t_values[2])) + (R_values[3] /(1+w*1j*t_values[3])) + (R_values[4] /(1+w*1j*t_values[4])) + (R_values[5] /(1+w*1j*t_values[5])) + (R_values[6] /(1+w*1j*t_values[6])) + (R_values[7] /(1+w*1j*t_values[7])) + (R_values[8] /(1+w*1j*t_values[8])) + (R_values[9] /(1+w*1j*t_values[9])) + (R_values[10] /(1+w*1j*t_values[10])) + (R_values[11] /(1+w*1j*t_values[11])) + (R_values[12] /(1+w*1j*t_values[12])) + (R_values[13] /(1+w*1j*t_values[13])) + (R_values[14] /(1+w*1j*t_values[14])) + (R_values[15] /(1+w*1j*t_values[15])) + (R_values[16] /(1+w*1j*t_values[16])) + (R_values[17] /(1+w*1j*t_values[17])) + (R_values[18] /(1+w*1j*t_values[18]))
-
-def KK_RC20(w, Rs, R_values, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    return Rs + (R_values[0]/(1+w*1j*t_values[0])) + (R_values[1] /(1+w*1j*t_values[1])) + (R_values[2] /(1+w*1j*t_values[2])) + (R_values[3] /(1+w*1j*t_values[3])) + (R_values[4] /(1+w*1j*t_values[4])) + (R_values[5] /(1+w*1j*t_values[5])) + (R_values[6] /(1+w*1j*t_values[6])) + (R_values[7] /(1+w*1j*t_values[7])) + (R_values[8] /(1+w*1j*t_values[8])) + (R_values[9] /(1+w*1j*t_values[9])) + (R_values[10] /(1+w*1j*t_values[10])) + (R_values[11] /(1+w*1j*t_values[11])) + (R_values[12] /(1+w*1j*t_values[12])) + (R_values[13] /(1+w*1j*t_values[13])) + (R_values[14] /(1+w*1j*t_values[14])) + (R_values[15] /(1+w*1j*t_values[15])) + (R_values[16] /(1+w*1j*t_values[16])) + (R_values[17] /(1+w*1j*t_values[17])) + (R_values[18] /(1+w*1j*t_values[18])) + (R_values[19] /(1+w*1j*t_values[19]))
-
-def KK_RC21(w, Rs, R_values, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    return Rs + (R_values[0]/(1+w*1j*t_values[0])) + (R_values[1] /(1+w*1j*t_values[1])) + (R_values[2] /(1+w*1j*t_values[2])) + (R_values[3] /(1+w*1j*t_values[3])) + (R_values[4] /(1+w*1j*t_values[4])) + (R_values[5] /(1+w*1j*t_values[5])) + (R_values[6] /(1+w*1j*t_values[6])) + (R_values[7] /(1+w*1j*t_values[7])) + (R_values[8] /(1+w*1j*t_values[8])) + (R_values[9] /(1+w*1j*t_values[9])) + (R_values[10] /(1+w*1j*t_values[10])) + (R_values[11] /(1+w*1j*t_values[11])) + (R_values[12] /(1+w*1j*t_values[12])) + (R_values[13] /(1+w*1j*t_values[13])) + (R_values[14] /(1+w*1j*t_values[14])) + (R_values[15] /(1+w*1j*t_values[15])) + (R_values[16] /(1+w*1j*t_values[16])) + (R_values[17] /(1+w*1j*t_values[17])) + (R_values[18] /(1+w*1j*t_values[18])) + (R_values[19] /(1+w*1j*t_values[19])) + (R_values[20] /(1+w*1j*t_values[20]))
-
-def KK_RC22(w, Rs, R_values, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    return Rs + (R_values[0]/(1+w*1j*t_values[0])) + (R_values[1] /(1+w*1j*t_values[1])) + (R_values[2] /(1+w*1j*t_values[2])) + (R_values[3] /(1+w*1j*t_values[3])) + (R_values[4] /(1+w*1j*t_values[4])) + (R_values[5] /(1+w*1j*t_values[5])) + (R_values[6] /(1+w*1j*t_values[6])) + (R_values[7] /(1+w*1j*t_values[7])) + (R_values[8] /(1+w*1j*t_values[8])) + (R_values[9] /(1+w*1j*t_values[9])) + (R_values[10] /(1+w*1j*t_values[10])) + (R_values[11] /(1+w*1j*t_values[11])) + (R_values[12] /(1+w*1j*t_values[12])) + (R_values[13] /(1+w*1j*t_values[13])) + (R_values[14] /(1+w*1j*t_values[14])) + (R_values[15] /(1+w*1j*t_values[15])) + (R_values[16] /(1+w*1j*t_values[16])) + (R_values[17] /(1+w*1j*t_values[17])) + (R_values[18] /(1+w*1j*t_values[18])) + (R_values[19] /(1+w*1j*t_values[19])) + (R_values[20] /(1+w*1j*t_values[20])) + (R_values[21] /(1+w*1j*t_values[21]))
-
-def KK_RC23(w, Rs, R_values, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    return Rs + (R_values[0]/(1+w*1j*t_values[0])) + (R_values[1] /(1+w*1j*t_values[1])) + (R_values[2] /(1+w*1j*t_values[2])) + (R_values[3] /(1+w*1j*t_values[3])) + (R_values[4] /(1+w*1j*t_values[4])) + (R_values[5] /(1+w*1j*t_values[5])) + (R_values[6] /(1+w*1j*t_values[6])) + (R_values[7] /(1+w*1j*t_values[7])) + (R_values[8] /(1+w*1j*t_values[8])) + (R_values[9] /(1+w*1j*t_values[9])) + (R_values[10] /(1+w*1j*t_values[10])) + (R_values[11] /(1+w*1j*t_values[11])) + (R_values[12] /(1+w*1j*t_values[12])) + (R_values[13] /(1+w*1j*t_values[13])) + (R_values[14] /(1+w*1j*t_values[14])) + (R_values[15] /(1+w*1j*t_values[15])) + (R_values[16] /(1+w*1j*t_values[16])) + (R_values[17] /(1+w*1j*t_values[17])) + (R_values[18] /(1+w*1j*t_values[18])) + (R_values[19] /(1+w*1j*t_values[19])) + (R_values[20] /(1+w*1j*t_values[20])) + (R_values[21] /(1+w*1j*t_values[21])) + (R_values[22] /(1+w*1j*t_values[22]))
-
-def KK_RC24(w, Rs, R_values, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    return Rs + (R_values[0]/(1+w*1j*t_values[0])) + (R_values[1] /(1+w*1j*t_values[1])) + (R_values[2] /(1+w*1j*t_values[2])) + (R_values[3] /(1+w*1j*t_values[3])) + (R_values[4] /(1+w*1j*t_values[4])) + (R_values[5] /(1+w*1j*t_values[5])) + (R_values[6] /(1+w*1j*t_values[6])) + (R_values[7] /(1+w*1j*t_values[7])) + (R_values[8] /(1+w*1j*t_values[8])) + (R_values[9] /(1+w*1j*t_values[9])) + (R_values[10] /(1+w*1j*t_values[10])) + (R_values[11] /(1+w*1j*t_values[11])) + (R_values[12] /(1+w*1j*t_values[12])) + (R_values[13] /(1+w*1j*t_values[13])) + (R_values[14] /(1+w*1j*t_values[14])) + (R_values[15] /(1+w*1j*t_values[15])) + (R_values[16] /(1+w*1j*t_values[16])) + (R_values[17] /(1+w*1j*t_values[17])) + (R_values[18] /(1+w*1j*t_values[18])) + (R_values[19] /(1+w*1j*t_values[19])) + (R_values[20] /(1+w*1j*t_values[20])) + (R_values[21] /(1+w*1j*t_values[21])) + (R_values[22] /(1+w*1j*t_values[22])) + (R_values[23] /(1+w*1j*t_values[23]))
-
-def KK_RC25(w, Rs, R_values, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    return Rs + (R_values[0]/(1+w*1j*t_values[0])) + (R_values[1] /(1+w*1j*t_values[1])) + (R_values[2] /(1+w*1j*t_values[2])) + (R_values[3] /(1+w*1j*t_values[3])) + (R_values[4] /(1+w*1j*t_values[4])) + (R_values[5] /(1+w*1j*t_values[5])) + (R_values[6] /(1+w*1j*t_values[6])) + (R_values[7] /(1+w*1j*t_values[7])) + (R_values[8] /(1+w*1j*t_values[8])) + (R_values[9] /(1+w*1j*t_values[9])) + (R_values[10] /(1+w*1j*t_values[10])) + (R_values[11] /(1+w*1j*t_values[11])) + (R_values[12] /(1+w*1j*t_values[12])) + (R_values[13] /(1+w*1j*t_values[13])) + (R_values[14] /(1+w*1j*t_values[14])) + (R_values[15] /(1+w*1j*t_values[15])) + (R_values[16] /(1+w*1j*t_values[16])) + (R_values[17] /(1+w*1j*t_values[17])) + (R_values[18] /(1+w*1j*t_values[18])) + (R_values[19] /(1+w*1j*t_values[19])) + (R_values[20] /(1+w*1j*t_values[20])) + (R_values[21] /(1+w*1j*t_values[21])) + (R_values[22] /(1+w*1j*t_values[22])) + (R_values[23] /(1+w*1j*t_values[23])) + (R_values[24] /(1+w*1j*t_values[24]))
-
-def KK_RC26(w, Rs, R_values, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    return Rs + (R_values[0]/(1+w*1j*t_values[0])) + (R_values[1] /(1+w*1j*t_values[1])) + (R_values[2] /(1+w*1j*t_values[2])) + (R_values[3] /(1+w*1j*t_values[3])) + (R_values[4] /(1+w*1j*t_values[4])) + (R_values[5] /(1+w*1j*t_values[5])) + (R_values[6] /(1+w*1j*t_values[6])) + (R_values[7] /(1+w*1j*t_values[7])) + (R_values[8] /(1+w*1j*t_values[8])) + (R_values[9] /(1+w*1j*t_values[9])) + (R_values[10] /(1+w*1j*t_values[10])) + (R_values[11] /(1+w*1j*t_values[11])) + (R_values[12] /(1+w*1j*t_values[12])) + (R_values[13] /(1+w*1j*t_values[13])) + (R_values[14] /(1+w*1j*t_values[14])) + (R_values[15] /(1+w*1j*t_values[15])) + (R_values[16] /(1+w*1j*t_values[16])) + (R_values[17] /(1+w*1j*t_values[17])) + (R_values[18] /(1+w*1j*t_values[18])) + (R_values[19] /(1+w*1j*t_values[19])) + (R_values[20] /(1+w*1j*t_values[20])) + (R_values[21] /(1+w*1j*t_values[21])) + (R_values[22] /(1+w*1j*t_values[22])) + (R_values[23] /(1+w*1j*t_values[23])) + (R_values[24] /(1+w*1j*t_values[24])) + (R_values[25] /(1+w*1j*t_values[25]))
-
-def KK_RC27(w, Rs, R_values, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    return Rs + (R_values[0]/(1+w*1j*t_values[0])) + (R_values[1] /(1+w*1j*t_values[1])) + (R_values[2] /(1+w*1j*t_values[2])) + (R_values[3] /(1+w*1j*t_values[3])) + (R_values[4] /(1+w*1j*t_values[4])) + (R_values[5] /(1+w*1j*t_values[5])) + (R_values[6] /(1+w*1j*t_values[6])) + (R_values[7] /(1+w*1j*t_values[7])) + (R_values[8] /(1+w*1j*t_values[8])) + (R_values[9] /(1+w*1j*t_values[9])) + (R_values[10] /(1+w*1j*t_values[10])) + (R_values[11] /(1+w*1j*t_values[11])) + (R_values[12] /(1+w*1j*t_values[12])) + (R_values[13] /(1+w*1j*t_values[13])) + (R_values[14] /(1+w*1j*t_values[14])) + (R_values[15] /(1+w*1j*t_values[15])) + (R_values[16] /(1+w*1j*t_values[16])) + (R_values[17] /(1+w*1j*t_values[17])) + (R_values[18] /(1+w*1j*t_values[18])) + (R_values[19] /(1+w*1j*t_values[19])) + (R_values[20] /(1+w*1j*t_values[20])) + (R_values[21] /(1+w*1j*t_values[21])) + (R_values[22] /(1+w*1j*t_values[22])) + (R_values[23] /(1+w*1j*t_values[23])) + (R_values[24] /(1+w*1j*t_values[24])) + (R_values[25] /(1+w*1j*t_values[25])) + (R_values[26] /(1+w*1j*t_values[26]))
-
-def KK_RC28(w, Rs, R_values, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    return Rs + (R_values[0]/(1+w*1j*t_values[0])) + (R_values[1] /(1+w*1j*t_values[1])) + (R_values[2] /(1+w*1j*t_values[2])) + (R_values[3] /(1+w*1j*t_values[3])) + (R_values[4] /(1+w*1j*t_values[4])) + (R_values[5] /(1+w*1j*t_values[5])) + (R_values[6] /(1+w*1j*t_values[6])) + (R_values[7] /(1+w*1j*t_values[7])) + (R_values[8] /(1+w*1j*t_values[8])) + (R_values[9] /(1+w*1j*t_values[9])) + (R_values[10] /(1+w*1j*t_values[10])) + (R_values[11] /(1+w*1j*t_values[11])) + (R_values[12] /(1+w*1j*t_values[12])) + (R_values[13] /(1+w*1j*t_values[13])) + (R_values[14] /(1+w*1j*t_values[14])) + (R_values[15] /(1+w*1j*t_values[15])) + (R_values[16] /(1+w*1j*t_values[16])) + (R_values[17] /(1+w*1j*t_values[17])) + (R_values[18] /(1+w*1j*t_values[18])) + (R_values[19] /(1+w*1j*t_values[19])) + (R_values[20] /(1+w*1j*t_values[20])) + (R_values[21] /(1+w*1j*t_values[21])) + (R_values[22] /(1+w*1j*t_values[22])) + (R_values[23] /(1+w*1j*t_values[23])) + (R_values[24] /(1+w*1j*t_values[24])) + (R_values[25] /(1+w*1j*t_values[25])) + (R_values[26] /(1+w*1j*t_values[26])) + (R_values[27] /(1+w*1j*t_values[27]))
-
-def KK_RC29(w, Rs, R_values, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    return Rs + (R_values[0]/(1+w*1j*t_values[0])) + (R_values[1] /(1+w*1j*t_values[1])) + (R_values[2] /(1+w*1j*t_values[2])) + (R_values[3] /(1+w*1j*t_values[3])) + (R_values[4] /(1+w*1j*t_values[4])) + (R_values[5] /(1+w*1j*t_values[5])) + (R_values[6] /(1+w*1j*t_values[6])) + (R_values[7] /(1+w*1j*t_values[7])) + (R_values[8] /(1+w*1j*t_values[8])) + (R_values[9] /(1+w*1j*t_values[9])) + (R_values[10] /(1+w*1j*t_values[10])) + (R_values[11] /(1+w*1j*t_values[11])) + (R_values[12] /(1+w*1j*t_values[12])) + (R_values[13] /(1+w*1j*t_values[13])) + (R_values[14] /(1+w*1j*t_values[14])) + (R_values[15] /(1+w*1j*t_values[15])) + (R_values[16] /(1+w*1j*t_values[16])) + (R_values[17] /(1+w*1j*t_values[17])) + (R_values[18] /(1+w*1j*t_values[18])) + (R_values[19] /(1+w*1j*t_values[19])) + (R_values[20] /(1+w*1j*t_values[20])) + (R_values[21] /(1+w*1j*t_values[21])) + (R_values[22] /(1+w*1j*t_values[22])) + (R_values[23] /(1+w*1j*t_values[23])) + (R_values[24] /(1+w*1j*t_values[24])) + (R_values[25] /(1+w*1j*t_values[25])) + (R_values[26] /(1+w*1j*t_values[26])) + (R_values[27] /(1+w*1j*t_values[27])) + (R_values[28] /(1+w*1j*t_values[28]))
-
-def KK_RC30(w, Rs, R_values, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    return Rs + (R_values[0]/(1+w*1j*t_values[0])) + (R_values[1] /(1+w*1j*t_values[1])) + (R_values[2] /(1+w*1j*t_values[2])) + (R_values[3] /(1+w*1j*t_values[3])) + (R_values[4] /(1+w*1j*t_values[4])) + (R_values[5] /(1+w*1j*t_values[5])) + (R_values[6] /(1+w*1j*t_values[6])) + (R_values[7] /(1+w*1j*t_values[7])) + (R_values[8] /(1+w*1j*t_values[8])) + (R_values[9] /(1+w*1j*t_values[9])) + (R_values[10] /(1+w*1j*t_values[10])) + (R_values[11] /(1+w*1j*t_values[11])) + (R_values[12] /(1+w*1j*t_values[12])) + (R_values[13] /(1+w*1j*t_values[13])) + (R_values[14] /(1+w*1j*t_values[14])) + (R_values[15] /(1+w*1j*t_values[15])) + (R_values[16] /(1+w*1j*t_values[16])) + (R_values[17] /(1+w*1j*t_values[17])) + (R_values[18] /(1+w*1j*t_values[18])) + (R_values[19] /(1+w*1j*t_values[19])) + (R_values[20] /(1+w*1j*t_values[20])) + (R_values[21] /(1+w*1j*t_values[21])) + (R_values[22] /(1+w*1j*t_values[22])) + (R_values[23] /(1+w*1j*t_values[23])) + (R_values[24] /(1+w*1j*t_values[24])) + (R_values[25] /(1+w*1j*t_values[25])) + (R_values[26] /(1+w*1j*t_values[26])) + (R_values[27] /(1+w*1j*t_values[27])) + (R_values[28] /(1+w*1j*t_values[28])) + (R_values[29] /(1+w*1j*t_values[29]))
-
-def KK_RC31(w, Rs, R_values, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    return Rs + (R_values[0]/(1+w*1j*t_values[0])) + (R_values[1] /(1+w*1j*t_values[1])) + (R_values[2] /(1+w*1j*t_values[2])) + (R_values[3] /(1+w*1j*t_values[3])) + (R_values[4] /(1+w*1j*t_values[4])) + (R_values[5] /(1+w*1j*t_values[5])) + (R_values[6] /(1+w*1j*t_values[6])) + (R_values[7] /(1+w*1j*t_values[7])) + (R_values[8] /(1+w*1j*t_values[8])) + (R_values[9] /(1+w*1j*t_values[9])) + (R_values[10] /(1+w*1j*t_values[10])) + (R_values[11] /(1+w*1j*t_values[11])) + (R_values[12] /(1+w*1j*t_values[12])) + (R_values[13] /(1+w*1j*t_values[13])) + (R_values[14] /(1+w*1j*t_values[14])) + (R_values[15] /(1+w*1j*t_values[15])) + (R_values[16] /(1+w*1j*t_values[16])) + (R_values[17] /(1+w*1j*t_values[17])) + (R_values[18] /(1+w*1j*t_values[18])) + (R_values[19] /(1+w*1j*t_values[19])) + (R_values[20] /(1+w*1j*t_values[20])) + (R_values[21] /(1+w*1j*t_values[21])) + (R_values[22] /(1+w*1j*t_values[22])) + (R_values[23] /(1+w*1j*t_values[23])) + (R_values[24] /(1+w*1j*t_values[24])) + (R_values[25] /(1+w*1j*t_values[25])) + (R_values[26] /(1+w*1j*t_values[26])) + (R_values[27] /(1+w*1j*t_values[27])) + (R_values[28] /(1+w*1j*t_values[28])) + (R_values[29] /(1+w*1j*t_values[29])) + (R_values[30] /(1+w*1j*t_values[30]))
-
-def KK_RC32(w, Rs, R_values, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    return Rs + (R_values[0]/(1+w*1j*t_values[0])) + (R_values[1] /(1+w*1j*t_values[1])) + (R_values[2] /(1+w*1j*t_values[2])) + (R_values[3] /(1+w*1j*t_values[3])) + (R_values[4] /(1+w*1j*t_values[4])) + (R_values[5] /(1+w*1j*t_values[5])) + (R_values[6] /(1+w*1j*t_values[6])) + (R_values[7] /(1+w*1j*t_values[7])) + (R_values[8] /(1+w*1j*t_values[8])) + (R_values[9] /(1+w*1j*t_values[9])) + (R_values[10] /(1+w*1j*t_values[10])) + (R_values[11] /(1+w*1j*t_values[11])) + (R_values[12] /(1+w*1j*t_values[12])) + (R_values[13] /(1+w*1j*t_values[13])) + (R_values[14] /(1+w*1j*t_values[14])) + (R_values[15] /(1+w*1j*t_values[15])) + (R_values[16] /(1+w*1j*t_values[16])) + (R_values[17] /(1+w*1j*t_values[17])) + (R_values[18] /(1+w*1j*t_values[18])) + (R_values[19] /(1+w*1j*t_values[19])) + (R_values[20] /(1+w*1j*t_values[20])) + (R_values[21] /(1+w*1j*t_values[21])) + (R_values[22] /(1+w*1j*t_values[22])) + (R_values[23] /(1+w*1j*t_values[23])) + (R_values[24] /(1+w*1j*t_values[24])) + (R_values[25] /(1+w*1j*t_values[25])) + (R_values[26] /(1+w*1j*t_values[26])) + (R_values[27] /(1+w*1j*t_values[27])) + (R_values[28] /(1+w*1j*t_values[28])) + (R_values[29] /(1+w*1j*t_values[29])) + (R_values[30] /(1+w*1j*t_values[30])) + (R_values[31] /(1+w*1j*t_values[31]))
-
-def KK_RC33(w, Rs, R_values, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    return Rs + (R_values[0]/(1+w*1j*t_values[0])) + (R_values[1] /(1+w*1j*t_values[1])) + (R_values[2] /(1+w*1j*t_values[2])) + (R_values[3] /(1+w*1j*t_values[3])) + (R_values[4] /(1+w*1j*t_values[4])) + (R_values[5] /(1+w*1j*t_values[5])) + (R_values[6] /(1+w*1j*t_values[6])) + (R_values[7] /(1+w*1j*t_values[7])) + (R_values[8] /(1+w*1j*t_values[8])) + (R_values[9] /(1+w*1j*t_values[9])) + (R_values[10] /(1+w*1j*t_values[10])) + (R_values[11] /(1+w*1j*t_values[11])) + (R_values[12] /(1+w*1j*t_values[12])) + (R_values[13] /(1+w*1j*t_values[13])) + (R_values[14] /(1+w*1j*t_values[14])) + (R_values[15] /(1+w*1j*t_values[15])) + (R_values[16] /(1+w*1j*t_values[16])) + (R_values[17] /(1+w*1j*t_values[17])) + (R_values[18] /(1+w*1j*t_values[18])) + (R_values[19] /(1+w*1j*t_values[19])) + (R_values[20] /(1+w*1j*t_values[20])) + (R_values[21] /(1+w*1j*t_values[21])) + (R_values[22] /(1+w*1j*t_values[22])) + (R_values[23] /(1+w*1j*t_values[23])) + (R_values[24] /(1+w*1j*t_values[24])) + (R_values[25] /(1+w*1j*t_values[25])) + (R_values[26] /(1+w*1j*t_values[26])) + (R_values[27] /(1+w*1j*t_values[27])) + (R_values[28] /(1+w*1j*t_values[28])) + (R_values[29] /(1+w*1j*t_values[29])) + (R_values[30] /(1+w*1j*t_values[30])) + (R_values[31] /(1+w*1j*t_values[31])) + (R_values[32] /(1+w*1j*t_values[32]))
-
-def KK_RC34(w, Rs, R_values, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    return Rs + (R_values[0]/(1+w*1j*t_values[0])) + (R_values[1] /(1+w*1j*t_values[1])) + (R_values[2] /(1+w*1j*t_values[2])) + (R_values[3] /(1+w*1j*t_values[3])) + (R_values[4] /(1+w*1j*t_values[4])) + (R_values[5] /(1+w*1j*t_values[5])) + (R_values[6] /(1+w*1j*t_values[6])) + (R_values[7] /(1+w*1j*t_values[7])) + (R_values[8] /(1+w*1j*t_values[8])) + (R_values[9] /(1+w*1j*t_values[9])) + (R_values[10] /(1+w*1j*t_values[10])) + (R_values[11] /(1+w*1j*t_values[11])) + (R_values[12] /(1+w*1j*t_values[12])) + (R_values[13] /(1+w*1j*t_values[13])) + (R_values[14] /(1+w*1j*t_values[14])) + (R_values[15] /(1+w*1j*t_values[15])) + (R_values[16] /(1+w*1j*t_values[16])) + (R_values[17] /(1+w*1j*t_values[17])) + (R_values[18] /(1+w*1j*t_values[18])) + (R_values[19] /(1+w*1j*t_values[19])) + (R_values[20] /(1+w*1j*t_values[20])) + (R_values[21] /(1+w*1j*t_values[21])) + (R_values[22] /(1+w*1j*t_values[22])) + (R_values[23] /(1+w*1j*t_values[23])) + (R_values[24] /(1+w*1j*t_values[24])) + (R_values[25] /(1+w*1j*t_values[25])) + (R_values[26] /(1+w*1j*t_values[26])) + (R_values[27] /(1+w*1j*t_values[27])) + (R_values[28] /(1+w*1j*t_values[28])) + (R_values[29] /(1+w*1j*t_values[29])) + (R_values[30] /(1+w*1j*t_values[30])) + (R_values[31] /(1+w*1j*t_values[31])) + (R_values[32] /(1+w*1j*t_values[32])) + (R_values[33] /(1+w*1j*t_values[33]))
-
-def KK_RC35(w, Rs, R_values, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    return Rs + (R_values[0]/(1+w*1j*t_values[0])) + (R_values[1] /(1+w*1j*t_values[1])) + (R_values[2] /(1+w*1j*t_values[2])) + (R_values[3] /(1+w*1j*t_values[3])) + (R_values[4] /(1+w*1j*t_values[4])) + (R_values[5] /(1+w*1j*t_values[5])) + (R_values[6] /(1+w*1j*t_values[6])) + (R_values[7] /(1+w*1j*t_values[7])) + (R_values[8] /(1+w*1j*t_values[8])) + (R_values[9] /(1+w*1j*t_values[9])) + (R_values[10] /(1+w*1j*t_values[10])) + (R_values[11] /(1+w*1j*t_values[11])) + (R_values[12] /(1+w*1j*t_values[12])) + (R_values[13] /(1+w*1j*t_values[13])) + (R_values[14] /(1+w*1j*t_values[14])) + (R_values[15] /(1+w*1j*t_values[15])) + (R_values[16] /(1+w*1j*t_values[16])) + (R_values[17] /(1+w*1j*t_values[17])) + (R_values[18] /(1+w*1j*t_values[18])) + (R_values[19] /(1+w*1j*t_values[19])) + (R_values[20] /(1+w*1j*t_values[20])) + (R_values[21] /(1+w*1j*t_values[21])) + (R_values[22] /(1+w*1j*t_values[22])) + (R_values[23] /(1+w*1j*t_values[23])) + (R_values[24] /(1+w*1j*t_values[24])) + (R_values[25] /(1+w*1j*t_values[25])) + (R_values[26] /(1+w*1j*t_values[26])) + (R_values[27] /(1+w*1j*t_values[27])) + (R_values[28] /(1+w*1j*t_values[28])) + (R_values[29] /(1+w*1j*t_values[29])) + (R_values[30] /(1+w*1j*t_values[30])) + (R_values[31] /(1+w*1j*t_values[31])) + (R_values[32] /(1+w*1j*t_values[32])) + (R_values[33] /(1+w*1j*t_values[33])) + (R_values[34] /(1+w*1j*t_values[34]))
-
-def KK_RC36(w, Rs, R_values, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    return Rs + (R_values[0]/(1+w*1j*t_values[0])) + (R_values[1] /(1+w*1j*t_values[1])) + (R_values[2] /(1+w*1j*t_values[2])) + (R_values[3] /(1+w*1j*t_values[3])) + (R_values[4] /(1+w*1j*t_values[4])) + (R_values[5] /(1+w*1j*t_values[5])) + (R_values[6] /(1+w*1j*t_values[6])) + (R_values[7] /(1+w*1j*t_values[7])) + (R_values[8] /(1+w*1j*t_values[8])) + (R_values[9] /(1+w*1j*t_values[9])) + (R_values[10] /(1+w*1j*t_values[10])) + (R_values[11] /(1+w*1j*t_values[11])) + (R_values[12] /(1+w*1j*t_values[12])) + (R_values[13] /(1+w*1j*t_values[13])) + (R_values[14] /(1+w*1j*t_values[14])) + (R_values[15] /(1+w*1j*t_values[15])) + (R_values[16] /(1+w*1j*t_values[16])) + (R_values[17] /(1+w*1j*t_values[17])) + (R_values[18] /(1+w*1j*t_values[18])) + (R_values[19] /(1+w*1j*t_values[19])) + (R_values[20] /(1+w*1j*t_values[20])) + (R_values[21] /(1+w*1j*t_values[21])) + (R_values[22] /(1+w*1j*t_values[22])) + (R_values[23] /(1+w*1j*t_values[23])) + (R_values[24] /(1+w*1j*t_values[24])) + (R_values[25] /(1+w*1j*t_values[25])) + (R_values[26] /(1+w*1j*t_values[26])) + (R_values[27] /(1+w*1j*t_values[27])) + (R_values[28] /(1+w*1j*t_values[28])) + (R_values[29] /(1+w*1j*t_values[29])) + (R_values[30] /(1+w*1j*t_values[30])) + (R_values[31] /(1+w*1j*t_values[31])) + (R_values[32] /(1+w*1j*t_values[32])) + (R_values[33] /(1+w*1j*t_values[33])) + (R_values[34] /(1+w*1j*t_values[34]))  + (R_values[35] /(1+w*1j*t_values[35]))
-
-def KK_RC37(w, Rs, R_values, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    return Rs + (R_values[0]/(1+w*1j*t_values[0])) + (R_values[1] /(1+w*1j*t_values[1])) + (R_values[2] /(1+w*1j*t_values[2])) + (R_values[3] /(1+w*1j*t_values[3])) + (R_values[4] /(1+w*1j*t_values[4])) + (R_values[5] /(1+w*1j*t_values[5])) + (R_values[6] /(1+w*1j*t_values[6])) + (R_values[7] /(1+w*1j*t_values[7])) + (R_values[8] /(1+w*1j*t_values[8])) + (R_values[9] /(1+w*1j*t_values[9])) + (R_values[10] /(1+w*1j*t_values[10])) + (R_values[11] /(1+w*1j*t_values[11])) + (R_values[12] /(1+w*1j*t_values[12])) + (R_values[13] /(1+w*1j*t_values[13])) + (R_values[14] /(1+w*1j*t_values[14])) + (R_values[15] /(1+w*1j*t_values[15])) + (R_values[16] /(1+w*1j*t_values[16])) + (R_values[17] /(1+w*1j*t_values[17])) + (R_values[18] /(1+w*1j*t_values[18])) + (R_values[19] /(1+w*1j*t_values[19])) + (R_values[20] /(1+w*1j*t_values[20])) + (R_values[21] /(1+w*1j*t_values[21])) + (R_values[22] /(1+w*1j*t_values[22])) + (R_values[23] /(1+w*1j*t_values[23])) + (R_values[24] /(1+w*1j*t_values[24])) + (R_values[25] /(1+w*1j*t_values[25])) + (R_values[26] /(1+w*1j*t_values[26])) + (R_values[27] /(1+w*1j*t_values[27])) + (R_values[28] /(1+w*1j*t_values[28])) + (R_values[29] /(1+w*1j*t_values[29])) + (R_values[30] /(1+w*1j*t_values[30])) + (R_values[31] /(1+w*1j*t_values[31])) + (R_values[32] /(1+w*1j*t_values[32])) + (R_values[33] /(1+w*1j*t_values[33])) + (R_values[34] /(1+w*1j*t_values[34]))  + (R_values[35] /(1+w*1j*t_values[35])) + (R_values[36] /(1+w*1j*t_values[36]))
-
-def KK_RC38(w, Rs, R_values, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    return Rs + (R_values[0]/(1+w*1j*t_values[0])) + (R_values[1] /(1+w*1j*t_values[1])) + (R_values[2] /(1+w*1j*t_values[2])) + (R_values[3] /(1+w*1j*t_values[3])) + (R_values[4] /(1+w*1j*t_values[4])) + (R_values[5] /(1+w*1j*t_values[5])) + (R_values[6] /(1+w*1j*t_values[6])) + (R_values[7] /(1+w*1j*t_values[7])) + (R_values[8] /(1+w*1j*t_values[8])) + (R_values[9] /(1+w*1j*t_values[9])) + (R_values[10] /(1+w*1j*t_values[10])) + (R_values[11] /(1+w*1j*t_values[11])) + (R_values[12] /(1+w*1j*t_values[12])) + (R_values[13] /(1+w*1j*t_values[13])) + (R_values[14] /(1+w*1j*t_values[14])) + (R_values[15] /(1+w*1j*t_values[15])) + (R_values[16] /(1+w*1j*t_values[16])) + (R_values[17] /(1+w*1j*t_values[17])) + (R_values[18] /(1+w*1j*t_values[18])) + (R_values[19] /(1+w*1j*t_values[19])) + (R_values[20] /(1+w*1j*t_values[20])) + (R_values[21] /(1+w*1j*t_values[21])) + (R_values[22] /(1+w*1j*t_values[22])) + (R_values[23] /(1+w*1j*t_values[23])) + (R_values[24] /(1+w*1j*t_values[24])) + (R_values[25] /(1+w*1j*t_values[25])) + (R_values[26] /(1+w*1j*t_values[26])) + (R_values[27] /(1+w*1j*t_values[27])) + (R_values[28] /(1+w*1j*t_values[28])) + (R_values[29] /(1+w*1j*t_values[29])) + (R_values[30] /(1+w*1j*t_values[30])) + (R_values[31] /(1+w*1j*t_values[31])) + (R_values[32] /(1+w*1j*t_values[32])) + (R_values[33] /(1+w*1j*t_values[33])) + (R_values[34] /(1+w*1j*t_values[34]))  + (R_values[35] /(1+w*1j*t_values[35])) + (R_values[36] /(1+w*1j*t_values[36])) + (R_values[37] /(1+w*1j*t_values[37]))
-
-def KK_RC39(w, Rs, R_values, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    return Rs + (R_values[0]/(1+w*1j*t_values[0])) + (R_values[1] /(1+w*1j*t_values[1])) + (R_values[2] /(1+w*1j*t_values[2])) + (R_values[3] /(1+w*1j*t_values[3])) + (R_values[4] /(1+w*1j*t_values[4])) + (R_values[5] /(1+w*1j*t_values[5])) + (R_values[6] /(1+w*1j*t_values[6])) + (R_values[7] /(1+w*1j*t_values[7])) + (R_values[8] /(1+w*1j*t_values[8])) + (R_values[9] /(1+w*1j*t_values[9])) + (R_values[10] /(1+w*1j*t_values[10])) + (R_values[11] /(1+w*1j*t_values[11])) + (R_values[12] /(1+w*1j*t_values[12])) + (R_values[13] /(1+w*1j*t_values[13])) + (R_values[14] /(1+w*1j*t_values[14])) + (R_values[15] /(1+w*1j*t_values[15])) + (R_values[16] /(1+w*1j*t_values[16])) + (R_values[17] /(1+w*1j*t_values[17])) + (R_values[18] /(1+w*1j*t_values[18])) + (R_values[19] /(1+w*1j*t_values[19])) + (R_values[20] /(1+w*1j*t_values[20])) + (R_values[21] /(1+w*1j*t_values[21])) + (R_values[22] /(1+w*1j*t_values[22])) + (R_values[23] /(1+w*1j*t_values[23])) + (R_values[24] /(1+w*1j*t_values[24])) + (R_values[25] /(1+w*1j*t_values[25])) + (R_values[26] /(1+w*1j*t_values[26])) + (R_values[27] /(1+w*1j*t_values[27])) + (R_values[28] /(1+w*1j*t_values[28])) + (R_values[29] /(1+w*1j*t_values[29])) + (R_values[30] /(1+w*1j*t_values[30])) + (R_values[31] /(1+w*1j*t_values[31])) + (R_values[32] /(1+w*1j*t_values[32])) + (R_values[33] /(1+w*1j*t_values[33])) + (R_values[34] /(1+w*1j*t_values[34]))  + (R_values[35] /(1+w*1j*t_values[35])) + (R_values[36] /(1+w*1j*t_values[36])) + (R_values[37] /(1+w*1j*t_values[37])) + (R_values[38] /(1+w*1j*t_values[38]))
-
-def KK_RC40(w, Rs, R_values, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    return Rs + (R_values[0]/(1+w*1j*t_values[0])) + (R_values[1] /(1+w*1j*t_values[1])) + (R_values[2] /(1+w*1j*t_values[2])) + (R_values[3] /(1+w*1j*t_values[3])) + (R_values[4] /(1+w*1j*t_values[4])) + (R_values[5] /(1+w*1j*t_values[5])) + (R_values[6] /(1+w*1j*t_values[6])) + (R_values[7] /(1+w*1j*t_values[7])) + (R_values[8] /(1+w*1j*t_values[8])) + (R_values[9] /(1+w*1j*t_values[9])) + (R_values[10] /(1+w*1j*t_values[10])) + (R_values[11] /(1+w*1j*t_values[11])) + (R_values[12] /(1+w*1j*t_values[12])) + (R_values[13] /(1+w*1j*t_values[13])) + (R_values[14] /(1+w*1j*t_values[14])) + (R_values[15] /(1+w*1j*t_values[15])) + (R_values[16] /(1+w*1j*t_values[16])) + (R_values[17] /(1+w*1j*t_values[17])) + (R_values[18] /(1+w*1j*t_values[18])) + (R_values[19] /(1+w*1j*t_values[19])) + (R_values[20] /(1+w*1j*t_values[20])) + (R_values[21] /(1+w*1j*t_values[21])) + (R_values[22] /(1+w*1j*t_values[22])) + (R_values[23] /(1+w*1j*t_values[23])) + (R_values[24] /(1+w*1j*t_values[24])) + (R_values[25] /(1+w*1j*t_values[25])) + (R_values[26] /(1+w*1j*t_values[26])) + (R_values[27] /(1+w*1j*t_values[27])) + (R_values[28] /(1+w*1j*t_values[28])) + (R_values[29] /(1+w*1j*t_values[29])) + (R_values[30] /(1+w*1j*t_values[30])) + (R_values[31] /(1+w*1j*t_values[31])) + (R_values[32] /(1+w*1j*t_values[32])) + (R_values[33] /(1+w*1j*t_values[33])) + (R_values[34] /(1+w*1j*t_values[34]))  + (R_values[35] /(1+w*1j*t_values[35])) + (R_values[36] /(1+w*1j*t_values[36])) + (R_values[37] /(1+w*1j*t_values[37])) + (R_values[38] /(1+w*1j*t_values[38])) + (R_values[39] /(1+w*1j*t_values[39]))
-
-def KK_RC41(w, Rs, R_values, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    return Rs + (R_values[0]/(1+w*1j*t_values[0])) + (R_values[1] /(1+w*1j*t_values[1])) + (R_values[2] /(1+w*1j*t_values[2])) + (R_values[3] /(1+w*1j*t_values[3])) + (R_values[4] /(1+w*1j*t_values[4])) + (R_values[5] /(1+w*1j*t_values[5])) + (R_values[6] /(1+w*1j*t_values[6])) + (R_values[7] /(1+w*1j*t_values[7])) + (R_values[8] /(1+w*1j*t_values[8])) + (R_values[9] /(1+w*1j*t_values[9])) + (R_values[10] /(1+w*1j*t_values[10])) + (R_values[11] /(1+w*1j*t_values[11])) + (R_values[12] /(1+w*1j*t_values[12])) + (R_values[13] /(1+w*1j*t_values[13])) + (R_values[14] /(1+w*1j*t_values[14])) + (R_values[15] /(1+w*1j*t_values[15])) + (R_values[16] /(1+w*1j*t_values[16])) + (R_values[17] /(1+w*1j*t_values[17])) + (R_values[18] /(1+w*1j*t_values[18])) + (R_values[19] /(1+w*1j*t_values[19])) + (R_values[20] /(1+w*1j*t_values[20])) + (R_values[21] /(1+w*1j*t_values[21])) + (R_values[22] /(1+w*1j*t_values[22])) + (R_values[23] /(1+w*1j*t_values[23])) + (R_values[24] /(1+w*1j*t_values[24])) + (R_values[25] /(1+w*1j*t_values[25])) + (R_values[26] /(1+w*1j*t_values[26])) + (R_values[27] /(1+w*1j*t_values[27])) + (R_values[28] /(1+w*1j*t_values[28])) + (R_values[29] /(1+w*1j*t_values[29])) + (R_values[30] /(1+w*1j*t_values[30])) + (R_values[31] /(1+w*1j*t_values[31])) + (R_values[32] /(1+w*1j*t_values[32])) + (R_values[33] /(1+w*1j*t_values[33])) + (R_values[34] /(1+w*1j*t_values[34]))  + (R_values[35] /(1+w*1j*t_values[35])) + (R_values[36] /(1+w*1j*t_values[36])) + (R_values[37] /(1+w*1j*t_values[37])) + (R_values[38] /(1+w*1j*t_values[38])) + (R_values[39] /(1+w*1j*t_values[39])) + (R_values[40] /(1+w*1j*t_values[40]))
-
-def KK_RC42(w, Rs, R_values, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    return Rs + (R_values[0]/(1+w*1j*t_values[0])) + (R_values[1] /(1+w*1j*t_values[1])) + (R_values[2] /(1+w*1j*t_values[2])) + (R_values[3] /(1+w*1j*t_values[3])) + (R_values[4] /(1+w*1j*t_values[4])) + (R_values[5] /(1+w*1j*t_values[5])) + (R_values[6] /(1+w*1j*t_values[6])) + (R_values[7] /(1+w*1j*t_values[7])) + (R_values[8] /(1+w*1j*t_values[8])) + (R_values[9] /(1+w*1j*t_values[9])) + (R_values[10] /(1+w*1j*t_values[10])) + (R_values[11] /(1+w*1j*t_values[11])) + (R_values[12] /(1+w*1j*t_values[12])) + (R_values[13] /(1+w*1j*t_values[13])) + (R_values[14] /(1+w*1j*t_values[14])) + (R_values[15] /(1+w*1j*t_values[15])) + (R_values[16] /(1+w*1j*t_values[16])) + (R_values[17] /(1+w*1j*t_values[17])) + (R_values[18] /(1+w*1j*t_values[18])) + (R_values[19] /(1+w*1j*t_values[19])) + (R_values[20] /(1+w*1j*t_values[20])) + (R_values[21] /(1+w*1j*t_values[21])) + (R_values[22] /(1+w*1j*t_values[22])) + (R_values[23] /(1+w*1j*t_values[23])) + (R_values[24] /(1+w*1j*t_values[24])) + (R_values[25] /(1+w*1j*t_values[25])) + (R_values[26] /(1+w*1j*t_values[26])) + (R_values[27] /(1+w*1j*t_values[27])) + (R_values[28] /(1+w*1j*t_values[28])) + (R_values[29] /(1+w*1j*t_values[29])) + (R_values[30] /(1+w*1j*t_values[30])) + (R_values[31] /(1+w*1j*t_values[31])) + (R_values[32] /(1+w*1j*t_values[32])) + (R_values[33] /(1+w*1j*t_values[33])) + (R_values[34] /(1+w*1j*t_values[34]))  + (R_values[35] /(1+w*1j*t_values[35])) + (R_values[36] /(1+w*1j*t_values[36])) + (R_values[37] /(1+w*1j*t_values[37])) + (R_values[38] /(1+w*1j*t_values[38])) + (R_values[39] /(1+w*1j*t_values[39])) + (R_values[40] /(1+w*1j*t_values[40])) + (R_values[41] /(1+w*1j*t_values[41]))
-
-def KK_RC43(w, Rs, R_values, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    return Rs + (R_values[0]/(1+w*1j*t_values[0])) + (R_values[1] /(1+w*1j*t_values[1])) + (R_values[2] /(1+w*1j*t_values[2])) + (R_values[3] /(1+w*1j*t_values[3])) + (R_values[4] /(1+w*1j*t_values[4])) + (R_values[5] /(1+w*1j*t_values[5])) + (R_values[6] /(1+w*1j*t_values[6])) + (R_values[7] /(1+w*1j*t_values[7])) + (R_values[8] /(1+w*1j*t_values[8])) + (R_values[9] /(1+w*1j*t_values[9])) + (R_values[10] /(1+w*1j*t_values[10])) + (R_values[11] /(1+w*1j*t_values[11])) + (R_values[12] /(1+w*1j*t_values[12])) + (R_values[13] /(1+w*1j*t_values[13])) + (R_values[14] /(1+w*1j*t_values[14])) + (R_values[15] /(1+w*1j*t_values[15])) + (R_values[16] /(1+w*1j*t_values[16])) + (R_values[17] /(1+w*1j*t_values[17])) + (R_values[18] /(1+w*1j*t_values[18])) + (R_values[19] /(1+w*1j*t_values[19])) + (R_values[20] /(1+w*1j*t_values[20])) + (R_values[21] /(1+w*1j*t_values[21])) + (R_values[22] /(1+w*1j*t_values[22])) + (R_values[23] /(1+w*1j*t_values[23])) + (R_values[24] /(1+w*1j*t_values[24])) + (R_values[25] /(1+w*1j*t_values[25])) + (R_values[26] /(1+w*1j*t_values[26])) + (R_values[27] /(1+w*1j*t_values[27])) + (R_values[28] /(1+w*1j*t_values[28])) + (R_values[29] /(1+w*1j*t_values[29])) + (R_values[30] /(1+w*1j*t_values[30])) + (R_values[31] /(1+w*1j*t_values[31])) + (R_values[32] /(1+w*1j*t_values[32])) + (R_values[33] /(1+w*1j*t_values[33])) + (R_values[34] /(1+w*1j*t_values[34]))  + (R_values[35] /(1+w*1j*t_values[35])) + (R_values[36] /(1+w*1j*t_values[36])) + (R_values[37] /(1+w*1j*t_values[37])) + (R_values[38] /(1+w*1j*t_values[38])) + (R_values[39] /(1+w*1j*t_values[39])) + (R_values[40] /(1+w*1j*t_values[40])) + (R_values[41] /(1+w*1j*t_values[41])) + (R_values[42] /(1+w*1j*t_values[42]))
-
-def KK_RC44(w, Rs, R_values, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    return Rs + (R_values[0]/(1+w*1j*t_values[0])) + (R_values[1] /(1+w*1j*t_values[1])) + (R_values[2] /(1+w*1j*t_values[2])) + (R_values[3] /(1+w*1j*t_values[3])) + (R_values[4] /(1+w*1j*t_values[4])) + (R_values[5] /(1+w*1j*t_values[5])) + (R_values[6] /(1+w*1j*t_values[6])) + (R_values[7] /(1+w*1j*t_values[7])) + (R_values[8] /(1+w*1j*t_values[8])) + (R_values[9] /(1+w*1j*t_values[9])) + (R_values[10] /(1+w*1j*t_values[10])) + (R_values[11] /(1+w*1j*t_values[11])) + (R_values[12] /(1+w*1j*t_values[12])) + (R_values[13] /(1+w*1j*t_values[13])) + (R_values[14] /(1+w*1j*t_values[14])) + (R_values[15] /(1+w*1j*t_values[15])) + (R_values[16] /(1+w*1j*t_values[16])) + (R_values[17] /(1+w*1j*t_values[17])) + (R_values[18] /(1+w*1j*t_values[18])) + (R_values[19] /(1+w*1j*t_values[19])) + (R_values[20] /(1+w*1j*t_values[20])) + (R_values[21] /(1+w*1j*t_values[21])) + (R_values[22] /(1+w*1j*t_values[22])) + (R_values[23] /(1+w*1j*t_values[23])) + (R_values[24] /(1+w*1j*t_values[24])) + (R_values[25] /(1+w*1j*t_values[25])) + (R_values[26] /(1+w*1j*t_values[26])) + (R_values[27] /(1+w*1j*t_values[27])) + (R_values[28] /(1+w*1j*t_values[28])) + (R_values[29] /(1+w*1j*t_values[29])) + (R_values[30] /(1+w*1j*t_values[30])) + (R_values[31] /(1+w*1j*t_values[31])) + (R_values[32] /(1+w*1j*t_values[32])) + (R_values[33] /(1+w*1j*t_values[33])) + (R_values[34] /(1+w*1j*t_values[34]))  + (R_values[35] /(1+w*1j*t_values[35])) + (R_values[36] /(1+w*1j*t_values[36])) + (R_values[37] /(1+w*1j*t_values[37])) + (R_values[38] /(1+w*1j*t_values[38])) + (R_values[39] /(1+w*1j*t_values[39])) + (R_values[40] /(1+w*1j*t_values[40])) + (R_values[41] /(1+w*1j*t_values[41])) + (R_values[42] /(1+w*1j*t_values[42])) + (R_values[43] /(1+w*1j*t_values[43]))
-
-def KK_RC45(w, Rs, R_values, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    return Rs + (R_values[0]/(1+w*1j*t_values[0])) + (R_values[1] /(1+w*1j*t_values[1])) + (R_values[2] /(1+w*1j*t_values[2])) + (R_values[3] /(1+w*1j*t_values[3])) + (R_values[4] /(1+w*1j*t_values[4])) + (R_values[5] /(1+w*1j*t_values[5])) + (R_values[6] /(1+w*1j*t_values[6])) + (R_values[7] /(1+w*1j*t_values[7])) + (R_values[8] /(1+w*1j*t_values[8])) + (R_values[9] /(1+w*1j*t_values[9])) + (R_values[10] /(1+w*1j*t_values[10])) + (R_values[11] /(1+w*1j*t_values[11])) + (R_values[12] /(1+w*1j*t_values[12])) + (R_values[13] /(1+w*1j*t_values[13])) + (R_values[14] /(1+w*1j*t_values[14])) + (R_values[15] /(1+w*1j*t_values[15])) + (R_values[16] /(1+w*1j*t_values[16])) + (R_values[17] /(1+w*1j*t_values[17])) + (R_values[18] /(1+w*1j*t_values[18])) + (R_values[19] /(1+w*1j*t_values[19])) + (R_values[20] /(1+w*1j*t_values[20])) + (R_values[21] /(1+w*1j*t_values[21])) + (R_values[22] /(1+w*1j*t_values[22])) + (R_values[23] /(1+w*1j*t_values[23])) + (R_values[24] /(1+w*1j*t_values[24])) + (R_values[25] /(1+w*1j*t_values[25])) + (R_values[26] /(1+w*1j*t_values[26])) + (R_values[27] /(1+w*1j*t_values[27])) + (R_values[28] /(1+w*1j*t_values[28])) + (R_values[29] /(1+w*1j*t_values[29])) + (R_values[30] /(1+w*1j*t_values[30])) + (R_values[31] /(1+w*1j*t_values[31])) + (R_values[32] /(1+w*1j*t_values[32])) + (R_values[33] /(1+w*1j*t_values[33])) + (R_values[34] /(1+w*1j*t_values[34]))  + (R_values[35] /(1+w*1j*t_values[35])) + (R_values[36] /(1+w*1j*t_values[36])) + (R_values[37] /(1+w*1j*t_values[37])) + (R_values[38] /(1+w*1j*t_values[38])) + (R_values[39] /(1+w*1j*t_values[39])) + (R_values[40] /(1+w*1j*t_values[40])) + (R_values[41] /(1+w*1j*t_values[41])) + (R_values[42] /(1+w*1j*t_values[42])) + (R_values[43] /(1+w*1j*t_values[43])) + (R_values[44] /(1+w*1j*t_values[44]))
-
-def KK_RC46(w, Rs, R_values, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    return Rs + (R_values[0]/(1+w*1j*t_values[0])) + (R_values[1] /(1+w*1j*t_values[1])) + (R_values[2] /(1+w*1j*t_values[2])) + (R_values[3] /(1+w*1j*t_values[3])) + (R_values[4] /(1+w*1j*t_values[4])) + (R_values[5] /(1+w*1j*t_values[5])) + (R_values[6] /(1+w*1j*t_values[6])) + (R_values[7] /(1+w*1j*t_values[7])) + (R_values[8] /(1+w*1j*t_values[8])) + (R_values[9] /(1+w*1j*t_values[9])) + (R_values[10] /(1+w*1j*t_values[10])) + (R_values[11] /(1+w*1j*t_values[11])) + (R_values[12] /(1+w*1j*t_values[12])) + (R_values[13] /(1+w*1j*t_values[13])) + (R_values[14] /(1+w*1j*t_values[14])) + (R_values[15] /(1+w*1j*t_values[15])) + (R_values[16] /(1+w*1j*t_values[16])) + (R_values[17] /(1+w*1j*t_values[17])) + (R_values[18] /(1+w*1j*t_values[18])) + (R_values[19] /(1+w*1j*t_values[19])) + (R_values[20] /(1+w*1j*t_values[20])) + (R_values[21] /(1+w*1j*t_values[21])) + (R_values[22] /(1+w*1j*t_values[22])) + (R_values[23] /(1+w*1j*t_values[23])) + (R_values[24] /(1+w*1j*t_values[24])) + (R_values[25] /(1+w*1j*t_values[25])) + (R_values[26] /(1+w*1j*t_values[26])) + (R_values[27] /(1+w*1j*t_values[27])) + (R_values[28] /(1+w*1j*t_values[28])) + (R_values[29] /(1+w*1j*t_values[29])) + (R_values[30] /(1+w*1j*t_values[30])) + (R_values[31] /(1+w*1j*t_values[31])) + (R_values[32] /(1+w*1j*t_values[32])) + (R_values[33] /(1+w*1j*t_values[33])) + (R_values[34] /(1+w*1j*t_values[34]))  + (R_values[35] /(1+w*1j*t_values[35])) + (R_values[36] /(1+w*1j*t_values[36])) + (R_values[37] /(1+w*1j*t_values[37])) + (R_values[38] /(1+w*1j*t_values[38])) + (R_values[39] /(1+w*1j*t_values[39])) + (R_values[40] /(1+w*1j*t_values[40])) + (R_values[41] /(1+w*1j*t_values[41])) + (R_values[42] /(1+w*1j*t_values[42])) + (R_values[43] /(1+w*1j*t_values[43])) + (R_values[44] /(1+w*1j*t_values[44])) + (R_values[45] /(1+w*1j*t_values[45]))
-
-def KK_RC47(w, Rs, R_values, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    return Rs + (R_values[0]/(1+w*1j*t_values[0])) + (R_values[1] /(1+w*1j*t_values[1])) + (R_values[2] /(1+w*1j*t_values[2])) + (R_values[3] /(1+w*1j*t_values[3])) + (R_values[4] /(1+w*1j*t_values[4])) + (R_values[5] /(1+w*1j*t_values[5])) + (R_values[6] /(1+w*1j*t_values[6])) + (R_values[7] /(1+w*1j*t_values[7])) + (R_values[8] /(1+w*1j*t_values[8])) + (R_values[9] /(1+w*1j*t_values[9])) + (R_values[10] /(1+w*1j*t_values[10])) + (R_values[11] /(1+w*1j*t_values[11])) + (R_values[12] /(1+w*1j*t_values[12])) + (R_values[13] /(1+w*1j*t_values[13])) + (R_values[14] /(1+w*1j*t_values[14])) + (R_values[15] /(1+w*1j*t_values[15])) + (R_values[16] /(1+w*1j*t_values[16])) + (R_values[17] /(1+w*1j*t_values[17])) + (R_values[18] /(1+w*1j*t_values[18])) + (R_values[19] /(1+w*1j*t_values[19])) + (R_values[20] /(1+w*1j*t_values[20])) + (R_values[21] /(1+w*1j*t_values[21])) + (R_values[22] /(1+w*1j*t_values[22])) + (R_values[23] /(1+w*1j*t_values[23])) + (R_values[24] /(1+w*1j*t_values[24])) + (R_values[25] /(1+w*1j*t_values[25])) + (R_values[26] /(1+w*1j*t_values[26])) + (R_values[27] /(1+w*1j*t_values[27])) + (R_values[28] /(1+w*1j*t_values[28])) + (R_values[29] /(1+w*1j*t_values[29])) + (R_values[30] /(1+w*1j*t_values[30])) + (R_values[31] /(1+w*1j*t_values[31])) + (R_values[32] /(1+w*1j*t_values[32])) + (R_values[33] /(1+w*1j*t_values[33])) + (R_values[34] /(1+w*1j*t_values[34]))  + (R_values[35] /(1+w*1j*t_values[35])) + (R_values[36] /(1+w*1j*t_values[36])) + (R_values[37] /(1+w*1j*t_values[37])) + (R_values[38] /(1+w*1j*t_values[38])) + (R_values[39] /(1+w*1j*t_values[39])) + (R_values[40] /(1+w*1j*t_values[40])) + (R_values[41] /(1+w*1j*t_values[41])) + (R_values[42] /(1+w*1j*t_values[42])) + (R_values[43] /(1+w*1j*t_values[43])) + (R_values[44] /(1+w*1j*t_values[44])) + (R_values[45] /(1+w*1j*t_values[45])) + (R_values[46] /(1+w*1j*t_values[46]))
-
-def KK_RC48(w, Rs, R_values, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    return Rs + (R_values[0]/(1+w*1j*t_values[0])) + (R_values[1] /(1+w*1j*t_values[1])) + (R_values[2] /(1+w*1j*t_values[2])) + (R_values[3] /(1+w*1j*t_values[3])) + (R_values[4] /(1+w*1j*t_values[4])) + (R_values[5] /(1+w*1j*t_values[5])) + (R_values[6] /(1+w*1j*t_values[6])) + (R_values[7] /(1+w*1j*t_values[7])) + (R_values[8] /(1+w*1j*t_values[8])) + (R_values[9] /(1+w*1j*t_values[9])) + (R_values[10] /(1+w*1j*t_values[10])) + (R_values[11] /(1+w*1j*t_values[11])) + (R_values[12] /(1+w*1j*t_values[12])) + (R_values[13] /(1+w*1j*t_values[13])) + (R_values[14] /(1+w*1j*t_values[14])) + (R_values[15] /(1+w*1j*t_values[15])) + (R_values[16] /(1+w*1j*t_values[16])) + (R_values[17] /(1+w*1j*t_values[17])) + (R_values[18] /(1+w*1j*t_values[18])) + (R_values[19] /(1+w*1j*t_values[19])) + (R_values[20] /(1+w*1j*t_values[20])) + (R_values[21] /(1+w*1j*t_values[21])) + (R_values[22] /(1+w*1j*t_values[22])) + (R_values[23] /(1+w*1j*t_values[23])) + (R_values[24] /(1+w*1j*t_values[24])) + (R_values[25] /(1+w*1j*t_values[25])) + (R_values[26] /(1+w*1j*t_values[26])) + (R_values[27] /(1+w*1j*t_values[27])) + (R_values[28] /(1+w*1j*t_values[28])) + (R_values[29] /(1+w*1j*t_values[29])) + (R_values[30] /(1+w*1j*t_values[30])) + (R_values[31] /(1+w*1j*t_values[31])) + (R_values[32] /(1+w*1j*t_values[32])) + (R_values[33] /(1+w*1j*t_values[33])) + (R_values[34] /(1+w*1j*t_values[34]))  + (R_values[35] /(1+w*1j*t_values[35])) + (R_values[36] /(1+w*1j*t_values[36])) + (R_values[37] /(1+w*1j*t_values[37])) + (R_values[38] /(1+w*1j*t_values[38])) + (R_values[39] /(1+w*1j*t_values[39])) + (R_values[40] /(1+w*1j*t_values[40])) + (R_values[41] /(1+w*1j*t_values[41])) + (R_values[42] /(1+w*1j*t_values[42])) + (R_values[43] /(1+w*1j*t_values[43])) + (R_values[44] /(1+w*1j*t_values[44])) + (R_values[45] /(1+w*1j*t_values[45])) + (R_values[46] /(1+w*1j*t_values[46])) + (R_values[47] /(1+w*1j*t_values[47]))
-
-def KK_RC49(w, Rs, R_values, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    return Rs + (R_values[0]/(1+w*1j*t_values[0])) + (R_values[1] /(1+w*1j*t_values[1])) + (R_values[2] /(1+w*1j*t_values[2])) + (R_values[3] /(1+w*1j*t_values[3])) + (R_values[4] /(1+w*1j*t_values[4])) + (R_values[5] /(1+w*1j*t_values[5])) + (R_values[6] /(1+w*1j*t_values[6])) + (R_values[7] /(1+w*1j*t_values[7])) + (R_values[8] /(1+w*1j*t_values[8])) + (R_values[9] /(1+w*1j*t_values[9])) + (R_values[10] /(1+w*1j*t_values[10])) + (R_values[11] /(1+w*1j*t_values[11])) + (R_values[12] /(1+w*1j*t_values[12])) + (R_values[13] /(1+w*1j*t_values[13])) + (R_values[14] /(1+w*1j*t_values[14])) + (R_values[15] /(1+w*1j*t_values[15])) + (R_values[16] /(1+w*1j*t_values[16])) + (R_values[17] /(1+w*1j*t_values[17])) + (R_values[18] /(1+w*1j*t_values[18])) + (R_values[19] /(1+w*1j*t_values[19])) + (R_values[20] /(1+w*1j*t_values[20])) + (R_values[21] /(1+w*1j*t_values[21])) + (R_values[22] /(1+w*1j*t_values[22])) + (R_values[23] /(1+w*1j*t_values[23])) + (R_values[24] /(1+w*1j*t_values[24])) + (R_values[25] /(1+w*1j*t_values[25])) + (R_values[26] /(1+w*1j*t_values[26])) + (R_values[27] /(1+w*1j*t_values[27])) + (R_values[28] /(1+w*1j*t_values[28])) + (R_values[29] /(1+w*1j*t_values[29])) + (R_values[30] /(1+w*1j*t_values[30])) + (R_values[31] /(1+w*1j*t_values[31])) + (R_values[32] /(1+w*1j*t_values[32])) + (R_values[33] /(1+w*1j*t_values[33])) + (R_values[34] /(1+w*1j*t_values[34]))  + (R_values[35] /(1+w*1j*t_values[35])) + (R_values[36] /(1+w*1j*t_values[36])) + (R_values[37] /(1+w*1j*t_values[37])) + (R_values[38] /(1+w*1j*t_values[38])) + (R_values[39] /(1+w*1j*t_values[39])) + (R_values[40] /(1+w*1j*t_values[40])) + (R_values[41] /(1+w*1j*t_values[41])) + (R_values[42] /(1+w*1j*t_values[42])) + (R_values[43] /(1+w*1j*t_values[43])) + (R_values[44] /(1+w*1j*t_values[44])) + (R_values[45] /(1+w*1j*t_values[45])) + (R_values[46] /(1+w*1j*t_values[46])) + (R_values[47] /(1+w*1j*t_values[47])) + (R_values[48] /(1+w*1j*t_values[48]))
-
-def KK_RC50(w, Rs, R_values, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    return Rs + (R_values[0]/(1+w*1j*t_values[0])) + (R_values[1] /(1+w*1j*t_values[1])) + (R_values[2] /(1+w*1j*t_values[2])) + (R_values[3] /(1+w*1j*t_values[3])) + (R_values[4] /(1+w*1j*t_values[4])) + (R_values[5] /(1+w*1j*t_values[5])) + (R_values[6] /(1+w*1j*t_values[6])) + (R_values[7] /(1+w*1j*t_values[7])) + (R_values[8] /(1+w*1j*t_values[8])) + (R_values[9] /(1+w*1j*t_values[9])) + (R_values[10] /(1+w*1j*t_values[10])) + (R_values[11] /(1+w*1j*t_values[11])) + (R_values[12] /(1+w*1j*t_values[12])) + (R_values[13] /(1+w*1j*t_values[13])) + (R_values[14] /(1+w*1j*t_values[14])) + (R_values[15] /(1+w*1j*t_values[15])) + (R_values[16] /(1+w*1j*t_values[16])) + (R_values[17] /(1+w*1j*t_values[17])) + (R_values[18] /(1+w*1j*t_values[18])) + (R_values[19] /(1+w*1j*t_values[19])) + (R_values[20] /(1+w*1j*t_values[20])) + (R_values[21] /(1+w*1j*t_values[21])) + (R_values[22] /(1+w*1j*t_values[22])) + (R_values[23] /(1+w*1j*t_values[23])) + (R_values[24] /(1+w*1j*t_values[24])) + (R_values[25] /(1+w*1j*t_values[25])) + (R_values[26] /(1+w*1j*t_values[26])) + (R_values[27] /(1+w*1j*t_values[27])) + (R_values[28] /(1+w*1j*t_values[28])) + (R_values[29] /(1+w*1j*t_values[29])) + (R_values[30] /(1+w*1j*t_values[30])) + (R_values[31] /(1+w*1j*t_values[31])) + (R_values[32] /(1+w*1j*t_values[32])) + (R_values[33] /(1+w*1j*t_values[33])) + (R_values[34] /(1+w*1j*t_values[34]))  + (R_values[35] /(1+w*1j*t_values[35])) + (R_values[36] /(1+w*1j*t_values[36])) + (R_values[37] /(1+w*1j*t_values[37])) + (R_values[38] /(1+w*1j*t_values[38])) + (R_values[39] /(1+w*1j*t_values[39])) + (R_values[40] /(1+w*1j*t_values[40])) + (R_values[41] /(1+w*1j*t_values[41])) + (R_values[42] /(1+w*1j*t_values[42])) + (R_values[43] /(1+w*1j*t_values[43])) + (R_values[44] /(1+w*1j*t_values[44])) + (R_values[45] /(1+w*1j*t_values[45])) + (R_values[46] /(1+w*1j*t_values[46])) + (R_values[47] /(1+w*1j*t_values[47])) + (R_values[48] /(1+w*1j*t_values[48])) + (R_values[49] /(1+w*1j*t_values[49]))
-
-def KK_RC51(w, Rs, R_values, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    return Rs + (R_values[0]/(1+w*1j*t_values[0])) + (R_values[1] /(1+w*1j*t_values[1])) + (R_values[2] /(1+w*1j*t_values[2])) + (R_values[3] /(1+w*1j*t_values[3])) + (R_values[4] /(1+w*1j*t_values[4])) + (R_values[5] /(1+w*1j*t_values[5])) + (R_values[6] /(1+w*1j*t_values[6])) + (R_values[7] /(1+w*1j*t_values[7])) + (R_values[8] /(1+w*1j*t_values[8])) + (R_values[9] /(1+w*1j*t_values[9])) + (R_values[10] /(1+w*1j*t_values[10])) + (R_values[11] /(1+w*1j*t_values[11])) + (R_values[12] /(1+w*1j*t_values[12])) + (R_values[13] /(1+w*1j*t_values[13])) + (R_values[14] /(1+w*1j*t_values[14])) + (R_values[15] /(1+w*1j*t_values[15])) + (R_values[16] /(1+w*1j*t_values[16])) + (R_values[17] /(1+w*1j*t_values[17])) + (R_values[18] /(1+w*1j*t_values[18])) + (R_values[19] /(1+w*1j*t_values[19])) + (R_values[20] /(1+w*1j*t_values[20])) + (R_values[21] /(1+w*1j*t_values[21])) + (R_values[22] /(1+w*1j*t_values[22])) + (R_values[23] /(1+w*1j*t_values[23])) + (R_values[24] /(1+w*1j*t_values[24])) + (R_values[25] /(1+w*1j*t_values[25])) + (R_values[26] /(1+w*1j*t_values[26])) + (R_values[27] /(1+w*1j*t_values[27])) + (R_values[28] /(1+w*1j*t_values[28])) + (R_values[29] /(1+w*1j*t_values[29])) + (R_values[30] /(1+w*1j*t_values[30])) + (R_values[31] /(1+w*1j*t_values[31])) + (R_values[32] /(1+w*1j*t_values[32])) + (R_values[33] /(1+w*1j*t_values[33])) + (R_values[34] /(1+w*1j*t_values[34]))  + (R_values[35] /(1+w*1j*t_values[35])) + (R_values[36] /(1+w*1j*t_values[36])) + (R_values[37] /(1+w*1j*t_values[37])) + (R_values[38] /(1+w*1j*t_values[38])) + (R_values[39] /(1+w*1j*t_values[39])) + (R_values[40] /(1+w*1j*t_values[40])) + (R_values[41] /(1+w*1j*t_values[41])) + (R_values[42] /(1+w*1j*t_values[42])) + (R_values[43] /(1+w*1j*t_values[43])) + (R_values[44] /(1+w*1j*t_values[44])) + (R_values[45] /(1+w*1j*t_values[45])) + (R_values[46] /(1+w*1j*t_values[46])) + (R_values[47] /(1+w*1j*t_values[47])) + (R_values[48] /(1+w*1j*t_values[48])) + (R_values[49] /(1+w*1j*t_values[49])) + (R_values[50] /(1+w*1j*t_values[50]))
-
-def KK_RC52(w, Rs, R_values, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    return Rs + (R_values[0]/(1+w*1j*t_values[0])) + (R_values[1] /(1+w*1j*t_values[1])) + (R_values[2] /(1+w*1j*t_values[2])) + (R_values[3] /(1+w*1j*t_values[3])) + (R_values[4] /(1+w*1j*t_values[4])) + (R_values[5] /(1+w*1j*t_values[5])) + (R_values[6] /(1+w*1j*t_values[6])) + (R_values[7] /(1+w*1j*t_values[7])) + (R_values[8] /(1+w*1j*t_values[8])) + (R_values[9] /(1+w*1j*t_values[9])) + (R_values[10] /(1+w*1j*t_values[10])) + (R_values[11] /(1+w*1j*t_values[11])) + (R_values[12] /(1+w*1j*t_values[12])) + (R_values[13] /(1+w*1j*t_values[13])) + (R_values[14] /(1+w*1j*t_values[14])) + (R_values[15] /(1+w*1j*t_values[15])) + (R_values[16] /(1+w*1j*t_values[16])) + (R_values[17] /(1+w*1j*t_values[17])) + (R_values[18] /(1+w*1j*t_values[18])) + (R_values[19] /(1+w*1j*t_values[19])) + (R_values[20] /(1+w*1j*t_values[20])) + (R_values[21] /(1+w*1j*t_values[21])) + (R_values[22] /(1+w*1j*t_values[22])) + (R_values[23] /(1+w*1j*t_values[23])) + (R_values[24] /(1+w*1j*t_values[24])) + (R_values[25] /(1+w*1j*t_values[25])) + (R_values[26] /(1+w*1j*t_values[26])) + (R_values[27] /(1+w*1j*t_values[27])) + (R_values[28] /(1+w*1j*t_values[28])) + (R_values[29] /(1+w*1j*t_values[29])) + (R_values[30] /(1+w*1j*t_values[30])) + (R_values[31] /(1+w*1j*t_values[31])) + (R_values[32] /(1+w*1j*t_values[32])) + (R_values[33] /(1+w*1j*t_values[33])) + (R_values[34] /(1+w*1j*t_values[34]))  + (R_values[35] /(1+w*1j*t_values[35])) + (R_values[36] /(1+w*1j*t_values[36])) + (R_values[37] /(1+w*1j*t_values[37])) + (R_values[38] /(1+w*1j*t_values[38])) + (R_values[39] /(1+w*1j*t_values[39])) + (R_values[40] /(1+w*1j*t_values[40])) + (R_values[41] /(1+w*1j*t_values[41])) + (R_values[42] /(1+w*1j*t_values[42])) + (R_values[43] /(1+w*1j*t_values[43])) + (R_values[44] /(1+w*1j*t_values[44])) + (R_values[45] /(1+w*1j*t_values[45])) + (R_values[46] /(1+w*1j*t_values[46])) + (R_values[47] /(1+w*1j*t_values[47])) + (R_values[48] /(1+w*1j*t_values[48])) + (R_values[49] /(1+w*1j*t_values[49])) + (R_values[50] /(1+w*1j*t_values[50])) + (R_values[51] /(1+w*1j*t_values[51]))
-
-def KK_RC53(w, Rs, R_values, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    return Rs + (R_values[0]/(1+w*1j*t_values[0])) + (R_values[1] /(1+w*1j*t_values[1])) + (R_values[2] /(1+w*1j*t_values[2])) + (R_values[3] /(1+w*1j*t_values[3])) + (R_values[4] /(1+w*1j*t_values[4])) + (R_values[5] /(1+w*1j*t_values[5])) + (R_values[6] /(1+w*1j*t_values[6])) + (R_values[7] /(1+w*1j*t_values[7])) + (R_values[8] /(1+w*1j*t_values[8])) + (R_values[9] /(1+w*1j*t_values[9])) + (R_values[10] /(1+w*1j*t_values[10])) + (R_values[11] /(1+w*1j*t_values[11])) + (R_values[12] /(1+w*1j*t_values[12])) + (R_values[13] /(1+w*1j*t_values[13])) + (R_values[14] /(1+w*1j*t_values[14])) + (R_values[15] /(1+w*1j*t_values[15])) + (R_values[16] /(1+w*1j*t_values[16])) + (R_values[17] /(1+w*1j*t_values[17])) + (R_values[18] /(1+w*1j*t_values[18])) + (R_values[19] /(1+w*1j*t_values[19])) + (R_values[20] /(1+w*1j*t_values[20])) + (R_values[21] /(1+w*1j*t_values[21])) + (R_values[22] /(1+w*1j*t_values[22])) + (R_values[23] /(1+w*1j*t_values[23])) + (R_values[24] /(1+w*1j*t_values[24])) + (R_values[25] /(1+w*1j*t_values[25])) + (R_values[26] /(1+w*1j*t_values[26])) + (R_values[27] /(1+w*1j*t_values[27])) + (R_values[28] /(1+w*1j*t_values[28])) + (R_values[29] /(1+w*1j*t_values[29])) + (R_values[30] /(1+w*1j*t_values[30])) + (R_values[31] /(1+w*1j*t_values[31])) + (R_values[32] /(1+w*1j*t_values[32])) + (R_values[33] /(1+w*1j*t_values[33])) + (R_values[34] /(1+w*1j*t_values[34]))  + (R_values[35] /(1+w*1j*t_values[35])) + (R_values[36] /(1+w*1j*t_values[36])) + (R_values[37] /(1+w*1j*t_values[37])) + (R_values[38] /(1+w*1j*t_values[38])) + (R_values[39] /(1+w*1j*t_values[39])) + (R_values[40] /(1+w*1j*t_values[40])) + (R_values[41] /(1+w*1j*t_values[41])) + (R_values[42] /(1+w*1j*t_values[42])) + (R_values[43] /(1+w*1j*t_values[43])) + (R_values[44] /(1+w*1j*t_values[44])) + (R_values[45] /(1+w*1j*t_values[45])) + (R_values[46] /(1+w*1j*t_values[46])) + (R_values[47] /(1+w*1j*t_values[47])) + (R_values[48] /(1+w*1j*t_values[48])) + (R_values[49] /(1+w*1j*t_values[49])) + (R_values[50] /(1+w*1j*t_values[50])) + (R_values[51] /(1+w*1j*t_values[51])) + (R_values[52] /(1+w*1j*t_values[52]))
-
-def KK_RC54(w, Rs, R_values, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    return Rs + (R_values[0]/(1+w*1j*t_values[0])) + (R_values[1] /(1+w*1j*t_values[1])) + (R_values[2] /(1+w*1j*t_values[2])) + (R_values[3] /(1+w*1j*t_values[3])) + (R_values[4] /(1+w*1j*t_values[4])) + (R_values[5] /(1+w*1j*t_values[5])) + (R_values[6] /(1+w*1j*t_values[6])) + (R_values[7] /(1+w*1j*t_values[7])) + (R_values[8] /(1+w*1j*t_values[8])) + (R_values[9] /(1+w*1j*t_values[9])) + (R_values[10] /(1+w*1j*t_values[10])) + (R_values[11] /(1+w*1j*t_values[11])) + (R_values[12] /(1+w*1j*t_values[12])) + (R_values[13] /(1+w*1j*t_values[13])) + (R_values[14] /(1+w*1j*t_values[14])) + (R_values[15] /(1+w*1j*t_values[15])) + (R_values[16] /(1+w*1j*t_values[16])) + (R_values[17] /(1+w*1j*t_values[17])) + (R_values[18] /(1+w*1j*t_values[18])) + (R_values[19] /(1+w*1j*t_values[19])) + (R_values[20] /(1+w*1j*t_values[20])) + (R_values[21] /(1+w*1j*t_values[21])) + (R_values[22] /(1+w*1j*t_values[22])) + (R_values[23] /(1+w*1j*t_values[23])) + (R_values[24] /(1+w*1j*t_values[24])) + (R_values[25] /(1+w*1j*t_values[25])) + (R_values[26] /(1+w*1j*t_values[26])) + (R_values[27] /(1+w*1j*t_values[27])) + (R_values[28] /(1+w*1j*t_values[28])) + (R_values[29] /(1+w*1j*t_values[29])) + (R_values[30] /(1+w*1j*t_values[30])) + (R_values[31] /(1+w*1j*t_values[31])) + (R_values[32] /(1+w*1j*t_values[32])) + (R_values[33] /(1+w*1j*t_values[33])) + (R_values[34] /(1+w*1j*t_values[34]))  + (R_values[35] /(1+w*1j*t_values[35])) + (R_values[36] /(1+w*1j*t_values[36])) + (R_values[37] /(1+w*1j*t_values[37])) + (R_values[38] /(1+w*1j*t_values[38])) + (R_values[39] /(1+w*1j*t_values[39])) + (R_values[40] /(1+w*1j*t_values[40])) + (R_values[41] /(1+w*1j*t_values[41])) + (R_values[42] /(1+w*1j*t_values[42])) + (R_values[43] /(1+w*1j*t_values[43])) + (R_values[44] /(1+w*1j*t_values[44])) + (R_values[45] /(1+w*1j*t_values[45])) + (R_values[46] /(1+w*1j*t_values[46])) + (R_values[47] /(1+w*1j*t_values[47])) + (R_values[48] /(1+w*1j*t_values[48])) + (R_values[49] /(1+w*1j*t_values[49])) + (R_values[50] /(1+w*1j*t_values[50])) + (R_values[51] /(1+w*1j*t_values[51])) + (R_values[52] /(1+w*1j*t_values[52])) + (R_values[53] /(1+w*1j*t_values[53]))
-
-def KK_RC55(w, Rs, R_values, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    return Rs + (R_values[0]/(1+w*1j*t_values[0])) + (R_values[1] /(1+w*1j*t_values[1])) + (R_values[2] /(1+w*1j*t_values[2])) + (R_values[3] /(1+w*1j*t_values[3])) + (R_values[4] /(1+w*1j*t_values[4])) + (R_values[5] /(1+w*1j*t_values[5])) + (R_values[6] /(1+w*1j*t_values[6])) + (R_values[7] /(1+w*1j*t_values[7])) + (R_values[8] /(1+w*1j*t_values[8])) + (R_values[9] /(1+w*1j*t_values[9])) + (R_values[10] /(1+w*1j*t_values[10])) + (R_values[11] /(1+w*1j*t_values[11])) + (R_values[12] /(1+w*1j*t_values[12])) + (R_values[13] /(1+w*1j*t_values[13])) + (R_values[14] /(1+w*1j*t_values[14])) + (R_values[15] /(1+w*1j*t_values[15])) + (R_values[16] /(1+w*1j*t_values[16])) + (R_values[17] /(1+w*1j*t_values[17])) + (R_values[18] /(1+w*1j*t_values[18])) + (R_values[19] /(1+w*1j*t_values[19])) + (R_values[20] /(1+w*1j*t_values[20])) + (R_values[21] /(1+w*1j*t_values[21])) + (R_values[22] /(1+w*1j*t_values[22])) + (R_values[23] /(1+w*1j*t_values[23])) + (R_values[24] /(1+w*1j*t_values[24])) + (R_values[25] /(1+w*1j*t_values[25])) + (R_values[26] /(1+w*1j*t_values[26])) + (R_values[27] /(1+w*1j*t_values[27])) + (R_values[28] /(1+w*1j*t_values[28])) + (R_values[29] /(1+w*1j*t_values[29])) + (R_values[30] /(1+w*1j*t_values[30])) + (R_values[31] /(1+w*1j*t_values[31])) + (R_values[32] /(1+w*1j*t_values[32])) + (R_values[33] /(1+w*1j*t_values[33])) + (R_values[34] /(1+w*1j*t_values[34]))  + (R_values[35] /(1+w*1j*t_values[35])) + (R_values[36] /(1+w*1j*t_values[36])) + (R_values[37] /(1+w*1j*t_values[37])) + (R_values[38] /(1+w*1j*t_values[38])) + (R_values[39] /(1+w*1j*t_values[39])) + (R_values[40] /(1+w*1j*t_values[40])) + (R_values[41] /(1+w*1j*t_values[41])) + (R_values[42] /(1+w*1j*t_values[42])) + (R_values[43] /(1+w*1j*t_values[43])) + (R_values[44] /(1+w*1j*t_values[44])) + (R_values[45] /(1+w*1j*t_values[45])) + (R_values[46] /(1+w*1j*t_values[46])) + (R_values[47] /(1+w*1j*t_values[47])) + (R_values[48] /(1+w*1j*t_values[48])) + (R_values[49] /(1+w*1j*t_values[49])) + (R_values[50] /(1+w*1j*t_values[50])) + (R_values[51] /(1+w*1j*t_values[51])) + (R_values[52] /(1+w*1j*t_values[52])) + (R_values[53] /(1+w*1j*t_values[53])) + (R_values[54] /(1+w*1j*t_values[54]))
-
-def KK_RC56(w, Rs, R_values, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    return Rs + (R_values[0]/(1+w*1j*t_values[0])) + (R_values[1] /(1+w*1j*t_values[1])) + (R_values[2] /(1+w*1j*t_values[2])) + (R_values[3] /(1+w*1j*t_values[3])) + (R_values[4] /(1+w*1j*t_values[4])) + (R_values[5] /(1+w*1j*t_values[5])) + (R_values[6] /(1+w*1j*t_values[6])) + (R_values[7] /(1+w*1j*t_values[7])) + (R_values[8] /(1+w*1j*t_values[8])) + (R_values[9] /(1+w*1j*t_values[9])) + (R_values[10] /(1+w*1j*t_values[10])) + (R_values[11] /(1+w*1j*t_values[11])) + (R_values[12] /(1+w*1j*t_values[12])) + (R_values[13] /(1+w*1j*t_values[13])) + (R_values[14] /(1+w*1j*t_values[14])) + (R_values[15] /(1+w*1j*t_values[15])) + (R_values[16] /(1+w*1j*t_values[16])) + (R_values[17] /(1+w*1j*t_values[17])) + (R_values[18] /(1+w*1j*t_values[18])) + (R_values[19] /(1+w*1j*t_values[19])) + (R_values[20] /(1+w*1j*t_values[20])) + (R_values[21] /(1+w*1j*t_values[21])) + (R_values[22] /(1+w*1j*t_values[22])) + (R_values[23] /(1+w*1j*t_values[23])) + (R_values[24] /(1+w*1j*t_values[24])) + (R_values[25] /(1+w*1j*t_values[25])) + (R_values[26] /(1+w*1j*t_values[26])) + (R_values[27] /(1+w*1j*t_values[27])) + (R_values[28] /(1+w*1j*t_values[28])) + (R_values[29] /(1+w*1j*t_values[29])) + (R_values[30] /(1+w*1j*t_values[30])) + (R_values[31] /(1+w*1j*t_values[31])) + (R_values[32] /(1+w*1j*t_values[32])) + (R_values[33] /(1+w*1j*t_values[33])) + (R_values[34] /(1+w*1j*t_values[34]))  + (R_values[35] /(1+w*1j*t_values[35])) + (R_values[36] /(1+w*1j*t_values[36])) + (R_values[37] /(1+w*1j*t_values[37])) + (R_values[38] /(1+w*1j*t_values[38])) + (R_values[39] /(1+w*1j*t_values[39])) + (R_values[40] /(1+w*1j*t_values[40])) + (R_values[41] /(1+w*1j*t_values[41])) + (R_values[42] /(1+w*1j*t_values[42])) + (R_values[43] /(1+w*1j*t_values[43])) + (R_values[44] /(1+w*1j*t_values[44])) + (R_values[45] /(1+w*1j*t_values[45])) + (R_values[46] /(1+w*1j*t_values[46])) + (R_values[47] /(1+w*1j*t_values[47])) + (R_values[48] /(1+w*1j*t_values[48])) + (R_values[49] /(1+w*1j*t_values[49])) + (R_values[50] /(1+w*1j*t_values[50])) + (R_values[51] /(1+w*1j*t_values[51])) + (R_values[52] /(1+w*1j*t_values[52])) + (R_values[53] /(1+w*1j*t_values[53])) + (R_values[54] /(1+w*1j*t_values[54])) + (R_values[55] /(1+w*1j*t_values[55]))
-
-def KK_RC57(w, Rs, R_values, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    return Rs + (R_values[0]/(1+w*1j*t_values[0])) + (R_values[1] /(1+w*1j*t_values[1])) + (R_values[2] /(1+w*1j*t_values[2])) + (R_values[3] /(1+w*1j*t_values[3])) + (R_values[4] /(1+w*1j*t_values[4])) + (R_values[5] /(1+w*1j*t_values[5])) + (R_values[6] /(1+w*1j*t_values[6])) + (R_values[7] /(1+w*1j*t_values[7])) + (R_values[8] /(1+w*1j*t_values[8])) + (R_values[9] /(1+w*1j*t_values[9])) + (R_values[10] /(1+w*1j*t_values[10])) + (R_values[11] /(1+w*1j*t_values[11])) + (R_values[12] /(1+w*1j*t_values[12])) + (R_values[13] /(1+w*1j*t_values[13])) + (R_values[14] /(1+w*1j*t_values[14])) + (R_values[15] /(1+w*1j*t_values[15])) + (R_values[16] /(1+w*1j*t_values[16])) + (R_values[17] /(1+w*1j*t_values[17])) + (R_values[18] /(1+w*1j*t_values[18])) + (R_values[19] /(1+w*1j*t_values[19])) + (R_values[20] /(1+w*1j*t_values[20])) + (R_values[21] /(1+w*1j*t_values[21])) + (R_values[22] /(1+w*1j*t_values[22])) + (R_values[23] /(1+w*1j*t_values[23])) + (R_values[24] /(1+w*1j*t_values[24])) + (R_values[25] /(1+w*1j*t_values[25])) + (R_values[26] /(1+w*1j*t_values[26])) + (R_values[27] /(1+w*1j*t_values[27])) + (R_values[28] /(1+w*1j*t_values[28])) + (R_values[29] /(1+w*1j*t_values[29])) + (R_values[30] /(1+w*1j*t_values[30])) + (R_values[31] /(1+w*1j*t_values[31])) + (R_values[32] /(1+w*1j*t_values[32])) + (R_values[33] /(1+w*1j*t_values[33])) + (R_values[34] /(1+w*1j*t_values[34]))  + (R_values[35] /(1+w*1j*t_values[35])) + (R_values[36] /(1+w*1j*t_values[36])) + (R_values[37] /(1+w*1j*t_values[37])) + (R_values[38] /(1+w*1j*t_values[38])) + (R_values[39] /(1+w*1j*t_values[39])) + (R_values[40] /(1+w*1j*t_values[40])) + (R_values[41] /(1+w*1j*t_values[41])) + (R_values[42] /(1+w*1j*t_values[42])) + (R_values[43] /(1+w*1j*t_values[43])) + (R_values[44] /(1+w*1j*t_values[44])) + (R_values[45] /(1+w*1j*t_values[45])) + (R_values[46] /(1+w*1j*t_values[46])) + (R_values[47] /(1+w*1j*t_values[47])) + (R_values[48] /(1+w*1j*t_values[48])) + (R_values[49] /(1+w*1j*t_values[49])) + (R_values[50] /(1+w*1j*t_values[50])) + (R_values[51] /(1+w*1j*t_values[51])) + (R_values[52] /(1+w*1j*t_values[52])) + (R_values[53] /(1+w*1j*t_values[53])) + (R_values[54] /(1+w*1j*t_values[54])) + (R_values[55] /(1+w*1j*t_values[55])) + (R_values[56] /(1+w*1j*t_values[56]))
-
-def KK_RC58(w, Rs, R_values, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    return Rs + (R_values[0]/(1+w*1j*t_values[0])) + (R_values[1] /(1+w*1j*t_values[1])) + (R_values[2] /(1+w*1j*t_values[2])) + (R_values[3] /(1+w*1j*t_values[3])) + (R_values[4] /(1+w*1j*t_values[4])) + (R_values[5] /(1+w*1j*t_values[5])) + (R_values[6] /(1+w*1j*t_values[6])) + (R_values[7] /(1+w*1j*t_values[7])) + (R_values[8] /(1+w*1j*t_values[8])) + (R_values[9] /(1+w*1j*t_values[9])) + (R_values[10] /(1+w*1j*t_values[10])) + (R_values[11] /(1+w*1j*t_values[11])) + (R_values[12] /(1+w*1j*t_values[12])) + (R_values[13] /(1+w*1j*t_values[13])) + (R_values[14] /(1+w*1j*t_values[14])) + (R_values[15] /(1+w*1j*t_values[15])) + (R_values[16] /(1+w*1j*t_values[16])) + (R_values[17] /(1+w*1j*t_values[17])) + (R_values[18] /(1+w*1j*t_values[18])) + (R_values[19] /(1+w*1j*t_values[19])) + (R_values[20] /(1+w*1j*t_values[20])) + (R_values[21] /(1+w*1j*t_values[21])) + (R_values[22] /(1+w*1j*t_values[22])) + (R_values[23] /(1+w*1j*t_values[23])) + (R_values[24] /(1+w*1j*t_values[24])) + (R_values[25] /(1+w*1j*t_values[25])) + (R_values[26] /(1+w*1j*t_values[26])) + (R_values[27] /(1+w*1j*t_values[27])) + (R_values[28] /(1+w*1j*t_values[28])) + (R_values[29] /(1+w*1j*t_values[29])) + (R_values[30] /(1+w*1j*t_values[30])) + (R_values[31] /(1+w*1j*t_values[31])) + (R_values[32] /(1+w*1j*t_values[32])) + (R_values[33] /(1+w*1j*t_values[33])) + (R_values[34] /(1+w*1j*t_values[34]))  + (R_values[35] /(1+w*1j*t_values[35])) + (R_values[36] /(1+w*1j*t_values[36])) + (R_values[37] /(1+w*1j*t_values[37])) + (R_values[38] /(1+w*1j*t_values[38])) + (R_values[39] /(1+w*1j*t_values[39])) + (R_values[40] /(1+w*1j*t_values[40])) + (R_values[41] /(1+w*1j*t_values[41])) + (R_values[42] /(1+w*1j*t_values[42])) + (R_values[43] /(1+w*1j*t_values[43])) + (R_values[44] /(1+w*1j*t_values[44])) + (R_values[45] /(1+w*1j*t_values[45])) + (R_values[46] /(1+w*1j*t_values[46])) + (R_values[47] /(1+w*1j*t_values[47])) + (R_values[48] /(1+w*1j*t_values[48])) + (R_values[49] /(1+w*1j*t_values[49])) + (R_values[50] /(1+w*1j*t_values[50])) + (R_values[51] /(1+w*1j*t_values[51])) + (R_values[52] /(1+w*1j*t_values[52])) + (R_values[53] /(1+w*1j*t_values[53])) + (R_values[54] /(1+w*1j*t_values[54])) + (R_values[55] /(1+w*1j*t_values[55])) + (R_values[56] /(1+w*1j*t_values[56])) + (R_values[57] /(1+w*1j*t_values[57]))
-
-
-def KK_RC59(w, Rs, R_values, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    return Rs + (R_values[0]/(1+w*1j*t_values[0])) + (R_values[1] /(1+w*1j*t_values[1])) + (R_values[2] /(1+w*1j*t_values[2])) + (R_values[3] /(1+w*1j*t_values[3])) + (R_values[4] /(1+w*1j*t_values[4])) + (R_values[5] /(1+w*1j*t_values[5])) + (R_values[6] /(1+w*1j*t_values[6])) + (R_values[7] /(1+w*1j*t_values[7])) + (R_values[8] /(1+w*1j*t_values[8])) + (R_values[9] /(1+w*1j*t_values[9])) + (R_values[10] /(1+w*1j*t_values[10])) + (R_values[11] /(1+w*1j*t_values[11])) + (R_values[12] /(1+w*1j*t_values[12])) + (R_values[13] /(1+w*1j*t_values[13])) + (R_values[14] /(1+w*1j*t_values[14])) + (R_values[15] /(1+w*1j*t_values[15])) + (R_values[16] /(1+w*1j*t_values[16])) + (R_values[17] /(1+w*1j*t_values[17])) + (R_values[18] /(1+w*1j*t_values[18])) + (R_values[19] /(1+w*1j*t_values[19])) + (R_values[20] /(1+w*1j*t_values[20])) + (R_values[21] /(1+w*1j*t_values[21])) + (R_values[22] /(1+w*1j*t_values[22])) + (R_values[23] /(1+w*1j*t_values[23])) + (R_values[24] /(1+w*1j*t_values[24])) + (R_values[25] /(1+w*1j*t_values[25])) + (R_values[26] /(1+w*1j*t_values[26])) + (R_values[27] /(1+w*1j*t_values[27])) + (R_values[28] /(1+w*1j*t_values[28])) + (R_values[29] /(1+w*1j*t_values[29])) + (R_values[30] /(1+w*1j*t_values[30])) + (R_values[31] /(1+w*1j*t_values[31])) + (R_values[32] /(1+w*1j*t_values[32])) + (R_values[33] /(1+w*1j*t_values[33])) + (R_values[34] /(1+w*1j*t_values[34]))  + (R_values[35] /(1+w*1j*t_values[35])) + (R_values[36] /(1+w*1j*t_values[36])) + (R_values[37] /(1+w*1j*t_values[37])) + (R_values[38] /(1+w*1j*t_values[38])) + (R_values[39] /(1+w*1j*t_values[39])) + (R_values[40] /(1+w*1j*t_values[40])) + (R_values[41] /(1+w*1j*t_values[41])) + (R_values[42] /(1+w*1j*t_values[42])) + (R_values[43] /(1+w*1j*t_values[43])) + (R_values[44] /(1+w*1j*t_values[44])) + (R_values[45] /(1+w*1j*t_values[45])) + (R_values[46] /(1+w*1j*t_values[46])) + (R_values[47] /(1+w*1j*t_values[47])) + (R_values[48] /(1+w*1j*t_values[48])) + (R_values[49] /(1+w*1j*t_values[49])) + (R_values[50] /(1+w*1j*t_values[50])) + (R_values[51] /(1+w*1j*t_values[51])) + (R_values[52] /(1+w*1j*t_values[52])) + (R_values[53] /(1+w*1j*t_values[53])) + (R_values[54] /(1+w*1j*t_values[54])) + (R_values[55] /(1+w*1j*t_values[55])) + (R_values[56] /(1+w*1j*t_values[56])) + (R_values[57] /(1+w*1j*t_values[57])) + (R_values[58] /(1+w*1j*t_values[58]))
-
-def KK_RC60(w, Rs, R_values, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    return Rs + (R_values[0]/(1+w*1j*t_values[0])) + (R_values[1] /(1+w*1j*t_values[1])) + (R_values[2] /(1+w*1j*t_values[2])) + (R_values[3] /(1+w*1j*t_values[3])) + (R_values[4] /(1+w*1j*t_values[4])) + (R_values[5] /(1+w*1j*t_values[5])) + (R_values[6] /(1+w*1j*t_values[6])) + (R_values[7] /(1+w*1j*t_values[7])) + (R_values[8] /(1+w*1j*t_values[8])) + (R_values[9] /(1+w*1j*t_values[9])) + (R_values[10] /(1+w*1j*t_values[10])) + (R_values[11] /(1+w*1j*t_values[11])) + (R_values[12] /(1+w*1j*t_values[12])) + (R_values[13] /(1+w*1j*t_values[13])) + (R_values[14] /(1+w*1j*t_values[14])) + (R_values[15] /(1+w*1j*t_values[15])) + (R_values[16] /(1+w*1j*t_values[16])) + (R_values[17] /(1+w*1j*t_values[17])) + (R_values[18] /(1+w*1j*t_values[18])) + (R_values[19] /(1+w*1j*t_values[19])) + (R_values[20] /(1+w*1j*t_values[20])) + (R_values[21] /(1+w*1j*t_values[21])) + (R_values[22] /(1+w*1j*t_values[22])) + (R_values[23] /(1+w*1j*t_values[23])) + (R_values[24] /(1+w*1j*t_values[24])) + (R_values[25] /(1+w*1j*t_values[25])) + (R_values[26] /(1+w*1j*t_values[26])) + (R_values[27] /(1+w*1j*t_values[27])) + (R_values[28] /(1+w*1j*t_values[28])) + (R_values[29] /(1+w*1j*t_values[29])) + (R_values[30] /(1+w*1j*t_values[30])) + (R_values[31] /(1+w*1j*t_values[31])) + (R_values[32] /(1+w*1j*t_values[32])) + (R_values[33] /(1+w*1j*t_values[33])) + (R_values[34] /(1+w*1j*t_values[34]))  + (R_values[35] /(1+w*1j*t_values[35])) + (R_values[36] /(1+w*1j*t_values[36])) + (R_values[37] /(1+w*1j*t_values[37])) + (R_values[38] /(1+w*1j*t_values[38])) + (R_values[39] /(1+w*1j*t_values[39])) + (R_values[40] /(1+w*1j*t_values[40])) + (R_values[41] /(1+w*1j*t_values[41])) + (R_values[42] /(1+w*1j*t_values[42])) + (R_values[43] /(1+w*1j*t_values[43])) + (R_values[44] /(1+w*1j*t_values[44])) + (R_values[45] /(1+w*1j*t_values[45])) + (R_values[46] /(1+w*1j*t_values[46])) + (R_values[47] /(1+w*1j*t_values[47])) + (R_values[48] /(1+w*1j*t_values[48])) + (R_values[49] /(1+w*1j*t_values[49])) + (R_values[50] /(1+w*1j*t_values[50])) + (R_values[51] /(1+w*1j*t_values[51])) + (R_values[52] /(1+w*1j*t_values[52])) + (R_values[53] /(1+w*1j*t_values[53])) + (R_values[54] /(1+w*1j*t_values[54])) + (R_values[55] /(1+w*1j*t_values[55])) + (R_values[56] /(1+w*1j*t_values[56])) + (R_values[57] /(1+w*1j*t_values[57])) + (R_values[58] /(1+w*1j*t_values[58])) + (R_values[59] /(1+w*1j*t_values[59]))
-
-def KK_RC61(w, Rs, R_values, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    return Rs + (R_values[0]/(1+w*1j*t_values[0])) + (R_values[1] /(1+w*1j*t_values[1])) + (R_values[2] /(1+w*1j*t_values[2])) + (R_values[3] /(1+w*1j*t_values[3])) + (R_values[4] /(1+w*1j*t_values[4])) + (R_values[5] /(1+w*1j*t_values[5])) + (R_values[6] /(1+w*1j*t_values[6])) + (R_values[7] /(1+w*1j*t_values[7])) + (R_values[8] /(1+w*1j*t_values[8])) + (R_values[9] /(1+w*1j*t_values[9])) + (R_values[10] /(1+w*1j*t_values[10])) + (R_values[11] /(1+w*1j*t_values[11])) + (R_values[12] /(1+w*1j*t_values[12])) + (R_values[13] /(1+w*1j*t_values[13])) + (R_values[14] /(1+w*1j*t_values[14])) + (R_values[15] /(1+w*1j*t_values[15])) + (R_values[16] /(1+w*1j*t_values[16])) + (R_values[17] /(1+w*1j*t_values[17])) + (R_values[18] /(1+w*1j*t_values[18])) + (R_values[19] /(1+w*1j*t_values[19])) + (R_values[20] /(1+w*1j*t_values[20])) + (R_values[21] /(1+w*1j*t_values[21])) + (R_values[22] /(1+w*1j*t_values[22])) + (R_values[23] /(1+w*1j*t_values[23])) + (R_values[24] /(1+w*1j*t_values[24])) + (R_values[25] /(1+w*1j*t_values[25])) + (R_values[26] /(1+w*1j*t_values[26])) + (R_values[27] /(1+w*1j*t_values[27])) + (R_values[28] /(1+w*1j*t_values[28])) + (R_values[29] /(1+w*1j*t_values[29])) + (R_values[30] /(1+w*1j*t_values[30])) + (R_values[31] /(1+w*1j*t_values[31])) + (R_values[32] /(1+w*1j*t_values[32])) + (R_values[33] /(1+w*1j*t_values[33])) + (R_values[34] /(1+w*1j*t_values[34]))  + (R_values[35] /(1+w*1j*t_values[35])) + (R_values[36] /(1+w*1j*t_values[36])) + (R_values[37] /(1+w*1j*t_values[37])) + (R_values[38] /(1+w*1j*t_values[38])) + (R_values[39] /(1+w*1j*t_values[39])) + (R_values[40] /(1+w*1j*t_values[40])) + (R_values[41] /(1+w*1j*t_values[41])) + (R_values[42] /(1+w*1j*t_values[42])) + (R_values[43] /(1+w*1j*t_values[43])) + (R_values[44] /(1+w*1j*t_values[44])) + (R_values[45] /(1+w*1j*t_values[45])) + (R_values[46] /(1+w*1j*t_values[46])) + (R_values[47] /(1+w*1j*t_values[47])) + (R_values[48] /(1+w*1j*t_values[48])) + (R_values[49] /(1+w*1j*t_values[49])) + (R_values[50] /(1+w*1j*t_values[50])) + (R_values[51] /(1+w*1j*t_values[51])) + (R_values[52] /(1+w*1j*t_values[52])) + (R_values[53] /(1+w*1j*t_values[53])) + (R_values[54] /(1+w*1j*t_values[54])) + (R_values[55] /(1+w*1j*t_values[55])) + (R_values[56] /(1+w*1j*t_values[56])) + (R_values[57] /(1+w*1j*t_values[57])) + (R_values[58] /(1+w*1j*t_values[58])) + (R_values[59] /(1+w*1j*t_values[59])) + (R_values[60] /(1+w*1j*t_values[60]))
-
-def KK_RC62(w, Rs, R_values, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    return Rs + (R_values[0]/(1+w*1j*t_values[0])) + (R_values[1] /(1+w*1j*t_values[1])) + (R_values[2] /(1+w*1j*t_values[2])) + (R_values[3] /(1+w*1j*t_values[3])) + (R_values[4] /(1+w*1j*t_values[4])) + (R_values[5] /(1+w*1j*t_values[5])) + (R_values[6] /(1+w*1j*t_values[6])) + (R_values[7] /(1+w*1j*t_values[7])) + (R_values[8] /(1+w*1j*t_values[8])) + (R_values[9] /(1+w*1j*t_values[9])) + (R_values[10] /(1+w*1j*t_values[10])) + (R_values[11] /(1+w*1j*t_values[11])) + (R_values[12] /(1+w*1j*t_values[12])) + (R_values[13] /(1+w*1j*t_values[13])) + (R_values[14] /(1+w*1j*t_values[14])) + (R_values[15] /(1+w*1j*t_values[15])) + (R_values[16] /(1+w*1j*t_values[16])) + (R_values[17] /(1+w*1j*t_values[17])) + (R_values[18] /(1+w*1j*t_values[18])) + (R_values[19] /(1+w*1j*t_values[19])) + (R_values[20] /(1+w*1j*t_values[20])) + (R_values[21] /(1+w*1j*t_values[21])) + (R_values[22] /(1+w*1j*t_values[22])) + (R_values[23] /(1+w*1j*t_values[23])) + (R_values[24] /(1+w*1j*t_values[24])) + (R_values[25] /(1+w*1j*t_values[25])) + (R_values[26] /(1+w*1j*t_values[26])) + (R_values[27] /(1+w*1j*t_values[27])) + (R_values[28] /(1+w*1j*t_values[28])) + (R_values[29] /(1+w*1j*t_values[29])) + (R_values[30] /(1+w*1j*t_values[30])) + (R_values[31] /(1+w*1j*t_values[31])) + (R_values[32] /(1+w*1j*t_values[32])) + (R_values[33] /(1+w*1j*t_values[33])) + (R_values[34] /(1+w*1j*t_values[34]))  + (R_values[35] /(1+w*1j*t_values[35])) + (R_values[36] /(1+w*1j*t_values[36])) + (R_values[37] /(1+w*1j*t_values[37])) + (R_values[38] /(1+w*1j*t_values[38])) + (R_values[39] /(1+w*1j*t_values[39])) + (R_values[40] /(1+w*1j*t_values[40])) + (R_values[41] /(1+w*1j*t_values[41])) + (R_values[42] /(1+w*1j*t_values[42])) + (R_values[43] /(1+w*1j*t_values[43])) + (R_values[44] /(1+w*1j*t_values[44])) + (R_values[45] /(1+w*1j*t_values[45])) + (R_values[46] /(1+w*1j*t_values[46])) + (R_values[47] /(1+w*1j*t_values[47])) + (R_values[48] /(1+w*1j*t_values[48])) + (R_values[49] /(1+w*1j*t_values[49])) + (R_values[50] /(1+w*1j*t_values[50])) + (R_values[51] /(1+w*1j*t_values[51])) + (R_values[52] /(1+w*1j*t_values[52])) + (R_values[53] /(1+w*1j*t_values[53])) + (R_values[54] /(1+w*1j*t_values[54])) + (R_values[55] /(1+w*1j*t_values[55])) + (R_values[56] /(1+w*1j*t_values[56])) + (R_values[57] /(1+w*1j*t_values[57])) + (R_values[58] /(1+w*1j*t_values[58])) + (R_values[59] /(1+w*1j*t_values[59])) + (R_values[60] /(1+w*1j*t_values[60])) + (R_values[61] /(1+w*1j*t_values[61]))
-
-def KK_RC63(w, Rs, R_values, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    return Rs + (R_values[0]/(1+w*1j*t_values[0])) + (R_values[1] /(1+w*1j*t_values[1])) + (R_values[2] /(1+w*1j*t_values[2])) + (R_values[3] /(1+w*1j*t_values[3])) + (R_values[4] /(1+w*1j*t_values[4])) + (R_values[5] /(1+w*1j*t_values[5])) + (R_values[6] /(1+w*1j*t_values[6])) + (R_values[7] /(1+w*1j*t_values[7])) + (R_values[8] /(1+w*1j*t_values[8])) + (R_values[9] /(1+w*1j*t_values[9])) + (R_values[10] /(1+w*1j*t_values[10])) + (R_values[11] /(1+w*1j*t_values[11])) + (R_values[12] /(1+w*1j*t_values[12])) + (R_values[13] /(1+w*1j*t_values[13])) + (R_values[14] /(1+w*1j*t_values[14])) + (R_values[15] /(1+w*1j*t_values[15])) + (R_values[16] /(1+w*1j*t_values[16])) + (R_values[17] /(1+w*1j*t_values[17])) + (R_values[18] /(1+w*1j*t_values[18])) + (R_values[19] /(1+w*1j*t_values[19])) + (R_values[20] /(1+w*1j*t_values[20])) + (R_values[21] /(1+w*1j*t_values[21])) + (R_values[22] /(1+w*1j*t_values[22])) + (R_values[23] /(1+w*1j*t_values[23])) + (R_values[24] /(1+w*1j*t_values[24])) + (R_values[25] /(1+w*1j*t_values[25])) + (R_values[26] /(1+w*1j*t_values[26])) + (R_values[27] /(1+w*1j*t_values[27])) + (R_values[28] /(1+w*1j*t_values[28])) + (R_values[29] /(1+w*1j*t_values[29])) + (R_values[30] /(1+w*1j*t_values[30])) + (R_values[31] /(1+w*1j*t_values[31])) + (R_values[32] /(1+w*1j*t_values[32])) + (R_values[33] /(1+w*1j*t_values[33])) + (R_values[34] /(1+w*1j*t_values[34]))  + (R_values[35] /(1+w*1j*t_values[35])) + (R_values[36] /(1+w*1j*t_values[36])) + (R_values[37] /(1+w*1j*t_values[37])) + (R_values[38] /(1+w*1j*t_values[38])) + (R_values[39] /(1+w*1j*t_values[39])) + (R_values[40] /(1+w*1j*t_values[40])) + (R_values[41] /(1+w*1j*t_values[41])) + (R_values[42] /(1+w*1j*t_values[42])) + (R_values[43] /(1+w*1j*t_values[43])) + (R_values[44] /(1+w*1j*t_values[44])) + (R_values[45] /(1+w*1j*t_values[45])) + (R_values[46] /(1+w*1j*t_values[46])) + (R_values[47] /(1+w*1j*t_values[47])) + (R_values[48] /(1+w*1j*t_values[48])) + (R_values[49] /(1+w*1j*t_values[49])) + (R_values[50] /(1+w*1j*t_values[50])) + (R_values[51] /(1+w*1j*t_values[51])) + (R_values[52] /(1+w*1j*t_values[52])) + (R_values[53] /(1+w*1j*t_values[53])) + (R_values[54] /(1+w*1j*t_values[54])) + (R_values[55] /(1+w*1j*t_values[55])) + (R_values[56] /(1+w*1j*t_values[56])) + (R_values[57] /(1+w*1j*t_values[57])) + (R_values[58] /(1+w*1j*t_values[58])) + (R_values[59] /(1+w*1j*t_values[59])) + (R_values[60] /(1+w*1j*t_values[60])) + (R_values[61] /(1+w*1j*t_values[61])) + (R_values[62] /(1+w*1j*t_values[62]))
-
-def KK_RC64(w, Rs, R_values, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    return Rs + (R_values[0]/(1+w*1j*t_values[0])) + (R_values[1] /(1+w*1j*t_values[1])) + (R_values[2] /(1+w*1j*t_values[2])) + (R_values[3] /(1+w*1j*t_values[3])) + (R_values[4] /(1+w*1j*t_values[4])) + (R_values[5] /(1+w*1j*t_values[5])) + (R_values[6] /(1+w*1j*t_values[6])) + (R_values[7] /(1+w*1j*t_values[7])) + (R_values[8] /(1+w*1j*t_values[8])) + (R_values[9] /(1+w*1j*t_values[9])) + (R_values[10] /(1+w*1j*t_values[10])) + (R_values[11] /(1+w*1j*t_values[11])) + (R_values[12] /(1+w*1j*t_values[12])) + (R_values[13] /(1+w*1j*t_values[13])) + (R_values[14] /(1+w*1j*t_values[14])) + (R_values[15] /(1+w*1j*t_values[15])) + (R_values[16] /(1+w*1j*t_values[16])) + (R_values[17] /(1+w*1j*t_values[17])) + (R_values[18] /(1+w*1j*t_values[18])) + (R_values[19] /(1+w*1j*t_values[19])) + (R_values[20] /(1+w*1j*t_values[20])) + (R_values[21] /(1+w*1j*t_values[21])) + (R_values[22] /(1+w*1j*t_values[22])) + (R_values[23] /(1+w*1j*t_values[23])) + (R_values[24] /(1+w*1j*t_values[24])) + (R_values[25] /(1+w*1j*t_values[25])) + (R_values[26] /(1+w*1j*t_values[26])) + (R_values[27] /(1+w*1j*t_values[27])) + (R_values[28] /(1+w*1j*t_values[28])) + (R_values[29] /(1+w*1j*t_values[29])) + (R_values[30] /(1+w*1j*t_values[30])) + (R_values[31] /(1+w*1j*t_values[31])) + (R_values[32] /(1+w*1j*t_values[32])) + (R_values[33] /(1+w*1j*t_values[33])) + (R_values[34] /(1+w*1j*t_values[34]))  + (R_values[35] /(1+w*1j*t_values[35])) + (R_values[36] /(1+w*1j*t_values[36])) + (R_values[37] /(1+w*1j*t_values[37])) + (R_values[38] /(1+w*1j*t_values[38])) + (R_values[39] /(1+w*1j*t_values[39])) + (R_values[40] /(1+w*1j*t_values[40])) + (R_values[41] /(1+w*1j*t_values[41])) + (R_values[42] /(1+w*1j*t_values[42])) + (R_values[43] /(1+w*1j*t_values[43])) + (R_values[44] /(1+w*1j*t_values[44])) + (R_values[45] /(1+w*1j*t_values[45])) + (R_values[46] /(1+w*1j*t_values[46])) + (R_values[47] /(1+w*1j*t_values[47])) + (R_values[48] /(1+w*1j*t_values[48])) + (R_values[49] /(1+w*1j*t_values[49])) + (R_values[50] /(1+w*1j*t_values[50])) + (R_values[51] /(1+w*1j*t_values[51])) + (R_values[52] /(1+w*1j*t_values[52])) + (R_values[53] /(1+w*1j*t_values[53])) + (R_values[54] /(1+w*1j*t_values[54])) + (R_values[55] /(1+w*1j*t_values[55])) + (R_values[56] /(1+w*1j*t_values[56])) + (R_values[57] /(1+w*1j*t_values[57])) + (R_values[58] /(1+w*1j*t_values[58])) + (R_values[59] /(1+w*1j*t_values[59])) + (R_values[60] /(1+w*1j*t_values[60])) + (R_values[61] /(1+w*1j*t_values[61])) + (R_values[62] /(1+w*1j*t_values[62])) + (R_values[63] /(1+w*1j*t_values[63]))
-
-def KK_RC65(w, Rs, R_values, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    return Rs + (R_values[0]/(1+w*1j*t_values[0])) + (R_values[1] /(1+w*1j*t_values[1])) + (R_values[2] /(1+w*1j*t_values[2])) + (R_values[3] /(1+w*1j*t_values[3])) + (R_values[4] /(1+w*1j*t_values[4])) + (R_values[5] /(1+w*1j*t_values[5])) + (R_values[6] /(1+w*1j*t_values[6])) + (R_values[7] /(1+w*1j*t_values[7])) + (R_values[8] /(1+w*1j*t_values[8])) + (R_values[9] /(1+w*1j*t_values[9])) + (R_values[10] /(1+w*1j*t_values[10])) + (R_values[11] /(1+w*1j*t_values[11])) + (R_values[12] /(1+w*1j*t_values[12])) + (R_values[13] /(1+w*1j*t_values[13])) + (R_values[14] /(1+w*1j*t_values[14])) + (R_values[15] /(1+w*1j*t_values[15])) + (R_values[16] /(1+w*1j*t_values[16])) + (R_values[17] /(1+w*1j*t_values[17])) + (R_values[18] /(1+w*1j*t_values[18])) + (R_values[19] /(1+w*1j*t_values[19])) + (R_values[20] /(1+w*1j*t_values[20])) + (R_values[21] /(1+w*1j*t_values[21])) + (R_values[22] /(1+w*1j*t_values[22])) + (R_values[23] /(1+w*1j*t_values[23])) + (R_values[24] /(1+w*1j*t_values[24])) + (R_values[25] /(1+w*1j*t_values[25])) + (R_values[26] /(1+w*1j*t_values[26])) + (R_values[27] /(1+w*1j*t_values[27])) + (R_values[28] /(1+w*1j*t_values[28])) + (R_values[29] /(1+w*1j*t_values[29])) + (R_values[30] /(1+w*1j*t_values[30])) + (R_values[31] /(1+w*1j*t_values[31])) + (R_values[32] /(1+w*1j*t_values[32])) + (R_values[33] /(1+w*1j*t_values[33])) + (R_values[34] /(1+w*1j*t_values[34]))  + (R_values[35] /(1+w*1j*t_values[35])) + (R_values[36] /(1+w*1j*t_values[36])) + (R_values[37] /(1+w*1j*t_values[37])) + (R_values[38] /(1+w*1j*t_values[38])) + (R_values[39] /(1+w*1j*t_values[39])) + (R_values[40] /(1+w*1j*t_values[40])) + (R_values[41] /(1+w*1j*t_values[41])) + (R_values[42] /(1+w*1j*t_values[42])) + (R_values[43] /(1+w*1j*t_values[43])) + (R_values[44] /(1+w*1j*t_values[44])) + (R_values[45] /(1+w*1j*t_values[45])) + (R_values[46] /(1+w*1j*t_values[46])) + (R_values[47] /(1+w*1j*t_values[47])) + (R_values[48] /(1+w*1j*t_values[48])) + (R_values[49] /(1+w*1j*t_values[49])) + (R_values[50] /(1+w*1j*t_values[50])) + (R_values[51] /(1+w*1j*t_values[51])) + (R_values[52] /(1+w*1j*t_values[52])) + (R_values[53] /(1+w*1j*t_values[53])) + (R_values[54] /(1+w*1j*t_values[54])) + (R_values[55] /(1+w*1j*t_values[55])) + (R_values[56] /(1+w*1j*t_values[56])) + (R_values[57] /(1+w*1j*t_values[57])) + (R_values[58] /(1+w*1j*t_values[58])) + (R_values[59] /(1+w*1j*t_values[59])) + (R_values[60] /(1+w*1j*t_values[60])) + (R_values[61] /(1+w*1j*t_values[61])) + (R_values[62] /(1+w*1j*t_values[62])) + (R_values[63] /(1+w*1j*t_values[63])) + (R_values[64] /(1+w*1j*t_values[64]))
-
-def KK_RC66(w, Rs, R_values, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    return Rs + (R_values[0]/(1+w*1j*t_values[0])) + (R_values[1] /(1+w*1j*t_values[1])) + (R_values[2] /(1+w*1j*t_values[2])) + (R_values[3] /(1+w*1j*t_values[3])) + (R_values[4] /(1+w*1j*t_values[4])) + (R_values[5] /(1+w*1j*t_values[5])) + (R_values[6] /(1+w*1j*t_values[6])) + (R_values[7] /(1+w*1j*t_values[7])) + (R_values[8] /(1+w*1j*t_values[8])) + (R_values[9] /(1+w*1j*t_values[9])) + (R_values[10] /(1+w*1j*t_values[10])) + (R_values[11] /(1+w*1j*t_values[11])) + (R_values[12] /(1+w*1j*t_values[12])) + (R_values[13] /(1+w*1j*t_values[13])) + (R_values[14] /(1+w*1j*t_values[14])) + (R_values[15] /(1+w*1j*t_values[15])) + (R_values[16] /(1+w*1j*t_values[16])) + (R_values[17] /(1+w*1j*t_values[17])) + (R_values[18] /(1+w*1j*t_values[18])) + (R_values[19] /(1+w*1j*t_values[19])) + (R_values[20] /(1+w*1j*t_values[20])) + (R_values[21] /(1+w*1j*t_values[21])) + (R_values[22] /(1+w*1j*t_values[22])) + (R_values[23] /(1+w*1j*t_values[23])) + (R_values[24] /(1+w*1j*t_values[24])) + (R_values[25] /(1+w*1j*t_values[25])) + (R_values[26] /(1+w*1j*t_values[26])) + (R_values[27] /(1+w*1j*t_values[27])) + (R_values[28] /(1+w*1j*t_values[28])) + (R_values[29] /(1+w*1j*t_values[29])) + (R_values[30] /(1+w*1j*t_values[30])) + (R_values[31] /(1+w*1j*t_values[31])) + (R_values[32] /(1+w*1j*t_values[32])) + (R_values[33] /(1+w*1j*t_values[33])) + (R_values[34] /(1+w*1j*t_values[34]))  + (R_values[35] /(1+w*1j*t_values[35])) + (R_values[36] /(1+w*1j*t_values[36])) + (R_values[37] /(1+w*1j*t_values[37])) + (R_values[38] /(1+w*1j*t_values[38])) + (R_values[39] /(1+w*1j*t_values[39])) + (R_values[40] /(1+w*1j*t_values[40])) + (R_values[41] /(1+w*1j*t_values[41])) + (R_values[42] /(1+w*1j*t_values[42])) + (R_values[43] /(1+w*1j*t_values[43])) + (R_values[44] /(1+w*1j*t_values[44])) + (R_values[45] /(1+w*1j*t_values[45])) + (R_values[46] /(1+w*1j*t_values[46])) + (R_values[47] /(1+w*1j*t_values[47])) + (R_values[48] /(1+w*1j*t_values[48])) + (R_values[49] /(1+w*1j*t_values[49])) + (R_values[50] /(1+w*1j*t_values[50])) + (R_values[51] /(1+w*1j*t_values[51])) + (R_values[52] /(1+w*1j*t_values[52])) + (R_values[53] /(1+w*1j*t_values[53])) + (R_values[54] /(1+w*1j*t_values[54])) + (R_values[55] /(1+w*1j*t_values[55])) + (R_values[56] /(1+w*1j*t_values[56])) + (R_values[57] /(1+w*1j*t_values[57])) + (R_values[58] /(1+w*1j*t_values[58])) + (R_values[59] /(1+w*1j*t_values[59])) + (R_values[60] /(1+w*1j*t_values[60])) + (R_values[61] /(1+w*1j*t_values[61])) + (R_values[62] /(1+w*1j*t_values[62])) + (R_values[63] /(1+w*1j*t_values[63])) + (R_values[64] /(1+w*1j*t_values[64])) + (R_values[65] /(1+w*1j*t_values[65]))
-
-def KK_RC67(w, Rs, R_values, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    return Rs + (R_values[0]/(1+w*1j*t_values[0])) + (R_values[1] /(1+w*1j*t_values[1])) + (R_values[2] /(1+w*1j*t_values[2])) + (R_values[3] /(1+w*1j*t_values[3])) + (R_values[4] /(1+w*1j*t_values[4])) + (R_values[5] /(1+w*1j*t_values[5])) + (R_values[6] /(1+w*1j*t_values[6])) + (R_values[7] /(1+w*1j*t_values[7])) + (R_values[8] /(1+w*1j*t_values[8])) + (R_values[9] /(1+w*1j*t_values[9])) + (R_values[10] /(1+w*1j*t_values[10])) + (R_values[11] /(1+w*1j*t_values[11])) + (R_values[12] /(1+w*1j*t_values[12])) + (R_values[13] /(1+w*1j*t_values[13])) + (R_values[14] /(1+w*1j*t_values[14])) + (R_values[15] /(1+w*1j*t_values[15])) + (R_values[16] /(1+w*1j*t_values[16])) + (R_values[17] /(1+w*1j*t_values[17])) + (R_values[18] /(1+w*1j*t_values[18])) + (R_values[19] /(1+w*1j*t_values[19])) + (R_values[20] /(1+w*1j*t_values[20])) + (R_values[21] /(1+w*1j*t_values[21])) + (R_values[22] /(1+w*1j*t_values[22])) + (R_values[23] /(1+w*1j*t_values[23])) + (R_values[24] /(1+w*1j*t_values[24])) + (R_values[25] /(1+w*1j*t_values[25])) + (R_values[26] /(1+w*1j*t_values[26])) + (R_values[27] /(1+w*1j*t_values[27])) + (R_values[28] /(1+w*1j*t_values[28])) + (R_values[29] /(1+w*1j*t_values[29])) + (R_values[30] /(1+w*1j*t_values[30])) + (R_values[31] /(1+w*1j*t_values[31])) + (R_values[32] /(1+w*1j*t_values[32])) + (R_values[33] /(1+w*1j*t_values[33])) + (R_values[34] /(1+w*1j*t_values[34]))  + (R_values[35] /(1+w*1j*t_values[35])) + (R_values[36] /(1+w*1j*t_values[36])) + (R_values[37] /(1+w*1j*t_values[37])) + (R_values[38] /(1+w*1j*t_values[38])) + (R_values[39] /(1+w*1j*t_values[39])) + (R_values[40] /(1+w*1j*t_values[40])) + (R_values[41] /(1+w*1j*t_values[41])) + (R_values[42] /(1+w*1j*t_values[42])) + (R_values[43] /(1+w*1j*t_values[43])) + (R_values[44] /(1+w*1j*t_values[44])) + (R_values[45] /(1+w*1j*t_values[45])) + (R_values[46] /(1+w*1j*t_values[46])) + (R_values[47] /(1+w*1j*t_values[47])) + (R_values[48] /(1+w*1j*t_values[48])) + (R_values[49] /(1+w*1j*t_values[49])) + (R_values[50] /(1+w*1j*t_values[50])) + (R_values[51] /(1+w*1j*t_values[51])) + (R_values[52] /(1+w*1j*t_values[52])) + (R_values[53] /(1+w*1j*t_values[53])) + (R_values[54] /(1+w*1j*t_values[54])) + (R_values[55] /(1+w*1j*t_values[55])) + (R_values[56] /(1+w*1j*t_values[56])) + (R_values[57] /(1+w*1j*t_values[57])) + (R_values[58] /(1+w*1j*t_values[58])) + (R_values[59] /(1+w*1j*t_values[59])) + (R_values[60] /(1+w*1j*t_values[60])) + (R_values[61] /(1+w*1j*t_values[61])) + (R_values[62] /(1+w*1j*t_values[62])) + (R_values[63] /(1+w*1j*t_values[63])) + (R_values[64] /(1+w*1j*t_values[64])) + (R_values[65] /(1+w*1j*t_values[65])) + (R_values[66] /(1+w*1j*t_values[66]))
-
-def KK_RC68(w, Rs, R_values, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    return Rs + (R_values[0]/(1+w*1j*t_values[0])) + (R_values[1] /(1+w*1j*t_values[1])) + (R_values[2] /(1+w*1j*t_values[2])) + (R_values[3] /(1+w*1j*t_values[3])) + (R_values[4] /(1+w*1j*t_values[4])) + (R_values[5] /(1+w*1j*t_values[5])) + (R_values[6] /(1+w*1j*t_values[6])) + (R_values[7] /(1+w*1j*t_values[7])) + (R_values[8] /(1+w*1j*t_values[8])) + (R_values[9] /(1+w*1j*t_values[9])) + (R_values[10] /(1+w*1j*t_values[10])) + (R_values[11] /(1+w*1j*t_values[11])) + (R_values[12] /(1+w*1j*t_values[12])) + (R_values[13] /(1+w*1j*t_values[13])) + (R_values[14] /(1+w*1j*t_values[14])) + (R_values[15] /(1+w*1j*t_values[15])) + (R_values[16] /(1+w*1j*t_values[16])) + (R_values[17] /(1+w*1j*t_values[17])) + (R_values[18] /(1+w*1j*t_values[18])) + (R_values[19] /(1+w*1j*t_values[19])) + (R_values[20] /(1+w*1j*t_values[20])) + (R_values[21] /(1+w*1j*t_values[21])) + (R_values[22] /(1+w*1j*t_values[22])) + (R_values[23] /(1+w*1j*t_values[23])) + (R_values[24] /(1+w*1j*t_values[24])) + (R_values[25] /(1+w*1j*t_values[25])) + (R_values[26] /(1+w*1j*t_values[26])) + (R_values[27] /(1+w*1j*t_values[27])) + (R_values[28] /(1+w*1j*t_values[28])) + (R_values[29] /(1+w*1j*t_values[29])) + (R_values[30] /(1+w*1j*t_values[30])) + (R_values[31] /(1+w*1j*t_values[31])) + (R_values[32] /(1+w*1j*t_values[32])) + (R_values[33] /(1+w*1j*t_values[33])) + (R_values[34] /(1+w*1j*t_values[34]))  + (R_values[35] /(1+w*1j*t_values[35])) + (R_values[36] /(1+w*1j*t_values[36])) + (R_values[37] /(1+w*1j*t_values[37])) + (R_values[38] /(1+w*1j*t_values[38])) + (R_values[39] /(1+w*1j*t_values[39])) + (R_values[40] /(1+w*1j*t_values[40])) + (R_values[41] /(1+w*1j*t_values[41])) + (R_values[42] /(1+w*1j*t_values[42])) + (R_values[43] /(1+w*1j*t_values[43])) + (R_values[44] /(1+w*1j*t_values[44])) + (R_values[45] /(1+w*1j*t_values[45])) + (R_values[46] /(1+w*1j*t_values[46])) + (R_values[47] /(1+w*1j*t_values[47])) + (R_values[48] /(1+w*1j*t_values[48])) + (R_values[49] /(1+w*1j*t_values[49])) + (R_values[50] /(1+w*1j*t_values[50])) + (R_values[51] /(1+w*1j*t_values[51])) + (R_values[52] /(1+w*1j*t_values[52])) + (R_values[53] /(1+w*1j*t_values[53])) + (R_values[54] /(1+w*1j*t_values[54])) + (R_values[55] /(1+w*1j*t_values[55])) + (R_values[56] /(1+w*1j*t_values[56])) + (R_values[57] /(1+w*1j*t_values[57])) + (R_values[58] /(1+w*1j*t_values[58])) + (R_values[59] /(1+w*1j*t_values[59])) + (R_values[60] /(1+w*1j*t_values[60])) + (R_values[61] /(1+w*1j*t_values[61])) + (R_values[62] /(1+w*1j*t_values[62])) + (R_values[63] /(1+w*1j*t_values[63])) + (R_values[64] /(1+w*1j*t_values[64])) + (R_values[65] /(1+w*1j*t_values[65])) + (R_values[66] /(1+w*1j*t_values[66])) + (R_values[67] /(1+w*1j*t_values[67]))
-
-def KK_RC69(w, Rs, R_values, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    return Rs + (R_values[0]/(1+w*1j*t_values[0])) + (R_values[1] /(1+w*1j*t_values[1])) + (R_values[2] /(1+w*1j*t_values[2])) + (R_values[3] /(1+w*1j*t_values[3])) + (R_values[4] /(1+w*1j*t_values[4])) + (R_values[5] /(1+w*1j*t_values[5])) + (R_values[6] /(1+w*1j*t_values[6])) + (R_values[7] /(1+w*1j*t_values[7])) + (R_values[8] /(1+w*1j*t_values[8])) + (R_values[9] /(1+w*1j*t_values[9])) + (R_values[10] /(1+w*1j*t_values[10])) + (R_values[11] /(1+w*1j*t_values[11])) + (R_values[12] /(1+w*1j*t_values[12])) + (R_values[13] /(1+w*1j*t_values[13])) + (R_values[14] /(1+w*1j*t_values[14])) + (R_values[15] /(1+w*1j*t_values[15])) + (R_values[16] /(1+w*1j*t_values[16])) + (R_values[17] /(1+w*1j*t_values[17])) + (R_values[18] /(1+w*1j*t_values[18])) + (R_values[19] /(1+w*1j*t_values[19])) + (R_values[20] /(1+w*1j*t_values[20])) + (R_values[21] /(1+w*1j*t_values[21])) + (R_values[22] /(1+w*1j*t_values[22])) + (R_values[23] /(1+w*1j*t_values[23])) + (R_values[24] /(1+w*1j*t_values[24])) + (R_values[25] /(1+w*1j*t_values[25])) + (R_values[26] /(1+w*1j*t_values[26])) + (R_values[27] /(1+w*1j*t_values[27])) + (R_values[28] /(1+w*1j*t_values[28])) + (R_values[29] /(1+w*1j*t_values[29])) + (R_values[30] /(1+w*1j*t_values[30])) + (R_values[31] /(1+w*1j*t_values[31])) + (R_values[32] /(1+w*1j*t_values[32])) + (R_values[33] /(1+w*1j*t_values[33])) + (R_values[34] /(1+w*1j*t_values[34]))  + (R_values[35] /(1+w*1j*t_values[35])) + (R_values[36] /(1+w*1j*t_values[36])) + (R_values[37] /(1+w*1j*t_values[37])) + (R_values[38] /(1+w*1j*t_values[38])) + (R_values[39] /(1+w*1j*t_values[39])) + (R_values[40] /(1+w*1j*t_values[40])) + (R_values[41] /(1+w*1j*t_values[41])) + (R_values[42] /(1+w*1j*t_values[42])) + (R_values[43] /(1+w*1j*t_values[43])) + (R_values[44] /(1+w*1j*t_values[44])) + (R_values[45] /(1+w*1j*t_values[45])) + (R_values[46] /(1+w*1j*t_values[46])) + (R_values[47] /(1+w*1j*t_values[47])) + (R_values[48] /(1+w*1j*t_values[48])) + (R_values[49] /(1+w*1j*t_values[49])) + (R_values[50] /(1+w*1j*t_values[50])) + (R_values[51] /(1+w*1j*t_values[51])) + (R_values[52] /(1+w*1j*t_values[52])) + (R_values[53] /(1+w*1j*t_values[53])) + (R_values[54] /(1+w*1j*t_values[54])) + (R_values[55] /(1+w*1j*t_values[55])) + (R_values[56] /(1+w*1j*t_values[56])) + (R_values[57] /(1+w*1j*t_values[57])) + (R_values[58] /(1+w*1j*t_values[58])) + (R_values[59] /(1+w*1j*t_values[59])) + (R_values[60] /(1+w*1j*t_values[60])) + (R_values[61] /(1+w*1j*t_values[61])) + (R_values[62] /(1+w*1j*t_values[62])) + (R_values[63] /(1+w*1j*t_values[63])) + (R_values[64] /(1+w*1j*t_values[64])) + (R_values[65] /(1+w*1j*t_values[65])) + (R_values[66] /(1+w*1j*t_values[66])) + (R_values[67] /(1+w*1j*t_values[67])) + (R_values[68] /(1+w*1j*t_values[68]))
-
-def KK_RC70(w, Rs, R_values, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    return Rs + (R_values[0]/(1+w*1j*t_values[0])) + (R_values[1] /(1+w*1j*t_values[1])) + (R_values[2] /(1+w*1j*t_values[2])) + (R_values[3] /(1+w*1j*t_values[3])) + (R_values[4] /(1+w*1j*t_values[4])) + (R_values[5] /(1+w*1j*t_values[5])) + (R_values[6] /(1+w*1j*t_values[6])) + (R_values[7] /(1+w*1j*t_values[7])) + (R_values[8] /(1+w*1j*t_values[8])) + (R_values[9] /(1+w*1j*t_values[9])) + (R_values[10] /(1+w*1j*t_values[10])) + (R_values[11] /(1+w*1j*t_values[11])) + (R_values[12] /(1+w*1j*t_values[12])) + (R_values[13] /(1+w*1j*t_values[13])) + (R_values[14] /(1+w*1j*t_values[14])) + (R_values[15] /(1+w*1j*t_values[15])) + (R_values[16] /(1+w*1j*t_values[16])) + (R_values[17] /(1+w*1j*t_values[17])) + (R_values[18] /(1+w*1j*t_values[18])) + (R_values[19] /(1+w*1j*t_values[19])) + (R_values[20] /(1+w*1j*t_values[20])) + (R_values[21] /(1+w*1j*t_values[21])) + (R_values[22] /(1+w*1j*t_values[22])) + (R_values[23] /(1+w*1j*t_values[23])) + (R_values[24] /(1+w*1j*t_values[24])) + (R_values[25] /(1+w*1j*t_values[25])) + (R_values[26] /(1+w*1j*t_values[26])) + (R_values[27] /(1+w*1j*t_values[27])) + (R_values[28] /(1+w*1j*t_values[28])) + (R_values[29] /(1+w*1j*t_values[29])) + (R_values[30] /(1+w*1j*t_values[30])) + (R_values[31] /(1+w*1j*t_values[31])) + (R_values[32] /(1+w*1j*t_values[32])) + (R_values[33] /(1+w*1j*t_values[33])) + (R_values[34] /(1+w*1j*t_values[34]))  + (R_values[35] /(1+w*1j*t_values[35])) + (R_values[36] /(1+w*1j*t_values[36])) + (R_values[37] /(1+w*1j*t_values[37])) + (R_values[38] /(1+w*1j*t_values[38])) + (R_values[39] /(1+w*1j*t_values[39])) + (R_values[40] /(1+w*1j*t_values[40])) + (R_values[41] /(1+w*1j*t_values[41])) + (R_values[42] /(1+w*1j*t_values[42])) + (R_values[43] /(1+w*1j*t_values[43])) + (R_values[44] /(1+w*1j*t_values[44])) + (R_values[45] /(1+w*1j*t_values[45])) + (R_values[46] /(1+w*1j*t_values[46])) + (R_values[47] /(1+w*1j*t_values[47])) + (R_values[48] /(1+w*1j*t_values[48])) + (R_values[49] /(1+w*1j*t_values[49])) + (R_values[50] /(1+w*1j*t_values[50])) + (R_values[51] /(1+w*1j*t_values[51])) + (R_values[52] /(1+w*1j*t_values[52])) + (R_values[53] /(1+w*1j*t_values[53])) + (R_values[54] /(1+w*1j*t_values[54])) + (R_values[55] /(1+w*1j*t_values[55])) + (R_values[56] /(1+w*1j*t_values[56])) + (R_values[57] /(1+w*1j*t_values[57])) + (R_values[58] /(1+w*1j*t_values[58])) + (R_values[59] /(1+w*1j*t_values[59])) + (R_values[60] /(1+w*1j*t_values[60])) + (R_values[61] /(1+w*1j*t_values[61])) + (R_values[62] /(1+w*1j*t_values[62])) + (R_values[63] /(1+w*1j*t_values[63])) + (R_values[64] /(1+w*1j*t_values[64])) + (R_values[65] /(1+w*1j*t_values[65])) + (R_values[66] /(1+w*1j*t_values[66])) + (R_values[67] /(1+w*1j*t_values[67])) + (R_values[68] /(1+w*1j*t_values[68])) + (R_values[69] /(1+w*1j*t_values[69]))
-
-def KK_RC71(w, Rs, R_values, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    return Rs + (R_values[0]/(1+w*1j*t_values[0])) + (R_values[1] /(1+w*1j*t_values[1])) + (R_values[2] /(1+w*1j*t_values[2])) + (R_values[3] /(1+w*1j*t_values[3])) + (R_values[4] /(1+w*1j*t_values[4])) + (R_values[5] /(1+w*1j*t_values[5])) + (R_values[6] /(1+w*1j*t_values[6])) + (R_values[7] /(1+w*1j*t_values[7])) + (R_values[8] /(1+w*1j*t_values[8])) + (R_values[9] /(1+w*1j*t_values[9])) + (R_values[10] /(1+w*1j*t_values[10])) + (R_values[11] /(1+w*1j*t_values[11])) + (R_values[12] /(1+w*1j*t_values[12])) + (R_values[13] /(1+w*1j*t_values[13])) + (R_values[14] /(1+w*1j*t_values[14])) + (R_values[15] /(1+w*1j*t_values[15])) + (R_values[16] /(1+w*1j*t_values[16])) + (R_values[17] /(1+w*1j*t_values[17])) + (R_values[18] /(1+w*1j*t_values[18])) + (R_values[19] /(1+w*1j*t_values[19])) + (R_values[20] /(1+w*1j*t_values[20])) + (R_values[21] /(1+w*1j*t_values[21])) + (R_values[22] /(1+w*1j*t_values[22])) + (R_values[23] /(1+w*1j*t_values[23])) + (R_values[24] /(1+w*1j*t_values[24])) + (R_values[25] /(1+w*1j*t_values[25])) + (R_values[26] /(1+w*1j*t_values[26])) + (R_values[27] /(1+w*1j*t_values[27])) + (R_values[28] /(1+w*1j*t_values[28])) + (R_values[29] /(1+w*1j*t_values[29])) + (R_values[30] /(1+w*1j*t_values[30])) + (R_values[31] /(1+w*1j*t_values[31])) + (R_values[32] /(1+w*1j*t_values[32])) + (R_values[33] /(1+w*1j*t_values[33])) + (R_values[34] /(1+w*1j*t_values[34]))  + (R_values[35] /(1+w*1j*t_values[35])) + (R_values[36] /(1+w*1j*t_values[36])) + (R_values[37] /(1+w*1j*t_values[37])) + (R_values[38] /(1+w*1j*t_values[38])) + (R_values[39] /(1+w*1j*t_values[39])) + (R_values[40] /(1+w*1j*t_values[40])) + (R_values[41] /(1+w*1j*t_values[41])) + (R_values[42] /(1+w*1j*t_values[42])) + (R_values[43] /(1+w*1j*t_values[43])) + (R_values[44] /(1+w*1j*t_values[44])) + (R_values[45] /(1+w*1j*t_values[45])) + (R_values[46] /(1+w*1j*t_values[46])) + (R_values[47] /(1+w*1j*t_values[47])) + (R_values[48] /(1+w*1j*t_values[48])) + (R_values[49] /(1+w*1j*t_values[49])) + (R_values[50] /(1+w*1j*t_values[50])) + (R_values[51] /(1+w*1j*t_values[51])) + (R_values[52] /(1+w*1j*t_values[52])) + (R_values[53] /(1+w*1j*t_values[53])) + (R_values[54] /(1+w*1j*t_values[54])) + (R_values[55] /(1+w*1j*t_values[55])) + (R_values[56] /(1+w*1j*t_values[56])) + (R_values[57] /(1+w*1j*t_values[57])) + (R_values[58] /(1+w*1j*t_values[58])) + (R_values[59] /(1+w*1j*t_values[59])) + (R_values[60] /(1+w*1j*t_values[60])) + (R_values[61] /(1+w*1j*t_values[61])) + (R_values[62] /(1+w*1j*t_values[62])) + (R_values[63] /(1+w*1j*t_values[63])) + (R_values[64] /(1+w*1j*t_values[64])) + (R_values[65] /(1+w*1j*t_values[65])) + (R_values[66] /(1+w*1j*t_values[66])) + (R_values[67] /(1+w*1j*t_values[67])) + (R_values[68] /(1+w*1j*t_values[68])) + (R_values[69] /(1+w*1j*t_values[69])) + (R_values[70] /(1+w*1j*t_values[70]))
-
-def KK_RC72(w, Rs, R_values, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    return Rs + (R_values[0]/(1+w*1j*t_values[0])) + (R_values[1] /(1+w*1j*t_values[1])) + (R_values[2] /(1+w*1j*t_values[2])) + (R_values[3] /(1+w*1j*t_values[3])) + (R_values[4] /(1+w*1j*t_values[4])) + (R_values[5] /(1+w*1j*t_values[5])) + (R_values[6] /(1+w*1j*t_values[6])) + (R_values[7] /(1+w*1j*t_values[7])) + (R_values[8] /(1+w*1j*t_values[8])) + (R_values[9] /(1+w*1j*t_values[9])) + (R_values[10] /(1+w*1j*t_values[10])) + (R_values[11] /(1+w*1j*t_values[11])) + (R_values[12] /(1+w*1j*t_values[12])) + (R_values[13] /(1+w*1j*t_values[13])) + (R_values[14] /(1+w*1j*t_values[14])) + (R_values[15] /(1+w*1j*t_values[15])) + (R_values[16] /(1+w*1j*t_values[16])) + (R_values[17] /(1+w*1j*t_values[17])) + (R_values[18] /(1+w*1j*t_values[18])) + (R_values[19] /(1+w*1j*t_values[19])) + (R_values[20] /(1+w*1j*t_values[20])) + (R_values[21] /(1+w*1j*t_values[21])) + (R_values[22] /(1+w*1j*t_values[22])) + (R_values[23] /(1+w*1j*t_values[23])) + (R_values[24] /(1+w*1j*t_values[24])) + (R_values[25] /(1+w*1j*t_values[25])) + (R_values[26] /(1+w*1j*t_values[26])) + (R_values[27] /(1+w*1j*t_values[27])) + (R_values[28] /(1+w*1j*t_values[28])) + (R_values[29] /(1+w*1j*t_values[29])) + (R_values[30] /(1+w*1j*t_values[30])) + (R_values[31] /(1+w*1j*t_values[31])) + (R_values[32] /(1+w*1j*t_values[32])) + (R_values[33] /(1+w*1j*t_values[33])) + (R_values[34] /(1+w*1j*t_values[34]))  + (R_values[35] /(1+w*1j*t_values[35])) + (R_values[36] /(1+w*1j*t_values[36])) + (R_values[37] /(1+w*1j*t_values[37])) + (R_values[38] /(1+w*1j*t_values[38])) + (R_values[39] /(1+w*1j*t_values[39])) + (R_values[40] /(1+w*1j*t_values[40])) + (R_values[41] /(1+w*1j*t_values[41])) + (R_values[42] /(1+w*1j*t_values[42])) + (R_values[43] /(1+w*1j*t_values[43])) + (R_values[44] /(1+w*1j*t_values[44])) + (R_values[45] /(1+w*1j*t_values[45])) + (R_values[46] /(1+w*1j*t_values[46])) + (R_values[47] /(1+w*1j*t_values[47])) + (R_values[48] /(1+w*1j*t_values[48])) + (R_values[49] /(1+w*1j*t_values[49])) + (R_values[50] /(1+w*1j*t_values[50])) + (R_values[51] /(1+w*1j*t_values[51])) + (R_values[52] /(1+w*1j*t_values[52])) + (R_values[53] /(1+w*1j*t_values[53])) + (R_values[54] /(1+w*1j*t_values[54])) + (R_values[55] /(1+w*1j*t_values[55])) + (R_values[56] /(1+w*1j*t_values[56])) + (R_values[57] /(1+w*1j*t_values[57])) + (R_values[58] /(1+w*1j*t_values[58])) + (R_values[59] /(1+w*1j*t_values[59])) + (R_values[60] /(1+w*1j*t_values[60])) + (R_values[61] /(1+w*1j*t_values[61])) + (R_values[62] /(1+w*1j*t_values[62])) + (R_values[63] /(1+w*1j*t_values[63])) + (R_values[64] /(1+w*1j*t_values[64])) + (R_values[65] /(1+w*1j*t_values[65])) + (R_values[66] /(1+w*1j*t_values[66])) + (R_values[67] /(1+w*1j*t_values[67])) + (R_values[68] /(1+w*1j*t_values[68])) + (R_values[69] /(1+w*1j*t_values[69])) + (R_values[70] /(1+w*1j*t_values[70])) + (R_values[71] /(1+w*1j*t_values[71]))
-
-def KK_RC73(w, Rs, R_values, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    return Rs + (R_values[0]/(1+w*1j*t_values[0])) + (R_values[1] /(1+w*1j*t_values[1])) + (R_values[2] /(1+w*1j*t_values[2])) + (R_values[3] /(1+w*1j*t_values[3])) + (R_values[4] /(1+w*1j*t_values[4])) + (R_values[5] /(1+w*1j*t_values[5])) + (R_values[6] /(1+w*1j*t_values[6])) + (R_values[7] /(1+w*1j*t_values[7])) + (R_values[8] /(1+w*1j*t_values[8])) + (R_values[9] /(1+w*1j*t_values[9])) + (R_values[10] /(1+w*1j*t_values[10])) + (R_values[11] /(1+w*1j*t_values[11])) + (R_values[12] /(1+w*1j*t_values[12])) + (R_values[13] /(1+w*1j*t_values[13])) + (R_values[14] /(1+w*1j*t_values[14])) + (R_values[15] /(1+w*1j*t_values[15])) + (R_values[16] /(1+w*1j*t_values[16])) + (R_values[17] /(1+w*1j*t_values[17])) + (R_values[18] /(1+w*1j*t_values[18])) + (R_values[19] /(1+w*1j*t_values[19])) + (R_values[20] /(1+w*1j*t_values[20])) + (R_values[21] /(1+w*1j*t_values[21])) + (R_values[22] /(1+w*1j*t_values[22])) + (R_values[23] /(1+w*1j*t_values[23])) + (R_values[24] /(1+w*1j*t_values[24])) + (R_values[25] /(1+w*1j*t_values[25])) + (R_values[26] /(1+w*1j*t_values[26])) + (R_values[27] /(1+w*1j*t_values[27])) + (R_values[28] /(1+w*1j*t_values[28])) + (R_values[29] /(1+w*1j*t_values[29])) + (R_values[30] /(1+w*1j*t_values[30])) + (R_values[31] /(1+w*1j*t_values[31])) + (R_values[32] /(1+w*1j*t_values[32])) + (R_values[33] /(1+w*1j*t_values[33])) + (R_values[34] /(1+w*1j*t_values[34]))  + (R_values[35] /(1+w*1j*t_values[35])) + (R_values[36] /(1+w*1j*t_values[36])) + (R_values[37] /(1+w*1j*t_values[37])) + (R_values[38] /(1+w*1j*t_values[38])) + (R_values[39] /(1+w*1j*t_values[39])) + (R_values[40] /(1+w*1j*t_values[40])) + (R_values[41] /(1+w*1j*t_values[41])) + (R_values[42] /(1+w*1j*t_values[42])) + (R_values[43] /(1+w*1j*t_values[43])) + (R_values[44] /(1+w*1j*t_values[44])) + (R_values[45] /(1+w*1j*t_values[45])) + (R_values[46] /(1+w*1j*t_values[46])) + (R_values[47] /(1+w*1j*t_values[47])) + (R_values[48] /(1+w*1j*t_values[48])) + (R_values[49] /(1+w*1j*t_values[49])) + (R_values[50] /(1+w*1j*t_values[50])) + (R_values[51] /(1+w*1j*t_values[51])) + (R_values[52] /(1+w*1j*t_values[52])) + (R_values[53] /(1+w*1j*t_values[53])) + (R_values[54] /(1+w*1j*t_values[54])) + (R_values[55] /(1+w*1j*t_values[55])) + (R_values[56] /(1+w*1j*t_values[56])) + (R_values[57] /(1+w*1j*t_values[57])) + (R_values[58] /(1+w*1j*t_values[58])) + (R_values[59] /(1+w*1j*t_values[59])) + (R_values[60] /(1+w*1j*t_values[60])) + (R_values[61] /(1+w*1j*t_values[61])) + (R_values[62] /(1+w*1j*t_values[62])) + (R_values[63] /(1+w*1j*t_values[63])) + (R_values[64] /(1+w*1j*t_values[64])) + (R_values[65] /(1+w*1j*t_values[65])) + (R_values[66] /(1+w*1j*t_values[66])) + (R_values[67] /(1+w*1j*t_values[67])) + (R_values[68] /(1+w*1j*t_values[68])) + (R_values[69] /(1+w*1j*t_values[69])) + (R_values[70] /(1+w*1j*t_values[70])) + (R_values[71] /(1+w*1j*t_values[71])) + (R_values[72] /(1+w*1j*t_values[72]))
-
-def KK_RC74(w, Rs, R_values, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    return Rs + (R_values[0]/(1+w*1j*t_values[0])) + (R_values[1] /(1+w*1j*t_values[1])) + (R_values[2] /(1+w*1j*t_values[2])) + (R_values[3] /(1+w*1j*t_values[3])) + (R_values[4] /(1+w*1j*t_values[4])) + (R_values[5] /(1+w*1j*t_values[5])) + (R_values[6] /(1+w*1j*t_values[6])) + (R_values[7] /(1+w*1j*t_values[7])) + (R_values[8] /(1+w*1j*t_values[8])) + (R_values[9] /(1+w*1j*t_values[9])) + (R_values[10] /(1+w*1j*t_values[10])) + (R_values[11] /(1+w*1j*t_values[11])) + (R_values[12] /(1+w*1j*t_values[12])) + (R_values[13] /(1+w*1j*t_values[13])) + (R_values[14] /(1+w*1j*t_values[14])) + (R_values[15] /(1+w*1j*t_values[15])) + (R_values[16] /(1+w*1j*t_values[16])) + (R_values[17] /(1+w*1j*t_values[17])) + (R_values[18] /(1+w*1j*t_values[18])) + (R_values[19] /(1+w*1j*t_values[19])) + (R_values[20] /(1+w*1j*t_values[20])) + (R_values[21] /(1+w*1j*t_values[21])) + (R_values[22] /(1+w*1j*t_values[22])) + (R_values[23] /(1+w*1j*t_values[23])) + (R_values[24] /(1+w*1j*t_values[24])) + (R_values[25] /(1+w*1j*t_values[25])) + (R_values[26] /(1+w*1j*t_values[26])) + (R_values[27] /(1+w*1j*t_values[27])) + (R_values[28] /(1+w*1j*t_values[28])) + (R_values[29] /(1+w*1j*t_values[29])) + (R_values[30] /(1+w*1j*t_values[30])) + (R_values[31] /(1+w*1j*t_values[31])) + (R_values[32] /(1+w*1j*t_values[32])) + (R_values[33] /(1+w*1j*t_values[33])) + (R_values[34] /(1+w*1j*t_values[34]))  + (R_values[35] /(1+w*1j*t_values[35])) + (R_values[36] /(1+w*1j*t_values[36])) + (R_values[37] /(1+w*1j*t_values[37])) + (R_values[38] /(1+w*1j*t_values[38])) + (R_values[39] /(1+w*1j*t_values[39])) + (R_values[40] /(1+w*1j*t_values[40])) + (R_values[41] /(1+w*1j*t_values[41])) + (R_values[42] /(1+w*1j*t_values[42])) + (R_values[43] /(1+w*1j*t_values[43])) + (R_values[44] /(1+w*1j*t_values[44])) + (R_values[45] /(1+w*1j*t_values[45])) + (R_values[46] /(1+w*1j*t_values[46])) + (R_values[47] /(1+w*1j*t_values[47])) + (R_values[48] /(1+w*1j*t_values[48])) + (R_values[49] /(1+w*1j*t_values[49])) + (R_values[50] /(1+w*1j*t_values[50])) + (R_values[51] /(1+w*1j*t_values[51])) + (R_values[52] /(1+w*1j*t_values[52])) + (R_values[53] /(1+w*1j*t_values[53])) + (R_values[54] /(1+w*1j*t_values[54])) + (R_values[55] /(1+w*1j*t_values[55])) + (R_values[56] /(1+w*1j*t_values[56])) + (R_values[57] /(1+w*1j*t_values[57])) + (R_values[58] /(1+w*1j*t_values[58])) + (R_values[59] /(1+w*1j*t_values[59])) + (R_values[60] /(1+w*1j*t_values[60])) + (R_values[61] /(1+w*1j*t_values[61])) + (R_values[62] /(1+w*1j*t_values[62])) + (R_values[63] /(1+w*1j*t_values[63])) + (R_values[64] /(1+w*1j*t_values[64])) + (R_values[65] /(1+w*1j*t_values[65])) + (R_values[66] /(1+w*1j*t_values[66])) + (R_values[67] /(1+w*1j*t_values[67])) + (R_values[68] /(1+w*1j*t_values[68])) + (R_values[69] /(1+w*1j*t_values[69])) + (R_values[70] /(1+w*1j*t_values[70])) + (R_values[71] /(1+w*1j*t_values[71])) + (R_values[72] /(1+w*1j*t_values[72])) + (R_values[73] /(1+w*1j*t_values[73]))
-
-def KK_RC75(w, Rs, R_values, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    return Rs + (R_values[0]/(1+w*1j*t_values[0])) + (R_values[1] /(1+w*1j*t_values[1])) + (R_values[2] /(1+w*1j*t_values[2])) + (R_values[3] /(1+w*1j*t_values[3])) + (R_values[4] /(1+w*1j*t_values[4])) + (R_values[5] /(1+w*1j*t_values[5])) + (R_values[6] /(1+w*1j*t_values[6])) + (R_values[7] /(1+w*1j*t_values[7])) + (R_values[8] /(1+w*1j*t_values[8])) + (R_values[9] /(1+w*1j*t_values[9])) + (R_values[10] /(1+w*1j*t_values[10])) + (R_values[11] /(1+w*1j*t_values[11])) + (R_values[12] /(1+w*1j*t_values[12])) + (R_values[13] /(1+w*1j*t_values[13])) + (R_values[14] /(1+w*1j*t_values[14])) + (R_values[15] /(1+w*1j*t_values[15])) + (R_values[16] /(1+w*1j*t_values[16])) + (R_values[17] /(1+w*1j*t_values[17])) + (R_values[18] /(1+w*1j*t_values[18])) + (R_values[19] /(1+w*1j*t_values[19])) + (R_values[20] /(1+w*1j*t_values[20])) + (R_values[21] /(1+w*1j*t_values[21])) + (R_values[22] /(1+w*1j*t_values[22])) + (R_values[23] /(1+w*1j*t_values[23])) + (R_values[24] /(1+w*1j*t_values[24])) + (R_values[25] /(1+w*1j*t_values[25])) + (R_values[26] /(1+w*1j*t_values[26])) + (R_values[27] /(1+w*1j*t_values[27])) + (R_values[28] /(1+w*1j*t_values[28])) + (R_values[29] /(1+w*1j*t_values[29])) + (R_values[30] /(1+w*1j*t_values[30])) + (R_values[31] /(1+w*1j*t_values[31])) + (R_values[32] /(1+w*1j*t_values[32])) + (R_values[33] /(1+w*1j*t_values[33])) + (R_values[34] /(1+w*1j*t_values[34]))  + (R_values[35] /(1+w*1j*t_values[35])) + (R_values[36] /(1+w*1j*t_values[36])) + (R_values[37] /(1+w*1j*t_values[37])) + (R_values[38] /(1+w*1j*t_values[38])) + (R_values[39] /(1+w*1j*t_values[39])) + (R_values[40] /(1+w*1j*t_values[40])) + (R_values[41] /(1+w*1j*t_values[41])) + (R_values[42] /(1+w*1j*t_values[42])) + (R_values[43] /(1+w*1j*t_values[43])) + (R_values[44] /(1+w*1j*t_values[44])) + (R_values[45] /(1+w*1j*t_values[45])) + (R_values[46] /(1+w*1j*t_values[46])) + (R_values[47] /(1+w*1j*t_values[47])) + (R_values[48] /(1+w*1j*t_values[48])) + (R_values[49] /(1+w*1j*t_values[49])) + (R_values[50] /(1+w*1j*t_values[50])) + (R_values[51] /(1+w*1j*t_values[51])) + (R_values[52] /(1+w*1j*t_values[52])) + (R_values[53] /(1+w*1j*t_values[53])) + (R_values[54] /(1+w*1j*t_values[54])) + (R_values[55] /(1+w*1j*t_values[55])) + (R_values[56] /(1+w*1j*t_values[56])) + (R_values[57] /(1+w*1j*t_values[57])) + (R_values[58] /(1+w*1j*t_values[58])) + (R_values[59] /(1+w*1j*t_values[59])) + (R_values[60] /(1+w*1j*t_values[60])) + (R_values[61] /(1+w*1j*t_values[61])) + (R_values[62] /(1+w*1j*t_values[62])) + (R_values[63] /(1+w*1j*t_values[63])) + (R_values[64] /(1+w*1j*t_values[64])) + (R_values[65] /(1+w*1j*t_values[65])) + (R_values[66] /(1+w*1j*t_values[66])) + (R_values[67] /(1+w*1j*t_values[67])) + (R_values[68] /(1+w*1j*t_values[68])) + (R_values[69] /(1+w*1j*t_values[69])) + (R_values[70] /(1+w*1j*t_values[70])) + (R_values[71] /(1+w*1j*t_values[71])) + (R_values[72] /(1+w*1j*t_values[72])) + (R_values[73] /(1+w*1j*t_values[73])) + (R_values[74] /(1+w*1j*t_values[74]))
-
-def KK_RC76(w, Rs, R_values, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    return Rs + (R_values[0]/(1+w*1j*t_values[0])) + (R_values[1] /(1+w*1j*t_values[1])) + (R_values[2] /(1+w*1j*t_values[2])) + (R_values[3] /(1+w*1j*t_values[3])) + (R_values[4] /(1+w*1j*t_values[4])) + (R_values[5] /(1+w*1j*t_values[5])) + (R_values[6] /(1+w*1j*t_values[6])) + (R_values[7] /(1+w*1j*t_values[7])) + (R_values[8] /(1+w*1j*t_values[8])) + (R_values[9] /(1+w*1j*t_values[9])) + (R_values[10] /(1+w*1j*t_values[10])) + (R_values[11] /(1+w*1j*t_values[11])) + (R_values[12] /(1+w*1j*t_values[12])) + (R_values[13] /(1+w*1j*t_values[13])) + (R_values[14] /(1+w*1j*t_values[14])) + (R_values[15] /(1+w*1j*t_values[15])) + (R_values[16] /(1+w*1j*t_values[16])) + (R_values[17] /(1+w*1j*t_values[17])) + (R_values[18] /(1+w*1j*t_values[18])) + (R_values[19] /(1+w*1j*t_values[19])) + (R_values[20] /(1+w*1j*t_values[20])) + (R_values[21] /(1+w*1j*t_values[21])) + (R_values[22] /(1+w*1j*t_values[22])) + (R_values[23] /(1+w*1j*t_values[23])) + (R_values[24] /(1+w*1j*t_values[24])) + (R_values[25] /(1+w*1j*t_values[25])) + (R_values[26] /(1+w*1j*t_values[26])) + (R_values[27] /(1+w*1j*t_values[27])) + (R_values[28] /(1+w*1j*t_values[28])) + (R_values[29] /(1+w*1j*t_values[29])) + (R_values[30] /(1+w*1j*t_values[30])) + (R_values[31] /(1+w*1j*t_values[31])) + (R_values[32] /(1+w*1j*t_values[32])) + (R_values[33] /(1+w*1j*t_values[33])) + (R_values[34] /(1+w*1j*t_values[34]))  + (R_values[35] /(1+w*1j*t_values[35])) + (R_values[36] /(1+w*1j*t_values[36])) + (R_values[37] /(1+w*1j*t_values[37])) + (R_values[38] /(1+w*1j*t_values[38])) + (R_values[39] /(1+w*1j*t_values[39])) + (R_values[40] /(1+w*1j*t_values[40])) + (R_values[41] /(1+w*1j*t_values[41])) + (R_values[42] /(1+w*1j*t_values[42])) + (R_values[43] /(1+w*1j*t_values[43])) + (R_values[44] /(1+w*1j*t_values[44])) + (R_values[45] /(1+w*1j*t_values[45])) + (R_values[46] /(1+w*1j*t_values[46])) + (R_values[47] /(1+w*1j*t_values[47])) + (R_values[48] /(1+w*1j*t_values[48])) + (R_values[49] /(1+w*1j*t_values[49])) + (R_values[50] /(1+w*1j*t_values[50])) + (R_values[51] /(1+w*1j*t_values[51])) + (R_values[52] /(1+w*1j*t_values[52])) + (R_values[53] /(1+w*1j*t_values[53])) + (R_values[54] /(1+w*1j*t_values[54])) + (R_values[55] /(1+w*1j*t_values[55])) + (R_values[56] /(1+w*1j*t_values[56])) + (R_values[57] /(1+w*1j*t_values[57])) + (R_values[58] /(1+w*1j*t_values[58])) + (R_values[59] /(1+w*1j*t_values[59])) + (R_values[60] /(1+w*1j*t_values[60])) + (R_values[61] /(1+w*1j*t_values[61])) + (R_values[62] /(1+w*1j*t_values[62])) + (R_values[63] /(1+w*1j*t_values[63])) + (R_values[64] /(1+w*1j*t_values[64])) + (R_values[65] /(1+w*1j*t_values[65])) + (R_values[66] /(1+w*1j*t_values[66])) + (R_values[67] /(1+w*1j*t_values[67])) + (R_values[68] /(1+w*1j*t_values[68])) + (R_values[69] /(1+w*1j*t_values[69])) + (R_values[70] /(1+w*1j*t_values[70])) + (R_values[71] /(1+w*1j*t_values[71])) + (R_values[72] /(1+w*1j*t_values[72])) + (R_values[73] /(1+w*1j*t_values[73])) + (R_values[74] /(1+w*1j*t_values[74])) + (R_values[75] /(1+w*1j*t_values[75]))
-
-def KK_RC77(w, Rs, R_values, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    return Rs + (R_values[0]/(1+w*1j*t_values[0])) + (R_values[1] /(1+w*1j*t_values[1])) + (R_values[2] /(1+w*1j*t_values[2])) + (R_values[3] /(1+w*1j*t_values[3])) + (R_values[4] /(1+w*1j*t_values[4])) + (R_values[5] /(1+w*1j*t_values[5])) + (R_values[6] /(1+w*1j*t_values[6])) + (R_values[7] /(1+w*1j*t_values[7])) + (R_values[8] /(1+w*1j*t_values[8])) + (R_values[9] /(1+w*1j*t_values[9])) + (R_values[10] /(1+w*1j*t_values[10])) + (R_values[11] /(1+w*1j*t_values[11])) + (R_values[12] /(1+w*1j*t_values[12])) + (R_values[13] /(1+w*1j*t_values[13])) + (R_values[14] /(1+w*1j*t_values[14])) + (R_values[15] /(1+w*1j*t_values[15])) + (R_values[16] /(1+w*1j*t_values[16])) + (R_values[17] /(1+w*1j*t_values[17])) + (R_values[18] /(1+w*1j*t_values[18])) + (R_values[19] /(1+w*1j*t_values[19])) + (R_values[20] /(1+w*1j*t_values[20])) + (R_values[21] /(1+w*1j*t_values[21])) + (R_values[22] /(1+w*1j*t_values[22])) + (R_values[23] /(1+w*1j*t_values[23])) + (R_values[24] /(1+w*1j*t_values[24])) + (R_values[25] /(1+w*1j*t_values[25])) + (R_values[26] /(1+w*1j*t_values[26])) + (R_values[27] /(1+w*1j*t_values[27])) + (R_values[28] /(1+w*1j*t_values[28])) + (R_values[29] /(1+w*1j*t_values[29])) + (R_values[30] /(1+w*1j*t_values[30])) + (R_values[31] /(1+w*1j*t_values[31])) + (R_values[32] /(1+w*1j*t_values[32])) + (R_values[33] /(1+w*1j*t_values[33])) + (R_values[34] /(1+w*1j*t_values[34]))  + (R_values[35] /(1+w*1j*t_values[35])) + (R_values[36] /(1+w*1j*t_values[36])) + (R_values[37] /(1+w*1j*t_values[37])) + (R_values[38] /(1+w*1j*t_values[38])) + (R_values[39] /(1+w*1j*t_values[39])) + (R_values[40] /(1+w*1j*t_values[40])) + (R_values[41] /(1+w*1j*t_values[41])) + (R_values[42] /(1+w*1j*t_values[42])) + (R_values[43] /(1+w*1j*t_values[43])) + (R_values[44] /(1+w*1j*t_values[44])) + (R_values[45] /(1+w*1j*t_values[45])) + (R_values[46] /(1+w*1j*t_values[46])) + (R_values[47] /(1+w*1j*t_values[47])) + (R_values[48] /(1+w*1j*t_values[48])) + (R_values[49] /(1+w*1j*t_values[49])) + (R_values[50] /(1+w*1j*t_values[50])) + (R_values[51] /(1+w*1j*t_values[51])) + (R_values[52] /(1+w*1j*t_values[52])) + (R_values[53] /(1+w*1j*t_values[53])) + (R_values[54] /(1+w*1j*t_values[54])) + (R_values[55] /(1+w*1j*t_values[55])) + (R_values[56] /(1+w*1j*t_values[56])) + (R_values[57] /(1+w*1j*t_values[57])) + (R_values[58] /(1+w*1j*t_values[58])) + (R_values[59] /(1+w*1j*t_values[59])) + (R_values[60] /(1+w*1j*t_values[60])) + (R_values[61] /(1+w*1j*t_values[61])) + (R_values[62] /(1+w*1j*t_values[62])) + (R_values[63] /(1+w*1j*t_values[63])) + (R_values[64] /(1+w*1j*t_values[64])) + (R_values[65] /(1+w*1j*t_values[65])) + (R_values[66] /(1+w*1j*t_values[66])) + (R_values[67] /(1+w*1j*t_values[67])) + (R_values[68] /(1+w*1j*t_values[68])) + (R_values[69] /(1+w*1j*t_values[69])) + (R_values[70] /(1+w*1j*t_values[70])) + (R_values[71] /(1+w*1j*t_values[71])) + (R_values[72] /(1+w*1j*t_values[72])) + (R_values[73] /(1+w*1j*t_values[73])) + (R_values[74] /(1+w*1j*t_values[74])) + (R_values[75] /(1+w*1j*t_values[75])) + (R_values[76] /(1+w*1j*t_values[76]))
-
-def KK_RC78(w, Rs, R_values, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    return Rs + (R_values[0]/(1+w*1j*t_values[0])) + (R_values[1] /(1+w*1j*t_values[1])) + (R_values[2] /(1+w*1j*t_values[2])) + (R_values[3] /(1+w*1j*t_values[3])) + (R_values[4] /(1+w*1j*t_values[4])) + (R_values[5] /(1+w*1j*t_values[5])) + (R_values[6] /(1+w*1j*t_values[6])) + (R_values[7] /(1+w*1j*t_values[7])) + (R_values[8] /(1+w*1j*t_values[8])) + (R_values[9] /(1+w*1j*t_values[9])) + (R_values[10] /(1+w*1j*t_values[10])) + (R_values[11] /(1+w*1j*t_values[11])) + (R_values[12] /(1+w*1j*t_values[12])) + (R_values[13] /(1+w*1j*t_values[13])) + (R_values[14] /(1+w*1j*t_values[14])) + (R_values[15] /(1+w*1j*t_values[15])) + (R_values[16] /(1+w*1j*t_values[16])) + (R_values[17] /(1+w*1j*t_values[17])) + (R_values[18] /(1+w*1j*t_values[18])) + (R_values[19] /(1+w*1j*t_values[19])) + (R_values[20] /(1+w*1j*t_values[20])) + (R_values[21] /(1+w*1j*t_values[21])) + (R_values[22] /(1+w*1j*t_values[22])) + (R_values[23] /(1+w*1j*t_values[23])) + (R_values[24] /(1+w*1j*t_values[24])) + (R_values[25] /(1+w*1j*t_values[25])) + (R_values[26] /(1+w*1j*t_values[26])) + (R_values[27] /(1+w*1j*t_values[27])) + (R_values[28] /(1+w*1j*t_values[28])) + (R_values[29] /(1+w*1j*t_values[29])) + (R_values[30] /(1+w*1j*t_values[30])) + (R_values[31] /(1+w*1j*t_values[31])) + (R_values[32] /(1+w*1j*t_values[32])) + (R_values[33] /(1+w*1j*t_values[33])) + (R_values[34] /(1+w*1j*t_values[34]))  + (R_values[35] /(1+w*1j*t_values[35])) + (R_values[36] /(1+w*1j*t_values[36])) + (R_values[37] /(1+w*1j*t_values[37])) + (R_values[38] /(1+w*1j*t_values[38])) + (R_values[39] /(1+w*1j*t_values[39])) + (R_values[40] /(1+w*1j*t_values[40])) + (R_values[41] /(1+w*1j*t_values[41])) + (R_values[42] /(1+w*1j*t_values[42])) + (R_values[43] /(1+w*1j*t_values[43])) + (R_values[44] /(1+w*1j*t_values[44])) + (R_values[45] /(1+w*1j*t_values[45])) + (R_values[46] /(1+w*1j*t_values[46])) + (R_values[47] /(1+w*1j*t_values[47])) + (R_values[48] /(1+w*1j*t_values[48])) + (R_values[49] /(1+w*1j*t_values[49])) + (R_values[50] /(1+w*1j*t_values[50])) + (R_values[51] /(1+w*1j*t_values[51])) + (R_values[52] /(1+w*1j*t_values[52])) + (R_values[53] /(1+w*1j*t_values[53])) + (R_values[54] /(1+w*1j*t_values[54])) + (R_values[55] /(1+w*1j*t_values[55])) + (R_values[56] /(1+w*1j*t_values[56])) + (R_values[57] /(1+w*1j*t_values[57])) + (R_values[58] /(1+w*1j*t_values[58])) + (R_values[59] /(1+w*1j*t_values[59])) + (R_values[60] /(1+w*1j*t_values[60])) + (R_values[61] /(1+w*1j*t_values[61])) + (R_values[62] /(1+w*1j*t_values[62])) + (R_values[63] /(1+w*1j*t_values[63])) + (R_values[64] /(1+w*1j*t_values[64])) + (R_values[65] /(1+w*1j*t_values[65])) + (R_values[66] /(1+w*1j*t_values[66])) + (R_values[67] /(1+w*1j*t_values[67])) + (R_values[68] /(1+w*1j*t_values[68])) + (R_values[69] /(1+w*1j*t_values[69])) + (R_values[70] /(1+w*1j*t_values[70])) + (R_values[71] /(1+w*1j*t_values[71])) + (R_values[72] /(1+w*1j*t_values[72])) + (R_values[73] /(1+w*1j*t_values[73])) + (R_values[74] /(1+w*1j*t_values[74])) + (R_values[75] /(1+w*1j*t_values[75])) + (R_values[76] /(1+w*1j*t_values[76])) + (R_values[77] /(1+w*1j*t_values[77]))
-
-def KK_RC79(w, Rs, R_values, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    return Rs + (R_values[0]/(1+w*1j*t_values[0])) + (R_values[1] /(1+w*1j*t_values[1])) + (R_values[2] /(1+w*1j*t_values[2])) + (R_values[3] /(1+w*1j*t_values[3])) + (R_values[4] /(1+w*1j*t_values[4])) + (R_values[5] /(1+w*1j*t_values[5])) + (R_values[6] /(1+w*1j*t_values[6])) + (R_values[7] /(1+w*1j*t_values[7])) + (R_values[8] /(1+w*1j*t_values[8])) + (R_values[9] /(1+w*1j*t_values[9])) + (R_values[10] /(1+w*1j*t_values[10])) + (R_values[11] /(1+w*1j*t_values[11])) + (R_values[12] /(1+w*1j*t_values[12])) + (R_values[13] /(1+w*1j*t_values[13])) + (R_values[14] /(1+w*1j*t_values[14])) + (R_values[15] /(1+w*1j*t_values[15])) + (R_values[16] /(1+w*1j*t_values[16])) + (R_values[17] /(1+w*1j*t_values[17])) + (R_values[18] /(1+w*1j*t_values[18])) + (R_values[19] /(1+w*1j*t_values[19])) + (R_values[20] /(1+w*1j*t_values[20])) + (R_values[21] /(1+w*1j*t_values[21])) + (R_values[22] /(1+w*1j*t_values[22])) + (R_values[23] /(1+w*1j*t_values[23])) + (R_values[24] /(1+w*1j*t_values[24])) + (R_values[25] /(1+w*1j*t_values[25])) + (R_values[26] /(1+w*1j*t_values[26])) + (R_values[27] /(1+w*1j*t_values[27])) + (R_values[28] /(1+w*1j*t_values[28])) + (R_values[29] /(1+w*1j*t_values[29])) + (R_values[30] /(1+w*1j*t_values[30])) + (R_values[31] /(1+w*1j*t_values[31])) + (R_values[32] /(1+w*1j*t_values[32])) + (R_values[33] /(1+w*1j*t_values[33])) + (R_values[34] /(1+w*1j*t_values[34]))  + (R_values[35] /(1+w*1j*t_values[35])) + (R_values[36] /(1+w*1j*t_values[36])) + (R_values[37] /(1+w*1j*t_values[37])) + (R_values[38] /(1+w*1j*t_values[38])) + (R_values[39] /(1+w*1j*t_values[39])) + (R_values[40] /(1+w*1j*t_values[40])) + (R_values[41] /(1+w*1j*t_values[41])) + (R_values[42] /(1+w*1j*t_values[42])) + (R_values[43] /(1+w*1j*t_values[43])) + (R_values[44] /(1+w*1j*t_values[44])) + (R_values[45] /(1+w*1j*t_values[45])) + (R_values[46] /(1+w*1j*t_values[46])) + (R_values[47] /(1+w*1j*t_values[47])) + (R_values[48] /(1+w*1j*t_values[48])) + (R_values[49] /(1+w*1j*t_values[49])) + (R_values[50] /(1+w*1j*t_values[50])) + (R_values[51] /(1+w*1j*t_values[51])) + (R_values[52] /(1+w*1j*t_values[52])) + (R_values[53] /(1+w*1j*t_values[53])) + (R_values[54] /(1+w*1j*t_values[54])) + (R_values[55] /(1+w*1j*t_values[55])) + (R_values[56] /(1+w*1j*t_values[56])) + (R_values[57] /(1+w*1j*t_values[57])) + (R_values[58] /(1+w*1j*t_values[58])) + (R_values[59] /(1+w*1j*t_values[59])) + (R_values[60] /(1+w*1j*t_values[60])) + (R_values[61] /(1+w*1j*t_values[61])) + (R_values[62] /(1+w*1j*t_values[62])) + (R_values[63] /(1+w*1j*t_values[63])) + (R_values[64] /(1+w*1j*t_values[64])) + (R_values[65] /(1+w*1j*t_values[65])) + (R_values[66] /(1+w*1j*t_values[66])) + (R_values[67] /(1+w*1j*t_values[67])) + (R_values[68] /(1+w*1j*t_values[68])) + (R_values[69] /(1+w*1j*t_values[69])) + (R_values[70] /(1+w*1j*t_values[70])) + (R_values[71] /(1+w*1j*t_values[71])) + (R_values[72] /(1+w*1j*t_values[72])) + (R_values[73] /(1+w*1j*t_values[73])) + (R_values[74] /(1+w*1j*t_values[74])) + (R_values[75] /(1+w*1j*t_values[75])) + (R_values[76] /(1+w*1j*t_values[76])) + (R_values[77] /(1+w*1j*t_values[77])) + (R_values[78] /(1+w*1j*t_values[78]))
-
-def KK_RC80(w, Rs, R_values, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    return Rs + (R_values[0]/(1+w*1j*t_values[0])) + (R_values[1] /(1+w*1j*t_values[1])) + (R_values[2] /(1+w*1j*t_values[2])) + (R_values[3] /(1+w*1j*t_values[3])) + (R_values[4] /(1+w*1j*t_values[4])) + (R_values[5] /(1+w*1j*t_values[5])) + (R_values[6] /(1+w*1j*t_values[6])) + (R_values[7] /(1+w*1j*t_values[7])) + (R_values[8] /(1+w*1j*t_values[8])) + (R_values[9] /(1+w*1j*t_values[9])) + (R_values[10] /(1+w*1j*t_values[10])) + (R_values[11] /(1+w*1j*t_values[11])) + (R_values[12] /(1+w*1j*t_values[12])) + (R_values[13] /(1+w*1j*t_values[13])) + (R_values[14] /(1+w*1j*t_values[14])) + (R_values[15] /(1+w*1j*t_values[15])) + (R_values[16] /(1+w*1j*t_values[16])) + (R_values[17] /(1+w*1j*t_values[17])) + (R_values[18] /(1+w*1j*t_values[18])) + (R_values[19] /(1+w*1j*t_values[19])) + (R_values[20] /(1+w*1j*t_values[20])) + (R_values[21] /(1+w*1j*t_values[21])) + (R_values[22] /(1+w*1j*t_values[22])) + (R_values[23] /(1+w*1j*t_values[23])) + (R_values[24] /(1+w*1j*t_values[24])) + (R_values[25] /(1+w*1j*t_values[25])) + (R_values[26] /(1+w*1j*t_values[26])) + (R_values[27] /(1+w*1j*t_values[27])) + (R_values[28] /(1+w*1j*t_values[28])) + (R_values[29] /(1+w*1j*t_values[29])) + (R_values[30] /(1+w*1j*t_values[30])) + (R_values[31] /(1+w*1j*t_values[31])) + (R_values[32] /(1+w*1j*t_values[32])) + (R_values[33] /(1+w*1j*t_values[33])) + (R_values[34] /(1+w*1j*t_values[34]))  + (R_values[35] /(1+w*1j*t_values[35])) + (R_values[36] /(1+w*1j*t_values[36])) + (R_values[37] /(1+w*1j*t_values[37])) + (R_values[38] /(1+w*1j*t_values[38])) + (R_values[39] /(1+w*1j*t_values[39])) + (R_values[40] /(1+w*1j*t_values[40])) + (R_values[41] /(1+w*1j*t_values[41])) + (R_values[42] /(1+w*1j*t_values[42])) + (R_values[43] /(1+w*1j*t_values[43])) + (R_values[44] /(1+w*1j*t_values[44])) + (R_values[45] /(1+w*1j*t_values[45])) + (R_values[46] /(1+w*1j*t_values[46])) + (R_values[47] /(1+w*1j*t_values[47])) + (R_values[48] /(1+w*1j*t_values[48])) + (R_values[49] /(1+w*1j*t_values[49])) + (R_values[50] /(1+w*1j*t_values[50])) + (R_values[51] /(1+w*1j*t_values[51])) + (R_values[52] /(1+w*1j*t_values[52])) + (R_values[53] /(1+w*1j*t_values[53])) + (R_values[54] /(1+w*1j*t_values[54])) + (R_values[55] /(1+w*1j*t_values[55])) + (R_values[56] /(1+w*1j*t_values[56])) + (R_values[57] /(1+w*1j*t_values[57])) + (R_values[58] /(1+w*1j*t_values[58])) + (R_values[59] /(1+w*1j*t_values[59])) + (R_values[60] /(1+w*1j*t_values[60])) + (R_values[61] /(1+w*1j*t_values[61])) + (R_values[62] /(1+w*1j*t_values[62])) + (R_values[63] /(1+w*1j*t_values[63])) + (R_values[64] /(1+w*1j*t_values[64])) + (R_values[65] /(1+w*1j*t_values[65])) + (R_values[66] /(1+w*1j*t_values[66])) + (R_values[67] /(1+w*1j*t_values[67])) + (R_values[68] /(1+w*1j*t_values[68])) + (R_values[69] /(1+w*1j*t_values[69])) + (R_values[70] /(1+w*1j*t_values[70])) + (R_values[71] /(1+w*1j*t_values[71])) + (R_values[72] /(1+w*1j*t_values[72])) + (R_values[73] /(1+w*1j*t_values[73])) + (R_values[74] /(1+w*1j*t_values[74])) + (R_values[75] /(1+w*1j*t_values[75])) + (R_values[76] /(1+w*1j*t_values[76])) + (R_values[77] /(1+w*1j*t_values[77])) + (R_values[78] /(1+w*1j*t_values[78])) + (R_values[79] /(1+w*1j*t_values[79]))
-
-### Fitting Functions
-##
-#
-
-def KK_RC2_fit(params, w, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    Rs = params['Rs']
-    R1 = params['R1']
-    R2 = params['R2']
-    return Rs + (R1/(1+w*1j*t_values[0])) + (R2 /(1+w*1j*t_values[1])) 
-
-def KK_RC3_fit(params, w, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    Rs = params['Rs']
-    R1 = params['R1']
-    R2 = params['R2']
-    R3 = params['R3']
-    return Rs + (R1/(1+w*1j*t_values[0])) + (R2 /(1+w*1j*t_values[1])) + (R3 /(1+w*1j*t_values[2]))
-
-def KK_RC4_fit(params, w, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    Rs = params['Rs']
-    R1 = params['R1']
-    R2 = params['R2']
-    R3 = params['R3']
-    R4 = params['R4']
-    return Rs + (R1/(1+w*1j*t_values[0])) + (R2 /(1+w*1j*t_values[1])) + (R3 /(1+w*1j*t_values[2])) + (R4 /(1+w*1j*t_values[3]))
-
-def KK_RC5_fit(params, w, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    Rs = params['Rs']
-    R1 = params['R1']
-    R2 = params['R2']
-    R3 = params['R3']
-    R4 = params['R4']
-    R5 = params['R5']
-    return Rs + (R1/(1+w*1j*t_values[0])) + (R2 /(1+w*1j*t_values[1])) + (R3 /(1+w*1j*t_values[2])) + (R4 /(1+w*1j*t_values[3])) + (R5 /(1+w*1j*t_values[4]))
-
-def KK_RC6_fit(params, w, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    Rs = params['Rs']
-    R1 = params['R1']
-    R2 = params['R2']
-    R3 = params['R3']
-    R4 = params['R4']
-    R5 = params['R5']
-    R6 = params['R6']
-    return Rs + (R1/(1+w*1j*t_values[0])) + (R2 /(1+w*1j*t_values[1])) + (R3 /(1+w*1j*t_values[2])) + (R4 /(1+w*1j*t_values[3])) + (R5 /(1+w*1j*t_values[4])) + (R6 /(1+w*1j*t_values[5]))
-
-def KK_RC7_fit(params, w, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    Rs = params['Rs']
-    R1 = params['R1']
-    R2 = params['R2']
-    R3 = params['R3']
-    R4 = params['R4']
-    R5 = params['R5']
-    R6 = params['R6']
-    R7 = params['R7']
-    return Rs + (R1/(1+w*1j*t_values[0])) + (R2 /(1+w*1j*t_values[1])) + (R3 /(1+w*1j*t_values[2])) + (R4 /(1+w*1j*t_values[3])) + (R5 /(1+w*1j*t_values[4])) + (R6 /(1+w*1j*t_values[5])) + (R7 /(1+w*1j*t_values[6]))
-
-def KK_RC8_fit(params, w, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    Rs = params['Rs']
-    R1 = params['R1']
-    R2 = params['R2']
-    R3 = params['R3']
-    R4 = params['R4']
-    R5 = params['R5']
-    R6 = params['R6']
-    R7 = params['R7']
-    R8 = params['R8']
-    return Rs + (R1/(1+w*1j*t_values[0])) + (R2 /(1+w*1j*t_values[1])) + (R3 /(1+w*1j*t_values[2])) + (R4 /(1+w*1j*t_values[3])) + (R5 /(1+w*1j*t_values[4])) + (R6 /(1+w*1j*t_values[5])) + (R7 /(1+w*1j*t_values[6])) + (R8 /(1+w*1j*t_values[7]))
-
-def KK_RC9_fit(params, w, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    Rs = params['Rs']
-    R1 = params['R1']
-    R2 = params['R2']
-    R3 = params['R3']
-    R4 = params['R4']
-    R5 = params['R5']
-    R6 = params['R6']
-    R7 = params['R7']
-    R8 = params['R8']
-    R9 = params['R9']
-    return Rs + (R1/(1+w*1j*t_values[0])) + (R2 /(1+w*1j*t_values[1])) + (R3 /(1+w*1j*t_values[2])) + (R4 /(1+w*1j*t_values[3])) + (R5 /(1+w*1j*t_values[4])) + (R6 /(1+w*1j*t_values[5])) + (R7 /(1+w*1j*t_values[6])) + (R8 /(1+w*1j*t_values[7])) + (R9 /(1+w*1j*t_values[8]))
-
-def KK_RC10_fit(params, w, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    Rs = params['Rs']
-    R1 = params['R1']
-    R2 = params['R2']
-    R3 = params['R3']
-    R4 = params['R4']
-    R5 = params['R5']
-    R6 = params['R6']
-    R7 = params['R7']
-    R8 = params['R8']
-    R9 = params['R9']
-    R10 = params['R10']
-    return Rs + (R1/(1+w*1j*t_values[0])) + (R2 /(1+w*1j*t_values[1])) + (R3 /(1+w*1j*t_values[2])) + (R4 /(1+w*1j*t_values[3])) + (R5 /(1+w*1j*t_values[4])) + (R6 /(1+w*1j*t_values[5])) + (R7 /(1+w*1j*t_values[6])) + (R8 /(1+w*1j*t_values[7])) + (R9 /(1+w*1j*t_values[8])) + (R10 /(1+w*1j*t_values[9]))
-
-def KK_RC11_fit(params, w, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    Rs = params['Rs']
-    R1 = params['R1']
-    R2 = params['R2']
-    R3 = params['R3']
-    R4 = params['R4']
-    R5 = params['R5']
-    R6 = params['R6']
-    R7 = params['R7']
-    R8 = params['R8']
-    R9 = params['R9']
-    R10 = params['R10']
-    R11 = params['R11']
-    return Rs + (R1/(1+w*1j*t_values[0])) + (R2 /(1+w*1j*t_values[1])) + (R3 /(1+w*1j*t_values[2])) + (R4 /(1+w*1j*t_values[3])) + (R5 /(1+w*1j*t_values[4])) + (R6 /(1+w*1j*t_values[5])) + (R7 /(1+w*1j*t_values[6])) + (R8 /(1+w*1j*t_values[7])) + (R9 /(1+w*1j*t_values[8])) + (R10 /(1+w*1j*t_values[9])) + (R11 /(1+w*1j*t_values[10]))
-
-def KK_RC12_fit(params, w, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    Rs = params['Rs']
-    R1 = params['R1']
-    R2 = params['R2']
-    R3 = params['R3']
-    R4 = params['R4']
-    R5 = params['R5']
-    R6 = params['R6']
-    R7 = params['R7']
-    R8 = params['R8']
-    R9 = params['R9']
-    R10 = params['R10']
-    R11 = params['R11']
-    R12 = params['R12']
-    return Rs + (R1/(1+w*1j*t_values[0])) + (R2 /(1+w*1j*t_values[1])) + (R3 /(1+w*1j*t_values[2])) + (R4 /(1+w*1j*t_values[3])) + (R5 /(1+w*1j*t_values[4])) + (R6 /(1+w*1j*t_values[5])) + (R7 /(1+w*1j*t_values[6])) + (R8 /(1+w*1j*t_values[7])) + (R9 /(1+w*1j*t_values[8])) + (R10 /(1+w*1j*t_values[9])) + (R11 /(1+w*1j*t_values[10])) + (R12 /(1+w*1j*t_values[11]))
-
-def KK_RC13_fit(params, w, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    Rs = params['Rs']
-    R1 = params['R1']
-    R2 = params['R2']
-    R3 = params['R3']
-    R4 = params['R4']
-    R5 = params['R5']
-    R6 = params['R6']
-    R7 = params['R7']
-    R8 = params['R8']
-    R9 = params['R9']
-    R10 = params['R10']
-    R11 = params['R11']
-    R12 = params['R12']
-    R13 = params['R13']
-    return Rs + (R1/(1+w*1j*t_values[0])) + (R2 /(1+w*1j*t_values[1])) + (R3 /(1+w*1j*t_values[2])) + (R4 /(1+w*1j*t_values[3])) + (R5 /(1+w*1j*t_values[4])) + (R6 /(1+w*1j*t_values[5])) + (R7 /(1+w*1j*t_values[6])) + (R8 /(1+w*1j*t_values[7])) + (R9 /(1+w*1j*t_values[8])) + (R10 /(1+w*1j*t_values[9])) + (R11 /(1+w*1j*t_values[10])) + (R12 /(1+w*1j*t_values[11])) + (R13 /(1+w*1j*t_values[12]))
-
-def KK_RC14_fit(params, w, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    Rs = params['Rs']
-    R1 = params['R1']
-    R2 = params['R2']
-    R3 = params['R3']
-    R4 = params['R4']
-    R5 = params['R5']
-    R6 = params['R6']
-    R7 = params['R7']
-    R8 = params['R8']
-    R9 = params['R9']
-    R10 = params['R10']
-    R11 = params['R11']
-    R12 = params['R12']
-    R13 = params['R13']
-    R14 = params['R14']
-    return Rs + (R1/(1+w*1j*t_values[0])) + (R2 /(1+w*1j*t_values[1])) + (R3 /(1+w*1j*t_values[2])) + (R4 /(1+w*1j*t_values[3])) + (R5 /(1+w*1j*t_values[4])) + (R6 /(1+w*1j*t_values[5])) + (R7 /(1+w*1j*t_values[6])) + (R8 /(1+w*1j*t_values[7])) + (R9 /(1+w*1j*t_values[8])) + (R10 /(1+w*1j*t_values[9])) + (R11 /(1+w*1j*t_values[10])) + (R12 /(1+w*1j*t_values[11])) + (R13 /(1+w*1j*t_values[12])) + (R14 /(1+w*1j*t_values[13]))
-
-def KK_RC15_fit(params, w, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    Rs = params['Rs']
-    R1 = params['R1']
-    R2 = params['R2']
-    R3 = params['R3']
-    R4 = params['R4']
-    R5 = params['R5']
-    R6 = params['R6']
-    R7 = params['R7']
-    R8 = params['R8']
-    R9 = params['R9']
-    R10 = params['R10']
-    R11 = params['R11']
-    R12 = params['R12']
-    R13 = params['R13']
-    R14 = params['R14']
-    R15 = params['R15']
-    return Rs + (R1/(1+w*1j*t_values[0])) + (R2 /(1+w*1j*t_values[1])) + (R3 /(1+w*1j*t_values[2])) + (R4 /(1+w*1j*t_values[3])) + (R5 /(1+w*1j*t_values[4])) + (R6 /(1+w*1j*t_values[5])) + (R7 /(1+w*1j*t_values[6])) + (R8 /(1+w*1j*t_values[7])) + (R9 /(1+w*1j*t_values[8])) + (R10 /(1+w*1j*t_values[9])) + (R11 /(1+w*1j*t_values[10])) + (R12 /(1+w*1j*t_values[11])) + (R13 /(1+w*1j*t_values[12])) + (R14 /(1+w*1j*t_values[13]))
-
-def KK_RC15_fit(params, w, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    Rs = params['Rs']
-    R1 = params['R1']
-    R2 = params['R2']
-    R3 = params['R3']
-    R4 = params['R4']
-    R5 = params['R5']
-    R6 = params['R6']
-    R7 = params['R7']
-    R8 = params['R8']
-    R9 = params['R9']
-    R10 = params['R10']
-    R11 = params['R11']
-    R12 = params['R12']
-    R13 = params['R13']
-    R14 = params['R14']
-    R15 = params['R15']
-    return Rs + (R1/(1+w*1j*t_values[0])) + (R2 /(1+w*1j*t_values[1])) + (R3 /(1+w*1j*t_values[2])) + (R4 /(1+w*1j*t_values[3])) + (R5 /(1+w*1j*t_values[4])) + (R6 /(1+w*1j*t_values[5])) + (R7 /(1+w*1j*t_values[6])) + (R8 /(1+w*1j*t_values[7])) + (R9 /(1+w*1j*t_values[8])) + (R10 /(1+w*1j*t_values[9])) + (R11 /(1+w*1j*t_values[10])) + (R12 /(1+w*1j*t_values[11])) + (R13 /(1+w*1j*t_values[12])) + (R14 /(1+w*1j*t_values[13])) + (R15 /(1+w*1j*t_values[14]))
-
-def KK_RC16_fit(params, w, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    Rs = params['Rs']
-    R1 = params['R1']
-    R2 = params['R2']
-    R3 = params['R3']
-    R4 = params['R4']
-    R5 = params['R5']
-    R6 = params['R6']
-    R7 = params['R7']
-    R8 = params['R8']
-    R9 = params['R9']
-    R10 = params['R10']
-    R11 = params['R11']
-    R12 = params['R12']
-    R13 = params['R13']
-    R14 = params['R14']
-    R15 = params['R15']
-    R16 = params['R16']
-    return Rs + (R1/(1+w*1j*t_values[0])) + (R2 /(1+w*1j*t_values[1])) + (R3 /(1+w*1j*t_values[2])) + (R4 /(1+w*1j*t_values[3])) + (R5 /(1+w*1j*t_values[4])) + (R6 /(1+w*1j*t_values[5])) + (R7 /(1+w*1j*t_values[6])) + (R8 /(1+w*1j*t_values[7])) + (R9 /(1+w*1j*t_values[8])) + (R10 /(1+w*1j*t_values[9])) + (R11 /(1+w*1j*t_values[10])) + (R12 /(1+w*1j*t_values[11])) + (R13 /(1+w*1j*t_values[12])) + (R14 /(1+w*1j*t_values[13])) + (R15 /(1+w*1j*t_values[14])) + (R16 /(1+w*1j*t_values[15]))
-
-def KK_RC17_fit(params, w, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    Rs = params['Rs']
-    R1 = params['R1']
-    R2 = params['R2']
-    R3 = params['R3']
-    R4 = params['R4']
-    R5 = params['R5']
-    R6 = params['R6']
-    R7 = params['R7']
-    R8 = params['R8']
-    R9 = params['R9']
-    R10 = params['R10']
-    R11 = params['R11']
-    R12 = params['R12']
-    R13 = params['R13']
-    R14 = params['R14']
-    R15 = params['R15']
-    R16 = params['R16']
-    R17 = params['R17']
-    return Rs + (R1/(1+w*1j*t_values[0])) + (R2 /(1+w*1j*t_values[1])) + (R3 /(1+w*1j*t_values[2])) + (R4 /(1+w*1j*t_values[3])) + (R5 /(1+w*1j*t_values[4])) + (R6 /(1+w*1j*t_values[5])) + (R7 /(1+w*1j*t_values[6])) + (R8 /(1+w*1j*t_values[7])) + (R9 /(1+w*1j*t_values[8])) + (R10 /(1+w*1j*t_values[9])) + (R11 /(1+w*1j*t_values[10])) + (R12 /(1+w*1j*t_values[11])) + (R13 /(1+w*1j*t_values[12])) + (R14 /(1+w*1j*t_values[13])) + (R15 /(1+w*1j*t_values[14])) + (R16 /(1+w*1j*t_values[15])) + (R17 /(1+w*1j*t_values[16]))
-
-def KK_RC18_fit(params, w, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    Rs = params['Rs']
-    R1 = params['R1']
-    R2 = params['R2']
-    R3 = params['R3']
-    R4 = params['R4']
-    R5 = params['R5']
-    R6 = params['R6']
-    R7 = params['R7']
-    R8 = params['R8']
-    R9 = params['R9']
-    R10 = params['R10']
-    R11 = params['R11']
-    R12 = params['R12']
-    R13 = params['R13']
-    R14 = params['R14']
-    R15 = params['R15']
-    R16 = params['R16']
-    R17 = params['R17']
-    R18 = params['R18']
-    return Rs + (R1/(1+w*1j*t_values[0])) + (R2 /(1+w*1j*t_values[1])) + (R3 /(1+w*1j*t_values[2])) + (R4 /(1+w*1j*t_values[3])) + (R5 /(1+w*1j*t_values[4])) + (R6 /(1+w*1j*t_values[5])) + (R7 /(1+w*1j*t_values[6])) + (R8 /(1+w*1j*t_values[7])) + (R9 /(1+w*1j*t_values[8])) + (R10 /(1+w*1j*t_values[9])) + (R11 /(1+w*1j*t_values[10])) + (R12 /(1+w*1j*t_values[11])) + (R13 /(1+w*1j*t_values[12])) + (R14 /(1+w*1j*t_values[13])) + (R15 /(1+w*1j*t_values[14])) + (R16 /(1+w*1j*t_values[15])) + (R17 /(1+w*1j*t_values[16])) + (R18 /(1+w*1j*t_values[17]))
-
-def KK_RC19_fit(params, w, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    Rs = params['Rs']
-    R1 = params['R1']
-    R2 = params['R2']
-    R3 = params['R3']
-    R4 = params['R4']
-    R5 = params['R5']
-    R6 = params['R6']
-    R7 = params['R7']
-    R8 = params['R8']
-    R9 = params['R9']
-    R10 = params['R10']
-    R11 = params['R11']
-    R12 = params['R12']
-    R13 = params['R13']
-    R14 = params['R14']
-    R15 = params['R15']
-    R16 = params['R16']
-    R17 = params['R17']
-    R18 = params['R18']
-    R19 = params['R19']
-    return Rs + (R1/(1+w*1j*t_values[0])) + (R2 /(1+w*1j*t_values[1])) + (R3 /(1+w*1j*t_values[2])) + (R4 /(1+w*1j*t_values[3])) + (R5 /(1+w*1j*t_values[4])) + (R6 /(1+w*1j*t_values[5])) + (R7 /(1+w*1j*t_values[6])) + (R8 /(1+w*1j*t_values[7])) + (R9 /(1+w*1j*t_values[8])) + (R10 /(1+w*1j*t_values[9])) + (R11 /(1+w*1j*t_values[10])) + (R12 /(1+w*1j*t_values[11])) + (R13 /(1+w*1j*t_values[12])) + (R14 /(1+w*1j*t_values[13])) + (R15 /(1+w*1j*t_values[14])) + (R16 /(1+w*1j*t_values[15])) + (R17 /(1+w*1j*t_values[16])) + (R18 /(1+w*1j*t_values[17])) + (R19 /(1+w*1j*t_values[18]))
-
-def KK_RC20_fit(params, w, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    Rs = params['Rs']
-    R1 = params['R1']
-    R2 = params['R2']
-    R3 = params['R3']
-    R4 = params['R4']
-    R5 = params['R5']
-    R6 = params['R6']
-    R7 = params['R7']
-    R8 = params['R8']
-    R9 = params['R9']
-    R10 = params['R10']
-    R11 = params['R11']
-    R12 = params['R12']
-    R13 = params['R13']
-    R14 = params['R14']
-    R15 = params['R15']
-    R16 = params['R16']
-    R17 = params['R17']
-    R18 = params['R18']
-    R19 = params['R19']
-    R20 = params['R20']
-    return Rs + (R1/(1+w*1j*t_values[0])) + (R2 /(1+w*1j*t_values[1])) + (R3 /(1+w*1j*t_values[2])) + (R4 /(1+w*1j*t_values[3])) + (R5 /(1+w*1j*t_values[4])) + (R6 /(1+w*1j*t_values[5])) + (R7 /(1+w*1j*t_values[6])) + (R8 /(1+w*1j*t_values[7])) + (R9 /(1+w*1j*t_values[8])) + (R10 /(1+w*1j*t_values[9])) + (R11 /(1+w*1j*t_values[10])) + (R12 /(1+w*1j*t_values[11])) + (R13 /(1+w*1j*t_values[12])) + (R14 /(1+w*1j*t_values[13])) + (R15 /(1+w*1j*t_values[14])) + (R16 /(1+w*1j*t_values[15])) + (R17 /(1+w*1j*t_values[16])) + (R18 /(1+w*1j*t_values[17])) + (R19 /(1+w*1j*t_values[18])) + (R20 /(1+w*1j*t_values[19]))
-
-def KK_RC21_fit(params, w, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    Rs = params['Rs']
-    R1 = params['R1']
-    R2 = params['R2']
-    R3 = params['R3']
-    R4 = params['R4']
-    R5 = params['R5']
-    R6 = params['R6']
-    R7 = params['R7']
-    R8 = params['R8']
-    R9 = params['R9']
-    R10 = params['R10']
-    R11 = params['R11']
-    R12 = params['R12']
-    R13 = params['R13']
-    R14 = params['R14']
-    R15 = params['R15']
-    R16 = params['R16']
-    R17 = params['R17']
-    R18 = params['R18']
-    R19 = params['R19']
-    R20 = params['R20']
-    R21 = params['R21']
-    return Rs + (R1/(1+w*1j*t_values[0])) + (R2 /(1+w*1j*t_values[1])) + (R3 /(1+w*1j*t_values[2])) + (R4 /(1+w*1j*t_values[3])) + (R5 /(1+w*1j*t_values[4])) + (R6 /(1+w*1j*t_values[5])) + (R7 /(1+w*1j*t_values[6])) + (R8 /(1+w*1j*t_values[7])) + (R9 /(1+w*1j*t_values[8])) + (R10 /(1+w*1j*t_values[9])) + (R11 /(1+w*1j*t_values[10])) + (R12 /(1+w*1j*t_values[11])) + (R13 /(1+w*1j*t_values[12])) + (R14 /(1+w*1j*t_values[13])) + (R15 /(1+w*1j*t_values[14])) + (R16 /(1+w*1j*t_values[15])) + (R17 /(1+w*1j*t_values[16])) + (R18 /(1+w*1j*t_values[17])) + (R19 /(1+w*1j*t_values[18])) + (R20 /(1+w*1j*t_values[19])) + (R21 /(1+w*1j*t_values[20]))
-
-def KK_RC22_fit(params, w, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    Rs = params['Rs']
-    R1 = params['R1']
-    R2 = params['R2']
-    R3 = params['R3']
-    R4 = params['R4']
-    R5 = params['R5']
-    R6 = params['R6']
-    R7 = params['R7']
-    R8 = params['R8']
-    R9 = params['R9']
-    R10 = params['R10']
-    R11 = params['R11']
-    R12 = params['R12']
-    R13 = params['R13']
-    R14 = params['R14']
-    R15 = params['R15']
-    R16 = params['R16']
-    R17 = params['R17']
-    R18 = params['R18']
-    R19 = params['R19']
-    R20 = params['R20']
-    R21 = params['R21']
-    R22 = params['R22']
-    return Rs + (R1/(1+w*1j*t_values[0])) + (R2 /(1+w*1j*t_values[1])) + (R3 /(1+w*1j*t_values[2])) + (R4 /(1+w*1j*t_values[3])) + (R5 /(1+w*1j*t_values[4])) + (R6 /(1+w*1j*t_values[5])) + (R7 /(1+w*1j*t_values[6])) + (R8 /(1+w*1j*t_values[7])) + (R9 /(1+w*1j*t_values[8])) + (R10 /(1+w*1j*t_values[9])) + (R11 /(1+w*1j*t_values[10])) + (R12 /(1+w*1j*t_values[11])) + (R13 /(1+w*1j*t_values[12])) + (R14 /(1+w*1j*t_values[13])) + (R15 /(1+w*1j*t_values[14])) + (R16 /(1+w*1j*t_values[15])) + (R17 /(1+w*1j*t_values[16])) + (R18 /(1+w*1j*t_values[17])) + (R19 /(1+w*1j*t_values[18])) + (R20 /(1+w*1j*t_values[19])) + (R21 /(1+w*1j*t_values[20])) + (R22 /(1+w*1j*t_values[21]))
-
-def KK_RC23_fit(params, w, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    Rs = params['Rs']
-    R1 = params['R1']
-    R2 = params['R2']
-    R3 = params['R3']
-    R4 = params['R4']
-    R5 = params['R5']
-    R6 = params['R6']
-    R7 = params['R7']
-    R8 = params['R8']
-    R9 = params['R9']
-    R10 = params['R10']
-    R11 = params['R11']
-    R12 = params['R12']
-    R13 = params['R13']
-    R14 = params['R14']
-    R15 = params['R15']
-    R16 = params['R16']
-    R17 = params['R17']
-    R18 = params['R18']
-    R19 = params['R19']
-    R20 = params['R20']
-    R21 = params['R21']
-    R22 = params['R22']
-    R23 = params['R23']
-    return Rs + (R1/(1+w*1j*t_values[0])) + (R2 /(1+w*1j*t_values[1])) + (R3 /(1+w*1j*t_values[2])) + (R4 /(1+w*1j*t_values[3])) + (R5 /(1+w*1j*t_values[4])) + (R6 /(1+w*1j*t_values[5])) + (R7 /(1+w*1j*t_values[6])) + (R8 /(1+w*1j*t_values[7])) + (R9 /(1+w*1j*t_values[8])) + (R10 /(1+w*1j*t_values[9])) + (R11 /(1+w*1j*t_values[10])) + (R12 /(1+w*1j*t_values[11])) + (R13 /(1+w*1j*t_values[12])) + (R14 /(1+w*1j*t_values[13])) + (R15 /(1+w*1j*t_values[14])) + (R16 /(1+w*1j*t_values[15])) + (R17 /(1+w*1j*t_values[16])) + (R18 /(1+w*1j*t_values[17])) + (R19 /(1+w*1j*t_values[18])) + (R20 /(1+w*1j*t_values[19])) + (R21 /(1+w*1j*t_values[20])) + (R22 /(1+w*1j*t_values[21])) + (R23 /(1+w*1j*t_values[22]))
-
-def KK_RC24_fit(params, w, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    Rs = params['Rs']
-    R1 = params['R1']
-    R2 = params['R2']
-    R3 = params['R3']
-    R4 = params['R4']
-    R5 = params['R5']
-    R6 = params['R6']
-    R7 = params['R7']
-    R8 = params['R8']
-    R9 = params['R9']
-    R10 = params['R10']
-    R11 = params['R11']
-    R12 = params['R12']
-    R13 = params['R13']
-    R14 = params['R14']
-    R15 = params['R15']
-    R16 = params['R16']
-    R17 = params['R17']
-    R18 = params['R18']
-    R19 = params['R19']
-    R20 = params['R20']
-    R21 = params['R21']
-    R22 = params['R22']
-    R23 = params['R23']
-    R24 = params['R24']
-    return Rs + (R1/(1+w*1j*t_values[0])) + (R2 /(1+w*1j*t_values[1])) + (R3 /(1+w*1j*t_values[2])) + (R4 /(1+w*1j*t_values[3])) + (R5 /(1+w*1j*t_values[4])) + (R6 /(1+w*1j*t_values[5])) + (R7 /(1+w*1j*t_values[6])) + (R8 /(1+w*1j*t_values[7])) + (R9 /(1+w*1j*t_values[8])) + (R10 /(1+w*1j*t_values[9])) + (R11 /(1+w*1j*t_values[10])) + (R12 /(1+w*1j*t_values[11])) + (R13 /(1+w*1j*t_values[12])) + (R14 /(1+w*1j*t_values[13])) + (R15 /(1+w*1j*t_values[14])) + (R16 /(1+w*1j*t_values[15])) + (R17 /(1+w*1j*t_values[16])) + (R18 /(1+w*1j*t_values[17])) + (R19 /(1+w*1j*t_values[18])) + (R20 /(1+w*1j*t_values[19])) + (R21 /(1+w*1j*t_values[20])) + (R22 /(1+w*1j*t_values[21])) + (R23 /(1+w*1j*t_values[22])) + (R24 /(1+w*1j*t_values[23]))
-
-def KK_RC25_fit(params, w, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    Rs = params['Rs']
-    R1 = params['R1']
-    R2 = params['R2']
-    R3 = params['R3']
-    R4 = params['R4']
-    R5 = params['R5']
-    R6 = params['R6']
-    R7 = params['R7']
-    R8 = params['R8']
-    R9 = params['R9']
-    R10 = params['R10']
-    R11 = params['R11']
-    R12 = params['R12']
-    R13 = params['R13']
-    R14 = params['R14']
-    R15 = params['R15']
-    R16 = params['R16']
-    R17 = params['R17']
-    R18 = params['R18']
-    R19 = params['R19']
-    R20 = params['R20']
-    R21 = params['R21']
-    R22 = params['R22']
-    R23 = params['R23']
-    R24 = params['R24']
-    R25 = params['R25']
-    return Rs + (R1/(1+w*1j*t_values[0])) + (R2 /(1+w*1j*t_values[1])) + (R3 /(1+w*1j*t_values[2])) + (R4 /(1+w*1j*t_values[3])) + (R5 /(1+w*1j*t_values[4])) + (R6 /(1+w*1j*t_values[5])) + (R7 /(1+w*1j*t_values[6])) + (R8 /(1+w*1j*t_values[7])) + (R9 /(1+w*1j*t_values[8])) + (R10 /(1+w*1j*t_values[9])) + (R11 /(1+w*1j*t_values[10])) + (R12 /(1+w*1j*t_values[11])) + (R13 /(1+w*1j*t_values[12])) + (R14 /(1+w*1j*t_values[13])) + (R15 /(1+w*1j*t_values[14])) + (R16 /(1+w*1j*t_values[15])) + (R17 /(1+w*1j*t_values[16])) + (R18 /(1+w*1j*t_values[17])) + (R19 /(1+w*1j*t_values[18])) + (R20 /(1+w*1j*t_values[19])) + (R21 /(1+w*1j*t_values[20])) + (R22 /(1+w*1j*t_values[21])) + (R23 /(1+w*1j*t_values[22])) + (R24 /(1+w*1j*t_values[23])) + (R25 /(1+w*1j*t_values[24]))
-
-def KK_RC26_fit(params, w, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    Rs = params['Rs']
-    R1 = params['R1']
-    R2 = params['R2']
-    R3 = params['R3']
-    R4 = params['R4']
-    R5 = params['R5']
-    R6 = params['R6']
-    R7 = params['R7']
-    R8 = params['R8']
-    R9 = params['R9']
-    R10 = params['R10']
-    R11 = params['R11']
-    R12 = params['R12']
-    R13 = params['R13']
-    R14 = params['R14']
-    R15 = params['R15']
-    R16 = params['R16']
-    R17 = params['R17']
-    R18 = params['R18']
-    R19 = params['R19']
-    R20 = params['R20']
-    R21 = params['R21']
-    R22 = params['R22']
-    R23 = params['R23']
-    R24 = params['R24']
-    R25 = params['R25']
-    R26 = params['R26']
-    return Rs + (R1/(1+w*1j*t_values[0])) + (R2 /(1+w*1j*t_values[1])) + (R3 /(1+w*1j*t_values[2])) + (R4 /(1+w*1j*t_values[3])) + (R5 /(1+w*1j*t_values[4])) + (R6 /(1+w*1j*t_values[5])) + (R7 /(1+w*1j*t_values[6])) + (R8 /(1+w*1j*t_values[7])) + (R9 /(1+w*1j*t_values[8])) + (R10 /(1+w*1j*t_values[9])) + (R11 /(1+w*1j*t_values[10])) + (R12 /(1+w*1j*t_values[11])) + (R13 /(1+w*1j*t_values[12])) + (R14 /(1+w*1j*t_values[13])) + (R15 /(1+w*1j*t_values[14])) + (R16 /(1+w*1j*t_values[15])) + (R17 /(1+w*1j*t_values[16])) + (R18 /(1+w*1j*t_values[17])) + (R19 /(1+w*1j*t_values[18])) + (R20 /(1+w*1j*t_values[19])) + (R21 /(1+w*1j*t_values[20])) + (R22 /(1+w*1j*t_values[21])) + (R23 /(1+w*1j*t_values[22])) + (R24 /(1+w*1j*t_values[23])) + (R25 /(1+w*1j*t_values[24])) + (R26 /(1+w*1j*t_values[25]))
-
-def KK_RC27_fit(params, w, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    Rs = params['Rs']
-    R1 = params['R1']
-    R2 = params['R2']
-    R3 = params['R3']
-    R4 = params['R4']
-    R5 = params['R5']
-    R6 = params['R6']
-    R7 = params['R7']
-    R8 = params['R8']
-    R9 = params['R9']
-    R10 = params['R10']
-    R11 = params['R11']
-    R12 = params['R12']
-    R13 = params['R13']
-    R14 = params['R14']
-    R15 = params['R15']
-    R16 = params['R16']
-    R17 = params['R17']
-    R18 = params['R18']
-    R19 = params['R19']
-    R20 = params['R20']
-    R21 = params['R21']
-    R22 = params['R22']
-    R23 = params['R23']
-    R24 = params['R24']
-    R25 = params['R25']
-    R26 = params['R26']
-    R27 = params['R27']
-    return Rs + (R1/(1+w*1j*t_values[0])) + (R2 /(1+w*1j*t_values[1])) + (R3 /(1+w*1j*t_values[2])) + (R4 /(1+w*1j*t_values[3])) + (R5 /(1+w*1j*t_values[4])) + (R6 /(1+w*1j*t_values[5])) + (R7 /(1+w*1j*t_values[6])) + (R8 /(1+w*1j*t_values[7])) + (R9 /(1+w*1j*t_values[8])) + (R10 /(1+w*1j*t_values[9])) + (R11 /(1+w*1j*t_values[10])) + (R12 /(1+w*1j*t_values[11])) + (R13 /(1+w*1j*t_values[12])) + (R14 /(1+w*1j*t_values[13])) + (R15 /(1+w*1j*t_values[14])) + (R16 /(1+w*1j*t_values[15])) + (R17 /(1+w*1j*t_values[16])) + (R18 /(1+w*1j*t_values[17])) + (R19 /(1+w*1j*t_values[18])) + (R20 /(1+w*1j*t_values[19])) + (R21 /(1+w*1j*t_values[20])) + (R22 /(1+w*1j*t_values[21])) + (R23 /(1+w*1j*t_values[22])) + (R24 /(1+w*1j*t_values[23])) + (R25 /(1+w*1j*t_values[24])) + (R26 /(1+w*1j*t_values[25])) + (R27 /(1+w*1j*t_values[26]))
-
-def KK_RC28_fit(params, w, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    Rs = params['Rs']
-    R1 = params['R1']
-    R2 = params['R2']
-    R3 = params['R3']
-    R4 = params['R4']
-    R5 = params['R5']
-    R6 = params['R6']
-    R7 = params['R7']
-    R8 = params['R8']
-    R9 = params['R9']
-    R10 = params['R10']
-    R11 = params['R11']
-    R12 = params['R12']
-    R13 = params['R13']
-    R14 = params['R14']
-    R15 = params['R15']
-    R16 = params['R16']
-    R17 = params['R17']
-    R18 = params['R18']
-    R19 = params['R19']
-    R20 = params['R20']
-    R21 = params['R21']
-    R22 = params['R22']
-    R23 = params['R23']
-    R24 = params['R24']
-    R25 = params['R25']
-    R26 = params['R26']
-    R27 = params['R27']
-    R28 = params['R28']
-    return Rs + (R1/(1+w*1j*t_values[0])) + (R2 /(1+w*1j*t_values[1])) + (R3 /(1+w*1j*t_values[2])) + (R4 /(1+w*1j*t_values[3])) + (R5 /(1+w*1j*t_values[4])) + (R6 /(1+w*1j*t_values[5])) + (R7 /(1+w*1j*t_values[6])) + (R8 /(1+w*1j*t_values[7])) + (R9 /(1+w*1j*t_values[8])) + (R10 /(1+w*1j*t_values[9])) + (R11 /(1+w*1j*t_values[10])) + (R12 /(1+w*1j*t_values[11])) + (R13 /(1+w*1j*t_values[12])) + (R14 /(1+w*1j*t_values[13])) + (R15 /(1+w*1j*t_values[14])) + (R16 /(1+w*1j*t_values[15])) + (R17 /(1+w*1j*t_values[16])) + (R18 /(1+w*1j*t_values[17])) + (R19 /(1+w*1j*t_values[18])) + (R20 /(1+w*1j*t_values[19])) + (R21 /(1+w*1j*t_values[20])) + (R22 /(1+w*1j*t_values[21])) + (R23 /(1+w*1j*t_values[22])) + (R24 /(1+w*1j*t_values[23])) + (R25 /(1+w*1j*t_values[24])) + (R26 /(1+w*1j*t_values[25])) + (R27 /(1+w*1j*t_values[26])) + (R28 /(1+w*1j*t_values[27]))
-
-def KK_RC29_fit(params, w, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    Rs = params['Rs']
-    R1 = params['R1']
-    R2 = params['R2']
-    R3 = params['R3']
-    R4 = params['R4']
-    R5 = params['R5']
-    R6 = params['R6']
-    R7 = params['R7']
-    R8 = params['R8']
-    R9 = params['R9']
-    R10 = params['R10']
-    R11 = params['R11']
-    R12 = params['R12']
-    R13 = params['R13']
-    R14 = params['R14']
-    R15 = params['R15']
-    R16 = params['R16']
-    R17 = params['R17']
-    R18 = params['R18']
-    R19 = params['R19']
-    R20 = params['R20']
-    R21 = params['R21']
-    R22 = params['R22']
-    R23 = params['R23']
-    R24 = params['R24']
-    R25 = params['R25']
-    R26 = params['R26']
-    R27 = params['R27']
-    R28 = params['R28']
-    R29 = params['R29']
-    return Rs + (R1/(1+w*1j*t_values[0])) + (R2 /(1+w*1j*t_values[1])) + (R3 /(1+w*1j*t_values[2])) + (R4 /(1+w*1j*t_values[3])) + (R5 /(1+w*1j*t_values[4])) + (R6 /(1+w*1j*t_values[5])) + (R7 /(1+w*1j*t_values[6])) + (R8 /(1+w*1j*t_values[7])) + (R9 /(1+w*1j*t_values[8])) + (R10 /(1+w*1j*t_values[9])) + (R11 /(1+w*1j*t_values[10])) + (R12 /(1+w*1j*t_values[11])) + (R13 /(1+w*1j*t_values[12])) + (R14 /(1+w*1j*t_values[13])) + (R15 /(1+w*1j*t_values[14])) + (R16 /(1+w*1j*t_values[15])) + (R17 /(1+w*1j*t_values[16])) + (R18 /(1+w*1j*t_values[17])) + (R19 /(1+w*1j*t_values[18])) + (R20 /(1+w*1j*t_values[19])) + (R21 /(1+w*1j*t_values[20])) + (R22 /(1+w*1j*t_values[21])) + (R23 /(1+w*1j*t_values[22])) + (R24 /(1+w*1j*t_values[23])) + (R25 /(1+w*1j*t_values[24])) + (R26 /(1+w*1j*t_values[25])) + (R27 /(1+w*1j*t_values[26])) + (R28 /(1+w*1j*t_values[27])) + (R29 /(1+w*1j*t_values[28]))
-
-def KK_RC30_fit(params, w, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    Rs = params['Rs']
-    R1 = params['R1']
-    R2 = params['R2']
-    R3 = params['R3']
-    R4 = params['R4']
-    R5 = params['R5']
-    R6 = params['R6']
-    R7 = params['R7']
-    R8 = params['R8']
-    R9 = params['R9']
-    R10 = params['R10']
-    R11 = params['R11']
-    R12 = params['R12']
-    R13 = params['R13']
-    R14 = params['R14']
-    R15 = params['R15']
-    R16 = params['R16']
-    R17 = params['R17']
-    R18 = params['R18']
-    R19 = params['R19']
-    R20 = params['R20']
-    R21 = params['R21']
-    R22 = params['R22']
-    R23 = params['R23']
-    R24 = params['R24']
-    R25 = params['R25']
-    R26 = params['R26']
-    R27 = params['R27']
-    R28 = params['R28']
-    R29 = params['R29']
-    R30 = params['R30']
-    return Rs + (R1/(1+w*1j*t_values[0])) + (R2 /(1+w*1j*t_values[1])) + (R3 /(1+w*1j*t_values[2])) + (R4 /(1+w*1j*t_values[3])) + (R5 /(1+w*1j*t_values[4])) + (R6 /(1+w*1j*t_values[5])) + (R7 /(1+w*1j*t_values[6])) + (R8 /(1+w*1j*t_values[7])) + (R9 /(1+w*1j*t_values[8])) + (R10 /(1+w*1j*t_values[9])) + (R11 /(1+w*1j*t_values[10])) + (R12 /(1+w*1j*t_values[11])) + (R13 /(1+w*1j*t_values[12])) + (R14 /(1+w*1j*t_values[13])) + (R15 /(1+w*1j*t_values[14])) + (R16 /(1+w*1j*t_values[15])) + (R17 /(1+w*1j*t_values[16])) + (R18 /(1+w*1j*t_values[17])) + (R19 /(1+w*1j*t_values[18])) + (R20 /(1+w*1j*t_values[19])) + (R21 /(1+w*1j*t_values[20])) + (R22 /(1+w*1j*t_values[21])) + (R23 /(1+w*1j*t_values[22])) + (R24 /(1+w*1j*t_values[23])) + (R25 /(1+w*1j*t_values[24])) + (R26 /(1+w*1j*t_values[25])) + (R27 /(1+w*1j*t_values[26])) + (R28 /(1+w*1j*t_values[27])) + (R29 /(1+w*1j*t_values[28])) + (R30 /(1+w*1j*t_values[29]))
-
-def KK_RC31_fit(params, w, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    Rs = params['Rs']
-    R1 = params['R1']
-    R2 = params['R2']
-    R3 = params['R3']
-    R4 = params['R4']
-    R5 = params['R5']
-    R6 = params['R6']
-    R7 = params['R7']
-    R8 = params['R8']
-    R9 = params['R9']
-    R10 = params['R10']
-    R11 = params['R11']
-    R12 = params['R12']
-    R13 = params['R13']
-    R14 = params['R14']
-    R15 = params['R15']
-    R16 = params['R16']
-    R17 = params['R17']
-    R18 = params['R18']
-    R19 = params['R19']
-    R20 = params['R20']
-    R21 = params['R21']
-    R22 = params['R22']
-    R23 = params['R23']
-    R24 = params['R24']
-    R25 = params['R25']
-    R26 = params['R26']
-    R27 = params['R27']
-    R28 = params['R28']
-    R29 = params['R29']
-    R30 = params['R30']
-    R31 = params['R31']
-    return Rs + (R1/(1+w*1j*t_values[0])) + (R2 /(1+w*1j*t_values[1])) + (R3 /(1+w*1j*t_values[2])) + (R4 /(1+w*1j*t_values[3])) + (R5 /(1+w*1j*t_values[4])) + (R6 /(1+w*1j*t_values[5])) + (R7 /(1+w*1j*t_values[6])) + (R8 /(1+w*1j*t_values[7])) + (R9 /(1+w*1j*t_values[8])) + (R10 /(1+w*1j*t_values[9])) + (R11 /(1+w*1j*t_values[10])) + (R12 /(1+w*1j*t_values[11])) + (R13 /(1+w*1j*t_values[12])) + (R14 /(1+w*1j*t_values[13])) + (R15 /(1+w*1j*t_values[14])) + (R16 /(1+w*1j*t_values[15])) + (R17 /(1+w*1j*t_values[16])) + (R18 /(1+w*1j*t_values[17])) + (R19 /(1+w*1j*t_values[18])) + (R20 /(1+w*1j*t_values[19])) + (R21 /(1+w*1j*t_values[20])) + (R22 /(1+w*1j*t_values[21])) + (R23 /(1+w*1j*t_values[22])) + (R24 /(1+w*1j*t_values[23])) + (R25 /(1+w*1j*t_values[24])) + (R26 /(1+w*1j*t_values[25])) + (R27 /(1+w*1j*t_values[26])) + (R28 /(1+w*1j*t_values[27])) + (R29 /(1+w*1j*t_values[28])) + (R30 /(1+w*1j*t_values[29])) + (R31 /(1+w*1j*t_values[30]))
-
-def KK_RC32_fit(params, w, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    Rs = params['Rs']
-    R1 = params['R1']
-    R2 = params['R2']
-    R3 = params['R3']
-    R4 = params['R4']
-    R5 = params['R5']
-    R6 = params['R6']
-    R7 = params['R7']
-    R8 = params['R8']
-    R9 = params['R9']
-    R10 = params['R10']
-    R11 = params['R11']
-    R12 = params['R12']
-    R13 = params['R13']
-    R14 = params['R14']
-    R15 = params['R15']
-    R16 = params['R16']
-    R17 = params['R17']
-    R18 = params['R18']
-    R19 = params['R19']
-    R20 = params['R20']
-    R21 = params['R21']
-    R22 = params['R22']
-    R23 = params['R23']
-    R24 = params['R24']
-    R25 = params['R25']
-    R26 = params['R26']
-    R27 = params['R27']
-    R28 = params['R28']
-    R29 = params['R29']
-    R30 = params['R30']
-    R31 = params['R31']
-    R32 = params['R32']
-    return Rs + (R1/(1+w*1j*t_values[0])) + (R2 /(1+w*1j*t_values[1])) + (R3 /(1+w*1j*t_values[2])) + (R4 /(1+w*1j*t_values[3])) + (R5 /(1+w*1j*t_values[4])) + (R6 /(1+w*1j*t_values[5])) + (R7 /(1+w*1j*t_values[6])) + (R8 /(1+w*1j*t_values[7])) + (R9 /(1+w*1j*t_values[8])) + (R10 /(1+w*1j*t_values[9])) + (R11 /(1+w*1j*t_values[10])) + (R12 /(1+w*1j*t_values[11])) + (R13 /(1+w*1j*t_values[12])) + (R14 /(1+w*1j*t_values[13])) + (R15 /(1+w*1j*t_values[14])) + (R16 /(1+w*1j*t_values[15])) + (R17 /(1+w*1j*t_values[16])) + (R18 /(1+w*1j*t_values[17])) + (R19 /(1+w*1j*t_values[18])) + (R20 /(1+w*1j*t_values[19])) + (R21 /(1+w*1j*t_values[20])) + (R22 /(1+w*1j*t_values[21])) + (R23 /(1+w*1j*t_values[22])) + (R24 /(1+w*1j*t_values[23])) + (R25 /(1+w*1j*t_values[24])) + (R26 /(1+w*1j*t_values[25])) + (R27 /(1+w*1j*t_values[26])) + (R28 /(1+w*1j*t_values[27])) + (R29 /(1+w*1j*t_values[28])) + (R30 /(1+w*1j*t_values[29])) + (R31 /(1+w*1j*t_values[30])) + (R32 /(1+w*1j*t_values[31]))
-
-def KK_RC33_fit(params, w, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    Rs = params['Rs']
-    R1 = params['R1']
-    R2 = params['R2']
-    R3 = params['R3']
-    R4 = params['R4']
-    R5 = params['R5']
-    R6 = params['R6']
-    R7 = params['R7']
-    R8 = params['R8']
-    R9 = params['R9']
-    R10 = params['R10']
-    R11 = params['R11']
-    R12 = params['R12']
-    R13 = params['R13']
-    R14 = params['R14']
-    R15 = params['R15']
-    R16 = params['R16']
-    R17 = params['R17']
-    R18 = params['R18']
-    R19 = params['R19']
-    R20 = params['R20']
-    R21 = params['R21']
-    R22 = params['R22']
-    R23 = params['R23']
-    R24 = params['R24']
-    R25 = params['R25']
-    R26 = params['R26']
-    R27 = params['R27']
-    R28 = params['R28']
-    R29 = params['R29']
-    R30 = params['R30']
-    R31 = params['R31']
-    R32 = params['R32']
-    R33 = params['R33']
-    return Rs + (R1/(1+w*1j*t_values[0])) + (R2 /(1+w*1j*t_values[1])) + (R3 /(1+w*1j*t_values[2])) + (R4 /(1+w*1j*t_values[3])) + (R5 /(1+w*1j*t_values[4])) + (R6 /(1+w*1j*t_values[5])) + (R7 /(1+w*1j*t_values[6])) + (R8 /(1+w*1j*t_values[7])) + (R9 /(1+w*1j*t_values[8])) + (R10 /(1+w*1j*t_values[9])) + (R11 /(1+w*1j*t_values[10])) + (R12 /(1+w*1j*t_values[11])) + (R13 /(1+w*1j*t_values[12])) + (R14 /(1+w*1j*t_values[13])) + (R15 /(1+w*1j*t_values[14])) + (R16 /(1+w*1j*t_values[15])) + (R17 /(1+w*1j*t_values[16])) + (R18 /(1+w*1j*t_values[17])) + (R19 /(1+w*1j*t_values[18])) + (R20 /(1+w*1j*t_values[19])) + (R21 /(1+w*1j*t_values[20])) + (R22 /(1+w*1j*t_values[21])) + (R23 /(1+w*1j*t_values[22])) + (R24 /(1+w*1j*t_values[23])) + (R25 /(1+w*1j*t_values[24])) + (R26 /(1+w*1j*t_values[25])) + (R27 /(1+w*1j*t_values[26])) + (R28 /(1+w*1j*t_values[27])) + (R29 /(1+w*1j*t_values[28])) + (R30 /(1+w*1j*t_values[29])) + (R31 /(1+w*1j*t_values[30])) + (R32 /(1+w*1j*t_values[31])) + (R33 /(1+w*1j*t_values[32]))
-
-def KK_RC34_fit(params, w, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    Rs = params['Rs']
-    R1 = params['R1']
-    R2 = params['R2']
-    R3 = params['R3']
-    R4 = params['R4']
-    R5 = params['R5']
-    R6 = params['R6']
-    R7 = params['R7']
-    R8 = params['R8']
-    R9 = params['R9']
-    R10 = params['R10']
-    R11 = params['R11']
-    R12 = params['R12']
-    R13 = params['R13']
-    R14 = params['R14']
-    R15 = params['R15']
-    R16 = params['R16']
-    R17 = params['R17']
-    R18 = params['R18']
-    R19 = params['R19']
-    R20 = params['R20']
-    R21 = params['R21']
-    R22 = params['R22']
-    R23 = params['R23']
-    R24 = params['R24']
-    R25 = params['R25']
-    R26 = params['R26']
-    R27 = params['R27']
-    R28 = params['R28']
-    R29 = params['R29']
-    R30 = params['R30']
-    R31 = params['R31']
-    R32 = params['R32']
-    R33 = params['R33']
-    R34 = params['R34']
-    return Rs + (R1/(1+w*1j*t_values[0])) + (R2 /(1+w*1j*t_values[1])) + (R3 /(1+w*1j*t_values[2])) + (R4 /(1+w*1j*t_values[3])) + (R5 /(1+w*1j*t_values[4])) + (R6 /(1+w*1j*t_values[5])) + (R7 /(1+w*1j*t_values[6])) + (R8 /(1+w*1j*t_values[7])) + (R9 /(1+w*1j*t_values[8])) + (R10 /(1+w*1j*t_values[9])) + (R11 /(1+w*1j*t_values[10])) + (R12 /(1+w*1j*t_values[11])) + (R13 /(1+w*1j*t_values[12])) + (R14 /(1+w*1j*t_values[13])) + (R15 /(1+w*1j*t_values[14])) + (R16 /(1+w*1j*t_values[15])) + (R17 /(1+w*1j*t_values[16])) + (R18 /(1+w*1j*t_values[17])) + (R19 /(1+w*1j*t_values[18])) + (R20 /(1+w*1j*t_values[19])) + (R21 /(1+w*1j*t_values[20])) + (R22 /(1+w*1j*t_values[21])) + (R23 /(1+w*1j*t_values[22])) + (R24 /(1+w*1j*t_values[23])) + (R25 /(1+w*1j*t_values[24])) + (R26 /(1+w*1j*t_values[25])) + (R27 /(1+w*1j*t_values[26])) + (R28 /(1+w*1j*t_values[27])) + (R29 /(1+w*1j*t_values[28])) + (R30 /(1+w*1j*t_values[29])) + (R31 /(1+w*1j*t_values[30])) + (R32 /(1+w*1j*t_values[31])) + (R33 /(1+w*1j*t_values[32])) + (R34 /(1+w*1j*t_values[33]))
-
-def KK_RC35_fit(params, w, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    Rs = params['Rs']
-    R1 = params['R1']
-    R2 = params['R2']
-    R3 = params['R3']
-    R4 = params['R4']
-    R5 = params['R5']
-    R6 = params['R6']
-    R7 = params['R7']
-    R8 = params['R8']
-    R9 = params['R9']
-    R10 = params['R10']
-    R11 = params['R11']
-    R12 = params['R12']
-    R13 = params['R13']
-    R14 = params['R14']
-    R15 = params['R15']
-    R16 = params['R16']
-    R17 = params['R17']
-    R18 = params['R18']
-    R19 = params['R19']
-    R20 = params['R20']
-    R21 = params['R21']
-    R22 = params['R22']
-    R23 = params['R23']
-    R24 = params['R24']
-    R25 = params['R25']
-    R26 = params['R26']
-    R27 = params['R27']
-    R28 = params['R28']
-    R29 = params['R29']
-    R30 = params['R30']
-    R31 = params['R31']
-    R32 = params['R32']
-    R33 = params['R33']
-    R34 = params['R34']
-    R35 = params['R35']
-    return Rs + (R1/(1+w*1j*t_values[0])) + (R2 /(1+w*1j*t_values[1])) + (R3 /(1+w*1j*t_values[2])) + (R4 /(1+w*1j*t_values[3])) + (R5 /(1+w*1j*t_values[4])) + (R6 /(1+w*1j*t_values[5])) + (R7 /(1+w*1j*t_values[6])) + (R8 /(1+w*1j*t_values[7])) + (R9 /(1+w*1j*t_values[8])) + (R10 /(1+w*1j*t_values[9])) + (R11 /(1+w*1j*t_values[10])) + (R12 /(1+w*1j*t_values[11])) + (R13 /(1+w*1j*t_values[12])) + (R14 /(1+w*1j*t_values[13])) + (R15 /(1+w*1j*t_values[14])) + (R16 /(1+w*1j*t_values[15])) + (R17 /(1+w*1j*t_values[16])) + (R18 /(1+w*1j*t_values[17])) + (R19 /(1+w*1j*t_values[18])) + (R20 /(1+w*1j*t_values[19])) + (R21 /(1+w*1j*t_values[20])) + (R22 /(1+w*1j*t_values[21])) + (R23 /(1+w*1j*t_values[22])) + (R24 /(1+w*1j*t_values[23])) + (R25 /(1+w*1j*t_values[24])) + (R26 /(1+w*1j*t_values[25])) + (R27 /(1+w*1j*t_values[26])) + (R28 /(1+w*1j*t_values[27])) + (R29 /(1+w*1j*t_values[28])) + (R30 /(1+w*1j*t_values[29])) + (R31 /(1+w*1j*t_values[30])) + (R32 /(1+w*1j*t_values[31])) + (R33 /(1+w*1j*t_values[32])) + (R34 /(1+w*1j*t_values[33])) + (R35 /(1+w*1j*t_values[34]))
-
-def KK_RC36_fit(params, w, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    Rs = params['Rs']
-    R1 = params['R1']
-    R2 = params['R2']
-    R3 = params['R3']
-    R4 = params['R4']
-    R5 = params['R5']
-    R6 = params['R6']
-    R7 = params['R7']
-    R8 = params['R8']
-    R9 = params['R9']
-    R10 = params['R10']
-    R11 = params['R11']
-    R12 = params['R12']
-    R13 = params['R13']
-    R14 = params['R14']
-    R15 = params['R15']
-    R16 = params['R16']
-    R17 = params['R17']
-    R18 = params['R18']
-    R19 = params['R19']
-    R20 = params['R20']
-    R21 = params['R21']
-    R22 = params['R22']
-    R23 = params['R23']
-    R24 = params['R24']
-    R25 = params['R25']
-    R26 = params['R26']
-    R27 = params['R27']
-    R28 = params['R28']
-    R29 = params['R29']
-    R30 = params['R30']
-    R31 = params['R31']
-    R32 = params['R32']
-    R33 = params['R33']
-    R34 = params['R34']
-    R35 = params['R35']
-    R36 = params['R36']
-    return Rs + (R1/(1+w*1j*t_values[0])) + (R2 /(1+w*1j*t_values[1])) + (R3 /(1+w*1j*t_values[2])) + (R4 /(1+w*1j*t_values[3])) + (R5 /(1+w*1j*t_values[4])) + (R6 /(1+w*1j*t_values[5])) + (R7 /(1+w*1j*t_values[6])) + (R8 /(1+w*1j*t_values[7])) + (R9 /(1+w*1j*t_values[8])) + (R10 /(1+w*1j*t_values[9])) + (R11 /(1+w*1j*t_values[10])) + (R12 /(1+w*1j*t_values[11])) + (R13 /(1+w*1j*t_values[12])) + (R14 /(1+w*1j*t_values[13])) + (R15 /(1+w*1j*t_values[14])) + (R16 /(1+w*1j*t_values[15])) + (R17 /(1+w*1j*t_values[16])) + (R18 /(1+w*1j*t_values[17])) + (R19 /(1+w*1j*t_values[18])) + (R20 /(1+w*1j*t_values[19])) + (R21 /(1+w*1j*t_values[20])) + (R22 /(1+w*1j*t_values[21])) + (R23 /(1+w*1j*t_values[22])) + (R24 /(1+w*1j*t_values[23])) + (R25 /(1+w*1j*t_values[24])) + (R26 /(1+w*1j*t_values[25])) + (R27 /(1+w*1j*t_values[26])) + (R28 /(1+w*1j*t_values[27])) + (R29 /(1+w*1j*t_values[28])) + (R30 /(1+w*1j*t_values[29])) + (R31 /(1+w*1j*t_values[30])) + (R32 /(1+w*1j*t_values[31])) + (R33 /(1+w*1j*t_values[32])) + (R34 /(1+w*1j*t_values[33])) + (R35 /(1+w*1j*t_values[34]))  + (R36 /(1+w*1j*t_values[35]))
-
-def KK_RC37_fit(params, w, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    Rs = params['Rs']
-    R1 = params['R1']
-    R2 = params['R2']
-    R3 = params['R3']
-    R4 = params['R4']
-    R5 = params['R5']
-    R6 = params['R6']
-    R7 = params['R7']
-    R8 = params['R8']
-    R9 = params['R9']
-    R10 = params['R10']
-    R11 = params['R11']
-    R12 = params['R12']
-    R13 = params['R13']
-    R14 = params['R14']
-    R15 = params['R15']
-    R16 = params['R16']
-    R17 = params['R17']
-    R18 = params['R18']
-    R19 = params['R19']
-    R20 = params['R20']
-    R21 = params['R21']
-    R22 = params['R22']
-    R23 = params['R23']
-    R24 = params['R24']
-    R25 = params['R25']
-    R26 = params['R26']
-    R27 = params['R27']
-    R28 = params['R28']
-    R29 = params['R29']
-    R30 = params['R30']
-    R31 = params['R31']
-    R32 = params['R32']
-    R33 = params['R33']
-    R34 = params['R34']
-    R35 = params['R35']
-    R36 = params['R36']
-    R37 = params['R37']
-    return Rs + (R1/(1+w*1j*t_values[0])) + (R2 /(1+w*1j*t_values[1])) + (R3 /(1+w*1j*t_values[2])) + (R4 /(1+w*1j*t_values[3])) + (R5 /(1+w*1j*t_values[4])) + (R6 /(1+w*1j*t_values[5])) + (R7 /(1+w*1j*t_values[6])) + (R8 /(1+w*1j*t_values[7])) + (R9 /(1+w*1j*t_values[8])) + (R10 /(1+w*1j*t_values[9])) + (R11 /(1+w*1j*t_values[10])) + (R12 /(1+w*1j*t_values[11])) + (R13 /(1+w*1j*t_values[12])) + (R14 /(1+w*1j*t_values[13])) + (R15 /(1+w*1j*t_values[14])) + (R16 /(1+w*1j*t_values[15])) + (R17 /(1+w*1j*t_values[16])) + (R18 /(1+w*1j*t_values[17])) + (R19 /(1+w*1j*t_values[18])) + (R20 /(1+w*1j*t_values[19])) + (R21 /(1+w*1j*t_values[20])) + (R22 /(1+w*1j*t_values[21])) + (R23 /(1+w*1j*t_values[22])) + (R24 /(1+w*1j*t_values[23])) + (R25 /(1+w*1j*t_values[24])) + (R26 /(1+w*1j*t_values[25])) + (R27 /(1+w*1j*t_values[26])) + (R28 /(1+w*1j*t_values[27])) + (R29 /(1+w*1j*t_values[28])) + (R30 /(1+w*1j*t_values[29])) + (R31 /(1+w*1j*t_values[30])) + (R32 /(1+w*1j*t_values[31])) + (R33 /(1+w*1j*t_values[32])) + (R34 /(1+w*1j*t_values[33])) + (R35 /(1+w*1j*t_values[34]))  + (R36 /(1+w*1j*t_values[35])) + (R37 /(1+w*1j*t_values[36]))
-
-def KK_RC38_fit(params, w, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    Rs = params['Rs']
-    R1 = params['R1']
-    R2 = params['R2']
-    R3 = params['R3']
-    R4 = params['R4']
-    R5 = params['R5']
-    R6 = params['R6']
-    R7 = params['R7']
-    R8 = params['R8']
-    R9 = params['R9']
-    R10 = params['R10']
-    R11 = params['R11']
-    R12 = params['R12']
-    R13 = params['R13']
-    R14 = params['R14']
-    R15 = params['R15']
-    R16 = params['R16']
-    R17 = params['R17']
-    R18 = params['R18']
-    R19 = params['R19']
-    R20 = params['R20']
-    R21 = params['R21']
-    R22 = params['R22']
-    R23 = params['R23']
-    R24 = params['R24']
-    R25 = params['R25']
-    R26 = params['R26']
-    R27 = params['R27']
-    R28 = params['R28']
-    R29 = params['R29']
-    R30 = params['R30']
-    R31 = params['R31']
-    R32 = params['R32']
-    R33 = params['R33']
-    R34 = params['R34']
-    R35 = params['R35']
-    R36 = params['R36']
-    R37 = params['R37']
-    R38 = params['R38']
-    return Rs + (R1/(1+w*1j*t_values[0])) + (R2 /(1+w*1j*t_values[1])) + (R3 /(1+w*1j*t_values[2])) + (R4 /(1+w*1j*t_values[3])) + (R5 /(1+w*1j*t_values[4])) + (R6 /(1+w*1j*t_values[5])) + (R7 /(1+w*1j*t_values[6])) + (R8 /(1+w*1j*t_values[7])) + (R9 /(1+w*1j*t_values[8])) + (R10 /(1+w*1j*t_values[9])) + (R11 /(1+w*1j*t_values[10])) + (R12 /(1+w*1j*t_values[11])) + (R13 /(1+w*1j*t_values[12])) + (R14 /(1+w*1j*t_values[13])) + (R15 /(1+w*1j*t_values[14])) + (R16 /(1+w*1j*t_values[15])) + (R17 /(1+w*1j*t_values[16])) + (R18 /(1+w*1j*t_values[17])) + (R19 /(1+w*1j*t_values[18])) + (R20 /(1+w*1j*t_values[19])) + (R21 /(1+w*1j*t_values[20])) + (R22 /(1+w*1j*t_values[21])) + (R23 /(1+w*1j*t_values[22])) + (R24 /(1+w*1j*t_values[23])) + (R25 /(1+w*1j*t_values[24])) + (R26 /(1+w*1j*t_values[25])) + (R27 /(1+w*1j*t_values[26])) + (R28 /(1+w*1j*t_values[27])) + (R29 /(1+w*1j*t_values[28])) + (R30 /(1+w*1j*t_values[29])) + (R31 /(1+w*1j*t_values[30])) + (R32 /(1+w*1j*t_values[31])) + (R33 /(1+w*1j*t_values[32])) + (R34 /(1+w*1j*t_values[33])) + (R35 /(1+w*1j*t_values[34]))  + (R36 /(1+w*1j*t_values[35])) + (R37 /(1+w*1j*t_values[36])) + (R38 /(1+w*1j*t_values[37]))
-
-def KK_RC39_fit(params, w, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    Rs = params['Rs']
-    R1 = params['R1']
-    R2 = params['R2']
-    R3 = params['R3']
-    R4 = params['R4']
-    R5 = params['R5']
-    R6 = params['R6']
-    R7 = params['R7']
-    R8 = params['R8']
-    R9 = params['R9']
-    R10 = params['R10']
-    R11 = params['R11']
-    R12 = params['R12']
-    R13 = params['R13']
-    R14 = params['R14']
-    R15 = params['R15']
-    R16 = params['R16']
-    R17 = params['R17']
-    R18 = params['R18']
-    R19 = params['R19']
-    R20 = params['R20']
-    R21 = params['R21']
-    R22 = params['R22']
-    R23 = params['R23']
-    R24 = params['R24']
-    R25 = params['R25']
-    R26 = params['R26']
-    R27 = params['R27']
-    R28 = params['R28']
-    R29 = params['R29']
-    R30 = params['R30']
-    R31 = params['R31']
-    R32 = params['R32']
-    R33 = params['R33']
-    R34 = params['R34']
-    R35 = params['R35']
-    R36 = params['R36']
-    R37 = params['R37']
-    R38 = params['R38']
-    R39 = params['R39']
-    return Rs + (R1/(1+w*1j*t_values[0])) + (R2 /(1+w*1j*t_values[1])) + (R3 /(1+w*1j*t_values[2])) + (R4 /(1+w*1j*t_values[3])) + (R5 /(1+w*1j*t_values[4])) + (R6 /(1+w*1j*t_values[5])) + (R7 /(1+w*1j*t_values[6])) + (R8 /(1+w*1j*t_values[7])) + (R9 /(1+w*1j*t_values[8])) + (R10 /(1+w*1j*t_values[9])) + (R11 /(1+w*1j*t_values[10])) + (R12 /(1+w*1j*t_values[11])) + (R13 /(1+w*1j*t_values[12])) + (R14 /(1+w*1j*t_values[13])) + (R15 /(1+w*1j*t_values[14])) + (R16 /(1+w*1j*t_values[15])) + (R17 /(1+w*1j*t_values[16])) + (R18 /(1+w*1j*t_values[17])) + (R19 /(1+w*1j*t_values[18])) + (R20 /(1+w*1j*t_values[19])) + (R21 /(1+w*1j*t_values[20])) + (R22 /(1+w*1j*t_values[21])) + (R23 /(1+w*1j*t_values[22])) + (R24 /(1+w*1j*t_values[23])) + (R25 /(1+w*1j*t_values[24])) + (R26 /(1+w*1j*t_values[25])) + (R27 /(1+w*1j*t_values[26])) + (R28 /(1+w*1j*t_values[27])) + (R29 /(1+w*1j*t_values[28])) + (R30 /(1+w*1j*t_values[29])) + (R31 /(1+w*1j*t_values[30])) + (R32 /(1+w*1j*t_values[31])) + (R33 /(1+w*1j*t_values[32])) + (R34 /(1+w*1j*t_values[33])) + (R35 /(1+w*1j*t_values[34]))  + (R36 /(1+w*1j*t_values[35])) + (R37 /(1+w*1j*t_values[36])) + (R38 /(1+w*1j*t_values[37])) + (R39 /(1+w*1j*t_values[38]))
-
-def KK_RC40_fit(params, w, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    Rs = params['Rs']
-    R1 = params['R1']
-    R2 = params['R2']
-    R3 = params['R3']
-    R4 = params['R4']
-    R5 = params['R5']
-    R6 = params['R6']
-    R7 = params['R7']
-    R8 = params['R8']
-    R9 = params['R9']
-    R10 = params['R10']
-    R11 = params['R11']
-    R12 = params['R12']
-    R13 = params['R13']
-    R14 = params['R14']
-    R15 = params['R15']
-    R16 = params['R16']
-    R17 = params['R17']
-    R18 = params['R18']
-    R19 = params['R19']
-    R20 = params['R20']
-    R21 = params['R21']
-    R22 = params['R22']
-    R23 = params['R23']
-    R24 = params['R24']
-    R25 = params['R25']
-    R26 = params['R26']
-    R27 = params['R27']
-    R28 = params['R28']
-    R29 = params['R29']
-    R30 = params['R30']
-    R31 = params['R31']
-    R32 = params['R32']
-    R33 = params['R33']
-    R34 = params['R34']
-    R35 = params['R35']
-    R36 = params['R36']
-    R37 = params['R37']
-    R38 = params['R38']
-    R39 = params['R39']
-    R40 = params['R40']
-    return Rs + (R1/(1+w*1j*t_values[0])) + (R2 /(1+w*1j*t_values[1])) + (R3 /(1+w*1j*t_values[2])) + (R4 /(1+w*1j*t_values[3])) + (R5 /(1+w*1j*t_values[4])) + (R6 /(1+w*1j*t_values[5])) + (R7 /(1+w*1j*t_values[6])) + (R8 /(1+w*1j*t_values[7])) + (R9 /(1+w*1j*t_values[8])) + (R10 /(1+w*1j*t_values[9])) + (R11 /(1+w*1j*t_values[10])) + (R12 /(1+w*1j*t_values[11])) + (R13 /(1+w*1j*t_values[12])) + (R14 /(1+w*1j*t_values[13])) + (R15 /(1+w*1j*t_values[14])) + (R16 /(1+w*1j*t_values[15])) + (R17 /(1+w*1j*t_values[16])) + (R18 /(1+w*1j*t_values[17])) + (R19 /(1+w*1j*t_values[18])) + (R20 /(1+w*1j*t_values[19])) + (R21 /(1+w*1j*t_values[20])) + (R22 /(1+w*1j*t_values[21])) + (R23 /(1+w*1j*t_values[22])) + (R24 /(1+w*1j*t_values[23])) + (R25 /(1+w*1j*t_values[24])) + (R26 /(1+w*1j*t_values[25])) + (R27 /(1+w*1j*t_values[26])) + (R28 /(1+w*1j*t_values[27])) + (R29 /(1+w*1j*t_values[28])) + (R30 /(1+w*1j*t_values[29])) + (R31 /(1+w*1j*t_values[30])) + (R32 /(1+w*1j*t_values[31])) + (R33 /(1+w*1j*t_values[32])) + (R34 /(1+w*1j*t_values[33])) + (R35 /(1+w*1j*t_values[34]))  + (R36 /(1+w*1j*t_values[35])) + (R37 /(1+w*1j*t_values[36])) + (R38 /(1+w*1j*t_values[37])) + (R39 /(1+w*1j*t_values[38])) + (R40 /(1+w*1j*t_values[39]))
-
-def KK_RC41_fit(params, w, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    Rs = params['Rs']
-    R1 = params['R1']
-    R2 = params['R2']
-    R3 = params['R3']
-    R4 = params['R4']
-    R5 = params['R5']
-    R6 = params['R6']
-    R7 = params['R7']
-    R8 = params['R8']
-    R9 = params['R9']
-    R10 = params['R10']
-    R11 = params['R11']
-    R12 = params['R12']
-    R13 = params['R13']
-    R14 = params['R14']
-    R15 = params['R15']
-    R16 = params['R16']
-    R17 = params['R17']
-    R18 = params['R18']
-    R19 = params['R19']
-    R20 = params['R20']
-    R21 = params['R21']
-    R22 = params['R22']
-    R23 = params['R23']
-    R24 = params['R24']
-    R25 = params['R25']
-    R26 = params['R26']
-    R27 = params['R27']
-    R28 = params['R28']
-    R29 = params['R29']
-    R30 = params['R30']
-    R31 = params['R31']
-    R32 = params['R32']
-    R33 = params['R33']
-    R34 = params['R34']
-    R35 = params['R35']
-    R36 = params['R36']
-    R37 = params['R37']
-    R38 = params['R38']
-    R39 = params['R39']
-    R40 = params['R40']
-    R41 = params['R41']
-    return Rs + (R1/(1+w*1j*t_values[0])) + (R2 /(1+w*1j*t_values[1])) + (R3 /(1+w*1j*t_values[2])) + (R4 /(1+w*1j*t_values[3])) + (R5 /(1+w*1j*t_values[4])) + (R6 /(1+w*1j*t_values[5])) + (R7 /(1+w*1j*t_values[6])) + (R8 /(1+w*1j*t_values[7])) + (R9 /(1+w*1j*t_values[8])) + (R10 /(1+w*1j*t_values[9])) + (R11 /(1+w*1j*t_values[10])) + (R12 /(1+w*1j*t_values[11])) + (R13 /(1+w*1j*t_values[12])) + (R14 /(1+w*1j*t_values[13])) + (R15 /(1+w*1j*t_values[14])) + (R16 /(1+w*1j*t_values[15])) + (R17 /(1+w*1j*t_values[16])) + (R18 /(1+w*1j*t_values[17])) + (R19 /(1+w*1j*t_values[18])) + (R20 /(1+w*1j*t_values[19])) + (R21 /(1+w*1j*t_values[20])) + (R22 /(1+w*1j*t_values[21])) + (R23 /(1+w*1j*t_values[22])) + (R24 /(1+w*1j*t_values[23])) + (R25 /(1+w*1j*t_values[24])) + (R26 /(1+w*1j*t_values[25])) + (R27 /(1+w*1j*t_values[26])) + (R28 /(1+w*1j*t_values[27])) + (R29 /(1+w*1j*t_values[28])) + (R30 /(1+w*1j*t_values[29])) + (R31 /(1+w*1j*t_values[30])) + (R32 /(1+w*1j*t_values[31])) + (R33 /(1+w*1j*t_values[32])) + (R34 /(1+w*1j*t_values[33])) + (R35 /(1+w*1j*t_values[34]))  + (R36 /(1+w*1j*t_values[35])) + (R37 /(1+w*1j*t_values[36])) + (R38 /(1+w*1j*t_values[37])) + (R39 /(1+w*1j*t_values[38])) + (R40 /(1+w*1j*t_values[39])) + (R41 /(1+w*1j*t_values[40]))
-
-def KK_RC42_fit(params, w, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    Rs = params['Rs']
-    R1 = params['R1']
-    R2 = params['R2']
-    R3 = params['R3']
-    R4 = params['R4']
-    R5 = params['R5']
-    R6 = params['R6']
-    R7 = params['R7']
-    R8 = params['R8']
-    R9 = params['R9']
-    R10 = params['R10']
-    R11 = params['R11']
-    R12 = params['R12']
-    R13 = params['R13']
-    R14 = params['R14']
-    R15 = params['R15']
-    R16 = params['R16']
-    R17 = params['R17']
-    R18 = params['R18']
-    R19 = params['R19']
-    R20 = params['R20']
-    R21 = params['R21']
-    R22 = params['R22']
-    R23 = params['R23']
-    R24 = params['R24']
-    R25 = params['R25']
-    R26 = params['R26']
-    R27 = params['R27']
-    R28 = params['R28']
-    R29 = params['R29']
-    R30 = params['R30']
-    R31 = params['R31']
-    R32 = params['R32']
-    R33 = params['R33']
-    R34 = params['R34']
-    R35 = params['R35']
-    R36 = params['R36']
-    R37 = params['R37']
-    R38 = params['R38']
-    R39 = params['R39']
-    R40 = params['R40']
-    R41 = params['R41']
-    R42 = params['R42']
-    return Rs + (R1/(1+w*1j*t_values[0])) + (R2 /(1+w*1j*t_values[1])) + (R3 /(1+w*1j*t_values[2])) + (R4 /(1+w*1j*t_values[3])) + (R5 /(1+w*1j*t_values[4])) + (R6 /(1+w*1j*t_values[5])) + (R7 /(1+w*1j*t_values[6])) + (R8 /(1+w*1j*t_values[7])) + (R9 /(1+w*1j*t_values[8])) + (R10 /(1+w*1j*t_values[9])) + (R11 /(1+w*1j*t_values[10])) + (R12 /(1+w*1j*t_values[11])) + (R13 /(1+w*1j*t_values[12])) + (R14 /(1+w*1j*t_values[13])) + (R15 /(1+w*1j*t_values[14])) + (R16 /(1+w*1j*t_values[15])) + (R17 /(1+w*1j*t_values[16])) + (R18 /(1+w*1j*t_values[17])) + (R19 /(1+w*1j*t_values[18])) + (R20 /(1+w*1j*t_values[19])) + (R21 /(1+w*1j*t_values[20])) + (R22 /(1+w*1j*t_values[21])) + (R23 /(1+w*1j*t_values[22])) + (R24 /(1+w*1j*t_values[23])) + (R25 /(1+w*1j*t_values[24])) + (R26 /(1+w*1j*t_values[25])) + (R27 /(1+w*1j*t_values[26])) + (R28 /(1+w*1j*t_values[27])) + (R29 /(1+w*1j*t_values[28])) + (R30 /(1+w*1j*t_values[29])) + (R31 /(1+w*1j*t_values[30])) + (R32 /(1+w*1j*t_values[31])) + (R33 /(1+w*1j*t_values[32])) + (R34 /(1+w*1j*t_values[33])) + (R35 /(1+w*1j*t_values[34]))  + (R36 /(1+w*1j*t_values[35])) + (R37 /(1+w*1j*t_values[36])) + (R38 /(1+w*1j*t_values[37])) + (R39 /(1+w*1j*t_values[38])) + (R40 /(1+w*1j*t_values[39])) + (R41 /(1+w*1j*t_values[40])) + (R42 /(1+w*1j*t_values[41]))
-
-def KK_RC43_fit(params, w, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    Rs = params['Rs']
-    R1 = params['R1']
-    R2 = params['R2']
-    R3 = params['R3']
-    R4 = params['R4']
-    R5 = params['R5']
-    R6 = params['R6']
-    R7 = params['R7']
-    R8 = params['R8']
-    R9 = params['R9']
-    R10 = params['R10']
-    R11 = params['R11']
-    R12 = params['R12']
-    R13 = params['R13']
-    R14 = params['R14']
-    R15 = params['R15']
-    R16 = params['R16']
-    R17 = params['R17']
-    R18 = params['R18']
-    R19 = params['R19']
-    R20 = params['R20']
-    R21 = params['R21']
-    R22 = params['R22']
-    R23 = params['R23']
-    R24 = params['R24']
-    R25 = params['R25']
-    R26 = params['R26']
-    R27 = params['R27']
-    R28 = params['R28']
-    R29 = params['R29']
-    R30 = params['R30']
-    R31 = params['R31']
-    R32 = params['R32']
-    R33 = params['R33']
-    R34 = params['R34']
-    R35 = params['R35']
-    R36 = params['R36']
-    R37 = params['R37']
-    R38 = params['R38']
-    R39 = params['R39']
-    R40 = params['R40']
-    R41 = params['R41']
-    R42 = params['R42']
-    R43 = params['R43']
-    return Rs + (R1/(1+w*1j*t_values[0])) + (R2 /(1+w*1j*t_values[1])) + (R3 /(1+w*1j*t_values[2])) + (R4 /(1+w*1j*t_values[3])) + (R5 /(1+w*1j*t_values[4])) + (R6 /(1+w*1j*t_values[5])) + (R7 /(1+w*1j*t_values[6])) + (R8 /(1+w*1j*t_values[7])) + (R9 /(1+w*1j*t_values[8])) + (R10 /(1+w*1j*t_values[9])) + (R11 /(1+w*1j*t_values[10])) + (R12 /(1+w*1j*t_values[11])) + (R13 /(1+w*1j*t_values[12])) + (R14 /(1+w*1j*t_values[13])) + (R15 /(1+w*1j*t_values[14])) + (R16 /(1+w*1j*t_values[15])) + (R17 /(1+w*1j*t_values[16])) + (R18 /(1+w*1j*t_values[17])) + (R19 /(1+w*1j*t_values[18])) + (R20 /(1+w*1j*t_values[19])) + (R21 /(1+w*1j*t_values[20])) + (R22 /(1+w*1j*t_values[21])) + (R23 /(1+w*1j*t_values[22])) + (R24 /(1+w*1j*t_values[23])) + (R25 /(1+w*1j*t_values[24])) + (R26 /(1+w*1j*t_values[25])) + (R27 /(1+w*1j*t_values[26])) + (R28 /(1+w*1j*t_values[27])) + (R29 /(1+w*1j*t_values[28])) + (R30 /(1+w*1j*t_values[29])) + (R31 /(1+w*1j*t_values[30])) + (R32 /(1+w*1j*t_values[31])) + (R33 /(1+w*1j*t_values[32])) + (R34 /(1+w*1j*t_values[33])) + (R35 /(1+w*1j*t_values[34]))  + (R36 /(1+w*1j*t_values[35])) + (R37 /(1+w*1j*t_values[36])) + (R38 /(1+w*1j*t_values[37])) + (R39 /(1+w*1j*t_values[38])) + (R40 /(1+w*1j*t_values[39])) + (R41 /(1+w*1j*t_values[40])) + (R42 /(1+w*1j*t_values[41])) + (R43 /(1+w*1j*t_values[42]))
-
-def KK_RC44_fit(params, w, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    Rs = params['Rs']
-    R1 = params['R1']
-    R2 = params['R2']
-    R3 = params['R3']
-    R4 = params['R4']
-    R5 = params['R5']
-    R6 = params['R6']
-    R7 = params['R7']
-    R8 = params['R8']
-    R9 = params['R9']
-    R10 = params['R10']
-    R11 = params['R11']
-    R12 = params['R12']
-    R13 = params['R13']
-    R14 = params['R14']
-    R15 = params['R15']
-    R16 = params['R16']
-    R17 = params['R17']
-    R18 = params['R18']
-    R19 = params['R19']
-    R20 = params['R20']
-    R21 = params['R21']
-    R22 = params['R22']
-    R23 = params['R23']
-    R24 = params['R24']
-    R25 = params['R25']
-    R26 = params['R26']
-    R27 = params['R27']
-    R28 = params['R28']
-    R29 = params['R29']
-    R30 = params['R30']
-    R31 = params['R31']
-    R32 = params['R32']
-    R33 = params['R33']
-    R34 = params['R34']
-    R35 = params['R35']
-    R36 = params['R36']
-    R37 = params['R37']
-    R38 = params['R38']
-    R39 = params['R39']
-    R40 = params['R40']
-    R41 = params['R41']
-    R42 = params['R42']
-    R43 = params['R43']
-    R44 = params['R44']
-    return Rs + (R1/(1+w*1j*t_values[0])) + (R2 /(1+w*1j*t_values[1])) + (R3 /(1+w*1j*t_values[2])) + (R4 /(1+w*1j*t_values[3])) + (R5 /(1+w*1j*t_values[4])) + (R6 /(1+w*1j*t_values[5])) + (R7 /(1+w*1j*t_values[6])) + (R8 /(1+w*1j*t_values[7])) + (R9 /(1+w*1j*t_values[8])) + (R10 /(1+w*1j*t_values[9])) + (R11 /(1+w*1j*t_values[10])) + (R12 /(1+w*1j*t_values[11])) + (R13 /(1+w*1j*t_values[12])) + (R14 /(1+w*1j*t_values[13])) + (R15 /(1+w*1j*t_values[14])) + (R16 /(1+w*1j*t_values[15])) + (R17 /(1+w*1j*t_values[16])) + (R18 /(1+w*1j*t_values[17])) + (R19 /(1+w*1j*t_values[18])) + (R20 /(1+w*1j*t_values[19])) + (R21 /(1+w*1j*t_values[20])) + (R22 /(1+w*1j*t_values[21])) + (R23 /(1+w*1j*t_values[22])) + (R24 /(1+w*1j*t_values[23])) + (R25 /(1+w*1j*t_values[24])) + (R26 /(1+w*1j*t_values[25])) + (R27 /(1+w*1j*t_values[26])) + (R28 /(1+w*1j*t_values[27])) + (R29 /(1+w*1j*t_values[28])) + (R30 /(1+w*1j*t_values[29])) + (R31 /(1+w*1j*t_values[30])) + (R32 /(1+w*1j*t_values[31])) + (R33 /(1+w*1j*t_values[32])) + (R34 /(1+w*1j*t_values[33])) + (R35 /(1+w*1j*t_values[34]))  + (R36 /(1+w*1j*t_values[35])) + (R37 /(1+w*1j*t_values[36])) + (R38 /(1+w*1j*t_values[37])) + (R39 /(1+w*1j*t_values[38])) + (R40 /(1+w*1j*t_values[39])) + (R41 /(1+w*1j*t_values[40])) + (R42 /(1+w*1j*t_values[41])) + (R43 /(1+w*1j*t_values[42])) + (R44 /(1+w*1j*t_values[43]))
-
-def KK_RC45_fit(params, w, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    Rs = params['Rs']
-    R1 = params['R1']
-    R2 = params['R2']
-    R3 = params['R3']
-    R4 = params['R4']
-    R5 = params['R5']
-    R6 = params['R6']
-    R7 = params['R7']
-    R8 = params['R8']
-    R9 = params['R9']
-    R10 = params['R10']
-    R11 = params['R11']
-    R12 = params['R12']
-    R13 = params['R13']
-    R14 = params['R14']
-    R15 = params['R15']
-    R16 = params['R16']
-    R17 = params['R17']
-    R18 = params['R18']
-    R19 = params['R19']
-    R20 = params['R20']
-    R21 = params['R21']
-    R22 = params['R22']
-    R23 = params['R23']
-    R24 = params['R24']
-    R25 = params['R25']
-    R26 = params['R26']
-    R27 = params['R27']
-    R28 = params['R28']
-    R29 = params['R29']
-    R30 = params['R30']
-    R31 = params['R31']
-    R32 = params['R32']
-    R33 = params['R33']
-    R34 = params['R34']
-    R35 = params['R35']
-    R36 = params['R36']
-    R37 = params['R37']
-    R38 = params['R38']
-    R39 = params['R39']
-    R40 = params['R40']
-    R41 = params['R41']
-    R42 = params['R42']
-    R43 = params['R43']
-    R44 = params['R44']
-    R45 = params['R45']
-    return Rs + (R1/(1+w*1j*t_values[0])) + (R2 /(1+w*1j*t_values[1])) + (R3 /(1+w*1j*t_values[2])) + (R4 /(1+w*1j*t_values[3])) + (R5 /(1+w*1j*t_values[4])) + (R6 /(1+w*1j*t_values[5])) + (R7 /(1+w*1j*t_values[6])) + (R8 /(1+w*1j*t_values[7])) + (R9 /(1+w*1j*t_values[8])) + (R10 /(1+w*1j*t_values[9])) + (R11 /(1+w*1j*t_values[10])) + (R12 /(1+w*1j*t_values[11])) + (R13 /(1+w*1j*t_values[12])) + (R14 /(1+w*1j*t_values[13])) + (R15 /(1+w*1j*t_values[14])) + (R16 /(1+w*1j*t_values[15])) + (R17 /(1+w*1j*t_values[16])) + (R18 /(1+w*1j*t_values[17])) + (R19 /(1+w*1j*t_values[18])) + (R20 /(1+w*1j*t_values[19])) + (R21 /(1+w*1j*t_values[20])) + (R22 /(1+w*1j*t_values[21])) + (R23 /(1+w*1j*t_values[22])) + (R24 /(1+w*1j*t_values[23])) + (R25 /(1+w*1j*t_values[24])) + (R26 /(1+w*1j*t_values[25])) + (R27 /(1+w*1j*t_values[26])) + (R28 /(1+w*1j*t_values[27])) + (R29 /(1+w*1j*t_values[28])) + (R30 /(1+w*1j*t_values[29])) + (R31 /(1+w*1j*t_values[30])) + (R32 /(1+w*1j*t_values[31])) + (R33 /(1+w*1j*t_values[32])) + (R34 /(1+w*1j*t_values[33])) + (R35 /(1+w*1j*t_values[34]))  + (R36 /(1+w*1j*t_values[35])) + (R37 /(1+w*1j*t_values[36])) + (R38 /(1+w*1j*t_values[37])) + (R39 /(1+w*1j*t_values[38])) + (R40 /(1+w*1j*t_values[39])) + (R41 /(1+w*1j*t_values[40])) + (R42 /(1+w*1j*t_values[41])) + (R43 /(1+w*1j*t_values[42])) + (R44 /(1+w*1j*t_values[43])) + (R45 /(1+w*1j*t_values[44]))
-
-def KK_RC46_fit(params, w, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    Rs = params['Rs']
-    R1 = params['R1']
-    R2 = params['R2']
-    R3 = params['R3']
-    R4 = params['R4']
-    R5 = params['R5']
-    R6 = params['R6']
-    R7 = params['R7']
-    R8 = params['R8']
-    R9 = params['R9']
-    R10 = params['R10']
-    R11 = params['R11']
-    R12 = params['R12']
-    R13 = params['R13']
-    R14 = params['R14']
-    R15 = params['R15']
-    R16 = params['R16']
-    R17 = params['R17']
-    R18 = params['R18']
-    R19 = params['R19']
-    R20 = params['R20']
-    R21 = params['R21']
-    R22 = params['R22']
-    R23 = params['R23']
-    R24 = params['R24']
-    R25 = params['R25']
-    R26 = params['R26']
-    R27 = params['R27']
-    R28 = params['R28']
-    R29 = params['R29']
-    R30 = params['R30']
-    R31 = params['R31']
-    R32 = params['R32']
-    R33 = params['R33']
-    R34 = params['R34']
-    R35 = params['R35']
-    R36 = params['R36']
-    R37 = params['R37']
-    R38 = params['R38']
-    R39 = params['R39']
-    R40 = params['R40']
-    R41 = params['R41']
-    R42 = params['R42']
-    R43 = params['R43']
-    R44 = params['R44']
-    R45 = params['R45']
-    R46 = params['R46']
-    return Rs + (R1/(1+w*1j*t_values[0])) + (R2 /(1+w*1j*t_values[1])) + (R3 /(1+w*1j*t_values[2])) + (R4 /(1+w*1j*t_values[3])) + (R5 /(1+w*1j*t_values[4])) + (R6 /(1+w*1j*t_values[5])) + (R7 /(1+w*1j*t_values[6])) + (R8 /(1+w*1j*t_values[7])) + (R9 /(1+w*1j*t_values[8])) + (R10 /(1+w*1j*t_values[9])) + (R11 /(1+w*1j*t_values[10])) + (R12 /(1+w*1j*t_values[11])) + (R13 /(1+w*1j*t_values[12])) + (R14 /(1+w*1j*t_values[13])) + (R15 /(1+w*1j*t_values[14])) + (R16 /(1+w*1j*t_values[15])) + (R17 /(1+w*1j*t_values[16])) + (R18 /(1+w*1j*t_values[17])) + (R19 /(1+w*1j*t_values[18])) + (R20 /(1+w*1j*t_values[19])) + (R21 /(1+w*1j*t_values[20])) + (R22 /(1+w*1j*t_values[21])) + (R23 /(1+w*1j*t_values[22])) + (R24 /(1+w*1j*t_values[23])) + (R25 /(1+w*1j*t_values[24])) + (R26 /(1+w*1j*t_values[25])) + (R27 /(1+w*1j*t_values[26])) + (R28 /(1+w*1j*t_values[27])) + (R29 /(1+w*1j*t_values[28])) + (R30 /(1+w*1j*t_values[29])) + (R31 /(1+w*1j*t_values[30])) + (R32 /(1+w*1j*t_values[31])) + (R33 /(1+w*1j*t_values[32])) + (R34 /(1+w*1j*t_values[33])) + (R35 /(1+w*1j*t_values[34]))  + (R36 /(1+w*1j*t_values[35])) + (R37 /(1+w*1j*t_values[36])) + (R38 /(1+w*1j*t_values[37])) + (R39 /(1+w*1j*t_values[38])) + (R40 /(1+w*1j*t_values[39])) + (R41 /(1+w*1j*t_values[40])) + (R42 /(1+w*1j*t_values[41])) + (R43 /(1+w*1j*t_values[42])) + (R44 /(1+w*1j*t_values[43])) + (R45 /(1+w*1j*t_values[44])) + (R46 /(1+w*1j*t_values[45]))
-
-def KK_RC47_fit(params, w, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    Rs = params['Rs']
-    R1 = params['R1']
-    R2 = params['R2']
-    R3 = params['R3']
-    R4 = params['R4']
-    R5 = params['R5']
-    R6 = params['R6']
-    R7 = params['R7']
-    R8 = params['R8']
-    R9 = params['R9']
-    R10 = params['R10']
-    R11 = params['R11']
-    R12 = params['R12']
-    R13 = params['R13']
-    R14 = params['R14']
-    R15 = params['R15']
-    R16 = params['R16']
-    R17 = params['R17']
-    R18 = params['R18']
-    R19 = params['R19']
-    R20 = params['R20']
-    R21 = params['R21']
-    R22 = params['R22']
-    R23 = params['R23']
-    R24 = params['R24']
-    R25 = params['R25']
-    R26 = params['R26']
-    R27 = params['R27']
-    R28 = params['R28']
-    R29 = params['R29']
-    R30 = params['R30']
-    R31 = params['R31']
-    R32 = params['R32']
-    R33 = params['R33']
-    R34 = params['R34']
-    R35 = params['R35']
-    R36 = params['R36']
-    R37 = params['R37']
-    R38 = params['R38']
-    R39 = params['R39']
-    R40 = params['R40']
-    R41 = params['R41']
-    R42 = params['R42']
-    R43 = params['R43']
-    R44 = params['R44']
-    R45 = params['R45']
-    R46 = params['R46']
-    R47 = params['R47']
-    return Rs + (R1/(1+w*1j*t_values[0])) + (R2 /(1+w*1j*t_values[1])) + (R3 /(1+w*1j*t_values[2])) + (R4 /(1+w*1j*t_values[3])) + (R5 /(1+w*1j*t_values[4])) + (R6 /(1+w*1j*t_values[5])) + (R7 /(1+w*1j*t_values[6])) + (R8 /(1+w*1j*t_values[7])) + (R9 /(1+w*1j*t_values[8])) + (R10 /(1+w*1j*t_values[9])) + (R11 /(1+w*1j*t_values[10])) + (R12 /(1+w*1j*t_values[11])) + (R13 /(1+w*1j*t_values[12])) + (R14 /(1+w*1j*t_values[13])) + (R15 /(1+w*1j*t_values[14])) + (R16 /(1+w*1j*t_values[15])) + (R17 /(1+w*1j*t_values[16])) + (R18 /(1+w*1j*t_values[17])) + (R19 /(1+w*1j*t_values[18])) + (R20 /(1+w*1j*t_values[19])) + (R21 /(1+w*1j*t_values[20])) + (R22 /(1+w*1j*t_values[21])) + (R23 /(1+w*1j*t_values[22])) + (R24 /(1+w*1j*t_values[23])) + (R25 /(1+w*1j*t_values[24])) + (R26 /(1+w*1j*t_values[25])) + (R27 /(1+w*1j*t_values[26])) + (R28 /(1+w*1j*t_values[27])) + (R29 /(1+w*1j*t_values[28])) + (R30 /(1+w*1j*t_values[29])) + (R31 /(1+w*1j*t_values[30])) + (R32 /(1+w*1j*t_values[31])) + (R33 /(1+w*1j*t_values[32])) + (R34 /(1+w*1j*t_values[33])) + (R35 /(1+w*1j*t_values[34]))  + (R36 /(1+w*1j*t_values[35])) + (R37 /(1+w*1j*t_values[36])) + (R38 /(1+w*1j*t_values[37])) + (R39 /(1+w*1j*t_values[38])) + (R40 /(1+w*1j*t_values[39])) + (R41 /(1+w*1j*t_values[40])) + (R42 /(1+w*1j*t_values[41])) + (R43 /(1+w*1j*t_values[42])) + (R44 /(1+w*1j*t_values[43])) + (R45 /(1+w*1j*t_values[44])) + (R46 /(1+w*1j*t_values[45])) + (R47 /(1+w*1j*t_values[46]))
-
-def KK_RC48_fit(params, w, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    Rs = params['Rs']
-    R1 = params['R1']
-    R2 = params['R2']
-    R3 = params['R3']
-    R4 = params['R4']
-    R5 = params['R5']
-    R6 = params['R6']
-    R7 = params['R7']
-    R8 = params['R8']
-    R9 = params['R9']
-    R10 = params['R10']
-    R11 = params['R11']
-    R12 = params['R12']
-    R13 = params['R13']
-    R14 = params['R14']
-    R15 = params['R15']
-    R16 = params['R16']
-    R17 = params['R17']
-    R18 = params['R18']
-    R19 = params['R19']
-    R20 = params['R20']
-    R21 = params['R21']
-    R22 = params['R22']
-    R23 = params['R23']
-    R24 = params['R24']
-    R25 = params['R25']
-    R26 = params['R26']
-    R27 = params['R27']
-    R28 = params['R28']
-    R29 = params['R29']
-    R30 = params['R30']
-    R31 = params['R31']
-    R32 = params['R32']
-    R33 = params['R33']
-    R34 = params['R34']
-    R35 = params['R35']
-    R36 = params['R36']
-    R37 = params['R37']
-    R38 = params['R38']
-    R39 = params['R39']
-    R40 = params['R40']
-    R41 = params['R41']
-    R42 = params['R42']
-    R43 = params['R43']
-    R44 = params['R44']
-    R45 = params['R45']
-    R46 = params['R46']
-    R47 = params['R47']
-    R48 = params['R48']
-    return Rs + (R1/(1+w*1j*t_values[0])) + (R2 /(1+w*1j*t_values[1])) + (R3 /(1+w*1j*t_values[2])) + (R4 /(1+w*1j*t_values[3])) + (R5 /(1+w*1j*t_values[4])) + (R6 /(1+w*1j*t_values[5])) + (R7 /(1+w*1j*t_values[6])) + (R8 /(1+w*1j*t_values[7])) + (R9 /(1+w*1j*t_values[8])) + (R10 /(1+w*1j*t_values[9])) + (R11 /(1+w*1j*t_values[10])) + (R12 /(1+w*1j*t_values[11])) + (R13 /(1+w*1j*t_values[12])) + (R14 /(1+w*1j*t_values[13])) + (R15 /(1+w*1j*t_values[14])) + (R16 /(1+w*1j*t_values[15])) + (R17 /(1+w*1j*t_values[16])) + (R18 /(1+w*1j*t_values[17])) + (R19 /(1+w*1j*t_values[18])) + (R20 /(1+w*1j*t_values[19])) + (R21 /(1+w*1j*t_values[20])) + (R22 /(1+w*1j*t_values[21])) + (R23 /(1+w*1j*t_values[22])) + (R24 /(1+w*1j*t_values[23])) + (R25 /(1+w*1j*t_values[24])) + (R26 /(1+w*1j*t_values[25])) + (R27 /(1+w*1j*t_values[26])) + (R28 /(1+w*1j*t_values[27])) + (R29 /(1+w*1j*t_values[28])) + (R30 /(1+w*1j*t_values[29])) + (R31 /(1+w*1j*t_values[30])) + (R32 /(1+w*1j*t_values[31])) + (R33 /(1+w*1j*t_values[32])) + (R34 /(1+w*1j*t_values[33])) + (R35 /(1+w*1j*t_values[34]))  + (R36 /(1+w*1j*t_values[35])) + (R37 /(1+w*1j*t_values[36])) + (R38 /(1+w*1j*t_values[37])) + (R39 /(1+w*1j*t_values[38])) + (R40 /(1+w*1j*t_values[39])) + (R41 /(1+w*1j*t_values[40])) + (R42 /(1+w*1j*t_values[41])) + (R43 /(1+w*1j*t_values[42])) + (R44 /(1+w*1j*t_values[43])) + (R45 /(1+w*1j*t_values[44])) + (R46 /(1+w*1j*t_values[45])) + (R47 /(1+w*1j*t_values[46])) + (R48 /(1+w*1j*t_values[47]))
-
-def KK_RC49_fit(params, w, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    Rs = params['Rs']
-    R1 = params['R1']
-    R2 = params['R2']
-    R3 = params['R3']
-    R4 = params['R4']
-    R5 = params['R5']
-    R6 = params['R6']
-    R7 = params['R7']
-    R8 = params['R8']
-    R9 = params['R9']
-    R10 = params['R10']
-    R11 = params['R11']
-    R12 = params['R12']
-    R13 = params['R13']
-    R14 = params['R14']
-    R15 = params['R15']
-    R16 = params['R16']
-    R17 = params['R17']
-    R18 = params['R18']
-    R19 = params['R19']
-    R20 = params['R20']
-    R21 = params['R21']
-    R22 = params['R22']
-    R23 = params['R23']
-    R24 = params['R24']
-    R25 = params['R25']
-    R26 = params['R26']
-    R27 = params['R27']
-    R28 = params['R28']
-    R29 = params['R29']
-    R30 = params['R30']
-    R31 = params['R31']
-    R32 = params['R32']
-    R33 = params['R33']
-    R34 = params['R34']
-    R35 = params['R35']
-    R36 = params['R36']
-    R37 = params['R37']
-    R38 = params['R38']
-    R39 = params['R39']
-    R40 = params['R40']
-    R41 = params['R41']
-    R42 = params['R42']
-    R43 = params['R43']
-    R44 = params['R44']
-    R45 = params['R45']
-    R46 = params['R46']
-    R47 = params['R47']
-    R48 = params['R48']
-    R49 = params['R49']
-    return Rs + (R1/(1+w*1j*t_values[0])) + (R2 /(1+w*1j*t_values[1])) + (R3 /(1+w*1j*t_values[2])) + (R4 /(1+w*1j*t_values[3])) + (R5 /(1+w*1j*t_values[4])) + (R6 /(1+w*1j*t_values[5])) + (R7 /(1+w*1j*t_values[6])) + (R8 /(1+w*1j*t_values[7])) + (R9 /(1+w*1j*t_values[8])) + (R10 /(1+w*1j*t_values[9])) + (R11 /(1+w*1j*t_values[10])) + (R12 /(1+w*1j*t_values[11])) + (R13 /(1+w*1j*t_values[12])) + (R14 /(1+w*1j*t_values[13])) + (R15 /(1+w*1j*t_values[14])) + (R16 /(1+w*1j*t_values[15])) + (R17 /(1+w*1j*t_values[16])) + (R18 /(1+w*1j*t_values[17])) + (R19 /(1+w*1j*t_values[18])) + (R20 /(1+w*1j*t_values[19])) + (R21 /(1+w*1j*t_values[20])) + (R22 /(1+w*1j*t_values[21])) + (R23 /(1+w*1j*t_values[22])) + (R24 /(1+w*1j*t_values[23])) + (R25 /(1+w*1j*t_values[24])) + (R26 /(1+w*1j*t_values[25])) + (R27 /(1+w*1j*t_values[26])) + (R28 /(1+w*1j*t_values[27])) + (R29 /(1+w*1j*t_values[28])) + (R30 /(1+w*1j*t_values[29])) + (R31 /(1+w*1j*t_values[30])) + (R32 /(1+w*1j*t_values[31])) + (R33 /(1+w*1j*t_values[32])) + (R34 /(1+w*1j*t_values[33])) + (R35 /(1+w*1j*t_values[34]))  + (R36 /(1+w*1j*t_values[35])) + (R37 /(1+w*1j*t_values[36])) + (R38 /(1+w*1j*t_values[37])) + (R39 /(1+w*1j*t_values[38])) + (R40 /(1+w*1j*t_values[39])) + (R41 /(1+w*1j*t_values[40])) + (R42 /(1+w*1j*t_values[41])) + (R43 /(1+w*1j*t_values[42])) + (R44 /(1+w*1j*t_values[43])) + (R45 /(1+w*1j*t_values[44])) + (R46 /(1+w*1j*t_values[45])) + (R47 /(1+w*1j*t_values[46])) + (R48 /(1+w*1j*t_values[47])) + (R49 /(1+w*1j*t_values[48]))
-
-def KK_RC50_fit(params, w, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    Rs = params['Rs']
-    R1 = params['R1']
-    R2 = params['R2']
-    R3 = params['R3']
-    R4 = params['R4']
-    R5 = params['R5']
-    R6 = params['R6']
-    R7 = params['R7']
-    R8 = params['R8']
-    R9 = params['R9']
-    R10 = params['R10']
-    R11 = params['R11']
-    R12 = params['R12']
-    R13 = params['R13']
-    R14 = params['R14']
-    R15 = params['R15']
-    R16 = params['R16']
-    R17 = params['R17']
-    R18 = params['R18']
-    R19 = params['R19']
-    R20 = params['R20']
-    R21 = params['R21']
-    R22 = params['R22']
-    R23 = params['R23']
-    R24 = params['R24']
-    R25 = params['R25']
-    R26 = params['R26']
-    R27 = params['R27']
-    R28 = params['R28']
-    R29 = params['R29']
-    R30 = params['R30']
-    R31 = params['R31']
-    R32 = params['R32']
-    R33 = params['R33']
-    R34 = params['R34']
-    R35 = params['R35']
-    R36 = params['R36']
-    R37 = params['R37']
-    R38 = params['R38']
-    R39 = params['R39']
-    R40 = params['R40']
-    R41 = params['R41']
-    R42 = params['R42']
-    R43 = params['R43']
-    R44 = params['R44']
-    R45 = params['R45']
-    R46 = params['R46']
-    R47 = params['R47']
-    R48 = params['R48']
-    R49 = params['R49']
-    R50 = params['R50']
-    return Rs + (R1/(1+w*1j*t_values[0])) + (R2 /(1+w*1j*t_values[1])) + (R3 /(1+w*1j*t_values[2])) + (R4 /(1+w*1j*t_values[3])) + (R5 /(1+w*1j*t_values[4])) + (R6 /(1+w*1j*t_values[5])) + (R7 /(1+w*1j*t_values[6])) + (R8 /(1+w*1j*t_values[7])) + (R9 /(1+w*1j*t_values[8])) + (R10 /(1+w*1j*t_values[9])) + (R11 /(1+w*1j*t_values[10])) + (R12 /(1+w*1j*t_values[11])) + (R13 /(1+w*1j*t_values[12])) + (R14 /(1+w*1j*t_values[13])) + (R15 /(1+w*1j*t_values[14])) + (R16 /(1+w*1j*t_values[15])) + (R17 /(1+w*1j*t_values[16])) + (R18 /(1+w*1j*t_values[17])) + (R19 /(1+w*1j*t_values[18])) + (R20 /(1+w*1j*t_values[19])) + (R21 /(1+w*1j*t_values[20])) + (R22 /(1+w*1j*t_values[21])) + (R23 /(1+w*1j*t_values[22])) + (R24 /(1+w*1j*t_values[23])) + (R25 /(1+w*1j*t_values[24])) + (R26 /(1+w*1j*t_values[25])) + (R27 /(1+w*1j*t_values[26])) + (R28 /(1+w*1j*t_values[27])) + (R29 /(1+w*1j*t_values[28])) + (R30 /(1+w*1j*t_values[29])) + (R31 /(1+w*1j*t_values[30])) + (R32 /(1+w*1j*t_values[31])) + (R33 /(1+w*1j*t_values[32])) + (R34 /(1+w*1j*t_values[33])) + (R35 /(1+w*1j*t_values[34]))  + (R36 /(1+w*1j*t_values[35])) + (R37 /(1+w*1j*t_values[36])) + (R38 /(1+w*1j*t_values[37])) + (R39 /(1+w*1j*t_values[38])) + (R40 /(1+w*1j*t_values[39])) + (R41 /(1+w*1j*t_values[40])) + (R42 /(1+w*1j*t_values[41])) + (R43 /(1+w*1j*t_values[42])) + (R44 /(1+w*1j*t_values[43])) + (R45 /(1+w*1j*t_values[44])) + (R46 /(1+w*1j*t_values[45])) + (R47 /(1+w*1j*t_values[46])) + (R48 /(1+w*1j*t_values[47])) + (R49 /(1+w*1j*t_values[48])) + (R50 /(1+w*1j*t_values[49]))
-
-def KK_RC51_fit(params, w, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    Rs = params['Rs']
-    R1 = params['R1']
-    R2 = params['R2']
-    R3 = params['R3']
-    R4 = params['R4']
-    R5 = params['R5']
-    R6 = params['R6']
-    R7 = params['R7']
-    R8 = params['R8']
-    R9 = params['R9']
-    R10 = params['R10']
-    R11 = params['R11']
-    R12 = params['R12']
-    R13 = params['R13']
-    R14 = params['R14']
-    R15 = params['R15']
-    R16 = params['R16']
-    R17 = params['R17']
-    R18 = params['R18']
-    R19 = params['R19']
-    R20 = params['R20']
-    R21 = params['R21']
-    R22 = params['R22']
-    R23 = params['R23']
-    R24 = params['R24']
-    R25 = params['R25']
-    R26 = params['R26']
-    R27 = params['R27']
-    R28 = params['R28']
-    R29 = params['R29']
-    R30 = params['R30']
-    R31 = params['R31']
-    R32 = params['R32']
-    R33 = params['R33']
-    R34 = params['R34']
-    R35 = params['R35']
-    R36 = params['R36']
-    R37 = params['R37']
-    R38 = params['R38']
-    R39 = params['R39']
-    R40 = params['R40']
-    R41 = params['R41']
-    R42 = params['R42']
-    R43 = params['R43']
-    R44 = params['R44']
-    R45 = params['R45']
-    R46 = params['R46']
-    R47 = params['R47']
-    R48 = params['R48']
-    R49 = params['R49']
-    R50 = params['R50']
-    R51 = params['R51']
-    return Rs + (R1/(1+w*1j*t_values[0])) + (R2 /(1+w*1j*t_values[1])) + (R3 /(1+w*1j*t_values[2])) + (R4 /(1+w*1j*t_values[3])) + (R5 /(1+w*1j*t_values[4])) + (R6 /(1+w*1j*t_values[5])) + (R7 /(1+w*1j*t_values[6])) + (R8 /(1+w*1j*t_values[7])) + (R9 /(1+w*1j*t_values[8])) + (R10 /(1+w*1j*t_values[9])) + (R11 /(1+w*1j*t_values[10])) + (R12 /(1+w*1j*t_values[11])) + (R13 /(1+w*1j*t_values[12])) + (R14 /(1+w*1j*t_values[13])) + (R15 /(1+w*1j*t_values[14])) + (R16 /(1+w*1j*t_values[15])) + (R17 /(1+w*1j*t_values[16])) + (R18 /(1+w*1j*t_values[17])) + (R19 /(1+w*1j*t_values[18])) + (R20 /(1+w*1j*t_values[19])) + (R21 /(1+w*1j*t_values[20])) + (R22 /(1+w*1j*t_values[21])) + (R23 /(1+w*1j*t_values[22])) + (R24 /(1+w*1j*t_values[23])) + (R25 /(1+w*1j*t_values[24])) + (R26 /(1+w*1j*t_values[25])) + (R27 /(1+w*1j*t_values[26])) + (R28 /(1+w*1j*t_values[27])) + (R29 /(1+w*1j*t_values[28])) + (R30 /(1+w*1j*t_values[29])) + (R31 /(1+w*1j*t_values[30])) + (R32 /(1+w*1j*t_values[31])) + (R33 /(1+w*1j*t_values[32])) + (R34 /(1+w*1j*t_values[33])) + (R35 /(1+w*1j*t_values[34]))  + (R36 /(1+w*1j*t_values[35])) + (R37 /(1+w*1j*t_values[36])) + (R38 /(1+w*1j*t_values[37])) + (R39 /(1+w*1j*t_values[38])) + (R40 /(1+w*1j*t_values[39])) + (R41 /(1+w*1j*t_values[40])) + (R42 /(1+w*1j*t_values[41])) + (R43 /(1+w*1j*t_values[42])) + (R44 /(1+w*1j*t_values[43])) + (R45 /(1+w*1j*t_values[44])) + (R46 /(1+w*1j*t_values[45])) + (R47 /(1+w*1j*t_values[46])) + (R48 /(1+w*1j*t_values[47])) + (R49 /(1+w*1j*t_values[48])) + (R50 /(1+w*1j*t_values[49])) + (R51 /(1+w*1j*t_values[50]))
-
-def KK_RC52_fit(params, w, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    Rs = params['Rs']
-    R1 = params['R1']
-    R2 = params['R2']
-    R3 = params['R3']
-    R4 = params['R4']
-    R5 = params['R5']
-    R6 = params['R6']
-    R7 = params['R7']
-    R8 = params['R8']
-    R9 = params['R9']
-    R10 = params['R10']
-    R11 = params['R11']
-    R12 = params['R12']
-    R13 = params['R13']
-    R14 = params['R14']
-    R15 = params['R15']
-    R16 = params['R16']
-    R17 = params['R17']
-    R18 = params['R18']
-    R19 = params['R19']
-    R20 = params['R20']
-    R21 = params['R21']
-    R22 = params['R22']
-    R23 = params['R23']
-    R24 = params['R24']
-    R25 = params['R25']
-    R26 = params['R26']
-    R27 = params['R27']
-    R28 = params['R28']
-    R29 = params['R29']
-    R30 = params['R30']
-    R31 = params['R31']
-    R32 = params['R32']
-    R33 = params['R33']
-    R34 = params['R34']
-    R35 = params['R35']
-    R36 = params['R36']
-    R37 = params['R37']
-    R38 = params['R38']
-    R39 = params['R39']
-    R40 = params['R40']
-    R41 = params['R41']
-    R42 = params['R42']
-    R43 = params['R43']
-    R44 = params['R44']
-    R45 = params['R45']
-    R46 = params['R46']
-    R47 = params['R47']
-    R48 = params['R48']
-    R49 = params['R49']
-    R50 = params['R50']
-    R51 = params['R51']
-    R52 = params['R52']
-    return Rs + (R1/(1+w*1j*t_values[0])) + (R2 /(1+w*1j*t_values[1])) + (R3 /(1+w*1j*t_values[2])) + (R4 /(1+w*1j*t_values[3])) + (R5 /(1+w*1j*t_values[4])) + (R6 /(1+w*1j*t_values[5])) + (R7 /(1+w*1j*t_values[6])) + (R8 /(1+w*1j*t_values[7])) + (R9 /(1+w*1j*t_values[8])) + (R10 /(1+w*1j*t_values[9])) + (R11 /(1+w*1j*t_values[10])) + (R12 /(1+w*1j*t_values[11])) + (R13 /(1+w*1j*t_values[12])) + (R14 /(1+w*1j*t_values[13])) + (R15 /(1+w*1j*t_values[14])) + (R16 /(1+w*1j*t_values[15])) + (R17 /(1+w*1j*t_values[16])) + (R18 /(1+w*1j*t_values[17])) + (R19 /(1+w*1j*t_values[18])) + (R20 /(1+w*1j*t_values[19])) + (R21 /(1+w*1j*t_values[20])) + (R22 /(1+w*1j*t_values[21])) + (R23 /(1+w*1j*t_values[22])) + (R24 /(1+w*1j*t_values[23])) + (R25 /(1+w*1j*t_values[24])) + (R26 /(1+w*1j*t_values[25])) + (R27 /(1+w*1j*t_values[26])) + (R28 /(1+w*1j*t_values[27])) + (R29 /(1+w*1j*t_values[28])) + (R30 /(1+w*1j*t_values[29])) + (R31 /(1+w*1j*t_values[30])) + (R32 /(1+w*1j*t_values[31])) + (R33 /(1+w*1j*t_values[32])) + (R34 /(1+w*1j*t_values[33])) + (R35 /(1+w*1j*t_values[34]))  + (R36 /(1+w*1j*t_values[35])) + (R37 /(1+w*1j*t_values[36])) + (R38 /(1+w*1j*t_values[37])) + (R39 /(1+w*1j*t_values[38])) + (R40 /(1+w*1j*t_values[39])) + (R41 /(1+w*1j*t_values[40])) + (R42 /(1+w*1j*t_values[41])) + (R43 /(1+w*1j*t_values[42])) + (R44 /(1+w*1j*t_values[43])) + (R45 /(1+w*1j*t_values[44])) + (R46 /(1+w*1j*t_values[45])) + (R47 /(1+w*1j*t_values[46])) + (R48 /(1+w*1j*t_values[47])) + (R49 /(1+w*1j*t_values[48])) + (R50 /(1+w*1j*t_values[49])) + (R51 /(1+w*1j*t_values[50])) + (R52 /(1+w*1j*t_values[51]))
-
-def KK_RC53_fit(params, w, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    Rs = params['Rs']
-    R1 = params['R1']
-    R2 = params['R2']
-    R3 = params['R3']
-    R4 = params['R4']
-    R5 = params['R5']
-    R6 = params['R6']
-    R7 = params['R7']
-    R8 = params['R8']
-    R9 = params['R9']
-    R10 = params['R10']
-    R11 = params['R11']
-    R12 = params['R12']
-    R13 = params['R13']
-    R14 = params['R14']
-    R15 = params['R15']
-    R16 = params['R16']
-    R17 = params['R17']
-    R18 = params['R18']
-    R19 = params['R19']
-    R20 = params['R20']
-    R21 = params['R21']
-    R22 = params['R22']
-    R23 = params['R23']
-    R24 = params['R24']
-    R25 = params['R25']
-    R26 = params['R26']
-    R27 = params['R27']
-    R28 = params['R28']
-    R29 = params['R29']
-    R30 = params['R30']
-    R31 = params['R31']
-    R32 = params['R32']
-    R33 = params['R33']
-    R34 = params['R34']
-    R35 = params['R35']
-    R36 = params['R36']
-    R37 = params['R37']
-    R38 = params['R38']
-    R39 = params['R39']
-    R40 = params['R40']
-    R41 = params['R41']
-    R42 = params['R42']
-    R43 = params['R43']
-    R44 = params['R44']
-    R45 = params['R45']
-    R46 = params['R46']
-    R47 = params['R47']
-    R48 = params['R48']
-    R49 = params['R49']
-    R50 = params['R50']
-    R51 = params['R51']
-    R52 = params['R52']
-    R53 = params['R53']
-    return Rs + (R1/(1+w*1j*t_values[0])) + (R2 /(1+w*1j*t_values[1])) + (R3 /(1+w*1j*t_values[2])) + (R4 /(1+w*1j*t_values[3])) + (R5 /(1+w*1j*t_values[4])) + (R6 /(1+w*1j*t_values[5])) + (R7 /(1+w*1j*t_values[6])) + (R8 /(1+w*1j*t_values[7])) + (R9 /(1+w*1j*t_values[8])) + (R10 /(1+w*1j*t_values[9])) + (R11 /(1+w*1j*t_values[10])) + (R12 /(1+w*1j*t_values[11])) + (R13 /(1+w*1j*t_values[12])) + (R14 /(1+w*1j*t_values[13])) + (R15 /(1+w*1j*t_values[14])) + (R16 /(1+w*1j*t_values[15])) + (R17 /(1+w*1j*t_values[16])) + (R18 /(1+w*1j*t_values[17])) + (R19 /(1+w*1j*t_values[18])) + (R20 /(1+w*1j*t_values[19])) + (R21 /(1+w*1j*t_values[20])) + (R22 /(1+w*1j*t_values[21])) + (R23 /(1+w*1j*t_values[22])) + (R24 /(1+w*1j*t_values[23])) + (R25 /(1+w*1j*t_values[24])) + (R26 /(1+w*1j*t_values[25])) + (R27 /(1+w*1j*t_values[26])) + (R28 /(1+w*1j*t_values[27])) + (R29 /(1+w*1j*t_values[28])) + (R30 /(1+w*1j*t_values[29])) + (R31 /(1+w*1j*t_values[30])) + (R32 /(1+w*1j*t_values[31])) + (R33 /(1+w*1j*t_values[32])) + (R34 /(1+w*1j*t_values[33])) + (R35 /(1+w*1j*t_values[34]))  + (R36 /(1+w*1j*t_values[35])) + (R37 /(1+w*1j*t_values[36])) + (R38 /(1+w*1j*t_values[37])) + (R39 /(1+w*1j*t_values[38])) + (R40 /(1+w*1j*t_values[39])) + (R41 /(1+w*1j*t_values[40])) + (R42 /(1+w*1j*t_values[41])) + (R43 /(1+w*1j*t_values[42])) + (R44 /(1+w*1j*t_values[43])) + (R45 /(1+w*1j*t_values[44])) + (R46 /(1+w*1j*t_values[45])) + (R47 /(1+w*1j*t_values[46])) + (R48 /(1+w*1j*t_values[47])) + (R49 /(1+w*1j*t_values[48])) + (R50 /(1+w*1j*t_values[49])) + (R51 /(1+w*1j*t_values[50])) + (R52 /(1+w*1j*t_values[51])) + (R53 /(1+w*1j*t_values[52]))
-
-def KK_RC54_fit(params, w, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    Rs = params['Rs']
-    R1 = params['R1']
-    R2 = params['R2']
-    R3 = params['R3']
-    R4 = params['R4']
-    R5 = params['R5']
-    R6 = params['R6']
-    R7 = params['R7']
-    R8 = params['R8']
-    R9 = params['R9']
-    R10 = params['R10']
-    R11 = params['R11']
-    R12 = params['R12']
-    R13 = params['R13']
-    R14 = params['R14']
-    R15 = params['R15']
-    R16 = params['R16']
-    R17 = params['R17']
-    R18 = params['R18']
-    R19 = params['R19']
-    R20 = params['R20']
-    R21 = params['R21']
-    R22 = params['R22']
-    R23 = params['R23']
-    R24 = params['R24']
-    R25 = params['R25']
-    R26 = params['R26']
-    R27 = params['R27']
-    R28 = params['R28']
-    R29 = params['R29']
-    R30 = params['R30']
-    R31 = params['R31']
-    R32 = params['R32']
-    R33 = params['R33']
-    R34 = params['R34']
-    R35 = params['R35']
-    R36 = params['R36']
-    R37 = params['R37']
-    R38 = params['R38']
-    R39 = params['R39']
-    R40 = params['R40']
-    R41 = params['R41']
-    R42 = params['R42']
-    R43 = params['R43']
-    R44 = params['R44']
-    R45 = params['R45']
-    R46 = params['R46']
-    R47 = params['R47']
-    R48 = params['R48']
-    R49 = params['R49']
-    R50 = params['R50']
-    R51 = params['R51']
-    R52 = params['R52']
-    R53 = params['R53']
-    R54 = params['R54']
-    return Rs + (R1/(1+w*1j*t_values[0])) + (R2 /(1+w*1j*t_values[1])) + (R3 /(1+w*1j*t_values[2])) + (R4 /(1+w*1j*t_values[3])) + (R5 /(1+w*1j*t_values[4])) + (R6 /(1+w*1j*t_values[5])) + (R7 /(1+w*1j*t_values[6])) + (R8 /(1+w*1j*t_values[7])) + (R9 /(1+w*1j*t_values[8])) + (R10 /(1+w*1j*t_values[9])) + (R11 /(1+w*1j*t_values[10])) + (R12 /(1+w*1j*t_values[11])) + (R13 /(1+w*1j*t_values[12])) + (R14 /(1+w*1j*t_values[13])) + (R15 /(1+w*1j*t_values[14])) + (R16 /(1+w*1j*t_values[15])) + (R17 /(1+w*1j*t_values[16])) + (R18 /(1+w*1j*t_values[17])) + (R19 /(1+w*1j*t_values[18])) + (R20 /(1+w*1j*t_values[19])) + (R21 /(1+w*1j*t_values[20])) + (R22 /(1+w*1j*t_values[21])) + (R23 /(1+w*1j*t_values[22])) + (R24 /(1+w*1j*t_values[23])) + (R25 /(1+w*1j*t_values[24])) + (R26 /(1+w*1j*t_values[25])) + (R27 /(1+w*1j*t_values[26])) + (R28 /(1+w*1j*t_values[27])) + (R29 /(1+w*1j*t_values[28])) + (R30 /(1+w*1j*t_values[29])) + (R31 /(1+w*1j*t_values[30])) + (R32 /(1+w*1j*t_values[31])) + (R33 /(1+w*1j*t_values[32])) + (R34 /(1+w*1j*t_values[33])) + (R35 /(1+w*1j*t_values[34]))  + (R36 /(1+w*1j*t_values[35])) + (R37 /(1+w*1j*t_values[36])) + (R38 /(1+w*1j*t_values[37])) + (R39 /(1+w*1j*t_values[38])) + (R40 /(1+w*1j*t_values[39])) + (R41 /(1+w*1j*t_values[40])) + (R42 /(1+w*1j*t_values[41])) + (R43 /(1+w*1j*t_values[42])) + (R44 /(1+w*1j*t_values[43])) + (R45 /(1+w*1j*t_values[44])) + (R46 /(1+w*1j*t_values[45])) + (R47 /(1+w*1j*t_values[46])) + (R48 /(1+w*1j*t_values[47])) + (R49 /(1+w*1j*t_values[48])) + (R50 /(1+w*1j*t_values[49])) + (R51 /(1+w*1j*t_values[50])) + (R52 /(1+w*1j*t_values[51])) + (R53 /(1+w*1j*t_values[52])) + (R54 /(1+w*1j*t_values[53]))
-
-def KK_RC55_fit(params, w, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    Rs = params['Rs']
-    R1 = params['R1']
-    R2 = params['R2']
-    R3 = params['R3']
-    R4 = params['R4']
-    R5 = params['R5']
-    R6 = params['R6']
-    R7 = params['R7']
-    R8 = params['R8']
-    R9 = params['R9']
-    R10 = params['R10']
-    R11 = params['R11']
-    R12 = params['R12']
-    R13 = params['R13']
-    R14 = params['R14']
-    R15 = params['R15']
-    R16 = params['R16']
-    R17 = params['R17']
-    R18 = params['R18']
-    R19 = params['R19']
-    R20 = params['R20']
-    R21 = params['R21']
-    R22 = params['R22']
-    R23 = params['R23']
-    R24 = params['R24']
-    R25 = params['R25']
-    R26 = params['R26']
-    R27 = params['R27']
-    R28 = params['R28']
-    R29 = params['R29']
-    R30 = params['R30']
-    R31 = params['R31']
-    R32 = params['R32']
-    R33 = params['R33']
-    R34 = params['R34']
-    R35 = params['R35']
-    R36 = params['R36']
-    R37 = params['R37']
-    R38 = params['R38']
-    R39 = params['R39']
-    R40 = params['R40']
-    R41 = params['R41']
-    R42 = params['R42']
-    R43 = params['R43']
-    R44 = params['R44']
-    R45 = params['R45']
-    R46 = params['R46']
-    R47 = params['R47']
-    R48 = params['R48']
-    R49 = params['R49']
-    R50 = params['R50']
-    R51 = params['R51']
-    R52 = params['R52']
-    R53 = params['R53']
-    R54 = params['R54']
-    R55 = params['R55']
-    return Rs + (R1/(1+w*1j*t_values[0])) + (R2 /(1+w*1j*t_values[1])) + (R3 /(1+w*1j*t_values[2])) + (R4 /(1+w*1j*t_values[3])) + (R5 /(1+w*1j*t_values[4])) + (R6 /(1+w*1j*t_values[5])) + (R7 /(1+w*1j*t_values[6])) + (R8 /(1+w*1j*t_values[7])) + (R9 /(1+w*1j*t_values[8])) + (R10 /(1+w*1j*t_values[9])) + (R11 /(1+w*1j*t_values[10])) + (R12 /(1+w*1j*t_values[11])) + (R13 /(1+w*1j*t_values[12])) + (R14 /(1+w*1j*t_values[13])) + (R15 /(1+w*1j*t_values[14])) + (R16 /(1+w*1j*t_values[15])) + (R17 /(1+w*1j*t_values[16])) + (R18 /(1+w*1j*t_values[17])) + (R19 /(1+w*1j*t_values[18])) + (R20 /(1+w*1j*t_values[19])) + (R21 /(1+w*1j*t_values[20])) + (R22 /(1+w*1j*t_values[21])) + (R23 /(1+w*1j*t_values[22])) + (R24 /(1+w*1j*t_values[23])) + (R25 /(1+w*1j*t_values[24])) + (R26 /(1+w*1j*t_values[25])) + (R27 /(1+w*1j*t_values[26])) + (R28 /(1+w*1j*t_values[27])) + (R29 /(1+w*1j*t_values[28])) + (R30 /(1+w*1j*t_values[29])) + (R31 /(1+w*1j*t_values[30])) + (R32 /(1+w*1j*t_values[31])) + (R33 /(1+w*1j*t_values[32])) + (R34 /(1+w*1j*t_values[33])) + (R35 /(1+w*1j*t_values[34]))  + (R36 /(1+w*1j*t_values[35])) + (R37 /(1+w*1j*t_values[36])) + (R38 /(1+w*1j*t_values[37])) + (R39 /(1+w*1j*t_values[38])) + (R40 /(1+w*1j*t_values[39])) + (R41 /(1+w*1j*t_values[40])) + (R42 /(1+w*1j*t_values[41])) + (R43 /(1+w*1j*t_values[42])) + (R44 /(1+w*1j*t_values[43])) + (R45 /(1+w*1j*t_values[44])) + (R46 /(1+w*1j*t_values[45])) + (R47 /(1+w*1j*t_values[46])) + (R48 /(1+w*1j*t_values[47])) + (R49 /(1+w*1j*t_values[48])) + (R50 /(1+w*1j*t_values[49])) + (R51 /(1+w*1j*t_values[50])) + (R52 /(1+w*1j*t_values[51])) + (R53 /(1+w*1j*t_values[52])) + (R54 /(1+w*1j*t_values[53])) + (R55 /(1+w*1j*t_values[54]))
-
-def KK_RC56_fit(params, w, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    Rs = params['Rs']
-    R1 = params['R1']
-    R2 = params['R2']
-    R3 = params['R3']
-    R4 = params['R4']
-    R5 = params['R5']
-    R6 = params['R6']
-    R7 = params['R7']
-    R8 = params['R8']
-    R9 = params['R9']
-    R10 = params['R10']
-    R11 = params['R11']
-    R12 = params['R12']
-    R13 = params['R13']
-    R14 = params['R14']
-    R15 = params['R15']
-    R16 = params['R16']
-    R17 = params['R17']
-    R18 = params['R18']
-    R19 = params['R19']
-    R20 = params['R20']
-    R21 = params['R21']
-    R22 = params['R22']
-    R23 = params['R23']
-    R24 = params['R24']
-    R25 = params['R25']
-    R26 = params['R26']
-    R27 = params['R27']
-    R28 = params['R28']
-    R29 = params['R29']
-    R30 = params['R30']
-    R31 = params['R31']
-    R32 = params['R32']
-    R33 = params['R33']
-    R34 = params['R34']
-    R35 = params['R35']
-    R36 = params['R36']
-    R37 = params['R37']
-    R38 = params['R38']
-    R39 = params['R39']
-    R40 = params['R40']
-    R41 = params['R41']
-    R42 = params['R42']
-    R43 = params['R43']
-    R44 = params['R44']
-    R45 = params['R45']
-    R46 = params['R46']
-    R47 = params['R47']
-    R48 = params['R48']
-    R49 = params['R49']
-    R50 = params['R50']
-    R51 = params['R51']
-    R52 = params['R52']
-    R53 = params['R53']
-    R54 = params['R54']
-    R55 = params['R55']
-    R56 = params['R56']
-    return Rs + (R1/(1+w*1j*t_values[0])) + (R2 /(1+w*1j*t_values[1])) + (R3 /(1+w*1j*t_values[2])) + (R4 /(1+w*1j*t_values[3])) + (R5 /(1+w*1j*t_values[4])) + (R6 /(1+w*1j*t_values[5])) + (R7 /(1+w*1j*t_values[6])) + (R8 /(1+w*1j*t_values[7])) + (R9 /(1+w*1j*t_values[8])) + (R10 /(1+w*1j*t_values[9])) + (R11 /(1+w*1j*t_values[10])) + (R12 /(1+w*1j*t_values[11])) + (R13 /(1+w*1j*t_values[12])) + (R14 /(1+w*1j*t_values[13])) + (R15 /(1+w*1j*t_values[14])) + (R16 /(1+w*1j*t_values[15])) + (R17 /(1+w*1j*t_values[16])) + (R18 /(1+w*1j*t_values[17])) + (R19 /(1+w*1j*t_values[18])) + (R20 /(1+w*1j*t_values[19])) + (R21 /(1+w*1j*t_values[20])) + (R22 /(1+w*1j*t_values[21])) + (R23 /(1+w*1j*t_values[22])) + (R24 /(1+w*1j*t_values[23])) + (R25 /(1+w*1j*t_values[24])) + (R26 /(1+w*1j*t_values[25])) + (R27 /(1+w*1j*t_values[26])) + (R28 /(1+w*1j*t_values[27])) + (R29 /(1+w*1j*t_values[28])) + (R30 /(1+w*1j*t_values[29])) + (R31 /(1+w*1j*t_values[30])) + (R32 /(1+w*1j*t_values[31])) + (R33 /(1+w*1j*t_values[32])) + (R34 /(1+w*1j*t_values[33])) + (R35 /(1+w*1j*t_values[34]))  + (R36 /(1+w*1j*t_values[35])) + (R37 /(1+w*1j*t_values[36])) + (R38 /(1+w*1j*t_values[37])) + (R39 /(1+w*1j*t_values[38])) + (R40 /(1+w*1j*t_values[39])) + (R41 /(1+w*1j*t_values[40])) + (R42 /(1+w*1j*t_values[41])) + (R43 /(1+w*1j*t_values[42])) + (R44 /(1+w*1j*t_values[43])) + (R45 /(1+w*1j*t_values[44])) + (R46 /(1+w*1j*t_values[45])) + (R47 /(1+w*1j*t_values[46])) + (R48 /(1+w*1j*t_values[47])) + (R49 /(1+w*1j*t_values[48])) + (R50 /(1+w*1j*t_values[49])) + (R51 /(1+w*1j*t_values[50])) + (R52 /(1+w*1j*t_values[51])) + (R53 /(1+w*1j*t_values[52])) + (R54 /(1+w*1j*t_values[53])) + (R55 /(1+w*1j*t_values[54])) + (R56 /(1+w*1j*t_values[55]))
-
-def KK_RC57_fit(params, w, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    Rs = params['Rs']
-    R1 = params['R1']
-    R2 = params['R2']
-    R3 = params['R3']
-    R4 = params['R4']
-    R5 = params['R5']
-    R6 = params['R6']
-    R7 = params['R7']
-    R8 = params['R8']
-    R9 = params['R9']
-    R10 = params['R10']
-    R11 = params['R11']
-    R12 = params['R12']
-    R13 = params['R13']
-    R14 = params['R14']
-    R15 = params['R15']
-    R16 = params['R16']
-    R17 = params['R17']
-    R18 = params['R18']
-    R19 = params['R19']
-    R20 = params['R20']
-    R21 = params['R21']
-    R22 = params['R22']
-    R23 = params['R23']
-    R24 = params['R24']
-    R25 = params['R25']
-    R26 = params['R26']
-    R27 = params['R27']
-    R28 = params['R28']
-    R29 = params['R29']
-    R30 = params['R30']
-    R31 = params['R31']
-    R32 = params['R32']
-    R33 = params['R33']
-    R34 = params['R34']
-    R35 = params['R35']
-    R36 = params['R36']
-    R37 = params['R37']
-    R38 = params['R38']
-    R39 = params['R39']
-    R40 = params['R40']
-    R41 = params['R41']
-    R42 = params['R42']
-    R43 = params['R43']
-    R44 = params['R44']
-    R45 = params['R45']
-    R46 = params['R46']
-    R47 = params['R47']
-    R48 = params['R48']
-    R49 = params['R49']
-    R50 = params['R50']
-    R51 = params['R51']
-    R52 = params['R52']
-    R53 = params['R53']
-    R54 = params['R54']
-    R55 = params['R55']
-    R56 = params['R56']
-    R57 = params['R57']
-    return Rs + (R1/(1+w*1j*t_values[0])) + (R2 /(1+w*1j*t_values[1])) + (R3 /(1+w*1j*t_values[2])) + (R4 /(1+w*1j*t_values[3])) + (R5 /(1+w*1j*t_values[4])) + (R6 /(1+w*1j*t_values[5])) + (R7 /(1+w*1j*t_values[6])) + (R8 /(1+w*1j*t_values[7])) + (R9 /(1+w*1j*t_values[8])) + (R10 /(1+w*1j*t_values[9])) + (R11 /(1+w*1j*t_values[10])) + (R12 /(1+w*1j*t_values[11])) + (R13 /(1+w*1j*t_values[12])) + (R14 /(1+w*1j*t_values[13])) + (R15 /(1+w*1j*t_values[14])) + (R16 /(1+w*1j*t_values[15])) + (R17 /(1+w*1j*t_values[16])) + (R18 /(1+w*1j*t_values[17])) + (R19 /(1+w*1j*t_values[18])) + (R20 /(1+w*1j*t_values[19])) + (R21 /(1+w*1j*t_values[20])) + (R22 /(1+w*1j*t_values[21])) + (R23 /(1+w*1j*t_values[22])) + (R24 /(1+w*1j*t_values[23])) + (R25 /(1+w*1j*t_values[24])) + (R26 /(1+w*1j*t_values[25])) + (R27 /(1+w*1j*t_values[26])) + (R28 /(1+w*1j*t_values[27])) + (R29 /(1+w*1j*t_values[28])) + (R30 /(1+w*1j*t_values[29])) + (R31 /(1+w*1j*t_values[30])) + (R32 /(1+w*1j*t_values[31])) + (R33 /(1+w*1j*t_values[32])) + (R34 /(1+w*1j*t_values[33])) + (R35 /(1+w*1j*t_values[34]))  + (R36 /(1+w*1j*t_values[35])) + (R37 /(1+w*1j*t_values[36])) + (R38 /(1+w*1j*t_values[37])) + (R39 /(1+w*1j*t_values[38])) + (R40 /(1+w*1j*t_values[39])) + (R41 /(1+w*1j*t_values[40])) + (R42 /(1+w*1j*t_values[41])) + (R43 /(1+w*1j*t_values[42])) + (R44 /(1+w*1j*t_values[43])) + (R45 /(1+w*1j*t_values[44])) + (R46 /(1+w*1j*t_values[45])) + (R47 /(1+w*1j*t_values[46])) + (R48 /(1+w*1j*t_values[47])) + (R49 /(1+w*1j*t_values[48])) + (R50 /(1+w*1j*t_values[49])) + (R51 /(1+w*1j*t_values[50])) + (R52 /(1+w*1j*t_values[51])) + (R53 /(1+w*1j*t_values[52])) + (R54 /(1+w*1j*t_values[53])) + (R55 /(1+w*1j*t_values[54])) + (R56 /(1+w*1j*t_values[55])) + (R57 /(1+w*1j*t_values[56]))
-
-def KK_RC58_fit(params, w, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    Rs = params['Rs']
-    R1 = params['R1']
-    R2 = params['R2']
-    R3 = params['R3']
-    R4 = params['R4']
-    R5 = params['R5']
-    R6 = params['R6']
-    R7 = params['R7']
-    R8 = params['R8']
-    R9 = params['R9']
-    R10 = params['R10']
-    R11 = params['R11']
-    R12 = params['R12']
-    R13 = params['R13']
-    R14 = params['R14']
-    R15 = params['R15']
-    R16 = params['R16']
-    R17 = params['R17']
-    R18 = params['R18']
-    R19 = params['R19']
-    R20 = params['R20']
-    R21 = params['R21']
-    R22 = params['R22']
-    R23 = params['R23']
-    R24 = params['R24']
-    R25 = params['R25']
-    R26 = params['R26']
-    R27 = params['R27']
-    R28 = params['R28']
-    R29 = params['R29']
-    R30 = params['R30']
-    R31 = params['R31']
-    R32 = params['R32']
-    R33 = params['R33']
-    R34 = params['R34']
-    R35 = params['R35']
-    R36 = params['R36']
-    R37 = params['R37']
-    R38 = params['R38']
-    R39 = params['R39']
-    R40 = params['R40']
-    R41 = params['R41']
-    R42 = params['R42']
-    R43 = params['R43']
-    R44 = params['R44']
-    R45 = params['R45']
-    R46 = params['R46']
-    R47 = params['R47']
-    R48 = params['R48']
-    R49 = params['R49']
-    R50 = params['R50']
-    R51 = params['R51']
-    R52 = params['R52']
-    R53 = params['R53']
-    R54 = params['R54']
-    R55 = params['R55']
-    R56 = params['R56']
-    R57 = params['R57']
-    R58 = params['R58']
-    return Rs + (R1/(1+w*1j*t_values[0])) + (R2 /(1+w*1j*t_values[1])) + (R3 /(1+w*1j*t_values[2])) + (R4 /(1+w*1j*t_values[3])) + (R5 /(1+w*1j*t_values[4])) + (R6 /(1+w*1j*t_values[5])) + (R7 /(1+w*1j*t_values[6])) + (R8 /(1+w*1j*t_values[7])) + (R9 /(1+w*1j*t_values[8])) + (R10 /(1+w*1j*t_values[9])) + (R11 /(1+w*1j*t_values[10])) + (R12 /(1+w*1j*t_values[11])) + (R13 /(1+w*1j*t_values[12])) + (R14 /(1+w*1j*t_values[13])) + (R15 /(1+w*1j*t_values[14])) + (R16 /(1+w*1j*t_values[15])) + (R17 /(1+w*1j*t_values[16])) + (R18 /(1+w*1j*t_values[17])) + (R19 /(1+w*1j*t_values[18])) + (R20 /(1+w*1j*t_values[19])) + (R21 /(1+w*1j*t_values[20])) + (R22 /(1+w*1j*t_values[21])) + (R23 /(1+w*1j*t_values[22])) + (R24 /(1+w*1j*t_values[23])) + (R25 /(1+w*1j*t_values[24])) + (R26 /(1+w*1j*t_values[25])) + (R27 /(1+w*1j*t_values[26])) + (R28 /(1+w*1j*t_values[27])) + (R29 /(1+w*1j*t_values[28])) + (R30 /(1+w*1j*t_values[29])) + (R31 /(1+w*1j*t_values[30])) + (R32 /(1+w*1j*t_values[31])) + (R33 /(1+w*1j*t_values[32])) + (R34 /(1+w*1j*t_values[33])) + (R35 /(1+w*1j*t_values[34]))  + (R36 /(1+w*1j*t_values[35])) + (R37 /(1+w*1j*t_values[36])) + (R38 /(1+w*1j*t_values[37])) + (R39 /(1+w*1j*t_values[38])) + (R40 /(1+w*1j*t_values[39])) + (R41 /(1+w*1j*t_values[40])) + (R42 /(1+w*1j*t_values[41])) + (R43 /(1+w*1j*t_values[42])) + (R44 /(1+w*1j*t_values[43])) + (R45 /(1+w*1j*t_values[44])) + (R46 /(1+w*1j*t_values[45])) + (R47 /(1+w*1j*t_values[46])) + (R48 /(1+w*1j*t_values[47])) + (R49 /(1+w*1j*t_values[48])) + (R50 /(1+w*1j*t_values[49])) + (R51 /(1+w*1j*t_values[50])) + (R52 /(1+w*1j*t_values[51])) + (R53 /(1+w*1j*t_values[52])) + (R54 /(1+w*1j*t_values[53])) + (R55 /(1+w*1j*t_values[54])) + (R56 /(1+w*1j*t_values[55])) + (R57 /(1+w*1j*t_values[56])) + (R58 /(1+w*1j*t_values[57]))
-
-def KK_RC59_fit(params, w, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    Rs = params['Rs']
-    R1 = params['R1']
-    R2 = params['R2']
-    R3 = params['R3']
-    R4 = params['R4']
-    R5 = params['R5']
-    R6 = params['R6']
-    R7 = params['R7']
-    R8 = params['R8']
-    R9 = params['R9']
-    R10 = params['R10']
-    R11 = params['R11']
-    R12 = params['R12']
-    R13 = params['R13']
-    R14 = params['R14']
-    R15 = params['R15']
-    R16 = params['R16']
-    R17 = params['R17']
-    R18 = params['R18']
-    R19 = params['R19']
-    R20 = params['R20']
-    R21 = params['R21']
-    R22 = params['R22']
-    R23 = params['R23']
-    R24 = params['R24']
-    R25 = params['R25']
-    R26 = params['R26']
-    R27 = params['R27']
-    R28 = params['R28']
-    R29 = params['R29']
-    R30 = params['R30']
-    R31 = params['R31']
-    R32 = params['R32']
-    R33 = params['R33']
-    R34 = params['R34']
-    R35 = params['R35']
-    R36 = params['R36']
-    R37 = params['R37']
-    R38 = params['R38']
-    R39 = params['R39']
-    R40 = params['R40']
-    R41 = params['R41']
-    R42 = params['R42']
-    R43 = params['R43']
-    R44 = params['R44']
-    R45 = params['R45']
-    R46 = params['R46']
-    R47 = params['R47']
-    R48 = params['R48']
-    R49 = params['R49']
-    R50 = params['R50']
-    R51 = params['R51']
-    R52 = params['R52']
-    R53 = params['R53']
-    R54 = params['R54']
-    R55 = params['R55']
-    R56 = params['R56']
-    R57 = params['R57']
-    R58 = params['R58']
-    R59 = params['R59']
-    return Rs + (R1/(1+w*1j*t_values[0])) + (R2 /(1+w*1j*t_values[1])) + (R3 /(1+w*1j*t_values[2])) + (R4 /(1+w*1j*t_values[3])) + (R5 /(1+w*1j*t_values[4])) + (R6 /(1+w*1j*t_values[5])) + (R7 /(1+w*1j*t_values[6])) + (R8 /(1+w*1j*t_values[7])) + (R9 /(1+w*1j*t_values[8])) + (R10 /(1+w*1j*t_values[9])) + (R11 /(1+w*1j*t_values[10])) + (R12 /(1+w*1j*t_values[11])) + (R13 /(1+w*1j*t_values[12])) + (R14 /(1+w*1j*t_values[13])) + (R15 /(1+w*1j*t_values[14])) + (R16 /(1+w*1j*t_values[15])) + (R17 /(1+w*1j*t_values[16])) + (R18 /(1+w*1j*t_values[17])) + (R19 /(1+w*1j*t_values[18])) + (R20 /(1+w*1j*t_values[19])) + (R21 /(1+w*1j*t_values[20])) + (R22 /(1+w*1j*t_values[21])) + (R23 /(1+w*1j*t_values[22])) + (R24 /(1+w*1j*t_values[23])) + (R25 /(1+w*1j*t_values[24])) + (R26 /(1+w*1j*t_values[25])) + (R27 /(1+w*1j*t_values[26])) + (R28 /(1+w*1j*t_values[27])) + (R29 /(1+w*1j*t_values[28])) + (R30 /(1+w*1j*t_values[29])) + (R31 /(1+w*1j*t_values[30])) + (R32 /(1+w*1j*t_values[31])) + (R33 /(1+w*1j*t_values[32])) + (R34 /(1+w*1j*t_values[33])) + (R35 /(1+w*1j*t_values[34]))  + (R36 /(1+w*1j*t_values[35])) + (R37 /(1+w*1j*t_values[36])) + (R38 /(1+w*1j*t_values[37])) + (R39 /(1+w*1j*t_values[38])) + (R40 /(1+w*1j*t_values[39])) + (R41 /(1+w*1j*t_values[40])) + (R42 /(1+w*1j*t_values[41])) + (R43 /(1+w*1j*t_values[42])) + (R44 /(1+w*1j*t_values[43])) + (R45 /(1+w*1j*t_values[44])) + (R46 /(1+w*1j*t_values[45])) + (R47 /(1+w*1j*t_values[46])) + (R48 /(1+w*1j*t_values[47])) + (R49 /(1+w*1j*t_values[48])) + (R50 /(1+w*1j*t_values[49])) + (R51 /(1+w*1j*t_values[50])) + (R52 /(1+w*1j*t_values[51])) + (R53 /(1+w*1j*t_values[52])) + (R54 /(1+w*1j*t_values[53])) + (R55 /(1+w*1j*t_values[54])) + (R56 /(1+w*1j*t_values[55])) + (R57 /(1+w*1j*t_values[56])) + (R58 /(1+w*1j*t_values[57])) + (R59 /(1+w*1j*t_values[58]))
-
-def KK_RC60_fit(params, w, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    Rs = params['Rs']
-    R1 = params['R1']
-    R2 = params['R2']
-    R3 = params['R3']
-    R4 = params['R4']
-    R5 = params['R5']
-    R6 = params['R6']
-    R7 = params['R7']
-    R8 = params['R8']
-    R9 = params['R9']
-    R10 = params['R10']
-    R11 = params['R11']
-    R12 = params['R12']
-    R13 = params['R13']
-    R14 = params['R14']
-    R15 = params['R15']
-    R16 = params['R16']
-    R17 = params['R17']
-    R18 = params['R18']
-    R19 = params['R19']
-    R20 = params['R20']
-    R21 = params['R21']
-    R22 = params['R22']
-    R23 = params['R23']
-    R24 = params['R24']
-    R25 = params['R25']
-    R26 = params['R26']
-    R27 = params['R27']
-    R28 = params['R28']
-    R29 = params['R29']
-    R30 = params['R30']
-    R31 = params['R31']
-    R32 = params['R32']
-    R33 = params['R33']
-    R34 = params['R34']
-    R35 = params['R35']
-    R36 = params['R36']
-    R37 = params['R37']
-    R38 = params['R38']
-    R39 = params['R39']
-    R40 = params['R40']
-    R41 = params['R41']
-    R42 = params['R42']
-    R43 = params['R43']
-    R44 = params['R44']
-    R45 = params['R45']
-    R46 = params['R46']
-    R47 = params['R47']
-    R48 = params['R48']
-    R49 = params['R49']
-    R50 = params['R50']
-    R51 = params['R51']
-    R52 = params['R52']
-    R53 = params['R53']
-    R54 = params['R54']
-    R55 = params['R55']
-    R56 = params['R56']
-    R57 = params['R57']
-    R58 = params['R58']
-    R59 = params['R59']
-    R60 = params['R60']
-    return Rs + (R1/(1+w*1j*t_values[0])) + (R2 /(1+w*1j*t_values[1])) + (R3 /(1+w*1j*t_values[2])) + (R4 /(1+w*1j*t_values[3])) + (R5 /(1+w*1j*t_values[4])) + (R6 /(1+w*1j*t_values[5])) + (R7 /(1+w*1j*t_values[6])) + (R8 /(1+w*1j*t_values[7])) + (R9 /(1+w*1j*t_values[8])) + (R10 /(1+w*1j*t_values[9])) + (R11 /(1+w*1j*t_values[10])) + (R12 /(1+w*1j*t_values[11])) + (R13 /(1+w*1j*t_values[12])) + (R14 /(1+w*1j*t_values[13])) + (R15 /(1+w*1j*t_values[14])) + (R16 /(1+w*1j*t_values[15])) + (R17 /(1+w*1j*t_values[16])) + (R18 /(1+w*1j*t_values[17])) + (R19 /(1+w*1j*t_values[18])) + (R20 /(1+w*1j*t_values[19])) + (R21 /(1+w*1j*t_values[20])) + (R22 /(1+w*1j*t_values[21])) + (R23 /(1+w*1j*t_values[22])) + (R24 /(1+w*1j*t_values[23])) + (R25 /(1+w*1j*t_values[24])) + (R26 /(1+w*1j*t_values[25])) + (R27 /(1+w*1j*t_values[26])) + (R28 /(1+w*1j*t_values[27])) + (R29 /(1+w*1j*t_values[28])) + (R30 /(1+w*1j*t_values[29])) + (R31 /(1+w*1j*t_values[30])) + (R32 /(1+w*1j*t_values[31])) + (R33 /(1+w*1j*t_values[32])) + (R34 /(1+w*1j*t_values[33])) + (R35 /(1+w*1j*t_values[34]))  + (R36 /(1+w*1j*t_values[35])) + (R37 /(1+w*1j*t_values[36])) + (R38 /(1+w*1j*t_values[37])) + (R39 /(1+w*1j*t_values[38])) + (R40 /(1+w*1j*t_values[39])) + (R41 /(1+w*1j*t_values[40])) + (R42 /(1+w*1j*t_values[41])) + (R43 /(1+w*1j*t_values[42])) + (R44 /(1+w*1j*t_values[43])) + (R45 /(1+w*1j*t_values[44])) + (R46 /(1+w*1j*t_values[45])) + (R47 /(1+w*1j*t_values[46])) + (R48 /(1+w*1j*t_values[47])) + (R49 /(1+w*1j*t_values[48])) + (R50 /(1+w*1j*t_values[49])) + (R51 /(1+w*1j*t_values[50])) + (R52 /(1+w*1j*t_values[51])) + (R53 /(1+w*1j*t_values[52])) + (R54 /(1+w*1j*t_values[53])) + (R55 /(1+w*1j*t_values[54])) + (R56 /(1+w*1j*t_values[55])) + (R57 /(1+w*1j*t_values[56])) + (R58 /(1+w*1j*t_values[57])) + (R59 /(1+w*1j*t_values[58])) + (R60 /(1+w*1j*t_values[59]))
-
-def KK_RC61_fit(params, w, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    Rs = params['Rs']
-    R1 = params['R1']
-    R2 = params['R2']
-    R3 = params['R3']
-    R4 = params['R4']
-    R5 = params['R5']
-    R6 = params['R6']
-    R7 = params['R7']
-    R8 = params['R8']
-    R9 = params['R9']
-    R10 = params['R10']
-    R11 = params['R11']
-    R12 = params['R12']
-    R13 = params['R13']
-    R14 = params['R14']
-    R15 = params['R15']
-    R16 = params['R16']
-    R17 = params['R17']
-    R18 = params['R18']
-    R19 = params['R19']
-    R20 = params['R20']
-    R21 = params['R21']
-    R22 = params['R22']
-    R23 = params['R23']
-    R24 = params['R24']
-    R25 = params['R25']
-    R26 = params['R26']
-    R27 = params['R27']
-    R28 = params['R28']
-    R29 = params['R29']
-    R30 = params['R30']
-    R31 = params['R31']
-    R32 = params['R32']
-    R33 = params['R33']
-    R34 = params['R34']
-    R35 = params['R35']
-    R36 = params['R36']
-    R37 = params['R37']
-    R38 = params['R38']
-    R39 = params['R39']
-    R40 = params['R40']
-    R41 = params['R41']
-    R42 = params['R42']
-    R43 = params['R43']
-    R44 = params['R44']
-    R45 = params['R45']
-    R46 = params['R46']
-    R47 = params['R47']
-    R48 = params['R48']
-    R49 = params['R49']
-    R50 = params['R50']
-    R51 = params['R51']
-    R52 = params['R52']
-    R53 = params['R53']
-    R54 = params['R54']
-    R55 = params['R55']
-    R56 = params['R56']
-    R57 = params['R57']
-    R58 = params['R58']
-    R59 = params['R59']
-    R60 = params['R60']
-    R61 = params['R61']
-    return Rs + (R1/(1+w*1j*t_values[0])) + (R2 /(1+w*1j*t_values[1])) + (R3 /(1+w*1j*t_values[2])) + (R4 /(1+w*1j*t_values[3])) + (R5 /(1+w*1j*t_values[4])) + (R6 /(1+w*1j*t_values[5])) + (R7 /(1+w*1j*t_values[6])) + (R8 /(1+w*1j*t_values[7])) + (R9 /(1+w*1j*t_values[8])) + (R10 /(1+w*1j*t_values[9])) + (R11 /(1+w*1j*t_values[10])) + (R12 /(1+w*1j*t_values[11])) + (R13 /(1+w*1j*t_values[12])) + (R14 /(1+w*1j*t_values[13])) + (R15 /(1+w*1j*t_values[14])) + (R16 /(1+w*1j*t_values[15])) + (R17 /(1+w*1j*t_values[16])) + (R18 /(1+w*1j*t_values[17])) + (R19 /(1+w*1j*t_values[18])) + (R20 /(1+w*1j*t_values[19])) + (R21 /(1+w*1j*t_values[20])) + (R22 /(1+w*1j*t_values[21])) + (R23 /(1+w*1j*t_values[22])) + (R24 /(1+w*1j*t_values[23])) + (R25 /(1+w*1j*t_values[24])) + (R26 /(1+w*1j*t_values[25])) + (R27 /(1+w*1j*t_values[26])) + (R28 /(1+w*1j*t_values[27])) + (R29 /(1+w*1j*t_values[28])) + (R30 /(1+w*1j*t_values[29])) + (R31 /(1+w*1j*t_values[30])) + (R32 /(1+w*1j*t_values[31])) + (R33 /(1+w*1j*t_values[32])) + (R34 /(1+w*1j*t_values[33])) + (R35 /(1+w*1j*t_values[34]))  + (R36 /(1+w*1j*t_values[35])) + (R37 /(1+w*1j*t_values[36])) + (R38 /(1+w*1j*t_values[37])) + (R39 /(1+w*1j*t_values[38])) + (R40 /(1+w*1j*t_values[39])) + (R41 /(1+w*1j*t_values[40])) + (R42 /(1+w*1j*t_values[41])) + (R43 /(1+w*1j*t_values[42])) + (R44 /(1+w*1j*t_values[43])) + (R45 /(1+w*1j*t_values[44])) + (R46 /(1+w*1j*t_values[45])) + (R47 /(1+w*1j*t_values[46])) + (R48 /(1+w*1j*t_values[47])) + (R49 /(1+w*1j*t_values[48])) + (R50 /(1+w*1j*t_values[49])) + (R51 /(1+w*1j*t_values[50])) + (R52 /(1+w*1j*t_values[51])) + (R53 /(1+w*1j*t_values[52])) + (R54 /(1+w*1j*t_values[53])) + (R55 /(1+w*1j*t_values[54])) + (R56 /(1+w*1j*t_values[55])) + (R57 /(1+w*1j*t_values[56])) + (R58 /(1+w*1j*t_values[57])) + (R59 /(1+w*1j*t_values[58])) + (R60 /(1+w*1j*t_values[59])) + (R61 /(1+w*1j*t_values[60]))
-
-def KK_RC62_fit(params, w, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    Rs = params['Rs']
-    R1 = params['R1']
-    R2 = params['R2']
-    R3 = params['R3']
-    R4 = params['R4']
-    R5 = params['R5']
-    R6 = params['R6']
-    R7 = params['R7']
-    R8 = params['R8']
-    R9 = params['R9']
-    R10 = params['R10']
-    R11 = params['R11']
-    R12 = params['R12']
-    R13 = params['R13']
-    R14 = params['R14']
-    R15 = params['R15']
-    R16 = params['R16']
-    R17 = params['R17']
-    R18 = params['R18']
-    R19 = params['R19']
-    R20 = params['R20']
-    R21 = params['R21']
-    R22 = params['R22']
-    R23 = params['R23']
-    R24 = params['R24']
-    R25 = params['R25']
-    R26 = params['R26']
-    R27 = params['R27']
-    R28 = params['R28']
-    R29 = params['R29']
-    R30 = params['R30']
-    R31 = params['R31']
-    R32 = params['R32']
-    R33 = params['R33']
-    R34 = params['R34']
-    R35 = params['R35']
-    R36 = params['R36']
-    R37 = params['R37']
-    R38 = params['R38']
-    R39 = params['R39']
-    R40 = params['R40']
-    R41 = params['R41']
-    R42 = params['R42']
-    R43 = params['R43']
-    R44 = params['R44']
-    R45 = params['R45']
-    R46 = params['R46']
-    R47 = params['R47']
-    R48 = params['R48']
-    R49 = params['R49']
-    R50 = params['R50']
-    R51 = params['R51']
-    R52 = params['R52']
-    R53 = params['R53']
-    R54 = params['R54']
-    R55 = params['R55']
-    R56 = params['R56']
-    R57 = params['R57']
-    R58 = params['R58']
-    R59 = params['R59']
-    R60 = params['R60']
-    R61 = params['R61']
-    R62 = params['R62']
-    return Rs + (R1/(1+w*1j*t_values[0])) + (R2 /(1+w*1j*t_values[1])) + (R3 /(1+w*1j*t_values[2])) + (R4 /(1+w*1j*t_values[3])) + (R5 /(1+w*1j*t_values[4])) + (R6 /(1+w*1j*t_values[5])) + (R7 /(1+w*1j*t_values[6])) + (R8 /(1+w*1j*t_values[7])) + (R9 /(1+w*1j*t_values[8])) + (R10 /(1+w*1j*t_values[9])) + (R11 /(1+w*1j*t_values[10])) + (R12 /(1+w*1j*t_values[11])) + (R13 /(1+w*1j*t_values[12])) + (R14 /(1+w*1j*t_values[13])) + (R15 /(1+w*1j*t_values[14])) + (R16 /(1+w*1j*t_values[15])) + (R17 /(1+w*1j*t_values[16])) + (R18 /(1+w*1j*t_values[17])) + (R19 /(1+w*1j*t_values[18])) + (R20 /(1+w*1j*t_values[19])) + (R21 /(1+w*1j*t_values[20])) + (R22 /(1+w*1j*t_values[21])) + (R23 /(1+w*1j*t_values[22])) + (R24 /(1+w*1j*t_values[23])) + (R25 /(1+w*1j*t_values[24])) + (R26 /(1+w*1j*t_values[25])) + (R27 /(1+w*1j*t_values[26])) + (R28 /(1+w*1j*t_values[27])) + (R29 /(1+w*1j*t_values[28])) + (R30 /(1+w*1j*t_values[29])) + (R31 /(1+w*1j*t_values[30])) + (R32 /(1+w*1j*t_values[31])) + (R33 /(1+w*1j*t_values[32])) + (R34 /(1+w*1j*t_values[33])) + (R35 /(1+w*1j*t_values[34]))  + (R36 /(1+w*1j*t_values[35])) + (R37 /(1+w*1j*t_values[36])) + (R38 /(1+w*1j*t_values[37])) + (R39 /(1+w*1j*t_values[38])) + (R40 /(1+w*1j*t_values[39])) + (R41 /(1+w*1j*t_values[40])) + (R42 /(1+w*1j*t_values[41])) + (R43 /(1+w*1j*t_values[42])) + (R44 /(1+w*1j*t_values[43])) + (R45 /(1+w*1j*t_values[44])) + (R46 /(1+w*1j*t_values[45])) + (R47 /(1+w*1j*t_values[46])) + (R48 /(1+w*1j*t_values[47])) + (R49 /(1+w*1j*t_values[48])) + (R50 /(1+w*1j*t_values[49])) + (R51 /(1+w*1j*t_values[50])) + (R52 /(1+w*1j*t_values[51])) + (R53 /(1+w*1j*t_values[52])) + (R54 /(1+w*1j*t_values[53])) + (R55 /(1+w*1j*t_values[54])) + (R56 /(1+w*1j*t_values[55])) + (R57 /(1+w*1j*t_values[56])) + (R58 /(1+w*1j*t_values[57])) + (R59 /(1+w*1j*t_values[58])) + (R60 /(1+w*1j*t_values[59])) + (R61 /(1+w*1j*t_values[60])) + (R62 /(1+w*1j*t_values[61]))
-
-def KK_RC63_fit(params, w, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    Rs = params['Rs']
-    R1 = params['R1']
-    R2 = params['R2']
-    R3 = params['R3']
-    R4 = params['R4']
-    R5 = params['R5']
-    R6 = params['R6']
-    R7 = params['R7']
-    R8 = params['R8']
-    R9 = params['R9']
-    R10 = params['R10']
-    R11 = params['R11']
-    R12 = params['R12']
-    R13 = params['R13']
-    R14 = params['R14']
-    R15 = params['R15']
-    R16 = params['R16']
-    R17 = params['R17']
-    R18 = params['R18']
-    R19 = params['R19']
-    R20 = params['R20']
-    R21 = params['R21']
-    R22 = params['R22']
-    R23 = params['R23']
-    R24 = params['R24']
-    R25 = params['R25']
-    R26 = params['R26']
-    R27 = params['R27']
-    R28 = params['R28']
-    R29 = params['R29']
-    R30 = params['R30']
-    R31 = params['R31']
-    R32 = params['R32']
-    R33 = params['R33']
-    R34 = params['R34']
-    R35 = params['R35']
-    R36 = params['R36']
-    R37 = params['R37']
-    R38 = params['R38']
-    R39 = params['R39']
-    R40 = params['R40']
-    R41 = params['R41']
-    R42 = params['R42']
-    R43 = params['R43']
-    R44 = params['R44']
-    R45 = params['R45']
-    R46 = params['R46']
-    R47 = params['R47']
-    R48 = params['R48']
-    R49 = params['R49']
-    R50 = params['R50']
-    R51 = params['R51']
-    R52 = params['R52']
-    R53 = params['R53']
-    R54 = params['R54']
-    R55 = params['R55']
-    R56 = params['R56']
-    R57 = params['R57']
-    R58 = params['R58']
-    R59 = params['R59']
-    R60 = params['R60']
-    R61 = params['R61']
-    R62 = params['R62']
-    R63 = params['R63']
-    return Rs + (R1/(1+w*1j*t_values[0])) + (R2 /(1+w*1j*t_values[1])) + (R3 /(1+w*1j*t_values[2])) + (R4 /(1+w*1j*t_values[3])) + (R5 /(1+w*1j*t_values[4])) + (R6 /(1+w*1j*t_values[5])) + (R7 /(1+w*1j*t_values[6])) + (R8 /(1+w*1j*t_values[7])) + (R9 /(1+w*1j*t_values[8])) + (R10 /(1+w*1j*t_values[9])) + (R11 /(1+w*1j*t_values[10])) + (R12 /(1+w*1j*t_values[11])) + (R13 /(1+w*1j*t_values[12])) + (R14 /(1+w*1j*t_values[13])) + (R15 /(1+w*1j*t_values[14])) + (R16 /(1+w*1j*t_values[15])) + (R17 /(1+w*1j*t_values[16])) + (R18 /(1+w*1j*t_values[17])) + (R19 /(1+w*1j*t_values[18])) + (R20 /(1+w*1j*t_values[19])) + (R21 /(1+w*1j*t_values[20])) + (R22 /(1+w*1j*t_values[21])) + (R23 /(1+w*1j*t_values[22])) + (R24 /(1+w*1j*t_values[23])) + (R25 /(1+w*1j*t_values[24])) + (R26 /(1+w*1j*t_values[25])) + (R27 /(1+w*1j*t_values[26])) + (R28 /(1+w*1j*t_values[27])) + (R29 /(1+w*1j*t_values[28])) + (R30 /(1+w*1j*t_values[29])) + (R31 /(1+w*1j*t_values[30])) + (R32 /(1+w*1j*t_values[31])) + (R33 /(1+w*1j*t_values[32])) + (R34 /(1+w*1j*t_values[33])) + (R35 /(1+w*1j*t_values[34]))  + (R36 /(1+w*1j*t_values[35])) + (R37 /(1+w*1j*t_values[36])) + (R38 /(1+w*1j*t_values[37])) + (R39 /(1+w*1j*t_values[38])) + (R40 /(1+w*1j*t_values[39])) + (R41 /(1+w*1j*t_values[40])) + (R42 /(1+w*1j*t_values[41])) + (R43 /(1+w*1j*t_values[42])) + (R44 /(1+w*1j*t_values[43])) + (R45 /(1+w*1j*t_values[44])) + (R46 /(1+w*1j*t_values[45])) + (R47 /(1+w*1j*t_values[46])) + (R48 /(1+w*1j*t_values[47])) + (R49 /(1+w*1j*t_values[48])) + (R50 /(1+w*1j*t_values[49])) + (R51 /(1+w*1j*t_values[50])) + (R52 /(1+w*1j*t_values[51])) + (R53 /(1+w*1j*t_values[52])) + (R54 /(1+w*1j*t_values[53])) + (R55 /(1+w*1j*t_values[54])) + (R56 /(1+w*1j*t_values[55])) + (R57 /(1+w*1j*t_values[56])) + (R58 /(1+w*1j*t_values[57])) + (R59 /(1+w*1j*t_values[58])) + (R60 /(1+w*1j*t_values[59])) + (R61 /(1+w*1j*t_values[60])) + (R62 /(1+w*1j*t_values[61])) + (R63 /(1+w*1j*t_values[62]))    
-
-def KK_RC64_fit(params, w, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    Rs = params['Rs']
-    R1 = params['R1']
-    R2 = params['R2']
-    R3 = params['R3']
-    R4 = params['R4']
-    R5 = params['R5']
-    R6 = params['R6']
-    R7 = params['R7']
-    R8 = params['R8']
-    R9 = params['R9']
-    R10 = params['R10']
-    R11 = params['R11']
-    R12 = params['R12']
-    R13 = params['R13']
-    R14 = params['R14']
-    R15 = params['R15']
-    R16 = params['R16']
-    R17 = params['R17']
-    R18 = params['R18']
-    R19 = params['R19']
-    R20 = params['R20']
-    R21 = params['R21']
-    R22 = params['R22']
-    R23 = params['R23']
-    R24 = params['R24']
-    R25 = params['R25']
-    R26 = params['R26']
-    R27 = params['R27']
-    R28 = params['R28']
-    R29 = params['R29']
-    R30 = params['R30']
-    R31 = params['R31']
-    R32 = params['R32']
-    R33 = params['R33']
-    R34 = params['R34']
-    R35 = params['R35']
-    R36 = params['R36']
-    R37 = params['R37']
-    R38 = params['R38']
-    R39 = params['R39']
-    R40 = params['R40']
-    R41 = params['R41']
-    R42 = params['R42']
-    R43 = params['R43']
-    R44 = params['R44']
-    R45 = params['R45']
-    R46 = params['R46']
-    R47 = params['R47']
-    R48 = params['R48']
-    R49 = params['R49']
-    R50 = params['R50']
-    R51 = params['R51']
-    R52 = params['R52']
-    R53 = params['R53']
-    R54 = params['R54']
-    R55 = params['R55']
-    R56 = params['R56']
-    R57 = params['R57']
-    R58 = params['R58']
-    R59 = params['R59']
-    R60 = params['R60']
-    R61 = params['R61']
-    R62 = params['R62']
-    R63 = params['R63']
-    R64 = params['R64']
-    return Rs + (R1/(1+w*1j*t_values[0])) + (R2 /(1+w*1j*t_values[1])) + (R3 /(1+w*1j*t_values[2])) + (R4 /(1+w*1j*t_values[3])) + (R5 /(1+w*1j*t_values[4])) + (R6 /(1+w*1j*t_values[5])) + (R7 /(1+w*1j*t_values[6])) + (R8 /(1+w*1j*t_values[7])) + (R9 /(1+w*1j*t_values[8])) + (R10 /(1+w*1j*t_values[9])) + (R11 /(1+w*1j*t_values[10])) + (R12 /(1+w*1j*t_values[11])) + (R13 /(1+w*1j*t_values[12])) + (R14 /(1+w*1j*t_values[13])) + (R15 /(1+w*1j*t_values[14])) + (R16 /(1+w*1j*t_values[15])) + (R17 /(1+w*1j*t_values[16])) + (R18 /(1+w*1j*t_values[17])) + (R19 /(1+w*1j*t_values[18])) + (R20 /(1+w*1j*t_values[19])) + (R21 /(1+w*1j*t_values[20])) + (R22 /(1+w*1j*t_values[21])) + (R23 /(1+w*1j*t_values[22])) + (R24 /(1+w*1j*t_values[23])) + (R25 /(1+w*1j*t_values[24])) + (R26 /(1+w*1j*t_values[25])) + (R27 /(1+w*1j*t_values[26])) + (R28 /(1+w*1j*t_values[27])) + (R29 /(1+w*1j*t_values[28])) + (R30 /(1+w*1j*t_values[29])) + (R31 /(1+w*1j*t_values[30])) + (R32 /(1+w*1j*t_values[31])) + (R33 /(1+w*1j*t_values[32])) + (R34 /(1+w*1j*t_values[33])) + (R35 /(1+w*1j*t_values[34]))  + (R36 /(1+w*1j*t_values[35])) + (R37 /(1+w*1j*t_values[36])) + (R38 /(1+w*1j*t_values[37])) + (R39 /(1+w*1j*t_values[38])) + (R40 /(1+w*1j*t_values[39])) + (R41 /(1+w*1j*t_values[40])) + (R42 /(1+w*1j*t_values[41])) + (R43 /(1+w*1j*t_values[42])) + (R44 /(1+w*1j*t_values[43])) + (R45 /(1+w*1j*t_values[44])) + (R46 /(1+w*1j*t_values[45])) + (R47 /(1+w*1j*t_values[46])) + (R48 /(1+w*1j*t_values[47])) + (R49 /(1+w*1j*t_values[48])) + (R50 /(1+w*1j*t_values[49])) + (R51 /(1+w*1j*t_values[50])) + (R52 /(1+w*1j*t_values[51])) + (R53 /(1+w*1j*t_values[52])) + (R54 /(1+w*1j*t_values[53])) + (R55 /(1+w*1j*t_values[54])) + (R56 /(1+w*1j*t_values[55])) + (R57 /(1+w*1j*t_values[56])) + (R58 /(1+w*1j*t_values[57])) + (R59 /(1+w*1j*t_values[58])) + (R60 /(1+w*1j*t_values[59])) + (R61 /(1+w*1j*t_values[60])) + (R62 /(1+w*1j*t_values[61])) + (R63 /(1+w*1j*t_values[62])) + (R64 /(1+w*1j*t_values[63]))    
-
-def KK_RC65_fit(params, w, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    Rs = params['Rs']
-    R1 = params['R1']
-    R2 = params['R2']
-    R3 = params['R3']
-    R4 = params['R4']
-    R5 = params['R5']
-    R6 = params['R6']
-    R7 = params['R7']
-    R8 = params['R8']
-    R9 = params['R9']
-    R10 = params['R10']
-    R11 = params['R11']
-    R12 = params['R12']
-    R13 = params['R13']
-    R14 = params['R14']
-    R15 = params['R15']
-    R16 = params['R16']
-    R17 = params['R17']
-    R18 = params['R18']
-    R19 = params['R19']
-    R20 = params['R20']
-    R21 = params['R21']
-    R22 = params['R22']
-    R23 = params['R23']
-    R24 = params['R24']
-    R25 = params['R25']
-    R26 = params['R26']
-    R27 = params['R27']
-    R28 = params['R28']
-    R29 = params['R29']
-    R30 = params['R30']
-    R31 = params['R31']
-    R32 = params['R32']
-    R33 = params['R33']
-    R34 = params['R34']
-    R35 = params['R35']
-    R36 = params['R36']
-    R37 = params['R37']
-    R38 = params['R38']
-    R39 = params['R39']
-    R40 = params['R40']
-    R41 = params['R41']
-    R42 = params['R42']
-    R43 = params['R43']
-    R44 = params['R44']
-    R45 = params['R45']
-    R46 = params['R46']
-    R47 = params['R47']
-    R48 = params['R48']
-    R49 = params['R49']
-    R50 = params['R50']
-    R51 = params['R51']
-    R52 = params['R52']
-    R53 = params['R53']
-    R54 = params['R54']
-    R55 = params['R55']
-    R56 = params['R56']
-    R57 = params['R57']
-    R58 = params['R58']
-    R59 = params['R59']
-    R60 = params['R60']
-    R61 = params['R61']
-    R62 = params['R62']
-    R63 = params['R63']
-    R64 = params['R64']
-    R65 = params['R65']
-    return Rs + (R1/(1+w*1j*t_values[0])) + (R2 /(1+w*1j*t_values[1])) + (R3 /(1+w*1j*t_values[2])) + (R4 /(1+w*1j*t_values[3])) + (R5 /(1+w*1j*t_values[4])) + (R6 /(1+w*1j*t_values[5])) + (R7 /(1+w*1j*t_values[6])) + (R8 /(1+w*1j*t_values[7])) + (R9 /(1+w*1j*t_values[8])) + (R10 /(1+w*1j*t_values[9])) + (R11 /(1+w*1j*t_values[10])) + (R12 /(1+w*1j*t_values[11])) + (R13 /(1+w*1j*t_values[12])) + (R14 /(1+w*1j*t_values[13])) + (R15 /(1+w*1j*t_values[14])) + (R16 /(1+w*1j*t_values[15])) + (R17 /(1+w*1j*t_values[16])) + (R18 /(1+w*1j*t_values[17])) + (R19 /(1+w*1j*t_values[18])) + (R20 /(1+w*1j*t_values[19])) + (R21 /(1+w*1j*t_values[20])) + (R22 /(1+w*1j*t_values[21])) + (R23 /(1+w*1j*t_values[22])) + (R24 /(1+w*1j*t_values[23])) + (R25 /(1+w*1j*t_values[24])) + (R26 /(1+w*1j*t_values[25])) + (R27 /(1+w*1j*t_values[26])) + (R28 /(1+w*1j*t_values[27])) + (R29 /(1+w*1j*t_values[28])) + (R30 /(1+w*1j*t_values[29])) + (R31 /(1+w*1j*t_values[30])) + (R32 /(1+w*1j*t_values[31])) + (R33 /(1+w*1j*t_values[32])) + (R34 /(1+w*1j*t_values[33])) + (R35 /(1+w*1j*t_values[34]))  + (R36 /(1+w*1j*t_values[35])) + (R37 /(1+w*1j*t_values[36])) + (R38 /(1+w*1j*t_values[37])) + (R39 /(1+w*1j*t_values[38])) + (R40 /(1+w*1j*t_values[39])) + (R41 /(1+w*1j*t_values[40])) + (R42 /(1+w*1j*t_values[41])) + (R43 /(1+w*1j*t_values[42])) + (R44 /(1+w*1j*t_values[43])) + (R45 /(1+w*1j*t_values[44])) + (R46 /(1+w*1j*t_values[45])) + (R47 /(1+w*1j*t_values[46])) + (R48 /(1+w*1j*t_values[47])) + (R49 /(1+w*1j*t_values[48])) + (R50 /(1+w*1j*t_values[49])) + (R51 /(1+w*1j*t_values[50])) + (R52 /(1+w*1j*t_values[51])) + (R53 /(1+w*1j*t_values[52])) + (R54 /(1+w*1j*t_values[53])) + (R55 /(1+w*1j*t_values[54])) + (R56 /(1+w*1j*t_values[55])) + (R57 /(1+w*1j*t_values[56])) + (R58 /(1+w*1j*t_values[57])) + (R59 /(1+w*1j*t_values[58])) + (R60 /(1+w*1j*t_values[59])) + (R61 /(1+w*1j*t_values[60])) + (R62 /(1+w*1j*t_values[61])) + (R63 /(1+w*1j*t_values[62])) + (R64 /(1+w*1j*t_values[63])) + (R65 /(1+w*1j*t_values[64]))
-
-def KK_RC66_fit(params, w, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    Rs = params['Rs']
-    R1 = params['R1']
-    R2 = params['R2']
-    R3 = params['R3']
-    R4 = params['R4']
-    R5 = params['R5']
-    R6 = params['R6']
-    R7 = params['R7']
-    R8 = params['R8']
-    R9 = params['R9']
-    R10 = params['R10']
-    R11 = params['R11']
-    R12 = params['R12']
-    R13 = params['R13']
-    R14 = params['R14']
-    R15 = params['R15']
-    R16 = params['R16']
-    R17 = params['R17']
-    R18 = params['R18']
-    R19 = params['R19']
-    R20 = params['R20']
-    R21 = params['R21']
-    R22 = params['R22']
-    R23 = params['R23']
-    R24 = params['R24']
-    R25 = params['R25']
-    R26 = params['R26']
-    R27 = params['R27']
-    R28 = params['R28']
-    R29 = params['R29']
-    R30 = params['R30']
-    R31 = params['R31']
-    R32 = params['R32']
-    R33 = params['R33']
-    R34 = params['R34']
-    R35 = params['R35']
-    R36 = params['R36']
-    R37 = params['R37']
-    R38 = params['R38']
-    R39 = params['R39']
-    R40 = params['R40']
-    R41 = params['R41']
-    R42 = params['R42']
-    R43 = params['R43']
-    R44 = params['R44']
-    R45 = params['R45']
-    R46 = params['R46']
-    R47 = params['R47']
-    R48 = params['R48']
-    R49 = params['R49']
-    R50 = params['R50']
-    R51 = params['R51']
-    R52 = params['R52']
-    R53 = params['R53']
-    R54 = params['R54']
-    R55 = params['R55']
-    R56 = params['R56']
-    R57 = params['R57']
-    R58 = params['R58']
-    R59 = params['R59']
-    R60 = params['R60']
-    R61 = params['R61']
-    R62 = params['R62']
-    R63 = params['R63']
-    R64 = params['R64']
-    R65 = params['R65']
-    R66 = params['R66']
-    return Rs + (R1/(1+w*1j*t_values[0])) + (R2 /(1+w*1j*t_values[1])) + (R3 /(1+w*1j*t_values[2])) + (R4 /(1+w*1j*t_values[3])) + (R5 /(1+w*1j*t_values[4])) + (R6 /(1+w*1j*t_values[5])) + (R7 /(1+w*1j*t_values[6])) + (R8 /(1+w*1j*t_values[7])) + (R9 /(1+w*1j*t_values[8])) + (R10 /(1+w*1j*t_values[9])) + (R11 /(1+w*1j*t_values[10])) + (R12 /(1+w*1j*t_values[11])) + (R13 /(1+w*1j*t_values[12])) + (R14 /(1+w*1j*t_values[13])) + (R15 /(1+w*1j*t_values[14])) + (R16 /(1+w*1j*t_values[15])) + (R17 /(1+w*1j*t_values[16])) + (R18 /(1+w*1j*t_values[17])) + (R19 /(1+w*1j*t_values[18])) + (R20 /(1+w*1j*t_values[19])) + (R21 /(1+w*1j*t_values[20])) + (R22 /(1+w*1j*t_values[21])) + (R23 /(1+w*1j*t_values[22])) + (R24 /(1+w*1j*t_values[23])) + (R25 /(1+w*1j*t_values[24])) + (R26 /(1+w*1j*t_values[25])) + (R27 /(1+w*1j*t_values[26])) + (R28 /(1+w*1j*t_values[27])) + (R29 /(1+w*1j*t_values[28])) + (R30 /(1+w*1j*t_values[29])) + (R31 /(1+w*1j*t_values[30])) + (R32 /(1+w*1j*t_values[31])) + (R33 /(1+w*1j*t_values[32])) + (R34 /(1+w*1j*t_values[33])) + (R35 /(1+w*1j*t_values[34]))  + (R36 /(1+w*1j*t_values[35])) + (R37 /(1+w*1j*t_values[36])) + (R38 /(1+w*1j*t_values[37])) + (R39 /(1+w*1j*t_values[38])) + (R40 /(1+w*1j*t_values[39])) + (R41 /(1+w*1j*t_values[40])) + (R42 /(1+w*1j*t_values[41])) + (R43 /(1+w*1j*t_values[42])) + (R44 /(1+w*1j*t_values[43])) + (R45 /(1+w*1j*t_values[44])) + (R46 /(1+w*1j*t_values[45])) + (R47 /(1+w*1j*t_values[46])) + (R48 /(1+w*1j*t_values[47])) + (R49 /(1+w*1j*t_values[48])) + (R50 /(1+w*1j*t_values[49])) + (R51 /(1+w*1j*t_values[50])) + (R52 /(1+w*1j*t_values[51])) + (R53 /(1+w*1j*t_values[52])) + (R54 /(1+w*1j*t_values[53])) + (R55 /(1+w*1j*t_values[54])) + (R56 /(1+w*1j*t_values[55])) + (R57 /(1+w*1j*t_values[56])) + (R58 /(1+w*1j*t_values[57])) + (R59 /(1+w*1j*t_values[58])) + (R60 /(1+w*1j*t_values[59])) + (R61 /(1+w*1j*t_values[60])) + (R62 /(1+w*1j*t_values[61])) + (R63 /(1+w*1j*t_values[62])) + (R64 /(1+w*1j*t_values[63])) + (R65 /(1+w*1j*t_values[64])) + (R66 /(1+w*1j*t_values[65]))
-
-def KK_RC67_fit(params, w, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    Rs = params['Rs']
-    R1 = params['R1']
-    R2 = params['R2']
-    R3 = params['R3']
-    R4 = params['R4']
-    R5 = params['R5']
-    R6 = params['R6']
-    R7 = params['R7']
-    R8 = params['R8']
-    R9 = params['R9']
-    R10 = params['R10']
-    R11 = params['R11']
-    R12 = params['R12']
-    R13 = params['R13']
-    R14 = params['R14']
-    R15 = params['R15']
-    R16 = params['R16']
-    R17 = params['R17']
-    R18 = params['R18']
-    R19 = params['R19']
-    R20 = params['R20']
-    R21 = params['R21']
-    R22 = params['R22']
-    R23 = params['R23']
-    R24 = params['R24']
-    R25 = params['R25']
-    R26 = params['R26']
-    R27 = params['R27']
-    R28 = params['R28']
-    R29 = params['R29']
-    R30 = params['R30']
-    R31 = params['R31']
-    R32 = params['R32']
-    R33 = params['R33']
-    R34 = params['R34']
-    R35 = params['R35']
-    R36 = params['R36']
-    R37 = params['R37']
-    R38 = params['R38']
-    R39 = params['R39']
-    R40 = params['R40']
-    R41 = params['R41']
-    R42 = params['R42']
-    R43 = params['R43']
-    R44 = params['R44']
-    R45 = params['R45']
-    R46 = params['R46']
-    R47 = params['R47']
-    R48 = params['R48']
-    R49 = params['R49']
-    R50 = params['R50']
-    R51 = params['R51']
-    R52 = params['R52']
-    R53 = params['R53']
-    R54 = params['R54']
-    R55 = params['R55']
-    R56 = params['R56']
-    R57 = params['R57']
-    R58 = params['R58']
-    R59 = params['R59']
-    R60 = params['R60']
-    R61 = params['R61']
-    R62 = params['R62']
-    R63 = params['R63']
-    R64 = params['R64']
-    R65 = params['R65']
-    R66 = params['R66']
-    R67 = params['R67']
-    return Rs + (R1/(1+w*1j*t_values[0])) + (R2 /(1+w*1j*t_values[1])) + (R3 /(1+w*1j*t_values[2])) + (R4 /(1+w*1j*t_values[3])) + (R5 /(1+w*1j*t_values[4])) + (R6 /(1+w*1j*t_values[5])) + (R7 /(1+w*1j*t_values[6])) + (R8 /(1+w*1j*t_values[7])) + (R9 /(1+w*1j*t_values[8])) + (R10 /(1+w*1j*t_values[9])) + (R11 /(1+w*1j*t_values[10])) + (R12 /(1+w*1j*t_values[11])) + (R13 /(1+w*1j*t_values[12])) + (R14 /(1+w*1j*t_values[13])) + (R15 /(1+w*1j*t_values[14])) + (R16 /(1+w*1j*t_values[15])) + (R17 /(1+w*1j*t_values[16])) + (R18 /(1+w*1j*t_values[17])) + (R19 /(1+w*1j*t_values[18])) + (R20 /(1+w*1j*t_values[19])) + (R21 /(1+w*1j*t_values[20])) + (R22 /(1+w*1j*t_values[21])) + (R23 /(1+w*1j*t_values[22])) + (R24 /(1+w*1j*t_values[23])) + (R25 /(1+w*1j*t_values[24])) + (R26 /(1+w*1j*t_values[25])) + (R27 /(1+w*1j*t_values[26])) + (R28 /(1+w*1j*t_values[27])) + (R29 /(1+w*1j*t_values[28])) + (R30 /(1+w*1j*t_values[29])) + (R31 /(1+w*1j*t_values[30])) + (R32 /(1+w*1j*t_values[31])) + (R33 /(1+w*1j*t_values[32])) + (R34 /(1+w*1j*t_values[33])) + (R35 /(1+w*1j*t_values[34]))  + (R36 /(1+w*1j*t_values[35])) + (R37 /(1+w*1j*t_values[36])) + (R38 /(1+w*1j*t_values[37])) + (R39 /(1+w*1j*t_values[38])) + (R40 /(1+w*1j*t_values[39])) + (R41 /(1+w*1j*t_values[40])) + (R42 /(1+w*1j*t_values[41])) + (R43 /(1+w*1j*t_values[42])) + (R44 /(1+w*1j*t_values[43])) + (R45 /(1+w*1j*t_values[44])) + (R46 /(1+w*1j*t_values[45])) + (R47 /(1+w*1j*t_values[46])) + (R48 /(1+w*1j*t_values[47])) + (R49 /(1+w*1j*t_values[48])) + (R50 /(1+w*1j*t_values[49])) + (R51 /(1+w*1j*t_values[50])) + (R52 /(1+w*1j*t_values[51])) + (R53 /(1+w*1j*t_values[52])) + (R54 /(1+w*1j*t_values[53])) + (R55 /(1+w*1j*t_values[54])) + (R56 /(1+w*1j*t_values[55])) + (R57 /(1+w*1j*t_values[56])) + (R58 /(1+w*1j*t_values[57])) + (R59 /(1+w*1j*t_values[58])) + (R60 /(1+w*1j*t_values[59])) + (R61 /(1+w*1j*t_values[60])) + (R62 /(1+w*1j*t_values[61])) + (R63 /(1+w*1j*t_values[62])) + (R64 /(1+w*1j*t_values[63])) + (R65 /(1+w*1j*t_values[64])) + (R66 /(1+w*1j*t_values[65])) + (R67 /(1+w*1j*t_values[66]))    
-
-def KK_RC68_fit(params, w, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    Rs = params['Rs']
-    R1 = params['R1']
-    R2 = params['R2']
-    R3 = params['R3']
-    R4 = params['R4']
-    R5 = params['R5']
-    R6 = params['R6']
-    R7 = params['R7']
-    R8 = params['R8']
-    R9 = params['R9']
-    R10 = params['R10']
-    R11 = params['R11']
-    R12 = params['R12']
-    R13 = params['R13']
-    R14 = params['R14']
-    R15 = params['R15']
-    R16 = params['R16']
-    R17 = params['R17']
-    R18 = params['R18']
-    R19 = params['R19']
-    R20 = params['R20']
-    R21 = params['R21']
-    R22 = params['R22']
-    R23 = params['R23']
-    R24 = params['R24']
-    R25 = params['R25']
-    R26 = params['R26']
-    R27 = params['R27']
-    R28 = params['R28']
-    R29 = params['R29']
-    R30 = params['R30']
-    R31 = params['R31']
-    R32 = params['R32']
-    R33 = params['R33']
-    R34 = params['R34']
-    R35 = params['R35']
-    R36 = params['R36']
-    R37 = params['R37']
-    R38 = params['R38']
-    R39 = params['R39']
-    R40 = params['R40']
-    R41 = params['R41']
-    R42 = params['R42']
-    R43 = params['R43']
-    R44 = params['R44']
-    R45 = params['R45']
-    R46 = params['R46']
-    R47 = params['R47']
-    R48 = params['R48']
-    R49 = params['R49']
-    R50 = params['R50']
-    R51 = params['R51']
-    R52 = params['R52']
-    R53 = params['R53']
-    R54 = params['R54']
-    R55 = params['R55']
-    R56 = params['R56']
-    R57 = params['R57']
-    R58 = params['R58']
-    R59 = params['R59']
-    R60 = params['R60']
-    R61 = params['R61']
-    R62 = params['R62']
-    R63 = params['R63']
-    R64 = params['R64']
-    R65 = params['R65']
-    R66 = params['R66']
-    R67 = params['R67']
-    R68 = params['R68']
-    return Rs + (R1/(1+w*1j*t_values[0])) + (R2 /(1+w*1j*t_values[1])) + (R3 /(1+w*1j*t_values[2])) + (R4 /(1+w*1j*t_values[3])) + (R5 /(1+w*1j*t_values[4])) + (R6 /(1+w*1j*t_values[5])) + (R7 /(1+w*1j*t_values[6])) + (R8 /(1+w*1j*t_values[7])) + (R9 /(1+w*1j*t_values[8])) + (R10 /(1+w*1j*t_values[9])) + (R11 /(1+w*1j*t_values[10])) + (R12 /(1+w*1j*t_values[11])) + (R13 /(1+w*1j*t_values[12])) + (R14 /(1+w*1j*t_values[13])) + (R15 /(1+w*1j*t_values[14])) + (R16 /(1+w*1j*t_values[15])) + (R17 /(1+w*1j*t_values[16])) + (R18 /(1+w*1j*t_values[17])) + (R19 /(1+w*1j*t_values[18])) + (R20 /(1+w*1j*t_values[19])) + (R21 /(1+w*1j*t_values[20])) + (R22 /(1+w*1j*t_values[21])) + (R23 /(1+w*1j*t_values[22])) + (R24 /(1+w*1j*t_values[23])) + (R25 /(1+w*1j*t_values[24])) + (R26 /(1+w*1j*t_values[25])) + (R27 /(1+w*1j*t_values[26])) + (R28 /(1+w*1j*t_values[27])) + (R29 /(1+w*1j*t_values[28])) + (R30 /(1+w*1j*t_values[29])) + (R31 /(1+w*1j*t_values[30])) + (R32 /(1+w*1j*t_values[31])) + (R33 /(1+w*1j*t_values[32])) + (R34 /(1+w*1j*t_values[33])) + (R35 /(1+w*1j*t_values[34]))  + (R36 /(1+w*1j*t_values[35])) + (R37 /(1+w*1j*t_values[36])) + (R38 /(1+w*1j*t_values[37])) + (R39 /(1+w*1j*t_values[38])) + (R40 /(1+w*1j*t_values[39])) + (R41 /(1+w*1j*t_values[40])) + (R42 /(1+w*1j*t_values[41])) + (R43 /(1+w*1j*t_values[42])) + (R44 /(1+w*1j*t_values[43])) + (R45 /(1+w*1j*t_values[44])) + (R46 /(1+w*1j*t_values[45])) + (R47 /(1+w*1j*t_values[46])) + (R48 /(1+w*1j*t_values[47])) + (R49 /(1+w*1j*t_values[48])) + (R50 /(1+w*1j*t_values[49])) + (R51 /(1+w*1j*t_values[50])) + (R52 /(1+w*1j*t_values[51])) + (R53 /(1+w*1j*t_values[52])) + (R54 /(1+w*1j*t_values[53])) + (R55 /(1+w*1j*t_values[54])) + (R56 /(1+w*1j*t_values[55])) + (R57 /(1+w*1j*t_values[56])) + (R58 /(1+w*1j*t_values[57])) + (R59 /(1+w*1j*t_values[58])) + (R60 /(1+w*1j*t_values[59])) + (R61 /(1+w*1j*t_values[60])) + (R62 /(1+w*1j*t_values[61])) + (R63 /(1+w*1j*t_values[62])) + (R64 /(1+w*1j*t_values[63])) + (R65 /(1+w*1j*t_values[64])) + (R66 /(1+w*1j*t_values[65])) + (R67 /(1+w*1j*t_values[66])) + (R68 /(1+w*1j*t_values[67]))
-
-def KK_RC69_fit(params, w, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    Rs = params['Rs']
-    R1 = params['R1']
-    R2 = params['R2']
-    R3 = params['R3']
-    R4 = params['R4']
-    R5 = params['R5']
-    R6 = params['R6']
-    R7 = params['R7']
-    R8 = params['R8']
-    R9 = params['R9']
-    R10 = params['R10']
-    R11 = params['R11']
-    R12 = params['R12']
-    R13 = params['R13']
-    R14 = params['R14']
-    R15 = params['R15']
-    R16 = params['R16']
-    R17 = params['R17']
-    R18 = params['R18']
-    R19 = params['R19']
-    R20 = params['R20']
-    R21 = params['R21']
-    R22 = params['R22']
-    R23 = params['R23']
-    R24 = params['R24']
-    R25 = params['R25']
-    R26 = params['R26']
-    R27 = params['R27']
-    R28 = params['R28']
-    R29 = params['R29']
-    R30 = params['R30']
-    R31 = params['R31']
-    R32 = params['R32']
-    R33 = params['R33']
-    R34 = params['R34']
-    R35 = params['R35']
-    R36 = params['R36']
-    R37 = params['R37']
-    R38 = params['R38']
-    R39 = params['R39']
-    R40 = params['R40']
-    R41 = params['R41']
-    R42 = params['R42']
-    R43 = params['R43']
-    R44 = params['R44']
-    R45 = params['R45']
-    R46 = params['R46']
-    R47 = params['R47']
-    R48 = params['R48']
-    R49 = params['R49']
-    R50 = params['R50']
-    R51 = params['R51']
-    R52 = params['R52']
-    R53 = params['R53']
-    R54 = params['R54']
-    R55 = params['R55']
-    R56 = params['R56']
-    R57 = params['R57']
-    R58 = params['R58']
-    R59 = params['R59']
-    R60 = params['R60']
-    R61 = params['R61']
-    R62 = params['R62']
-    R63 = params['R63']
-    R64 = params['R64']
-    R65 = params['R65']
-    R66 = params['R66']
-    R67 = params['R67']
-    R68 = params['R68']
-    R69 = params['R69']
-    return Rs + (R1/(1+w*1j*t_values[0])) + (R2 /(1+w*1j*t_values[1])) + (R3 /(1+w*1j*t_values[2])) + (R4 /(1+w*1j*t_values[3])) + (R5 /(1+w*1j*t_values[4])) + (R6 /(1+w*1j*t_values[5])) + (R7 /(1+w*1j*t_values[6])) + (R8 /(1+w*1j*t_values[7])) + (R9 /(1+w*1j*t_values[8])) + (R10 /(1+w*1j*t_values[9])) + (R11 /(1+w*1j*t_values[10])) + (R12 /(1+w*1j*t_values[11])) + (R13 /(1+w*1j*t_values[12])) + (R14 /(1+w*1j*t_values[13])) + (R15 /(1+w*1j*t_values[14])) + (R16 /(1+w*1j*t_values[15])) + (R17 /(1+w*1j*t_values[16])) + (R18 /(1+w*1j*t_values[17])) + (R19 /(1+w*1j*t_values[18])) + (R20 /(1+w*1j*t_values[19])) + (R21 /(1+w*1j*t_values[20])) + (R22 /(1+w*1j*t_values[21])) + (R23 /(1+w*1j*t_values[22])) + (R24 /(1+w*1j*t_values[23])) + (R25 /(1+w*1j*t_values[24])) + (R26 /(1+w*1j*t_values[25])) + (R27 /(1+w*1j*t_values[26])) + (R28 /(1+w*1j*t_values[27])) + (R29 /(1+w*1j*t_values[28])) + (R30 /(1+w*1j*t_values[29])) + (R31 /(1+w*1j*t_values[30])) + (R32 /(1+w*1j*t_values[31])) + (R33 /(1+w*1j*t_values[32])) + (R34 /(1+w*1j*t_values[33])) + (R35 /(1+w*1j*t_values[34]))  + (R36 /(1+w*1j*t_values[35])) + (R37 /(1+w*1j*t_values[36])) + (R38 /(1+w*1j*t_values[37])) + (R39 /(1+w*1j*t_values[38])) + (R40 /(1+w*1j*t_values[39])) + (R41 /(1+w*1j*t_values[40])) + (R42 /(1+w*1j*t_values[41])) + (R43 /(1+w*1j*t_values[42])) + (R44 /(1+w*1j*t_values[43])) + (R45 /(1+w*1j*t_values[44])) + (R46 /(1+w*1j*t_values[45])) + (R47 /(1+w*1j*t_values[46])) + (R48 /(1+w*1j*t_values[47])) + (R49 /(1+w*1j*t_values[48])) + (R50 /(1+w*1j*t_values[49])) + (R51 /(1+w*1j*t_values[50])) + (R52 /(1+w*1j*t_values[51])) + (R53 /(1+w*1j*t_values[52])) + (R54 /(1+w*1j*t_values[53])) + (R55 /(1+w*1j*t_values[54])) + (R56 /(1+w*1j*t_values[55])) + (R57 /(1+w*1j*t_values[56])) + (R58 /(1+w*1j*t_values[57])) + (R59 /(1+w*1j*t_values[58])) + (R60 /(1+w*1j*t_values[59])) + (R61 /(1+w*1j*t_values[60])) + (R62 /(1+w*1j*t_values[61])) + (R63 /(1+w*1j*t_values[62])) + (R64 /(1+w*1j*t_values[63])) + (R65 /(1+w*1j*t_values[64])) + (R66 /(1+w*1j*t_values[65])) + (R67 /(1+w*1j*t_values[66])) + (R68 /(1+w*1j*t_values[67])) + (R69 /(1+w*1j*t_values[68]))
-
-def KK_RC70_fit(params, w, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    Rs = params['Rs']
-    R1 = params['R1']
-    R2 = params['R2']
-    R3 = params['R3']
-    R4 = params['R4']
-    R5 = params['R5']
-    R6 = params['R6']
-    R7 = params['R7']
-    R8 = params['R8']
-    R9 = params['R9']
-    R10 = params['R10']
-    R11 = params['R11']
-    R12 = params['R12']
-    R13 = params['R13']
-    R14 = params['R14']
-    R15 = params['R15']
-    R16 = params['R16']
-    R17 = params['R17']
-    R18 = params['R18']
-    R19 = params['R19']
-    R20 = params['R20']
-    R21 = params['R21']
-    R22 = params['R22']
-    R23 = params['R23']
-    R24 = params['R24']
-    R25 = params['R25']
-    R26 = params['R26']
-    R27 = params['R27']
-    R28 = params['R28']
-    R29 = params['R29']
-    R30 = params['R30']
-    R31 = params['R31']
-    R32 = params['R32']
-    R33 = params['R33']
-    R34 = params['R34']
-    R35 = params['R35']
-    R36 = params['R36']
-    R37 = params['R37']
-    R38 = params['R38']
-    R39 = params['R39']
-    R40 = params['R40']
-    R41 = params['R41']
-    R42 = params['R42']
-    R43 = params['R43']
-    R44 = params['R44']
-    R45 = params['R45']
-    R46 = params['R46']
-    R47 = params['R47']
-    R48 = params['R48']
-    R49 = params['R49']
-    R50 = params['R50']
-    R51 = params['R51']
-    R52 = params['R52']
-    R53 = params['R53']
-    R54 = params['R54']
-    R55 = params['R55']
-    R56 = params['R56']
-    R57 = params['R57']
-    R58 = params['R58']
-    R59 = params['R59']
-    R60 = params['R60']
-    R61 = params['R61']
-    R62 = params['R62']
-    R63 = params['R63']
-    R64 = params['R64']
-    R65 = params['R65']
-    R66 = params['R66']
-    R67 = params['R67']
-    R68 = params['R68']
-    R69 = params['R69']
-    R70 = params['R70']
-    return Rs + (R1/(1+w*1j*t_values[0])) + (R2 /(1+w*1j*t_values[1])) + (R3 /(1+w*1j*t_values[2])) + (R4 /(1+w*1j*t_values[3])) + (R5 /(1+w*1j*t_values[4])) + (R6 /(1+w*1j*t_values[5])) + (R7 /(1+w*1j*t_values[6])) + (R8 /(1+w*1j*t_values[7])) + (R9 /(1+w*1j*t_values[8])) + (R10 /(1+w*1j*t_values[9])) + (R11 /(1+w*1j*t_values[10])) + (R12 /(1+w*1j*t_values[11])) + (R13 /(1+w*1j*t_values[12])) + (R14 /(1+w*1j*t_values[13])) + (R15 /(1+w*1j*t_values[14])) + (R16 /(1+w*1j*t_values[15])) + (R17 /(1+w*1j*t_values[16])) + (R18 /(1+w*1j*t_values[17])) + (R19 /(1+w*1j*t_values[18])) + (R20 /(1+w*1j*t_values[19])) + (R21 /(1+w*1j*t_values[20])) + (R22 /(1+w*1j*t_values[21])) + (R23 /(1+w*1j*t_values[22])) + (R24 /(1+w*1j*t_values[23])) + (R25 /(1+w*1j*t_values[24])) + (R26 /(1+w*1j*t_values[25])) + (R27 /(1+w*1j*t_values[26])) + (R28 /(1+w*1j*t_values[27])) + (R29 /(1+w*1j*t_values[28])) + (R30 /(1+w*1j*t_values[29])) + (R31 /(1+w*1j*t_values[30])) + (R32 /(1+w*1j*t_values[31])) + (R33 /(1+w*1j*t_values[32])) + (R34 /(1+w*1j*t_values[33])) + (R35 /(1+w*1j*t_values[34]))  + (R36 /(1+w*1j*t_values[35])) + (R37 /(1+w*1j*t_values[36])) + (R38 /(1+w*1j*t_values[37])) + (R39 /(1+w*1j*t_values[38])) + (R40 /(1+w*1j*t_values[39])) + (R41 /(1+w*1j*t_values[40])) + (R42 /(1+w*1j*t_values[41])) + (R43 /(1+w*1j*t_values[42])) + (R44 /(1+w*1j*t_values[43])) + (R45 /(1+w*1j*t_values[44])) + (R46 /(1+w*1j*t_values[45])) + (R47 /(1+w*1j*t_values[46])) + (R48 /(1+w*1j*t_values[47])) + (R49 /(1+w*1j*t_values[48])) + (R50 /(1+w*1j*t_values[49])) + (R51 /(1+w*1j*t_values[50])) + (R52 /(1+w*1j*t_values[51])) + (R53 /(1+w*1j*t_values[52])) + (R54 /(1+w*1j*t_values[53])) + (R55 /(1+w*1j*t_values[54])) + (R56 /(1+w*1j*t_values[55])) + (R57 /(1+w*1j*t_values[56])) + (R58 /(1+w*1j*t_values[57])) + (R59 /(1+w*1j*t_values[58])) + (R60 /(1+w*1j*t_values[59])) + (R61 /(1+w*1j*t_values[60])) + (R62 /(1+w*1j*t_values[61])) + (R63 /(1+w*1j*t_values[62])) + (R64 /(1+w*1j*t_values[63])) + (R65 /(1+w*1j*t_values[64])) + (R66 /(1+w*1j*t_values[65])) + (R67 /(1+w*1j*t_values[66])) + (R68 /(1+w*1j*t_values[67])) + (R69 /(1+w*1j*t_values[68])) + (R70 /(1+w*1j*t_values[69]))    
-
-def KK_RC71_fit(params, w, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    Rs = params['Rs']
-    R1 = params['R1']
-    R2 = params['R2']
-    R3 = params['R3']
-    R4 = params['R4']
-    R5 = params['R5']
-    R6 = params['R6']
-    R7 = params['R7']
-    R8 = params['R8']
-    R9 = params['R9']
-    R10 = params['R10']
-    R11 = params['R11']
-    R12 = params['R12']
-    R13 = params['R13']
-    R14 = params['R14']
-    R15 = params['R15']
-    R16 = params['R16']
-    R17 = params['R17']
-    R18 = params['R18']
-    R19 = params['R19']
-    R20 = params['R20']
-    R21 = params['R21']
-    R22 = params['R22']
-    R23 = params['R23']
-    R24 = params['R24']
-    R25 = params['R25']
-    R26 = params['R26']
-    R27 = params['R27']
-    R28 = params['R28']
-    R29 = params['R29']
-    R30 = params['R30']
-    R31 = params['R31']
-    R32 = params['R32']
-    R33 = params['R33']
-    R34 = params['R34']
-    R35 = params['R35']
-    R36 = params['R36']
-    R37 = params['R37']
-    R38 = params['R38']
-    R39 = params['R39']
-    R40 = params['R40']
-    R41 = params['R41']
-    R42 = params['R42']
-    R43 = params['R43']
-    R44 = params['R44']
-    R45 = params['R45']
-    R46 = params['R46']
-    R47 = params['R47']
-    R48 = params['R48']
-    R49 = params['R49']
-    R50 = params['R50']
-    R51 = params['R51']
-    R52 = params['R52']
-    R53 = params['R53']
-    R54 = params['R54']
-    R55 = params['R55']
-    R56 = params['R56']
-    R57 = params['R57']
-    R58 = params['R58']
-    R59 = params['R59']
-    R60 = params['R60']
-    R61 = params['R61']
-    R62 = params['R62']
-    R63 = params['R63']
-    R64 = params['R64']
-    R65 = params['R65']
-    R66 = params['R66']
-    R67 = params['R67']
-    R68 = params['R68']
-    R69 = params['R69']
-    R70 = params['R70']
-    R71 = params['R71']
-    return Rs + (R1/(1+w*1j*t_values[0])) + (R2 /(1+w*1j*t_values[1])) + (R3 /(1+w*1j*t_values[2])) + (R4 /(1+w*1j*t_values[3])) + (R5 /(1+w*1j*t_values[4])) + (R6 /(1+w*1j*t_values[5])) + (R7 /(1+w*1j*t_values[6])) + (R8 /(1+w*1j*t_values[7])) + (R9 /(1+w*1j*t_values[8])) + (R10 /(1+w*1j*t_values[9])) + (R11 /(1+w*1j*t_values[10])) + (R12 /(1+w*1j*t_values[11])) + (R13 /(1+w*1j*t_values[12])) + (R14 /(1+w*1j*t_values[13])) + (R15 /(1+w*1j*t_values[14])) + (R16 /(1+w*1j*t_values[15])) + (R17 /(1+w*1j*t_values[16])) + (R18 /(1+w*1j*t_values[17])) + (R19 /(1+w*1j*t_values[18])) + (R20 /(1+w*1j*t_values[19])) + (R21 /(1+w*1j*t_values[20])) + (R22 /(1+w*1j*t_values[21])) + (R23 /(1+w*1j*t_values[22])) + (R24 /(1+w*1j*t_values[23])) + (R25 /(1+w*1j*t_values[24])) + (R26 /(1+w*1j*t_values[25])) + (R27 /(1+w*1j*t_values[26])) + (R28 /(1+w*1j*t_values[27])) + (R29 /(1+w*1j*t_values[28])) + (R30 /(1+w*1j*t_values[29])) + (R31 /(1+w*1j*t_values[30])) + (R32 /(1+w*1j*t_values[31])) + (R33 /(1+w*1j*t_values[32])) + (R34 /(1+w*1j*t_values[33])) + (R35 /(1+w*1j*t_values[34]))  + (R36 /(1+w*1j*t_values[35])) + (R37 /(1+w*1j*t_values[36])) + (R38 /(1+w*1j*t_values[37])) + (R39 /(1+w*1j*t_values[38])) + (R40 /(1+w*1j*t_values[39])) + (R41 /(1+w*1j*t_values[40])) + (R42 /(1+w*1j*t_values[41])) + (R43 /(1+w*1j*t_values[42])) + (R44 /(1+w*1j*t_values[43])) + (R45 /(1+w*1j*t_values[44])) + (R46 /(1+w*1j*t_values[45])) + (R47 /(1+w*1j*t_values[46])) + (R48 /(1+w*1j*t_values[47])) + (R49 /(1+w*1j*t_values[48])) + (R50 /(1+w*1j*t_values[49])) + (R51 /(1+w*1j*t_values[50])) + (R52 /(1+w*1j*t_values[51])) + (R53 /(1+w*1j*t_values[52])) + (R54 /(1+w*1j*t_values[53])) + (R55 /(1+w*1j*t_values[54])) + (R56 /(1+w*1j*t_values[55])) + (R57 /(1+w*1j*t_values[56])) + (R58 /(1+w*1j*t_values[57])) + (R59 /(1+w*1j*t_values[58])) + (R60 /(1+w*1j*t_values[59])) + (R61 /(1+w*1j*t_values[60])) + (R62 /(1+w*1j*t_values[61])) + (R63 /(1+w*1j*t_values[62])) + (R64 /(1+w*1j*t_values[63])) + (R65 /(1+w*1j*t_values[64])) + (R66 /(1+w*1j*t_values[65])) + (R67 /(1+w*1j*t_values[66])) + (R68 /(1+w*1j*t_values[67])) + (R69 /(1+w*1j*t_values[68])) + (R70 /(1+w*1j*t_values[69])) + (R71 /(1+w*1j*t_values[70]))    
-
-def KK_RC72_fit(params, w, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    Rs = params['Rs']
-    R1 = params['R1']
-    R2 = params['R2']
-    R3 = params['R3']
-    R4 = params['R4']
-    R5 = params['R5']
-    R6 = params['R6']
-    R7 = params['R7']
-    R8 = params['R8']
-    R9 = params['R9']
-    R10 = params['R10']
-    R11 = params['R11']
-    R12 = params['R12']
-    R13 = params['R13']
-    R14 = params['R14']
-    R15 = params['R15']
-    R16 = params['R16']
-    R17 = params['R17']
-    R18 = params['R18']
-    R19 = params['R19']
-    R20 = params['R20']
-    R21 = params['R21']
-    R22 = params['R22']
-    R23 = params['R23']
-    R24 = params['R24']
-    R25 = params['R25']
-    R26 = params['R26']
-    R27 = params['R27']
-    R28 = params['R28']
-    R29 = params['R29']
-    R30 = params['R30']
-    R31 = params['R31']
-    R32 = params['R32']
-    R33 = params['R33']
-    R34 = params['R34']
-    R35 = params['R35']
-    R36 = params['R36']
-    R37 = params['R37']
-    R38 = params['R38']
-    R39 = params['R39']
-    R40 = params['R40']
-    R41 = params['R41']
-    R42 = params['R42']
-    R43 = params['R43']
-    R44 = params['R44']
-    R45 = params['R45']
-    R46 = params['R46']
-    R47 = params['R47']
-    R48 = params['R48']
-    R49 = params['R49']
-    R50 = params['R50']
-    R51 = params['R51']
-    R52 = params['R52']
-    R53 = params['R53']
-    R54 = params['R54']
-    R55 = params['R55']
-    R56 = params['R56']
-    R57 = params['R57']
-    R58 = params['R58']
-    R59 = params['R59']
-    R60 = params['R60']
-    R61 = params['R61']
-    R62 = params['R62']
-    R63 = params['R63']
-    R64 = params['R64']
-    R65 = params['R65']
-    R66 = params['R66']
-    R67 = params['R67']
-    R68 = params['R68']
-    R69 = params['R69']
-    R70 = params['R70']
-    R71 = params['R71']
-    R72 = params['R72']
-    return Rs + (R1/(1+w*1j*t_values[0])) + (R2 /(1+w*1j*t_values[1])) + (R3 /(1+w*1j*t_values[2])) + (R4 /(1+w*1j*t_values[3])) + (R5 /(1+w*1j*t_values[4])) + (R6 /(1+w*1j*t_values[5])) + (R7 /(1+w*1j*t_values[6])) + (R8 /(1+w*1j*t_values[7])) + (R9 /(1+w*1j*t_values[8])) + (R10 /(1+w*1j*t_values[9])) + (R11 /(1+w*1j*t_values[10])) + (R12 /(1+w*1j*t_values[11])) + (R13 /(1+w*1j*t_values[12])) + (R14 /(1+w*1j*t_values[13])) + (R15 /(1+w*1j*t_values[14])) + (R16 /(1+w*1j*t_values[15])) + (R17 /(1+w*1j*t_values[16])) + (R18 /(1+w*1j*t_values[17])) + (R19 /(1+w*1j*t_values[18])) + (R20 /(1+w*1j*t_values[19])) + (R21 /(1+w*1j*t_values[20])) + (R22 /(1+w*1j*t_values[21])) + (R23 /(1+w*1j*t_values[22])) + (R24 /(1+w*1j*t_values[23])) + (R25 /(1+w*1j*t_values[24])) + (R26 /(1+w*1j*t_values[25])) + (R27 /(1+w*1j*t_values[26])) + (R28 /(1+w*1j*t_values[27])) + (R29 /(1+w*1j*t_values[28])) + (R30 /(1+w*1j*t_values[29])) + (R31 /(1+w*1j*t_values[30])) + (R32 /(1+w*1j*t_values[31])) + (R33 /(1+w*1j*t_values[32])) + (R34 /(1+w*1j*t_values[33])) + (R35 /(1+w*1j*t_values[34]))  + (R36 /(1+w*1j*t_values[35])) + (R37 /(1+w*1j*t_values[36])) + (R38 /(1+w*1j*t_values[37])) + (R39 /(1+w*1j*t_values[38])) + (R40 /(1+w*1j*t_values[39])) + (R41 /(1+w*1j*t_values[40])) + (R42 /(1+w*1j*t_values[41])) + (R43 /(1+w*1j*t_values[42])) + (R44 /(1+w*1j*t_values[43])) + (R45 /(1+w*1j*t_values[44])) + (R46 /(1+w*1j*t_values[45])) + (R47 /(1+w*1j*t_values[46])) + (R48 /(1+w*1j*t_values[47])) + (R49 /(1+w*1j*t_values[48])) + (R50 /(1+w*1j*t_values[49])) + (R51 /(1+w*1j*t_values[50])) + (R52 /(1+w*1j*t_values[51])) + (R53 /(1+w*1j*t_values[52])) + (R54 /(1+w*1j*t_values[53])) + (R55 /(1+w*1j*t_values[54])) + (R56 /(1+w*1j*t_values[55])) + (R57 /(1+w*1j*t_values[56])) + (R58 /(1+w*1j*t_values[57])) + (R59 /(1+w*1j*t_values[58])) + (R60 /(1+w*1j*t_values[59])) + (R61 /(1+w*1j*t_values[60])) + (R62 /(1+w*1j*t_values[61])) + (R63 /(1+w*1j*t_values[62])) + (R64 /(1+w*1j*t_values[63])) + (R65 /(1+w*1j*t_values[64])) + (R66 /(1+w*1j*t_values[65])) + (R67 /(1+w*1j*t_values[66])) + (R68 /(1+w*1j*t_values[67])) + (R69 /(1+w*1j*t_values[68])) + (R70 /(1+w*1j*t_values[69])) + (R71 /(1+w*1j*t_values[70])) + (R72 /(1+w*1j*t_values[71]))
-
-def KK_RC73_fit(params, w, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    Rs = params['Rs']
-    R1 = params['R1']
-    R2 = params['R2']
-    R3 = params['R3']
-    R4 = params['R4']
-    R5 = params['R5']
-    R6 = params['R6']
-    R7 = params['R7']
-    R8 = params['R8']
-    R9 = params['R9']
-    R10 = params['R10']
-    R11 = params['R11']
-    R12 = params['R12']
-    R13 = params['R13']
-    R14 = params['R14']
-    R15 = params['R15']
-    R16 = params['R16']
-    R17 = params['R17']
-    R18 = params['R18']
-    R19 = params['R19']
-    R20 = params['R20']
-    R21 = params['R21']
-    R22 = params['R22']
-    R23 = params['R23']
-    R24 = params['R24']
-    R25 = params['R25']
-    R26 = params['R26']
-    R27 = params['R27']
-    R28 = params['R28']
-    R29 = params['R29']
-    R30 = params['R30']
-    R31 = params['R31']
-    R32 = params['R32']
-    R33 = params['R33']
-    R34 = params['R34']
-    R35 = params['R35']
-    R36 = params['R36']
-    R37 = params['R37']
-    R38 = params['R38']
-    R39 = params['R39']
-    R40 = params['R40']
-    R41 = params['R41']
-    R42 = params['R42']
-    R43 = params['R43']
-    R44 = params['R44']
-    R45 = params['R45']
-    R46 = params['R46']
-    R47 = params['R47']
-    R48 = params['R48']
-    R49 = params['R49']
-    R50 = params['R50']
-    R51 = params['R51']
-    R52 = params['R52']
-    R53 = params['R53']
-    R54 = params['R54']
-    R55 = params['R55']
-    R56 = params['R56']
-    R57 = params['R57']
-    R58 = params['R58']
-    R59 = params['R59']
-    R60 = params['R60']
-    R61 = params['R61']
-    R62 = params['R62']
-    R63 = params['R63']
-    R64 = params['R64']
-    R65 = params['R65']
-    R66 = params['R66']
-    R67 = params['R67']
-    R68 = params['R68']
-    R69 = params['R69']
-    R70 = params['R70']
-    R71 = params['R71']
-    R72 = params['R72']
-    R73 = params['R73']
-    return Rs + (R1/(1+w*1j*t_values[0])) + (R2 /(1+w*1j*t_values[1])) + (R3 /(1+w*1j*t_values[2])) + (R4 /(1+w*1j*t_values[3])) + (R5 /(1+w*1j*t_values[4])) + (R6 /(1+w*1j*t_values[5])) + (R7 /(1+w*1j*t_values[6])) + (R8 /(1+w*1j*t_values[7])) + (R9 /(1+w*1j*t_values[8])) + (R10 /(1+w*1j*t_values[9])) + (R11 /(1+w*1j*t_values[10])) + (R12 /(1+w*1j*t_values[11])) + (R13 /(1+w*1j*t_values[12])) + (R14 /(1+w*1j*t_values[13])) + (R15 /(1+w*1j*t_values[14])) + (R16 /(1+w*1j*t_values[15])) + (R17 /(1+w*1j*t_values[16])) + (R18 /(1+w*1j*t_values[17])) + (R19 /(1+w*1j*t_values[18])) + (R20 /(1+w*1j*t_values[19])) + (R21 /(1+w*1j*t_values[20])) + (R22 /(1+w*1j*t_values[21])) + (R23 /(1+w*1j*t_values[22])) + (R24 /(1+w*1j*t_values[23])) + (R25 /(1+w*1j*t_values[24])) + (R26 /(1+w*1j*t_values[25])) + (R27 /(1+w*1j*t_values[26])) + (R28 /(1+w*1j*t_values[27])) + (R29 /(1+w*1j*t_values[28])) + (R30 /(1+w*1j*t_values[29])) + (R31 /(1+w*1j*t_values[30])) + (R32 /(1+w*1j*t_values[31])) + (R33 /(1+w*1j*t_values[32])) + (R34 /(1+w*1j*t_values[33])) + (R35 /(1+w*1j*t_values[34]))  + (R36 /(1+w*1j*t_values[35])) + (R37 /(1+w*1j*t_values[36])) + (R38 /(1+w*1j*t_values[37])) + (R39 /(1+w*1j*t_values[38])) + (R40 /(1+w*1j*t_values[39])) + (R41 /(1+w*1j*t_values[40])) + (R42 /(1+w*1j*t_values[41])) + (R43 /(1+w*1j*t_values[42])) + (R44 /(1+w*1j*t_values[43])) + (R45 /(1+w*1j*t_values[44])) + (R46 /(1+w*1j*t_values[45])) + (R47 /(1+w*1j*t_values[46])) + (R48 /(1+w*1j*t_values[47])) + (R49 /(1+w*1j*t_values[48])) + (R50 /(1+w*1j*t_values[49])) + (R51 /(1+w*1j*t_values[50])) + (R52 /(1+w*1j*t_values[51])) + (R53 /(1+w*1j*t_values[52])) + (R54 /(1+w*1j*t_values[53])) + (R55 /(1+w*1j*t_values[54])) + (R56 /(1+w*1j*t_values[55])) + (R57 /(1+w*1j*t_values[56])) + (R58 /(1+w*1j*t_values[57])) + (R59 /(1+w*1j*t_values[58])) + (R60 /(1+w*1j*t_values[59])) + (R61 /(1+w*1j*t_values[60])) + (R62 /(1+w*1j*t_values[61])) + (R63 /(1+w*1j*t_values[62])) + (R64 /(1+w*1j*t_values[63])) + (R65 /(1+w*1j*t_values[64])) + (R66 /(1+w*1j*t_values[65])) + (R67 /(1+w*1j*t_values[66])) + (R68 /(1+w*1j*t_values[67])) + (R69 /(1+w*1j*t_values[68])) + (R70 /(1+w*1j*t_values[69])) + (R71 /(1+w*1j*t_values[70])) + (R72 /(1+w*1j*t_values[71])) + (R73 /(1+w*1j*t_values[72]))
-
-def KK_RC74_fit(params, w, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    Rs = params['Rs']
-    R1 = params['R1']
-    R2 = params['R2']
-    R3 = params['R3']
-    R4 = params['R4']
-    R5 = params['R5']
-    R6 = params['R6']
-    R7 = params['R7']
-    R8 = params['R8']
-    R9 = params['R9']
-    R10 = params['R10']
-    R11 = params['R11']
-    R12 = params['R12']
-    R13 = params['R13']
-    R14 = params['R14']
-    R15 = params['R15']
-    R16 = params['R16']
-    R17 = params['R17']
-    R18 = params['R18']
-    R19 = params['R19']
-    R20 = params['R20']
-    R21 = params['R21']
-    R22 = params['R22']
-    R23 = params['R23']
-    R24 = params['R24']
-    R25 = params['R25']
-    R26 = params['R26']
-    R27 = params['R27']
-    R28 = params['R28']
-    R29 = params['R29']
-    R30 = params['R30']
-    R31 = params['R31']
-    R32 = params['R32']
-    R33 = params['R33']
-    R34 = params['R34']
-    R35 = params['R35']
-    R36 = params['R36']
-    R37 = params['R37']
-    R38 = params['R38']
-    R39 = params['R39']
-    R40 = params['R40']
-    R41 = params['R41']
-    R42 = params['R42']
-    R43 = params['R43']
-    R44 = params['R44']
-    R45 = params['R45']
-    R46 = params['R46']
-    R47 = params['R47']
-    R48 = params['R48']
-    R49 = params['R49']
-    R50 = params['R50']
-    R51 = params['R51']
-    R52 = params['R52']
-    R53 = params['R53']
-    R54 = params['R54']
-    R55 = params['R55']
-    R56 = params['R56']
-    R57 = params['R57']
-    R58 = params['R58']
-    R59 = params['R59']
-    R60 = params['R60']
-    R61 = params['R61']
-    R62 = params['R62']
-    R63 = params['R63']
-    R64 = params['R64']
-    R65 = params['R65']
-    R66 = params['R66']
-    R67 = params['R67']
-    R68 = params['R68']
-    R69 = params['R69']
-    R70 = params['R70']
-    R71 = params['R71']
-    R72 = params['R72']
-    R73 = params['R73']
-    R74 = params['R74']
-    return Rs + (R1/(1+w*1j*t_values[0])) + (R2 /(1+w*1j*t_values[1])) + (R3 /(1+w*1j*t_values[2])) + (R4 /(1+w*1j*t_values[3])) + (R5 /(1+w*1j*t_values[4])) + (R6 /(1+w*1j*t_values[5])) + (R7 /(1+w*1j*t_values[6])) + (R8 /(1+w*1j*t_values[7])) + (R9 /(1+w*1j*t_values[8])) + (R10 /(1+w*1j*t_values[9])) + (R11 /(1+w*1j*t_values[10])) + (R12 /(1+w*1j*t_values[11])) + (R13 /(1+w*1j*t_values[12])) + (R14 /(1+w*1j*t_values[13])) + (R15 /(1+w*1j*t_values[14])) + (R16 /(1+w*1j*t_values[15])) + (R17 /(1+w*1j*t_values[16])) + (R18 /(1+w*1j*t_values[17])) + (R19 /(1+w*1j*t_values[18])) + (R20 /(1+w*1j*t_values[19])) + (R21 /(1+w*1j*t_values[20])) + (R22 /(1+w*1j*t_values[21])) + (R23 /(1+w*1j*t_values[22])) + (R24 /(1+w*1j*t_values[23])) + (R25 /(1+w*1j*t_values[24])) + (R26 /(1+w*1j*t_values[25])) + (R27 /(1+w*1j*t_values[26])) + (R28 /(1+w*1j*t_values[27])) + (R29 /(1+w*1j*t_values[28])) + (R30 /(1+w*1j*t_values[29])) + (R31 /(1+w*1j*t_values[30])) + (R32 /(1+w*1j*t_values[31])) + (R33 /(1+w*1j*t_values[32])) + (R34 /(1+w*1j*t_values[33])) + (R35 /(1+w*1j*t_values[34]))  + (R36 /(1+w*1j*t_values[35])) + (R37 /(1+w*1j*t_values[36])) + (R38 /(1+w*1j*t_values[37])) + (R39 /(1+w*1j*t_values[38])) + (R40 /(1+w*1j*t_values[39])) + (R41 /(1+w*1j*t_values[40])) + (R42 /(1+w*1j*t_values[41])) + (R43 /(1+w*1j*t_values[42])) + (R44 /(1+w*1j*t_values[43])) + (R45 /(1+w*1j*t_values[44])) + (R46 /(1+w*1j*t_values[45])) + (R47 /(1+w*1j*t_values[46])) + (R48 /(1+w*1j*t_values[47])) + (R49 /(1+w*1j*t_values[48])) + (R50 /(1+w*1j*t_values[49])) + (R51 /(1+w*1j*t_values[50])) + (R52 /(1+w*1j*t_values[51])) + (R53 /(1+w*1j*t_values[52])) + (R54 /(1+w*1j*t_values[53])) + (R55 /(1+w*1j*t_values[54])) + (R56 /(1+w*1j*t_values[55])) + (R57 /(1+w*1j*t_values[56])) + (R58 /(1+w*1j*t_values[57])) + (R59 /(1+w*1j*t_values[58])) + (R60 /(1+w*1j*t_values[59])) + (R61 /(1+w*1j*t_values[60])) + (R62 /(1+w*1j*t_values[61])) + (R63 /(1+w*1j*t_values[62])) + (R64 /(1+w*1j*t_values[63])) + (R65 /(1+w*1j*t_values[64])) + (R66 /(1+w*1j*t_values[65])) + (R67 /(1+w*1j*t_values[66])) + (R68 /(1+w*1j*t_values[67])) + (R69 /(1+w*1j*t_values[68])) + (R70 /(1+w*1j*t_values[69])) + (R71 /(1+w*1j*t_values[70])) + (R72 /(1+w*1j*t_values[71])) + (R73 /(1+w*1j*t_values[72])) + (R74 /(1+w*1j*t_values[73]))
-
-def KK_RC75_fit(params, w, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    Rs = params['Rs']
-    R1 = params['R1']
-    R2 = params['R2']
-    R3 = params['R3']
-    R4 = params['R4']
-    R5 = params['R5']
-    R6 = params['R6']
-    R7 = params['R7']
-    R8 = params['R8']
-    R9 = params['R9']
-    R10 = params['R10']
-    R11 = params['R11']
-    R12 = params['R12']
-    R13 = params['R13']
-    R14 = params['R14']
-    R15 = params['R15']
-    R16 = params['R16']
-    R17 = params['R17']
-    R18 = params['R18']
-    R19 = params['R19']
-    R20 = params['R20']
-    R21 = params['R21']
-    R22 = params['R22']
-    R23 = params['R23']
-    R24 = params['R24']
-    R25 = params['R25']
-    R26 = params['R26']
-    R27 = params['R27']
-    R28 = params['R28']
-    R29 = params['R29']
-    R30 = params['R30']
-    R31 = params['R31']
-    R32 = params['R32']
-    R33 = params['R33']
-    R34 = params['R34']
-    R35 = params['R35']
-    R36 = params['R36']
-    R37 = params['R37']
-    R38 = params['R38']
-    R39 = params['R39']
-    R40 = params['R40']
-    R41 = params['R41']
-    R42 = params['R42']
-    R43 = params['R43']
-    R44 = params['R44']
-    R45 = params['R45']
-    R46 = params['R46']
-    R47 = params['R47']
-    R48 = params['R48']
-    R49 = params['R49']
-    R50 = params['R50']
-    R51 = params['R51']
-    R52 = params['R52']
-    R53 = params['R53']
-    R54 = params['R54']
-    R55 = params['R55']
-    R56 = params['R56']
-    R57 = params['R57']
-    R58 = params['R58']
-    R59 = params['R59']
-    R60 = params['R60']
-    R61 = params['R61']
-    R62 = params['R62']
-    R63 = params['R63']
-    R64 = params['R64']
-    R65 = params['R65']
-    R66 = params['R66']
-    R67 = params['R67']
-    R68 = params['R68']
-    R69 = params['R69']
-    R70 = params['R70']
-    R71 = params['R71']
-    R72 = params['R72']
-    R73 = params['R73']
-    R74 = params['R74']
-    R75 = params['R75']
-    return Rs + (R1/(1+w*1j*t_values[0])) + (R2 /(1+w*1j*t_values[1])) + (R3 /(1+w*1j*t_values[2])) + (R4 /(1+w*1j*t_values[3])) + (R5 /(1+w*1j*t_values[4])) + (R6 /(1+w*1j*t_values[5])) + (R7 /(1+w*1j*t_values[6])) + (R8 /(1+w*1j*t_values[7])) + (R9 /(1+w*1j*t_values[8])) + (R10 /(1+w*1j*t_values[9])) + (R11 /(1+w*1j*t_values[10])) + (R12 /(1+w*1j*t_values[11])) + (R13 /(1+w*1j*t_values[12])) + (R14 /(1+w*1j*t_values[13])) + (R15 /(1+w*1j*t_values[14])) + (R16 /(1+w*1j*t_values[15])) + (R17 /(1+w*1j*t_values[16])) + (R18 /(1+w*1j*t_values[17])) + (R19 /(1+w*1j*t_values[18])) + (R20 /(1+w*1j*t_values[19])) + (R21 /(1+w*1j*t_values[20])) + (R22 /(1+w*1j*t_values[21])) + (R23 /(1+w*1j*t_values[22])) + (R24 /(1+w*1j*t_values[23])) + (R25 /(1+w*1j*t_values[24])) + (R26 /(1+w*1j*t_values[25])) + (R27 /(1+w*1j*t_values[26])) + (R28 /(1+w*1j*t_values[27])) + (R29 /(1+w*1j*t_values[28])) + (R30 /(1+w*1j*t_values[29])) + (R31 /(1+w*1j*t_values[30])) + (R32 /(1+w*1j*t_values[31])) + (R33 /(1+w*1j*t_values[32])) + (R34 /(1+w*1j*t_values[33])) + (R35 /(1+w*1j*t_values[34]))  + (R36 /(1+w*1j*t_values[35])) + (R37 /(1+w*1j*t_values[36])) + (R38 /(1+w*1j*t_values[37])) + (R39 /(1+w*1j*t_values[38])) + (R40 /(1+w*1j*t_values[39])) + (R41 /(1+w*1j*t_values[40])) + (R42 /(1+w*1j*t_values[41])) + (R43 /(1+w*1j*t_values[42])) + (R44 /(1+w*1j*t_values[43])) + (R45 /(1+w*1j*t_values[44])) + (R46 /(1+w*1j*t_values[45])) + (R47 /(1+w*1j*t_values[46])) + (R48 /(1+w*1j*t_values[47])) + (R49 /(1+w*1j*t_values[48])) + (R50 /(1+w*1j*t_values[49])) + (R51 /(1+w*1j*t_values[50])) + (R52 /(1+w*1j*t_values[51])) + (R53 /(1+w*1j*t_values[52])) + (R54 /(1+w*1j*t_values[53])) + (R55 /(1+w*1j*t_values[54])) + (R56 /(1+w*1j*t_values[55])) + (R57 /(1+w*1j*t_values[56])) + (R58 /(1+w*1j*t_values[57])) + (R59 /(1+w*1j*t_values[58])) + (R60 /(1+w*1j*t_values[59])) + (R61 /(1+w*1j*t_values[60])) + (R62 /(1+w*1j*t_values[61])) + (R63 /(1+w*1j*t_values[62])) + (R64 /(1+w*1j*t_values[63])) + (R65 /(1+w*1j*t_values[64])) + (R66 /(1+w*1j*t_values[65])) + (R67 /(1+w*1j*t_values[66])) + (R68 /(1+w*1j*t_values[67])) + (R69 /(1+w*1j*t_values[68])) + (R70 /(1+w*1j*t_values[69])) + (R71 /(1+w*1j*t_values[70])) + (R72 /(1+w*1j*t_values[71])) + (R73 /(1+w*1j*t_values[72])) + (R74 /(1+w*1j*t_values[73])) + (R75 /(1+w*1j*t_values[74]))
-
-def KK_RC76_fit(params, w, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    Rs = params['Rs']
-    R1 = params['R1']
-    R2 = params['R2']
-    R3 = params['R3']
-    R4 = params['R4']
-    R5 = params['R5']
-    R6 = params['R6']
-    R7 = params['R7']
-    R8 = params['R8']
-    R9 = params['R9']
-    R10 = params['R10']
-    R11 = params['R11']
-    R12 = params['R12']
-    R13 = params['R13']
-    R14 = params['R14']
-    R15 = params['R15']
-    R16 = params['R16']
-    R17 = params['R17']
-    R18 = params['R18']
-    R19 = params['R19']
-    R20 = params['R20']
-    R21 = params['R21']
-    R22 = params['R22']
-    R23 = params['R23']
-    R24 = params['R24']
-    R25 = params['R25']
-    R26 = params['R26']
-    R27 = params['R27']
-    R28 = params['R28']
-    R29 = params['R29']
-    R30 = params['R30']
-    R31 = params['R31']
-    R32 = params['R32']
-    R33 = params['R33']
-    R34 = params['R34']
-    R35 = params['R35']
-    R36 = params['R36']
-    R37 = params['R37']
-    R38 = params['R38']
-    R39 = params['R39']
-    R40 = params['R40']
-    R41 = params['R41']
-    R42 = params['R42']
-    R43 = params['R43']
-    R44 = params['R44']
-    R45 = params['R45']
-    R46 = params['R46']
-    R47 = params['R47']
-    R48 = params['R48']
-    R49 = params['R49']
-    R50 = params['R50']
-    R51 = params['R51']
-    R52 = params['R52']
-    R53 = params['R53']
-    R54 = params['R54']
-    R55 = params['R55']
-    R56 = params['R56']
-    R57 = params['R57']
-    R58 = params['R58']
-    R59 = params['R59']
-    R60 = params['R60']
-    R61 = params['R61']
-    R62 = params['R62']
-    R63 = params['R63']
-    R64 = params['R64']
-    R65 = params['R65']
-    R66 = params['R66']
-    R67 = params['R67']
-    R68 = params['R68']
-    R69 = params['R69']
-    R70 = params['R70']
-    R71 = params['R71']
-    R72 = params['R72']
-    R73 = params['R73']
-    R74 = params['R74']
-    R75 = params['R75']
-    R76 = params['R76']
-    return Rs + (R1/(1+w*1j*t_values[0])) + (R2 /(1+w*1j*t_values[1])) + (R3 /(1+w*1j*t_values[2])) + (R4 /(1+w*1j*t_values[3])) + (R5 /(1+w*1j*t_values[4])) + (R6 /(1+w*1j*t_values[5])) + (R7 /(1+w*1j*t_values[6])) + (R8 /(1+w*1j*t_values[7])) + (R9 /(1+w*1j*t_values[8])) + (R10 /(1+w*1j*t_values[9])) + (R11 /(1+w*1j*t_values[10])) + (R12 /(1+w*1j*t_values[11])) + (R13 /(1+w*1j*t_values[12])) + (R14 /(1+w*1j*t_values[13])) + (R15 /(1+w*1j*t_values[14])) + (R16 /(1+w*1j*t_values[15])) + (R17 /(1+w*1j*t_values[16])) + (R18 /(1+w*1j*t_values[17])) + (R19 /(1+w*1j*t_values[18])) + (R20 /(1+w*1j*t_values[19])) + (R21 /(1+w*1j*t_values[20])) + (R22 /(1+w*1j*t_values[21])) + (R23 /(1+w*1j*t_values[22])) + (R24 /(1+w*1j*t_values[23])) + (R25 /(1+w*1j*t_values[24])) + (R26 /(1+w*1j*t_values[25])) + (R27 /(1+w*1j*t_values[26])) + (R28 /(1+w*1j*t_values[27])) + (R29 /(1+w*1j*t_values[28])) + (R30 /(1+w*1j*t_values[29])) + (R31 /(1+w*1j*t_values[30])) + (R32 /(1+w*1j*t_values[31])) + (R33 /(1+w*1j*t_values[32])) + (R34 /(1+w*1j*t_values[33])) + (R35 /(1+w*1j*t_values[34]))  + (R36 /(1+w*1j*t_values[35])) + (R37 /(1+w*1j*t_values[36])) + (R38 /(1+w*1j*t_values[37])) + (R39 /(1+w*1j*t_values[38])) + (R40 /(1+w*1j*t_values[39])) + (R41 /(1+w*1j*t_values[40])) + (R42 /(1+w*1j*t_values[41])) + (R43 /(1+w*1j*t_values[42])) + (R44 /(1+w*1j*t_values[43])) + (R45 /(1+w*1j*t_values[44])) + (R46 /(1+w*1j*t_values[45])) + (R47 /(1+w*1j*t_values[46])) + (R48 /(1+w*1j*t_values[47])) + (R49 /(1+w*1j*t_values[48])) + (R50 /(1+w*1j*t_values[49])) + (R51 /(1+w*1j*t_values[50])) + (R52 /(1+w*1j*t_values[51])) + (R53 /(1+w*1j*t_values[52])) + (R54 /(1+w*1j*t_values[53])) + (R55 /(1+w*1j*t_values[54])) + (R56 /(1+w*1j*t_values[55])) + (R57 /(1+w*1j*t_values[56])) + (R58 /(1+w*1j*t_values[57])) + (R59 /(1+w*1j*t_values[58])) + (R60 /(1+w*1j*t_values[59])) + (R61 /(1+w*1j*t_values[60])) + (R62 /(1+w*1j*t_values[61])) + (R63 /(1+w*1j*t_values[62])) + (R64 /(1+w*1j*t_values[63])) + (R65 /(1+w*1j*t_values[64])) + (R66 /(1+w*1j*t_values[65])) + (R67 /(1+w*1j*t_values[66])) + (R68 /(1+w*1j*t_values[67])) + (R69 /(1+w*1j*t_values[68])) + (R70 /(1+w*1j*t_values[69])) + (R71 /(1+w*1j*t_values[70])) + (R72 /(1+w*1j*t_values[71])) + (R73 /(1+w*1j*t_values[72])) + (R74 /(1+w*1j*t_values[73])) + (R75 /(1+w*1j*t_values[74])) + (R76 /(1+w*1j*t_values[75]))
+The module does not import matplotlib, or lmfit, which loads matplotlib, so KK_test() can be used on headless machines with
+"from PyEIS.PyEIS_Lin_KK import KK_test", see PyEIS/__init__.py
 
-def KK_RC77_fit(params, w, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    Rs = params['Rs']
-    R1 = params['R1']
-    R2 = params['R2']
-    R3 = params['R3']
-    R4 = params['R4']
-    R5 = params['R5']
-    R6 = params['R6']
-    R7 = params['R7']
-    R8 = params['R8']
-    R9 = params['R9']
-    R10 = params['R10']
-    R11 = params['R11']
-    R12 = params['R12']
-    R13 = params['R13']
-    R14 = params['R14']
-    R15 = params['R15']
-    R16 = params['R16']
-    R17 = params['R17']
-    R18 = params['R18']
-    R19 = params['R19']
-    R20 = params['R20']
-    R21 = params['R21']
-    R22 = params['R22']
-    R23 = params['R23']
-    R24 = params['R24']
-    R25 = params['R25']
-    R26 = params['R26']
-    R27 = params['R27']
-    R28 = params['R28']
-    R29 = params['R29']
-    R30 = params['R30']
-    R31 = params['R31']
-    R32 = params['R32']
-    R33 = params['R33']
-    R34 = params['R34']
-    R35 = params['R35']
-    R36 = params['R36']
-    R37 = params['R37']
-    R38 = params['R38']
-    R39 = params['R39']
-    R40 = params['R40']
-    R41 = params['R41']
-    R42 = params['R42']
-    R43 = params['R43']
-    R44 = params['R44']
-    R45 = params['R45']
-    R46 = params['R46']
-    R47 = params['R47']
-    R48 = params['R48']
-    R49 = params['R49']
-    R50 = params['R50']
-    R51 = params['R51']
-    R52 = params['R52']
-    R53 = params['R53']
-    R54 = params['R54']
-    R55 = params['R55']
-    R56 = params['R56']
-    R57 = params['R57']
-    R58 = params['R58']
-    R59 = params['R59']
-    R60 = params['R60']
-    R61 = params['R61']
-    R62 = params['R62']
-    R63 = params['R63']
-    R64 = params['R64']
-    R65 = params['R65']
-    R66 = params['R66']
-    R67 = params['R67']
-    R68 = params['R68']
-    R69 = params['R69']
-    R70 = params['R70']
-    R71 = params['R71']
-    R72 = params['R72']
-    R73 = params['R73']
-    R74 = params['R74']
-    R75 = params['R75']
-    R76 = params['R76']
-    R77 = params['R77']
-    return Rs + (R1/(1+w*1j*t_values[0])) + (R2 /(1+w*1j*t_values[1])) + (R3 /(1+w*1j*t_values[2])) + (R4 /(1+w*1j*t_values[3])) + (R5 /(1+w*1j*t_values[4])) + (R6 /(1+w*1j*t_values[5])) + (R7 /(1+w*1j*t_values[6])) + (R8 /(1+w*1j*t_values[7])) + (R9 /(1+w*1j*t_values[8])) + (R10 /(1+w*1j*t_values[9])) + (R11 /(1+w*1j*t_values[10])) + (R12 /(1+w*1j*t_values[11])) + (R13 /(1+w*1j*t_values[12])) + (R14 /(1+w*1j*t_values[13])) + (R15 /(1+w*1j*t_values[14])) + (R16 /(1+w*1j*t_values[15])) + (R17 /(1+w*1j*t_values[16])) + (R18 /(1+w*1j*t_values[17])) + (R19 /(1+w*1j*t_values[18])) + (R20 /(1+w*1j*t_values[19])) + (R21 /(1+w*1j*t_values[20])) + (R22 /(1+w*1j*t_values[21])) + (R23 /(1+w*1j*t_values[22])) + (R24 /(1+w*1j*t_values[23])) + (R25 /(1+w*1j*t_values[24])) + (R26 /(1+w*1j*t_values[25])) + (R27 /(1+w*1j*t_values[26])) + (R28 /(1+w*1j*t_values[27])) + (R29 /(1+w*1j*t_values[28])) + (R30 /(1+w*1j*t_values[29])) + (R31 /(1+w*1j*t_values[30])) + (R32 /(1+w*1j*t_values[31])) + (R33 /(1+w*1j*t_values[32])) + (R34 /(1+w*1j*t_values[33])) + (R35 /(1+w*1j*t_values[34]))  + (R36 /(1+w*1j*t_values[35])) + (R37 /(1+w*1j*t_values[36])) + (R38 /(1+w*1j*t_values[37])) + (R39 /(1+w*1j*t_values[38])) + (R40 /(1+w*1j*t_values[39])) + (R41 /(1+w*1j*t_values[40])) + (R42 /(1+w*1j*t_values[41])) + (R43 /(1+w*1j*t_values[42])) + (R44 /(1+w*1j*t_values[43])) + (R45 /(1+w*1j*t_values[44])) + (R46 /(1+w*1j*t_values[45])) + (R47 /(1+w*1j*t_values[46])) + (R48 /(1+w*1j*t_values[47])) + (R49 /(1+w*1j*t_values[48])) + (R50 /(1+w*1j*t_values[49])) + (R51 /(1+w*1j*t_values[50])) + (R52 /(1+w*1j*t_values[51])) + (R53 /(1+w*1j*t_values[52])) + (R54 /(1+w*1j*t_values[53])) + (R55 /(1+w*1j*t_values[54])) + (R56 /(1+w*1j*t_values[55])) + (R57 /(1+w*1j*t_values[56])) + (R58 /(1+w*1j*t_values[57])) + (R59 /(1+w*1j*t_values[58])) + (R60 /(1+w*1j*t_values[59])) + (R61 /(1+w*1j*t_values[60])) + (R62 /(1+w*1j*t_values[61])) + (R63 /(1+w*1j*t_values[62])) + (R64 /(1+w*1j*t_values[63])) + (R65 /(1+w*1j*t_values[64])) + (R66 /(1+w*1j*t_values[65])) + (R67 /(1+w*1j*t_values[66])) + (R68 /(1+w*1j*t_values[67])) + (R69 /(1+w*1j*t_values[68])) + (R70 /(1+w*1j*t_values[69])) + (R71 /(1+w*1j*t_values[70])) + (R72 /(1+w*1j*t_values[71])) + (R73 /(1+w*1j*t_values[72])) + (R74 /(1+w*1j*t_values[73])) + (R75 /(1+w*1j*t_values[74])) + (R76 /(1+w*1j*t_values[75])) + (R77 /(1+w*1j*t_values[76]))
+@author: Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
+"""
+import os
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
+from functools import lru_cache
+import numpy as np
+from .PyEIS_Backend import KK_RC_sum
 
-def KK_RC78_fit(params, w, t_values):
+### Simulation Functions
+##
+#
+def KK_RC(w, Rs, R_values, t_values):
     '''
-    Kramers-Kronig Function: -RC-
+    Kramers-Kronig Function: -R-(RC)-(RC)-...-(RC)-, with any number of -RC- elements
     
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
-    '''
-    Rs = params['Rs']
-    R1 = params['R1']
-    R2 = params['R2']
-    R3 = params['R3']
-    R4 = params['R4']
-    R5 = params['R5']
-    R6 = params['R6']
-    R7 = params['R7']
-    R8 = params['R8']
-    R9 = params['R9']
-    R10 = params['R10']
-    R11 = params['R11']
-    R12 = params['R12']
-    R13 = params['R13']
-    R14 = params['R14']
-    R15 = params['R15']
-    R16 = params['R16']
-    R17 = params['R17']
-    R18 = params['R18']
-    R19 = params['R19']
-    R20 = params['R20']
-    R21 = params['R21']
-    R22 = params['R22']
-    R23 = params['R23']
-    R24 = params['R24']
-    R25 = params['R25']
-    R26 = params['R26']
-    R27 = params['R27']
-    R28 = params['R28']
-    R29 = params['R29']
-    R30 = params['R30']
-    R31 = params['R31']
-    R32 = params['R32']
-    R33 = params['R33']
-    R34 = params['R34']
-    R35 = params['R35']
-    R36 = params['R36']
-    R37 = params['R37']
-    R38 = params['R38']
-    R39 = params['R39']
-    R40 = params['R40']
-    R41 = params['R41']
-    R42 = params['R42']
-    R43 = params['R43']
-    R44 = params['R44']
-    R45 = params['R45']
-    R46 = params['R46']
-    R47 = params['R47']
-    R48 = params['R48']
-    R49 = params['R49']
-    R50 = params['R50']
-    R51 = params['R51']
-    R52 = params['R52']
-    R53 = params['R53']
-    R54 = params['R54']
-    R55 = params['R55']
-    R56 = params['R56']
-    R57 = params['R57']
-    R58 = params['R58']
-    R59 = params['R59']
-    R60 = params['R60']
-    R61 = params['R61']
-    R62 = params['R62']
-    R63 = params['R63']
-    R64 = params['R64']
-    R65 = params['R65']
-    R66 = params['R66']
-    R67 = params['R67']
-    R68 = params['R68']
-    R69 = params['R69']
-    R70 = params['R70']
-    R71 = params['R71']
-    R72 = params['R72']
-    R73 = params['R73']
-    R74 = params['R74']
-    R75 = params['R75']
-    R76 = params['R76']
-    R77 = params['R77']
-    R78 = params['R78']
-    return Rs + (R1/(1+w*1j*t_values[0])) + (R2 /(1+w*1j*t_values[1])) + (R3 /(1+w*1j*t_values[2])) + (R4 /(1+w*1j*t_values[3])) + (R5 /(1+w*1j*t_values[4])) + (R6 /(1+w*1j*t_values[5])) + (R7 /(1+w*1j*t_values[6])) + (R8 /(1+w*1j*t_values[7])) + (R9 /(1+w*1j*t_values[8])) + (R10 /(1+w*1j*t_values[9])) + (R11 /(1+w*1j*t_values[10])) + (R12 /(1+w*1j*t_values[11])) + (R13 /(1+w*1j*t_values[12])) + (R14 /(1+w*1j*t_values[13])) + (R15 /(1+w*1j*t_values[14])) + (R16 /(1+w*1j*t_values[15])) + (R17 /(1+w*1j*t_values[16])) + (R18 /(1+w*1j*t_values[17])) + (R19 /(1+w*1j*t_values[18])) + (R20 /(1+w*1j*t_values[19])) + (R21 /(1+w*1j*t_values[20])) + (R22 /(1+w*1j*t_values[21])) + (R23 /(1+w*1j*t_values[22])) + (R24 /(1+w*1j*t_values[23])) + (R25 /(1+w*1j*t_values[24])) + (R26 /(1+w*1j*t_values[25])) + (R27 /(1+w*1j*t_values[26])) + (R28 /(1+w*1j*t_values[27])) + (R29 /(1+w*1j*t_values[28])) + (R30 /(1+w*1j*t_values[29])) + (R31 /(1+w*1j*t_values[30])) + (R32 /(1+w*1j*t_values[31])) + (R33 /(1+w*1j*t_values[32])) + (R34 /(1+w*1j*t_values[33])) + (R35 /(1+w*1j*t_values[34]))  + (R36 /(1+w*1j*t_values[35])) + (R37 /(1+w*1j*t_values[36])) + (R38 /(1+w*1j*t_values[37])) + (R39 /(1+w*1j*t_values[38])) + (R40 /(1+w*1j*t_values[39])) + (R41 /(1+w*1j*t_values[40])) + (R42 /(1+w*1j*t_values[41])) + (R43 /(1+w*1j*t_values[42])) + (R44 /(1+w*1j*t_values[43])) + (R45 /(1+w*1j*t_values[44])) + (R46 /(1+w*1j*t_values[45])) + (R47 /(1+w*1j*t_values[46])) + (R48 /(1+w*1j*t_values[47])) + (R49 /(1+w*1j*t_values[48])) + (R50 /(1+w*1j*t_values[49])) + (R51 /(1+w*1j*t_values[50])) + (R52 /(1+w*1j*t_values[51])) + (R53 /(1+w*1j*t_values[52])) + (R54 /(1+w*1j*t_values[53])) + (R55 /(1+w*1j*t_values[54])) + (R56 /(1+w*1j*t_values[55])) + (R57 /(1+w*1j*t_values[56])) + (R58 /(1+w*1j*t_values[57])) + (R59 /(1+w*1j*t_values[58])) + (R60 /(1+w*1j*t_values[59])) + (R61 /(1+w*1j*t_values[60])) + (R62 /(1+w*1j*t_values[61])) + (R63 /(1+w*1j*t_values[62])) + (R64 /(1+w*1j*t_values[63])) + (R65 /(1+w*1j*t_values[64])) + (R66 /(1+w*1j*t_values[65])) + (R67 /(1+w*1j*t_values[66])) + (R68 /(1+w*1j*t_values[67])) + (R69 /(1+w*1j*t_values[68])) + (R70 /(1+w*1j*t_values[69])) + (R71 /(1+w*1j*t_values[70])) + (R72 /(1+w*1j*t_values[71])) + (R73 /(1+w*1j*t_values[72])) + (R74 /(1+w*1j*t_values[73])) + (R75 /(1+w*1j*t_values[74])) + (R76 /(1+w*1j*t_values[75])) + (R77 /(1+w*1j*t_values[76])) + (R78 /(1+w*1j*t_values[77]))
+    Z = Rs + sum_k R_k/(1 + jw*t_k), evaluated as one matrix-vector product, see KK_RC_sum() in PyEIS_Backend.py
 
-def KK_RC79_fit(params, w, t_values):
-    '''
-    Kramers-Kronig Function: -RC-
-    
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
+    Inputs
+    -----------
+    w = angular frequency [1/s]
+    Rs = series resistance [ohm]
+    R_values = resistances of the -RC- elements [ohm]
+    t_values = time constants of the -RC- elements [s]
     '''
-    Rs = params['Rs']
-    R1 = params['R1']
-    R2 = params['R2']
-    R3 = params['R3']
-    R4 = params['R4']
-    R5 = params['R5']
-    R6 = params['R6']
-    R7 = params['R7']
-    R8 = params['R8']
-    R9 = params['R9']
-    R10 = params['R10']
-    R11 = params['R11']
-    R12 = params['R12']
-    R13 = params['R13']
-    R14 = params['R14']
-    R15 = params['R15']
-    R16 = params['R16']
-    R17 = params['R17']
-    R18 = params['R18']
-    R19 = params['R19']
-    R20 = params['R20']
-    R21 = params['R21']
-    R22 = params['R22']
-    R23 = params['R23']
-    R24 = params['R24']
-    R25 = params['R25']
-    R26 = params['R26']
-    R27 = params['R27']
-    R28 = params['R28']
-    R29 = params['R29']
-    R30 = params['R30']
-    R31 = params['R31']
-    R32 = params['R32']
-    R33 = params['R33']
-    R34 = params['R34']
-    R35 = params['R35']
-    R36 = params['R36']
-    R37 = params['R37']
-    R38 = params['R38']
-    R39 = params['R39']
-    R40 = params['R40']
-    R41 = params['R41']
-    R42 = params['R42']
-    R43 = params['R43']
-    R44 = params['R44']
-    R45 = params['R45']
-    R46 = params['R46']
-    R47 = params['R47']
-    R48 = params['R48']
-    R49 = params['R49']
-    R50 = params['R50']
-    R51 = params['R51']
-    R52 = params['R52']
-    R53 = params['R53']
-    R54 = params['R54']
-    R55 = params['R55']
-    R56 = params['R56']
-    R57 = params['R57']
-    R58 = params['R58']
-    R59 = params['R59']
-    R60 = params['R60']
-    R61 = params['R61']
-    R62 = params['R62']
-    R63 = params['R63']
-    R64 = params['R64']
-    R65 = params['R65']
-    R66 = params['R66']
-    R67 = params['R67']
-    R68 = params['R68']
-    R69 = params['R69']
-    R70 = params['R70']
-    R71 = params['R71']
-    R72 = params['R72']
-    R73 = params['R73']
-    R74 = params['R74']
-    R75 = params['R75']
-    R76 = params['R76']
-    R77 = params['R77']
-    R78 = params['R78']
-    R79 = params['R79']
-    return Rs + (R1/(1+w*1j*t_values[0])) + (R2 /(1+w*1j*t_values[1])) + (R3 /(1+w*1j*t_values[2])) + (R4 /(1+w*1j*t_values[3])) + (R5 /(1+w*1j*t_values[4])) + (R6 /(1+w*1j*t_values[5])) + (R7 /(1+w*1j*t_values[6])) + (R8 /(1+w*1j*t_values[7])) + (R9 /(1+w*1j*t_values[8])) + (R10 /(1+w*1j*t_values[9])) + (R11 /(1+w*1j*t_values[10])) + (R12 /(1+w*1j*t_values[11])) + (R13 /(1+w*1j*t_values[12])) + (R14 /(1+w*1j*t_values[13])) + (R15 /(1+w*1j*t_values[14])) + (R16 /(1+w*1j*t_values[15])) + (R17 /(1+w*1j*t_values[16])) + (R18 /(1+w*1j*t_values[17])) + (R19 /(1+w*1j*t_values[18])) + (R20 /(1+w*1j*t_values[19])) + (R21 /(1+w*1j*t_values[20])) + (R22 /(1+w*1j*t_values[21])) + (R23 /(1+w*1j*t_values[22])) + (R24 /(1+w*1j*t_values[23])) + (R25 /(1+w*1j*t_values[24])) + (R26 /(1+w*1j*t_values[25])) + (R27 /(1+w*1j*t_values[26])) + (R28 /(1+w*1j*t_values[27])) + (R29 /(1+w*1j*t_values[28])) + (R30 /(1+w*1j*t_values[29])) + (R31 /(1+w*1j*t_values[30])) + (R32 /(1+w*1j*t_values[31])) + (R33 /(1+w*1j*t_values[32])) + (R34 /(1+w*1j*t_values[33])) + (R35 /(1+w*1j*t_values[34]))  + (R36 /(1+w*1j*t_values[35])) + (R37 /(1+w*1j*t_values[36])) + (R38 /(1+w*1j*t_values[37])) + (R39 /(1+w*1j*t_values[38])) + (R40 /(1+w*1j*t_values[39])) + (R41 /(1+w*1j*t_values[40])) + (R42 /(1+w*1j*t_values[41])) + (R43 /(1+w*1j*t_values[42])) + (R44 /(1+w*1j*t_values[43])) + (R45 /(1+w*1j*t_values[44])) + (R46 /(1+w*1j*t_values[45])) + (R47 /(1+w*1j*t_values[46])) + (R48 /(1+w*1j*t_values[47])) + (R49 /(1+w*1j*t_values[48])) + (R50 /(1+w*1j*t_values[49])) + (R51 /(1+w*1j*t_values[50])) + (R52 /(1+w*1j*t_values[51])) + (R53 /(1+w*1j*t_values[52])) + (R54 /(1+w*1j*t_values[53])) + (R55 /(1+w*1j*t_values[54])) + (R56 /(1+w*1j*t_values[55])) + (R57 /(1+w*1j*t_values[56])) + (R58 /(1+w*1j*t_values[57])) + (R59 /(1+w*1j*t_values[58])) + (R60 /(1+w*1j*t_values[59])) + (R61 /(1+w*1j*t_values[60])) + (R62 /(1+w*1j*t_values[61])) + (R63 /(1+w*1j*t_values[62])) + (R64 /(1+w*1j*t_values[63])) + (R65 /(1+w*1j*t_values[64])) + (R66 /(1+w*1j*t_values[65])) + (R67 /(1+w*1j*t_values[66])) + (R68 /(1+w*1j*t_values[67])) + (R69 /(1+w*1j*t_values[68])) + (R70 /(1+w*1j*t_values[69])) + (R71 /(1+w*1j*t_values[70])) + (R72 /(1+w*1j*t_values[71])) + (R73 /(1+w*1j*t_values[72])) + (R74 /(1+w*1j*t_values[73])) + (R75 /(1+w*1j*t_values[74])) + (R76 /(1+w*1j*t_values[75])) + (R77 /(1+w*1j*t_values[76])) + (R78 /(1+w*1j*t_values[77])) + (R79 /(1+w*1j*t_values[78]))
+    return KK_RC_sum(w, Rs, R_values, t_values)
 
-def KK_RC80_fit(params, w, t_values):
+### Fitting Functions
+##
+#
+def KK_RC_fit(params, w, t_values):
     '''
-    Kramers-Kronig Function: -RC-
+    Kramers-Kronig Fit Function: -R-(RC)-(RC)-...-(RC)-, with one -RC- element per time constant
     
-    Kristian B. Knudsen (kknu@berkeley.edu / kristianbknudsen@gmail.com)
+    The parameters are Rs and R1, R2, ..., RM, see KK_Rnam_val()
     '''
-    Rs = params['Rs']
-    R1 = params['R1']
-    R2 = params['R2']
-    R3 = params['R3']
-    R4 = params['R4']
-    R5 = params['R5']
-    R6 = params['R6']
-    R7 = params['R7']
-    R8 = params['R8']
-    R9 = params['R9']
-    R10 = params['R10']
-    R11 = params['R11']
-    R12 = params['R12']
-    R13 = params['R13']
-    R14 = params['R14']
-    R15 = params['R15']
-    R16 = params['R16']
-    R17 = params['R17']
-    R18 = params['R18']
-    R19 = params['R19']
-    R20 = params['R20']
-    R21 = params['R21']
-    R22 = params['R22']
-    R23 = params['R23']
-    R24 = params['R24']
-    R25 = params['R25']
-    R26 = params['R26']
-    R27 = params['R27']
-    R28 = params['R28']
-    R29 = params['R29']
-    R30 = params['R30']
-    R31 = params['R31']
-    R32 = params['R32']
-    R33 = params['R33']
-    R34 = params['R34']
-    R35 = params['R35']
-    R36 = params['R36']
-    R37 = params['R37']
-    R38 = params['R38']
-    R39 = params['R39']
-    R40 = params['R40']
-    R41 = params['R41']
-    R42 = params['R42']
-    R43 = params['R43']
-    R44 = params['R44']
-    R45 = params['R45']
-    R46 = params['R46']
-    R47 = params['R47']
-    R48 = params['R48']
-    R49 = params['R49']
-    R50 = params['R50']
-    R51 = params['R51']
-    R52 = params['R52']
-    R53 = params['R53']
-    R54 = params['R54']
-    R55 = params['R55']
-    R56 = params['R56']
-    R57 = params['R57']
-    R58 = params['R58']
-    R59 = params['R59']
-    R60 = params['R60']
-    R61 = params['R61']
-    R62 = params['R62']
-    R63 = params['R63']
-    R64 = params['R64']
-    R65 = params['R65']
-    R66 = params['R66']
-    R67 = params['R67']
-    R68 = params['R68']
-    R69 = params['R69']
-    R70 = params['R70']
-    R71 = params['R71']
-    R72 = params['R72']
-    R73 = params['R73']
-    R74 = params['R74']
-    R75 = params['R75']
-    R76 = params['R76']
-    R77 = params['R77']
-    R78 = params['R78']
-    R79 = params['R79']
-    R80 = params['R80']
-    return Rs + (R1/(1+w*1j*t_values[0])) + (R2 /(1+w*1j*t_values[1])) + (R3 /(1+w*1j*t_values[2])) + (R4 /(1+w*1j*t_values[3])) + (R5 /(1+w*1j*t_values[4])) + (R6 /(1+w*1j*t_values[5])) + (R7 /(1+w*1j*t_values[6])) + (R8 /(1+w*1j*t_values[7])) + (R9 /(1+w*1j*t_values[8])) + (R10 /(1+w*1j*t_values[9])) + (R11 /(1+w*1j*t_values[10])) + (R12 /(1+w*1j*t_values[11])) + (R13 /(1+w*1j*t_values[12])) + (R14 /(1+w*1j*t_values[13])) + (R15 /(1+w*1j*t_values[14])) + (R16 /(1+w*1j*t_values[15])) + (R17 /(1+w*1j*t_values[16])) + (R18 /(1+w*1j*t_values[17])) + (R19 /(1+w*1j*t_values[18])) + (R20 /(1+w*1j*t_values[19])) + (R21 /(1+w*1j*t_values[20])) + (R22 /(1+w*1j*t_values[21])) + (R23 /(1+w*1j*t_values[22])) + (R24 /(1+w*1j*t_values[23])) + (R25 /(1+w*1j*t_values[24])) + (R26 /(1+w*1j*t_values[25])) + (R27 /(1+w*1j*t_values[26])) + (R28 /(1+w*1j*t_values[27])) + (R29 /(1+w*1j*t_values[28])) + (R30 /(1+w*1j*t_values[29])) + (R31 /(1+w*1j*t_values[30])) + (R32 /(1+w*1j*t_values[31])) + (R33 /(1+w*1j*t_values[32])) + (R34 /(1+w*1j*t_values[33])) + (R35 /(1+w*1j*t_values[34]))  + (R36 /(1+w*1j*t_values[35])) + (R37 /(1+w*1j*t_values[36])) + (R38 /(1+w*1j*t_values[37])) + (R39 /(1+w*1j*t_values[38])) + (R40 /(1+w*1j*t_values[39])) + (R41 /(1+w*1j*t_values[40])) + (R42 /(1+w*1j*t_values[41])) + (R43 /(1+w*1j*t_values[42])) + (R44 /(1+w*1j*t_values[43])) + (R45 /(1+w*1j*t_values[44])) + (R46 /(1+w*1j*t_values[45])) + (R47 /(1+w*1j*t_values[46])) + (R48 /(1+w*1j*t_values[47])) + (R49 /(1+w*1j*t_values[48])) + (R50 /(1+w*1j*t_values[49])) + (R51 /(1+w*1j*t_values[50])) + (R52 /(1+w*1j*t_values[51])) + (R53 /(1+w*1j*t_values[52])) + (R54 /(1+w*1j*t_values[53])) + (R55 /(1+w*1j*t_values[54])) + (R56 /(1+w*1j*t_values[55])) + (R57 /(1+w*1j*t_values[56])) + (R58 /(1+w*1j*t_values[57])) + (R59 /(1+w*1j*t_values[58])) + (R60 /(1+w*1j*t_values[59])) + (R61 /(1+w*1j*t_values[60])) + (R62 /(1+w*1j*t_values[61])) + (R63 /(1+w*1j*t_values[62])) + (R64 /(1+w*1j*t_values[63])) + (R65 /(1+w*1j*t_values[64])) + (R66 /(1+w*1j*t_values[65])) + (R67 /(1+w*1j*t_values[66])) + (R68 /(1+w*1j*t_values[67])) + (R69 /(1+w*1j*t_values[68])) + (R70 /(1+w*1j*t_values[69])) + (R71 /(1+w*1j*t_values[70])) + (R72 /(1+w*1j*t_values[71])) + (R73 /(1+w*1j*t_values[72])) + (R74 /(1+w*1j*t_values[73])) + (R75 /(1+w*1j*t_values[74])) + (R76 /(1+w*1j*t_values[75])) + (R77 /(1+w*1j*t_values[76])) + (R78 /(1+w*1j*t_values[77])) + (R79 /(1+w*1j*t_values[78])) + (R80 /(1+w*1j*t_values[79]))
+    R_values = [float(params['R'+str(k+1)]) for k in range(len(t_values))]
+    return KK_RC_sum(w, float(params['Rs']), R_values, t_values)
 
 ### Least-squres function and related functions
 ##
@@ -4657,6 +78,7 @@ def KK_Rnam_val(re, re_start, num_RC):
         R_name.append('R'+str(num_RC[j]))
         R_initial.append(1) #initial guess for Resistances
 
+    from lmfit import Parameters #imported on use, as lmfit loads matplotlib
     params = Parameters()
     for j in range(len(num_RC)):
         params.add(R_name[j], value=R_initial[j])
@@ -4684,21 +106,6 @@ def KK_timeconst(w, num_RC):
         t_initial.append(10**((np.log10(t_min)) + (j-1)/(len(num_RC)-1) * np.log10(t_max/t_min)) ) #initial guess parameter parameter tau for each -RC- circuit
     return t_initial
 
-
-#from scipy.optimize import curve_fit
-
-def KK_errorfunc_2(w, re, im, num_RC, t_values):
-    '''
-    test
-    '''
-    if num_RC == 51:
-        re_fit = curve_fit(lambda w, Rs, R1, R2, R3, R4, R5, R6, R7, R8, R9, R10, R11, R12, R13, R14, R15, R16, R17, R18, R19, R20, R21, R22, R23, R24, R25, R26, R27, R28, R29, R30, R31, R32, R33, R34, R35, R36, R37, R38, R39, R40, R41, R42, R43, R44, R45, R46, R47, R48, R49, R50, R51: KK_RC51_fit(w, Rs, R1, R2, R3, R4, R5, R6, R7, R8, R9, R10, R11, R12, R13, R14, R15, R16, R17, R18, R19, R20, R21, R22, R23, R24, R25, R26, R27, R28, R29, R30, R31, R32, R33, R34, R35, R36, R37, R38, R39, R40, R41, R42, R43, R44, R45, R46, R47, R48, R49, R50, R51, t_values), w, re)[0]
-#        im_fit = curve_fit(lambda w, Rs, R1, R2, R3, R4, R5, R6, R7, R8, R9, R10, R11, R12, R13, R14, R15, R16, R17, R18, R19, R20, R21, R22, R23, R24, R25, R26, R27, R28, R29, R30, R31, R32, R33, R34, R35, R36, R37, R38, R39, R40, R41, R42, R43, R44, R45, R46, R47, R48, R49, R50, R51: KK_RC51_fit(w, Rs, R1, R2, R3, R4, R5, R6, R7, R8, R9, R10, R11, R12, R13, R14, R15, R16, R17, R18, R19, R20, R21, R22, R23, R24, R25, R26, R27, R28, R29, R30, R31, R32, R33, R34, R35, R36, R37, R38, R39, R40, R41, R42, R43, R44, R45, R46, R47, R48, R49, R50, R51, t_values)[1], w, im)[0]
-    else:
-        print('error in this crap')
-    return re_fit#, im_fit
-
-
 def KK_errorfunc(params, w, re, im, num_RC, weight_func, t_values):
     '''
     Sum of squares error function for linear least-squares fitting for the Kramers-Kronig Relations. 
@@ -4715,7 +122,7 @@ def KK_errorfunc(params, w, re, im, num_RC, weight_func, t_values):
         - w = angular frequency
         - re = real impedance
         - im = imaginary impedance
-        - num_RC = number of RC-circuits
+        - num_RC = number of RC-circuits, i.e. len(t_values)
         - t_values = time constants
         
         weight_func = Weight function, Three options:
@@ -4724,245 +131,9 @@ def KK_errorfunc(params, w, re, im, num_RC, weight_func, t_values):
             - proportional
             - Boukamp
     '''
-    if num_RC == 2:
-        re_fit = KK_RC2_fit(params, w, t_values).real
-        im_fit = -KK_RC2_fit(params, w, t_values).imag
-    elif num_RC == 3:
-        re_fit = KK_RC3_fit(params, w, t_values).real
-        im_fit = -KK_RC3_fit(params, w, t_values).imag
-    elif num_RC == 4:
-        re_fit = KK_RC4_fit(params, w, t_values).real
-        im_fit = -KK_RC4_fit(params, w, t_values).imag
-    elif num_RC == 5:
-        re_fit = KK_RC5_fit(params, w, t_values).real
-        im_fit = -KK_RC5_fit(params, w, t_values).imag
-    elif num_RC == 6:
-        re_fit = KK_RC6_fit(params, w, t_values).real
-        im_fit = -KK_RC6_fit(params, w, t_values).imag
-    elif num_RC == 7:
-        re_fit = KK_RC7_fit(params, w, t_values).real
-        im_fit = -KK_RC7_fit(params, w, t_values).imag
-    elif num_RC == 8:
-        re_fit = KK_RC8_fit(params, w, t_values).real
-        im_fit = -KK_RC8_fit(params, w, t_values).imag
-    elif num_RC == 9:
-        re_fit = KK_RC9_fit(params, w, t_values).real
-        im_fit = -KK_RC9_fit(params, w, t_values).imag
-    elif num_RC == 10:
-        re_fit = KK_RC10_fit(params, w, t_values).real
-        im_fit = -KK_RC10_fit(params, w, t_values).imag
-    elif num_RC == 11:
-        re_fit = KK_RC11_fit(params, w, t_values).real
-        im_fit = -KK_RC11_fit(params, w, t_values).imag
-    elif num_RC == 12:
-        re_fit = KK_RC12_fit(params, w, t_values).real
-        im_fit = -KK_RC12_fit(params, w, t_values).imag
-    elif num_RC == 13:
-        re_fit = KK_RC13_fit(params, w, t_values).real
-        im_fit = -KK_RC13_fit(params, w, t_values).imag
-    elif num_RC == 14:
-        re_fit = KK_RC14_fit(params, w, t_values).real
-        im_fit = -KK_RC14_fit(params, w, t_values).imag
-    elif num_RC == 15:
-        re_fit = KK_RC15_fit(params, w, t_values).real
-        im_fit = -KK_RC15_fit(params, w, t_values).imag
-    elif num_RC == 16:
-        re_fit = KK_RC16_fit(params, w, t_values).real
-        im_fit = -KK_RC16_fit(params, w, t_values).imag
-    elif num_RC == 17:
-        re_fit = KK_RC17_fit(params, w, t_values).real
-        im_fit = -KK_RC17_fit(params, w, t_values).imag
-    elif num_RC == 18:
-        re_fit = KK_RC18_fit(params, w, t_values).real
-        im_fit = -KK_RC18_fit(params, w, t_values).imag
-    elif num_RC == 19:
-        re_fit = KK_RC19_fit(params, w, t_values).real
-        im_fit = -KK_RC19_fit(params, w, t_values).imag
-    elif num_RC == 20:
-        re_fit = KK_RC20_fit(params, w, t_values).real
-        im_fit = -KK_RC20_fit(params, w, t_values).imag
-    elif num_RC == 21:
-        re_fit = KK_RC21_fit(params, w, t_values).real
-        im_fit = -KK_RC21_fit(params, w, t_values).imag
-    elif num_RC == 22:
-        re_fit = KK_RC22_fit(params, w, t_values).real
-        im_fit = -KK_RC22_fit(params, w, t_values).imag
-    elif num_RC == 23:
-        re_fit = KK_RC23_fit(params, w, t_values).real
-        im_fit = -KK_RC23_fit(params, w, t_values).imag
-    elif num_RC == 24:
-        re_fit = KK_RC24_fit(params, w, t_values).real
-        im_fit = -KK_RC24_fit(params, w, t_values).imag
-    elif num_RC == 25:
-        re_fit = KK_RC25_fit(params, w, t_values).real
-        im_fit = -KK_RC25_fit(params, w, t_values).imag
-    elif num_RC == 26:
-        re_fit = KK_RC26_fit(params, w, t_values).real
-        im_fit = -KK_RC26_fit(params, w, t_values).imag
-    elif num_RC == 27:
-        re_fit = KK_RC27_fit(params, w, t_values).real
-        im_fit = -KK_RC27_fit(params, w, t_values).imag
-    elif num_RC == 28:
-        re_fit = KK_RC28_fit(params, w, t_values).real
-        im_fit = -KK_RC28_fit(params, w, t_values).imag
-    elif num_RC == 29:
-        re_fit = KK_RC29_fit(params, w, t_values).real
-        im_fit = -KK_RC29_fit(params, w, t_values).imag
-    elif num_RC == 30:
-        re_fit = KK_RC30_fit(params, w, t_values).real
-        im_fit = -KK_RC30_fit(params, w, t_values).imag
-    elif num_RC == 31:
-        re_fit = KK_RC31_fit(params, w, t_values).real
-        im_fit = -KK_RC31_fit(params, w, t_values).imag
-    elif num_RC == 32:
-        re_fit = KK_RC32_fit(params, w, t_values).real
-        im_fit = -KK_RC32_fit(params, w, t_values).imag
-    elif num_RC == 33:
-        re_fit = KK_RC33_fit(params, w, t_values).real
-        im_fit = -KK_RC33_fit(params, w, t_values).imag
-    elif num_RC == 34:
-        re_fit = KK_RC34_fit(params, w, t_values).real
-        im_fit = -KK_RC34_fit(params, w, t_values).imag
-    elif num_RC == 35:
-        re_fit = KK_RC35_fit(params, w, t_values).real
-        im_fit = -KK_RC35_fit(params, w, t_values).imag
-    elif num_RC == 36:
-        re_fit = KK_RC36_fit(params, w, t_values).real
-        im_fit = -KK_RC36_fit(params, w, t_values).imag
-    elif num_RC == 37:
-        re_fit = KK_RC37_fit(params, w, t_values).real
-        im_fit = -KK_RC37_fit(params, w, t_values).imag
-    elif num_RC == 38:
-        re_fit = KK_RC38_fit(params, w, t_values).real
-        im_fit = -KK_RC38_fit(params, w, t_values).imag
-    elif num_RC == 39:
-        re_fit = KK_RC39_fit(params, w, t_values).real
-        im_fit = -KK_RC39_fit(params, w, t_values).imag
-    elif num_RC == 40:
-        re_fit = KK_RC40_fit(params, w, t_values).real
-        im_fit = -KK_RC40_fit(params, w, t_values).imag
-    elif num_RC == 41:
-        re_fit = KK_RC41_fit(params, w, t_values).real
-        im_fit = -KK_RC41_fit(params, w, t_values).imag
-    elif num_RC == 42:
-        re_fit = KK_RC42_fit(params, w, t_values).real
-        im_fit = -KK_RC42_fit(params, w, t_values).imag
-    elif num_RC == 43:
-        re_fit = KK_RC43_fit(params, w, t_values).real
-        im_fit = -KK_RC43_fit(params, w, t_values).imag
-    elif num_RC == 44:
-        re_fit = KK_RC44_fit(params, w, t_values).real
-        im_fit = -KK_RC44_fit(params, w, t_values).imag
-    elif num_RC == 45:
-        re_fit = KK_RC45_fit(params, w, t_values).real
-        im_fit = -KK_RC45_fit(params, w, t_values).imag
-    elif num_RC == 46:
-        re_fit = KK_RC46_fit(params, w, t_values).real
-        im_fit = -KK_RC46_fit(params, w, t_values).imag
-    elif num_RC == 47:
-        re_fit = KK_RC47_fit(params, w, t_values).real
-        im_fit = -KK_RC47_fit(params, w, t_values).imag
-    elif num_RC == 48:
-        re_fit = KK_RC48_fit(params, w, t_values).real
-        im_fit = -KK_RC48_fit(params, w, t_values).imag
-    elif num_RC == 49:
-        re_fit = KK_RC49_fit(params, w, t_values).real
-        im_fit = -KK_RC49_fit(params, w, t_values).imag
-    elif num_RC == 50:
-        re_fit = KK_RC50_fit(params, w, t_values).real
-        im_fit = -KK_RC50_fit(params, w, t_values).imag
-    elif num_RC == 51:
-        re_fit = KK_RC51_fit(params, w, t_values).real
-        im_fit = -KK_RC51_fit(params, w, t_values).imag
-    elif num_RC == 52:
-        re_fit = KK_RC52_fit(params, w, t_values).real
-        im_fit = -KK_RC52_fit(params, w, t_values).imag
-    elif num_RC == 53:
-        re_fit = KK_RC53_fit(params, w, t_values).real
-        im_fit = -KK_RC53_fit(params, w, t_values).imag
-    elif num_RC == 54:
-        re_fit = KK_RC54_fit(params, w, t_values).real
-        im_fit = -KK_RC54_fit(params, w, t_values).imag
-    elif num_RC == 55:
-        re_fit = KK_RC55_fit(params, w, t_values).real
-        im_fit = -KK_RC55_fit(params, w, t_values).imag
-    elif num_RC == 56:
-        re_fit = KK_RC56_fit(params, w, t_values).real
-        im_fit = -KK_RC56_fit(params, w, t_values).imag
-    elif num_RC == 57:
-        re_fit = KK_RC57_fit(params, w, t_values).real
-        im_fit = -KK_RC57_fit(params, w, t_values).imag
-    elif num_RC == 58:
-        re_fit = KK_RC58_fit(params, w, t_values).real
-        im_fit = -KK_RC58_fit(params, w, t_values).imag
-    elif num_RC == 59:
-        re_fit = KK_RC59_fit(params, w, t_values).real
-        im_fit = -KK_RC59_fit(params, w, t_values).imag
-    elif num_RC == 60:
-        re_fit = KK_RC60_fit(params, w, t_values).real
-        im_fit = -KK_RC60_fit(params, w, t_values).imag
-    elif num_RC == 61:
-        re_fit = KK_RC61_fit(params, w, t_values).real
-        im_fit = -KK_RC61_fit(params, w, t_values).imag
-    elif num_RC == 62:
-        re_fit = KK_RC62_fit(params, w, t_values).real
-        im_fit = -KK_RC62_fit(params, w, t_values).imag
-    elif num_RC == 63:
-        re_fit = KK_RC63_fit(params, w, t_values).real
-        im_fit = -KK_RC63_fit(params, w, t_values).imag
-    elif num_RC == 64:
-        re_fit = KK_RC64_fit(params, w, t_values).real
-        im_fit = -KK_RC64_fit(params, w, t_values).imag
-    elif num_RC == 65:
-        re_fit = KK_RC65_fit(params, w, t_values).real
-        im_fit = -KK_RC65_fit(params, w, t_values).imag
-    elif num_RC == 66:
-        re_fit = KK_RC66_fit(params, w, t_values).real
-        im_fit = -KK_RC66_fit(params, w, t_values).imag
-    elif num_RC == 67:
-        re_fit = KK_RC67_fit(params, w, t_values).real
-        im_fit = -KK_RC67_fit(params, w, t_values).imag
-    elif num_RC == 68:
-        re_fit = KK_RC68_fit(params, w, t_values).real
-        im_fit = -KK_RC68_fit(params, w, t_values).imag
-    elif num_RC == 69:
-        re_fit = KK_RC69_fit(params, w, t_values).real
-        im_fit = -KK_RC69_fit(params, w, t_values).imag
-    elif num_RC == 70:
-        re_fit = KK_RC70_fit(params, w, t_values).real
-        im_fit = -KK_RC70_fit(params, w, t_values).imag
-    elif num_RC == 71:
-        re_fit = KK_RC71_fit(params, w, t_values).real
-        im_fit = -KK_RC71_fit(params, w, t_values).imag
-    elif num_RC == 72:
-        re_fit = KK_RC72_fit(params, w, t_values).real
-        im_fit = -KK_RC72_fit(params, w, t_values).imag
-    elif num_RC == 73:
-        re_fit = KK_RC73_fit(params, w, t_values).real
-        im_fit = -KK_RC73_fit(params, w, t_values).imag
-    elif num_RC == 74:
-        re_fit = KK_RC74_fit(params, w, t_values).real
-        im_fit = -KK_RC74_fit(params, w, t_values).imag
-    elif num_RC == 75:
-        re_fit = KK_RC75_fit(params, w, t_values).real
-        im_fit = -KK_RC75_fit(params, w, t_values).imag
-    elif num_RC == 76:
-        re_fit = KK_RC76_fit(params, w, t_values).real
-        im_fit = -KK_RC76_fit(params, w, t_values).imag
-    elif num_RC == 77:
-        re_fit = KK_RC77_fit(params, w, t_values).real
-        im_fit = -KK_RC77_fit(params, w, t_values).imag
-    elif num_RC == 78:
-        re_fit = KK_RC78_fit(params, w, t_values).real
-        im_fit = -KK_RC78_fit(params, w, t_values).imag
-    elif num_RC == 79:
-        re_fit = KK_RC79_fit(params, w, t_values).real
-        im_fit = -KK_RC79_fit(params, w, t_values).imag
-    elif num_RC == 80:
-        re_fit = KK_RC80_fit(params, w, t_values).real
-        im_fit = -KK_RC80_fit(params, w, t_values).imag
-    else:
-        print('In KK_errorfunc() - Define num_RC')
+    Z_fit = KK_RC_fit(params, w, t_values)
+    re_fit = Z_fit.real
+    im_fit = -Z_fit.imag
     error = [(re-re_fit)**2, (im-im_fit)**2] #sum of squares
     
     if weight_func == 'modulus':
@@ -4982,6 +153,694 @@ def KK_errorfunc(params, w, re, im, num_RC, weight_func, t_values):
     return S
 
 
+### Linear least-squares solver
+##
+#
+class KK_linear_fit:
+    '''
+    Result of KK_linear_solve(), i.e. the Lin-KK circuit Rs + sum_k R_k/(1 + jw*t_k) fitted to a spectrum
+
+    Attributes
+    -----------
+    Rs = series resistance [ohm]
+    R_values = resistances of the -RC- elements [ohm]
+    t_values = time constants of the -RC- elements [s]
+    R_names = names of the resistances, i.e. 'R1', 'R2', ...
+    chisqr = weighted sum of squares of the fit
+    params = the fitted values as lmfit Parameters, as given by minimize(KK_errorfunc, ...).params
+    '''
+    def __init__(self, Rs, R_values, t_values, chisqr):
+        self.Rs = Rs
+        self.R_values = R_values
+        self.t_values = t_values
+        self.chisqr = chisqr
+
+    @property
+    def R_names(self):
+        return ['R'+str(k+1) for k in range(len(self.R_values))]
+
+    @property
+    def params(self):
+        from lmfit import Parameters
+        params = Parameters()
+        for name, value in zip(self.R_names, self.R_values):
+            params.add(name, value=value)
+        params.add('Rs', value=self.Rs)
+        return params
+
+    def __repr__(self):
+        return 'KK_linear_fit(Rs='+str(self.Rs)+', num_RC='+str(len(self.R_values))+')'
+
+def KK_design_matrix(w, t_values):
+    '''
+    Complex design matrix of the Lin-KK circuit, [1, 1/(1 + jw*t_1), ..., 1/(1 + jw*t_M)], of shape (len(w), M+1)
+
+    The circuit is linear in Rs and R_k, as the time constants are fixed, i.e. Z = A @ [Rs, R_1, ..., R_M]
+    '''
+    w = np.asarray(w, dtype=float)
+    A = np.ones((w.size, len(t_values)+1), dtype=complex)
+    A[:, 1:] = 1/(1 + 1j*np.multiply.outer(w, t_values))
+    return A
+
+def KK_weights(re, im, weight_func='Boukamp'):
+    '''
+    Weights of the squared real and imaginary errors of the Lin-KK fit
+
+    The weights are found from the data, so the fit is linear: 'modulus' is 1/|Z|, 'proportional' and 'Boukamp' are 1/re^2 and 1/im^2,
+    and 'unity' is 1. Points where a weight is infinite, i.e. re or im is zero, are given the weight zero
+
+    Ref.: Boukamp, B.A. J. Electrochem. Soc., 142, 6, 1885-1894
+
+    Outputs
+    -----------
+    [0] = weights of the real part
+    [1] = weights of the imaginary part
+    '''
+    re = np.asarray(re, dtype=float)
+    im = np.asarray(im, dtype=float)
+    with np.errstate(divide='ignore'):
+        if weight_func == 'modulus':
+            weight_re = 1/((re**2 + im**2)**(1/2))
+            weight_im = weight_re
+        elif weight_func == 'proportional' or weight_func == 'Boukamp':
+            weight_re = 1/(re**2)
+            weight_im = 1/(im**2)
+        elif weight_func == 'unity':
+            weight_re = np.ones(re.size)
+            weight_im = np.ones(im.size)
+        else:
+            raise ValueError("weight_func must be 'Boukamp', 'modulus', 'proportional', or 'unity', not "+repr(weight_func))
+    weight_re = np.where(np.isfinite(weight_re), weight_re, 0)
+    weight_im = np.where(np.isfinite(weight_im), weight_im, 0)
+    return weight_re, weight_im
+
+def KK_linear_solve(w, re, im, t_values, weight_func='Boukamp'):
+    '''
+    Fits the Lin-KK circuit, Rs + sum_k R_k/(1 + jw*t_k), to a spectrum by weighted linear least-squares
+
+    As the time constants are fixed, the fit is linear in Rs and R_k, and it is solved in one step by a SVD based least-squares
+    solution (np.linalg.lstsq) of the real and imaginary rows of the design matrix, each scaled by the square root of its weight.
+    The sum of weighted squared errors is minimized exactly, with no initial guesses or convergence criteria
+
+    Ref.:
+        - Schōnleber, M. et al. Electrochimica Acta 131 (2014) 20-27
+        - Boukamp, B.A. J. Electrochem. Soc., 142, 6, 1885-1894
+
+    Inputs
+    -----------
+    w = angular frequency [1/s]
+    re = real impedance [ohm]
+    im = imaginary impedance, -Z'' [ohm]
+    t_values = time constants of the -RC- elements, see KK_timeconst()
+    weight_func = 'Boukamp' (default), 'modulus', 'proportional', or 'unity', see KK_weights()
+
+    Outputs
+    -----------
+    KK_linear_fit with the fitted Rs and R_values
+    '''
+    re = np.asarray(re, dtype=float)
+    im = np.asarray(im, dtype=float)
+    A = KK_design_matrix(w, t_values)
+    weight_re, weight_im = KK_weights(re, im, weight_func)
+    scale = np.concatenate([weight_re, weight_im])**(1/2)
+    A_w = np.concatenate([A.real, -A.imag])*scale[:, None] #im = -Z''
+    b_w = np.concatenate([re, im])*scale
+    x = np.linalg.lstsq(A_w, b_w, rcond=None)[0]
+    chisqr = np.sum((A_w @ x - b_w)**2)
+    return KK_linear_fit(Rs=x[0], R_values=x[1:], t_values=np.asarray(t_values, dtype=float), chisqr=chisqr)
+
+def KK_mu(R_values):
+    '''
+    Over-fitting measure of the Lin-KK fit, mu = 1 - |sum of negative R_k|/|sum of positive R_k|
+
+    R_values can be the resistances of one fit or a 2-D array with the resistances of one fit per row
+
+    Ref.: Schōnleber, M. et al. Electrochimica Acta 131 (2014) 20-27
+    '''
+    R_values = np.asarray(R_values, dtype=float)
+    R_greater = np.sum(np.where(R_values >= 0, R_values, 0), axis=-1)
+    R_minor = np.sum(np.where(R_values < 0, R_values, 0), axis=-1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return 1-(np.abs(R_minor)/np.abs(R_greater))
+
+def KK_auto_M(w, re, im, weight_func='Boukamp', num_RC_max=80, u_range=[0.75, 0.88], num_RC_start=2):
+    '''
+    Automatic number of -RC- elements, M, of the Lin-KK test of one spectrum
+
+    M is raised from num_RC_start until mu, see KK_mu(), is inside u_range. As the time constants of KK_timeconst() are spread over
+    the frequency range for each M, each M is a new fit by KK_linear_solve(). The search stops at num_RC_max, in which case the M with
+    mu closest to u_range is used. See KK_auto_M_batch() for many spectra with the same frequencies
+
+    Ref.: Schōnleber, M. et al. Electrochimica Acta 131 (2014) 20-27
+
+    Inputs
+    -----------
+    w = angular frequency [1/s]
+    re = real impedance [ohm]
+    im = imaginary impedance, -Z'' [ohm]
+    weight_func = see KK_weights()
+    num_RC_max = largest M of the search
+    u_range = [lower, upper] limits of mu
+    num_RC_start = first M of the search
+
+    Outputs
+    -----------
+    [0] = KK_linear_fit of the chosen M
+    [1] = the values of M that were explored
+    [2] = mu of each explored M, i.e. the explored mu(M) curve
+    '''
+    return KK_auto_M_batch(w, [re], [im], weight_func, num_RC_max, u_range, num_RC_start)[0]
+
+def KK_admittance(re, im):
+    '''
+    Admittance, Y = 1/Z, of a spectrum in the sign convention of re and im, i.e. returns Y' and -Y'' [S] from Z' and -Z'' [ohm]
+
+    The Lin-KK test of Y uses the time constants and the design matrix of Z. The admittance of the -RC- elements in parallel,
+    Y = G_inf + sum_k G_k*(1 - 1/(1 + jw*t_k)), is the Lin-KK circuit with Rs = G_inf + sum_k G_k and R_k = -G_k, so a fit of
+    (Y', -Y'') by KK_linear_solve() is the KK test of Y, and Y is more suited than Z for e.g. capacitive low frequency tails
+
+    Ref.: Schōnleber, M. et al. Electrochimica Acta 131 (2014) 20-27
+    '''
+    with np.errstate(divide='ignore', invalid='ignore'):
+        Y = 1/(np.asarray(re, dtype=float) - 1j*np.asarray(im, dtype=float))
+    return Y.real, -Y.imag
+
+def KK_elements(fit, representation='Z'):
+    '''
+    Resistances [ohm] of a Lin-KK fit of Z, or conductances [S] of a Lin-KK fit of Y, i.e. -R_values, see KK_admittance()
+    '''
+    if representation == 'Y':
+        return -fit.R_values
+    return fit.R_values
+
+### Lin-KK of many spectra with identical frequencies
+##
+#
+@lru_cache(maxsize=128)
+def _KK_basis(w_key, num_RC, weight_func):
+    w = np.frombuffer(w_key)
+    t_values = np.array(KK_timeconst(w=w, num_RC=num_RC))
+    A = KK_design_matrix(w, t_values)
+    A_real = np.concatenate([A.real, -A.imag]) #im = -Z''
+    if weight_func == 'unity': #the weights do not depend on the data, so the pseudo-inverse is shared by all spectra
+        A_pinv = np.linalg.pinv(A_real)
+        A_pinv.setflags(write=False)
+    else:
+        A_pinv = None
+    t_values.setflags(write=False)
+    A_real.setflags(write=False)
+    return t_values, A_real, A_pinv, np.linalg.cond(A_real)
+
+def KK_basis(w, num_RC, weight_func='Boukamp'):
+    '''
+    Cached time constants and design matrix of the Lin-KK circuit for a frequency grid
+
+    The cache is keyed by (frequency grid, num_RC, weight_func), so spectra measured at the same frequencies, e.g. the cycles of a
+    long experiment, share the time constants and the design matrix. For weight_func='unity', the pseudo-inverse of the design matrix
+    is cached as well, as the weights do not depend on the data. The 128 most recently used bases are kept
+
+    Outputs
+    -----------
+    [0] = time constants, see KK_timeconst()
+    [1] = real design matrix of shape (2*len(w), num_RC+1), the real rows followed by the -imaginary rows of KK_design_matrix()
+    [2] = pseudo-inverse of [1] for weight_func='unity', otherwise None
+    [3] = condition number of [1]
+    '''
+    w_key = np.ascontiguousarray(w, dtype=float).tobytes()
+    return _KK_basis(w_key, int(num_RC), 'unity' if weight_func == 'unity' else 'data')
+
+def KK_grid_groups(w_list):
+    '''
+    Groups spectra by their frequencies, returns a dict of {frequency grid: [indices of the spectra in w_list]}
+    '''
+    groups = {}
+    for i, w in enumerate(w_list):
+        groups.setdefault(np.ascontiguousarray(w, dtype=float).tobytes(), []).append(i)
+    return groups
+
+def KK_linear_solve_batch(w, re, im, num_RC, weight_func='Boukamp'):
+    '''
+    Fits the Lin-KK circuit with num_RC -RC- elements to many spectra measured at the same frequencies, see KK_linear_solve()
+
+    The design matrix is taken from KK_basis(). For weight_func='unity' all spectra are solved by one matrix-matrix product with the
+    cached pseudo-inverse. For the data dependent weights, e.g. 'Boukamp', the rows are scaled for each spectrum and the spectra
+    are solved together by the normal equations, or by a stacked SVD where the weighted design matrix may be too ill-conditioned for
+    the normal equations, i.e. at large num_RC
+
+    Inputs
+    -----------
+    w = angular frequency [1/s], shared by the spectra
+    re = real impedance [ohm] of shape (n_spectra, len(w))
+    im = imaginary impedance, -Z'' [ohm] of shape (n_spectra, len(w))
+    num_RC = number of -RC- elements
+    weight_func = see KK_weights()
+
+    Outputs
+    -----------
+    list of KK_linear_fit, one per spectrum
+    '''
+    re = np.atleast_2d(np.asarray(re, dtype=float))
+    im = np.atleast_2d(np.asarray(im, dtype=float))
+    t_values, A_real, A_pinv, A_cond = KK_basis(w, num_RC, weight_func)
+    b = np.concatenate([re, im], axis=1)
+    if A_pinv is not None:
+        x = b @ A_pinv.T
+        r = x @ A_real.T - b
+    else:
+        weight_re, weight_im = KK_weights(re, im, weight_func)
+        scale = np.concatenate([weight_re, weight_im], axis=1)**(1/2)
+        A_w = A_real[None, :, :]*scale[:, :, None]
+        b_w = b*scale
+        x = np.empty((len(b), A_real.shape[1]))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            normal = A_cond*np.max(scale, axis=1)/np.min(scale, axis=1) < 1e6 #upper bound of the condition number of A_w
+        if np.any(normal): #normal equations with the columns scaled to unit norm
+            A_n = A_w[normal]
+            G = A_n.transpose(0, 2, 1) @ A_n
+            norm = np.sqrt(np.diagonal(G, axis1=1, axis2=2))
+            G = G/(norm[:, :, None]*norm[:, None, :])
+            x[normal] = np.linalg.solve(G, ((A_n.transpose(0, 2, 1) @ b_w[normal][:, :, None])[:, :, 0]/norm)[:, :, None])[:, :, 0]/norm
+        if not np.all(normal): #stacked SVD, as np.linalg.lstsq()
+            U, sv, Vt = np.linalg.svd(A_w[~normal], full_matrices=False)
+            cutoff = np.finfo(float).eps*max(A_real.shape)*sv[:, :1]
+            with np.errstate(divide='ignore'):
+                sv_inv = np.where(sv > cutoff, 1/sv, 0)
+            x[~normal] = (Vt.transpose(0, 2, 1) @ (sv_inv*(U.transpose(0, 2, 1) @ b_w[~normal][:, :, None])[:, :, 0])[:, :, None])[:, :, 0]
+        r = (A_w @ x[:, :, None])[:, :, 0] - b_w
+    chisqr = np.sum(r**2, axis=1)
+    return [KK_linear_fit(Rs=x[i, 0], R_values=x[i, 1:], t_values=t_values, chisqr=chisqr[i]) for i in range(len(x))]
+
+def KK_auto_M_batch(w, re, im, weight_func='Boukamp', num_RC_max=80, u_range=[0.75, 0.88], num_RC_start=2, representation='Z'):
+    '''
+    KK_auto_M() of many spectra measured at the same frequencies
+
+    For each M, the spectra whose mu is not yet inside u_range are solved together by KK_linear_solve_batch()
+
+    Inputs
+    -----------
+    re, im = real and imaginary, -Z'', impedance [ohm] of shape (n_spectra, len(w)), other inputs as KK_auto_M()
+    representation = 'Z' (default), or 'Y' if re and im are the admittance, see KK_admittance(), for which mu is found from the
+    conductances of the -RC- elements, i.e. -R_values
+
+    Outputs
+    -----------
+    list of the outputs of KK_auto_M(), one per spectrum
+    '''
+    re = np.atleast_2d(np.asarray(re, dtype=float))
+    im = np.atleast_2d(np.asarray(im, dtype=float))
+    fits = [[] for i in range(len(re))]
+    u_values = [[] for i in range(len(re))]
+    active = np.arange(len(re))
+    for M in range(num_RC_start, max(num_RC_start, num_RC_max)+1):
+        batch = KK_linear_solve_batch(w, re[active], im[active], M, weight_func)
+        u_batch = KK_mu([KK_elements(fit, representation) for fit in batch])
+        for k, i in enumerate(active):
+            fits[i].append(batch[k])
+            u_values[i].append(u_batch[k])
+        active = active[(u_batch <= u_range[0]) | (u_batch >= u_range[1]) | np.isnan(u_batch)]
+        if len(active) == 0:
+            break
+
+    results = []
+    for i in range(len(re)):
+        u = np.array(u_values[i])
+        distance = np.maximum(u_range[0]-u, u-u_range[1]) #negative inside u_range
+        distance = np.where(np.isfinite(distance), distance, np.inf)
+        results.append((fits[i][int(np.argmin(distance))], np.arange(num_RC_start, num_RC_start+len(u)), u))
+    return results
+
+### Lin-KK test without plotting
+##
+#
+class KK_results:
+    '''
+    Results of the Lin-KK test of a set of spectra, see KK_test() and EIS_exp.lin_kk_results()
+
+    Attributes, one entry per spectrum
+    -----------
+    M = number of -RC- elements, array of int
+    mu = over-fitting measure, see KK_mu(), array
+    Rs = series resistance [ohm], array
+    R_values = list of the resistances of the -RC- elements [ohm]
+    t_values = list of the time constants of the -RC- elements [s]
+    Z_fit = list of the impedance of the fitted Lin-KK circuits [ohm]
+    residual_real, residual_imag = lists of the relative residuals, see residual_real() and residual_imag()
+    M_search, u_search = lists of the explored mu(M) curves, see KK_auto_M(), None for a hardwired num_RC
+    fits = list of KK_linear_fit
+    representation = list of 'Z' or 'Y', the representation that is tested. For 'Y', Rs and R_values are the coefficients of the
+    admittance, see KK_admittance(), Z_fit is 1/Y_fit, and the residuals are the relative residuals of Y
+    results_Z, results_Y = KK_results of each representation for representation='both' in KK_test(), otherwise None
+    '''
+    def __init__(self, w, re, im, fits, M_search=None, u_search=None, representation='Z'):
+        if isinstance(representation, str):
+            representation = [representation]*len(fits)
+        self.representation = representation
+        self.fits = fits
+        self.M = np.array([len(fit.R_values) for fit in fits], dtype=int)
+        self.mu = np.array([KK_mu(KK_elements(fits[i], representation[i])) for i in range(len(fits))], dtype=float)
+        self.Rs = np.array([fit.Rs for fit in fits], dtype=float)
+        self.R_values = [fit.R_values for fit in fits]
+        self.t_values = [fit.t_values for fit in fits]
+        self.Z_fit = []
+        self.residual_real = []
+        self.residual_imag = []
+        for i in range(len(fits)):
+            fit = KK_RC(w=w[i], Rs=fits[i].Rs, R_values=fits[i].R_values, t_values=fits[i].t_values)
+            if representation[i] == 'Y':
+                re_i, im_i = KK_admittance(re[i], im[i])
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    self.Z_fit.append(1/fit)
+            else:
+                re_i, im_i = re[i], im[i]
+                self.Z_fit.append(fit)
+            self.residual_real.append(residual_real(re=re_i, fit_re=fit.real, fit_im=-fit.imag))
+            self.residual_imag.append(residual_imag(im=im_i, fit_re=fit.real, fit_im=-fit.imag))
+        self.M_search = M_search
+        self.u_search = u_search
+        self.results_Z = None
+        self.results_Y = None
+
+    @property
+    def max_residual(self):
+        return np.array([np.max(np.abs(np.concatenate([self.residual_real[i], self.residual_imag[i]]))) for i in range(len(self))], dtype=float)
+
+    def __len__(self):
+        return len(self.fits)
+
+    def __repr__(self):
+        return 'KK_results(spectra='+str(len(self))+', M='+str(self.M.tolist())+')'
+
+def _KK_test_chunk(w, re, im, num_RC, weight_func, num_RC_max, representation='Z'):
+    #Lin-KK test of spectra with the same frequencies, w, returns a list of (fit, M_search, u_search)
+    if representation == 'Y':
+        re, im = KK_admittance(re, im)
+    if num_RC == 'auto':
+        return KK_auto_M_batch(w, re, im, weight_func, num_RC_max, representation=representation)
+    decade = np.log10(np.max(w))-np.log10(np.min(w)) #hardwired number of -RC- elements/decade
+    return [(fit, None, None) for fit in KK_linear_solve_batch(w, re, im, int(np.round(num_RC*decade)), weight_func)]
+
+def KK_n_workers(n_jobs):
+    '''
+    Number of workers of n_jobs, i.e. n_jobs or the number of CPUs for n_jobs=-1, raises a ValueError for other values
+    '''
+    if isinstance(n_jobs, (bool, np.bool_)) or not isinstance(n_jobs, (int, np.integer)) or (n_jobs < 1 and n_jobs != -1):
+        raise ValueError('n_jobs must be -1 or an integer >= 1, not '+repr(n_jobs))
+    if n_jobs == -1:
+        return os.cpu_count() or 1
+    return int(n_jobs)
+
+def KK_executor(n_jobs=1, executor='thread'):
+    '''
+    Returns the concurrent.futures executor used by KK_test() for n_jobs workers, or None for n_jobs=1
+
+    Inputs
+    -----------
+    n_jobs = number of workers, -1 uses all CPUs
+    executor = 'thread' (default) or 'process'. Threads share the cached KK_basis() and suffice as numpy releases the GIL in
+    the linear algebra, processes avoid the GIL in the Python parts of the search at the cost of copying the spectra to the workers
+    '''
+    n_jobs = KK_n_workers(n_jobs)
+    if executor not in ('thread', 'process'):
+        raise ValueError("executor must be 'thread' or 'process', not "+repr(executor))
+    if n_jobs == 1:
+        return None
+    if executor == 'process':
+        return ProcessPoolExecutor(max_workers=n_jobs)
+    return ThreadPoolExecutor(max_workers=n_jobs)
+
+def KK_test(w, re, im, num_RC='auto', weight_func='Boukamp', num_RC_max=80, n_jobs=1, executor='thread', representation='Z'):
+    '''
+    Lin-KK test of a set of spectra without plotting or printing, see Lin_KK() for the plots
+
+    Spectra with the same frequencies are tested together, see KK_auto_M_batch() and KK_linear_solve_batch(). With n_jobs > 1,
+    the spectra of each frequency grid are split into n_jobs chunks that are tested concurrently; the results are in the order of
+    the spectra regardless of n_jobs
+
+    With representation='both', Z and Y = 1/Z are tested in one pass on the same time constants and design matrices, see
+    KK_admittance(), and for each spectrum the representation with the smallest largest relative residual is reported
+
+    Inputs
+    -----------
+    w = list of the angular frequencies [1/s] of each spectrum
+    re = list of the real impedances [ohm] of each spectrum
+    im = list of the imaginary impedances, -Z'' [ohm], of each spectrum
+    num_RC = 'auto' for the automatic search of Schōnleber et al., see KK_auto_M(), or the number of -RC- elements/decade
+    weight_func = see KK_weights()
+    num_RC_max = largest number of -RC- elements of the 'auto' search
+    n_jobs = number of workers, default 1, -1 uses all CPUs
+    executor = 'thread' (default), 'process', or a concurrent.futures.Executor, see KK_executor()
+    representation = 'Z' (default), 'Y', or 'both'
+
+    Returns
+    -----------
+    KK_results
+    '''
+    w = [np.asarray(w_i, dtype=float) for w_i in w]
+    re = [np.asarray(re_i, dtype=float) for re_i in re]
+    im = [np.asarray(im_i, dtype=float) for im_i in im]
+    n_workers = KK_n_workers(n_jobs) #before the executor is used, also when it is given
+    pool = executor if isinstance(executor, Executor) else KK_executor(n_workers, executor)
+
+    if representation not in ('Z', 'Y', 'both'):
+        raise ValueError("representation must be 'Z', 'Y', or 'both', not "+repr(representation))
+    representations = ['Z', 'Y'] if representation == 'both' else [representation]
+
+    chunks = [] #spectra with the same frequencies, split in n_workers chunks
+    for grid, spectra in KK_grid_groups(w).items():
+        for chunk in np.array_split(np.array(spectra), min(n_workers, len(spectra))):
+            chunks.append(chunk.tolist())
+    args = []
+    for rep in representations: #Z and Y of a grid share the cached KK_basis()
+        args.extend([(w[chunk[0]], [re[i] for i in chunk], [im[i] for i in chunk], num_RC, weight_func, num_RC_max, rep) for chunk in chunks])
+    if pool is None:
+        results = [_KK_test_chunk(*arg) for arg in args]
+    else:
+        try:
+            results = list(pool.map(_KK_test_chunk, *zip(*args))) #map keeps the order of the chunks
+        finally:
+            if pool is not executor:
+                pool.shutdown()
+
+    kk_results = {}
+    for k, rep in enumerate(representations):
+        fits = [None]*len(w)
+        M_search = [None]*len(w)
+        u_search = [None]*len(w)
+        for chunk, result in zip(chunks, results[k*len(chunks):(k+1)*len(chunks)]):
+            for i, (fit, M_values, u_values) in zip(chunk, result):
+                fits[i] = fit
+                M_search[i] = M_values
+                u_search[i] = u_values
+        if num_RC != 'auto':
+            M_search = u_search = None
+        kk_results[rep] = KK_results(w, re, im, fits, M_search, u_search, rep)
+    if representation != 'both':
+        return kk_results[representation]
+
+    best = np.where(kk_results['Y'].max_residual < kk_results['Z'].max_residual, 'Y', 'Z') #nan compares False, i.e. 'Z'
+    fits = [kk_results[best[i]].fits[i] for i in range(len(w))]
+    if num_RC == 'auto':
+        M_search = [kk_results[best[i]].M_search[i] for i in range(len(w))]
+        u_search = [kk_results[best[i]].u_search[i] for i in range(len(w))]
+    results = KK_results(w, re, im, fits, M_search, u_search, best.tolist())
+    results.results_Z = kk_results['Z']
+    results.results_Y = kk_results['Y']
+    return results
+
+### Automatic masking of frequencies
+##
+#
+def KK_auto_mask(w, re, im, threshold=0.01, num_RC=3, weight_func='Boukamp', min_points=10, max_iter=20):
+    '''
+    Finds the frequencies of each spectrum that pass the Lin-KK test by trimming the high and low frequency ends
+
+    The spectra are KK tested by KK_test(), and the point at the high and at the low frequency end is removed if its relative residual
+    is above the threshold, see residual_real() and residual_imag(). This is repeated for the trimmed spectra until no more points are
+    removed, max_iter is reached, or fewer than min_points would be left. One point is removed per end and iteration, as a corrupted
+    end distorts the fit, which raises the residuals of the good points next to it until the corrupted points are removed. Points
+    inside the spectrum are not removed, as they are not a cut-off, and all spectra with the same remaining frequencies are tested
+    together in each iteration
+
+    Inputs
+    -----------
+    w = list of the angular frequencies [1/s] of each spectrum
+    re = list of the real impedances [ohm] of each spectrum
+    im = list of the imaginary impedances, -Z'' [ohm], of each spectrum
+    threshold = limit of the relative residuals, default 0.01 (1%)
+    num_RC = number of -RC- elements/decade, default 3, or 'auto', see KK_test(). A hardwired num_RC is used by default, as the
+    'auto' search runs to num_RC_max for spectra where mu never reaches its range, which is common for spectra with little noise
+    weight_func = see KK_weights()
+    min_points = smallest number of points left in a spectrum, default 10
+    max_iter = largest number of iterations, i.e. of points removed at each end, default 20
+
+    Outputs
+    -----------
+    list of boolean arrays, True for the points of each spectrum that are kept, in the order of w
+    '''
+    w = [np.asarray(w_i, dtype=float) for w_i in w]
+    re = [np.asarray(re_i, dtype=float) for re_i in re]
+    im = [np.asarray(im_i, dtype=float) for im_i in im]
+    order = [np.argsort(w_i)[::-1] for w_i in w] #high to low frequency
+    first = [0]*len(w) #index in order of the highest kept frequency
+    last = [len(w_i) for w_i in w] #index in order after the lowest kept frequency
+    active = [i for i in range(len(w)) if len(w[i]) > min_points]
+    for iteration in range(max_iter):
+        if len(active) == 0:
+            break
+        kept = [order[i][first[i]:last[i]] for i in active]
+        results = KK_test(w=[w[i][k] for i, k in zip(active, kept)], re=[re[i][k] for i, k in zip(active, kept)], im=[im[i][k] for i, k in zip(active, kept)], num_RC=num_RC, weight_func=weight_func)
+        trimmed = []
+        for j, i in enumerate(active):
+            bad = (np.abs(results.residual_real[j]) > threshold) | (np.abs(results.residual_imag[j]) > threshold)
+            bad = bad | ~np.isfinite(results.residual_real[j]) | ~np.isfinite(results.residual_imag[j])
+            n_high = int(bad[0]) #high frequency end
+            n_low = int(bad[-1])
+            if n_high + n_low == 0 or len(bad) - n_high - n_low < min_points:
+                continue
+            first[i] += n_high
+            last[i] -= n_low
+            trimmed.append(i)
+        active = trimmed
+
+    masks = []
+    for i in range(len(w)):
+        keep = np.zeros(len(w[i]), dtype=bool)
+        keep[order[i][first[i]:last[i]]] = True
+        masks.append(keep)
+    return masks
+
+### Streaming Lin-KK test
+##
+#
+class KK_stream:
+    '''
+    Streaming Lin-KK test of a spectrum that is measured one frequency at a time
+
+    The time constants are fixed from the planned sweep by KK_timeconst(), so the Lin-KK circuit is linear in Rs and R_k, and
+    the fit is updated for each new point by recursive least-squares (RLS) with the weights of KK_weights(). After each point,
+    the relative residuals of all points measured so far, see residual_real() and residual_imag(), are found from the updated
+    fit, and points with |residual| > threshold are flagged, e.g. to stop a drifting measurement before the sweep is done.
+
+    The RLS is started with P = (prior*|Z|)^2*I at the first point, i.e. a weak ridge penalty on Rs and R_k, which keeps the fit
+    defined before there are as many points as -RC- elements. Points are only flagged from min_points on
+
+    Inputs
+    -----------
+    f_start = first frequency of the planned sweep [Hz]
+    f_stop = last frequency of the planned sweep [Hz]
+    num_RC = number of -RC- elements/decade of the planned sweep, default 3
+    weight_func = 'Boukamp' (default), 'modulus', 'proportional', or 'unity', see KK_weights()
+    threshold = limit of the relative residuals, default 0.01 (1%)
+    min_points = number of points before residuals are flagged, default 'none' is the number of -RC- elements + 1
+    prior = scale of the initial RLS covariance relative to the first |Z|, default 1e4
+
+    Example
+    -----------
+    kk = KK_stream(f_start=1e5, f_stop=1e-2)
+    for f, re, im in sweep:
+        if not kk.add(f, re, im):
+            print('KK violated at', kk.f[kk.violations])
+    '''
+    def __init__(self, f_start, f_stop, num_RC=3, weight_func='Boukamp', threshold=0.01, min_points='none', prior=1e4):
+        KK_weights(1, 1, weight_func) #raises for an invalid weight_func
+        decade = np.abs(np.log10(f_start)-np.log10(f_stop))
+        self.t_values = np.array(KK_timeconst(w=2*np.pi*np.array([f_start, f_stop], dtype=float), num_RC=max(int(np.round(num_RC*decade)), 2)))
+        self.weight_func = weight_func
+        self.threshold = threshold
+        if min_points == 'none':
+            self.min_points = len(self.t_values)+1
+        else:
+            self.min_points = min_points
+        self.prior = prior
+        self.x = np.zeros(len(self.t_values)+1) #[Rs, R_1, ..., R_M]
+        self.P = None
+        self.chisqr = 0
+        self._f = []
+        self._re = []
+        self._im = []
+        self._A = []
+        self.residual_real = np.zeros(0)
+        self.residual_imag = np.zeros(0)
+        self.violations = np.zeros(0, dtype=int)
+
+    def add(self, f, re, im):
+        '''
+        Updates the fit with a new point and returns False if any residual of the points measured so far exceeds the threshold
+
+        Inputs
+        -----------
+        f = frequency [Hz]
+        re = real impedance [ohm]
+        im = imaginary impedance, -Z'' [ohm]
+        '''
+        A = KK_design_matrix([2*np.pi*f], self.t_values)[0]
+        weight_re, weight_im = KK_weights([re], [im], self.weight_func)
+        if self.P is None:
+            self.P = np.eye(len(self.x))*(self.prior*np.abs(complex(re, im)))**2
+        for row, y, weight in ((A.real, re, weight_re[0]), (-A.imag, im, weight_im[0])): #rank-1 RLS update of each row, im = -Z''
+            if weight == 0:
+                continue
+            h = row*weight**(1/2)
+            y = y*weight**(1/2)
+            Ph = self.P @ h
+            gain = Ph/(1 + h @ Ph)
+            error = y - h @ self.x
+            self.x = self.x + gain*error
+            self.P = self.P - np.outer(gain, Ph)
+            self.chisqr += error*(y - h @ self.x)
+        self.P = (self.P + self.P.T)/2
+        self._f.append(f)
+        self._re.append(re)
+        self._im.append(im)
+        self._A.append(A)
+
+        Z_fit = np.array(self._A) @ self.x
+        self.residual_real = residual_real(re=self.re, fit_re=Z_fit.real, fit_im=-Z_fit.imag)
+        self.residual_imag = residual_imag(im=self.im, fit_re=Z_fit.real, fit_im=-Z_fit.imag)
+        if len(self._f) < self.min_points:
+            self.violations = np.zeros(0, dtype=int)
+        else:
+            self.violations = np.flatnonzero((np.abs(self.residual_real) > self.threshold) | (np.abs(self.residual_imag) > self.threshold))
+        return self.valid
+
+    @property
+    def valid(self):
+        return len(self.violations) == 0
+
+    @property
+    def f(self):
+        return np.array(self._f, dtype=float)
+
+    @property
+    def re(self):
+        return np.array(self._re, dtype=float)
+
+    @property
+    def im(self):
+        return np.array(self._im, dtype=float)
+
+    @property
+    def Rs(self):
+        return self.x[0]
+
+    @property
+    def R_values(self):
+        return self.x[1:]
+
+    @property
+    def mu(self):
+        return KK_mu(self.R_values)
+
+    @property
+    def fit(self):
+        return KK_linear_fit(Rs=self.Rs, R_values=self.R_values, t_values=self.t_values, chisqr=self.chisqr)
+
+    def __len__(self):
+        return len(self._f)
+
+    def __repr__(self):
+        return 'KK_stream(points='+str(len(self))+', num_RC='+str(len(self.t_values))+', valid='+str(self.valid)+')'
+
 ### Functions for Evaluating Fits
 ##
 #
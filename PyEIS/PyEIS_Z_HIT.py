@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+This script contains the Z-HIT (Hilbert transform) consistency check, a fast complement to the linear Kramers-Kronig test
+
+Z-HIT reconstructs the modulus of the impedance from its phase, as the two are related by a Hilbert transform for causal,
+linear, and stable systems. The reconstruction is a numerical integral of the phase over log(w), so it needs no fitting and
+is vectorized over all spectra measured at the same frequencies, which makes it suited for pre-screening large data sets
+before the Lin-KK test and CNLS fitting. Deviations between the measured and the reconstructed modulus are given as relative
+residuals in the format of residual_real() and residual_imag()
+
+Ref.:
+    - Ehm, W. et al. Acta Chimica Hungarica 137 (2000) 145-157
+    - Schiller, C.A. et al. Electrochimica Acta 46 (2001) 3619-3625
+"""
+import numpy as np
+from .PyEIS_Lin_KK import KK_grid_groups, residual_real, residual_imag
+
+### Z-HIT reconstruction
+##
+#
+def Z_HIT(w, re, im, ref_range='none', gamma=-np.pi/6):
+    '''
+    Reconstructs |Z| from the phase of the impedance by Z-HIT
+
+    ln|Z(w0)| = const + 2/pi*integral(phi(w) dln(w), w_min, w0) + gamma*dphi(w0)/dln(w)
+
+    The integral is found by the trapezoidal rule and the derivative by central differences on log(w). The constant is the mean
+    of ln|Z_data| - ln|Z_HIT| over the reference range, as the integral only gives |Z| up to a factor
+
+    The reconstruction is an approximation, i.e. |Z| of an ideal -RC- element is reconstructed within ~2%, so the residuals should be
+    compared with a threshold of a few %, while the Lin-KK residuals are exact for KK compliant data
+
+    Inputs
+    -----------
+    w = angular frequency [1/s]
+    re = real impedance [ohm], of shape (len(w),) or (n_spectra, len(w)) for spectra measured at w
+    im = imaginary impedance, -Z'' [ohm], of the same shape as re
+    ref_range = [f_min, f_max] frequency range [Hz] in which |Z_HIT| is matched to the data, default 'none' uses all points
+    gamma = factor of the derivative term, default -pi/6
+
+    Outputs
+    -----------
+    |Z| reconstructed from the phase [ohm], of the same shape as re
+    '''
+    w = np.asarray(w, dtype=float)
+    re = np.asarray(re, dtype=float)
+    im = np.asarray(im, dtype=float)
+    shape = re.shape
+    re = re.reshape(-1, w.size)
+    im = im.reshape(-1, w.size)
+
+    order = np.argsort(w)
+    ln_w = np.log(w[order])
+    phase = np.unwrap(np.arctan2(-im[:, order], re[:, order]), axis=1) #im = -Z''
+    integral = np.zeros(phase.shape)
+    integral[:, 1:] = np.cumsum((phase[:, 1:] + phase[:, :-1])/2*np.diff(ln_w), axis=1)
+    ln_modulus = 2/np.pi*integral + gamma*np.gradient(phase, ln_w, axis=1)
+
+    if ref_range == 'none':
+        ref = np.ones(w.size, dtype=bool)
+    else:
+        f = w[order]/(2*np.pi)
+        ref = (f >= min(ref_range)) & (f <= max(ref_range))
+        if not np.any(ref):
+            raise ValueError('no frequencies in ref_range '+str(ref_range))
+    ln_modulus_data = np.log(np.hypot(re[:, order], im[:, order]))
+    offset = np.mean(ln_modulus_data[:, ref] - ln_modulus[:, ref], axis=1)
+
+    modulus = np.empty(phase.shape)
+    modulus[:, order] = np.exp(ln_modulus + offset[:, None])
+    return modulus.reshape(shape)
+
+class Z_HIT_results:
+    '''
+    Results of the Z-HIT check of a set of spectra, see Z_HIT_test() and EIS_exp.z_hit_results()
+
+    Attributes, one entry per spectrum
+    -----------
+    modulus = list of |Z| reconstructed from the phase [ohm]
+    Z_fit = list of the impedance with the reconstructed modulus and the measured phase [ohm]
+    residual_real, residual_imag = lists of the relative residuals of Z_fit, see residual_real() and residual_imag()
+    residual_modulus = list of the relative residuals of the modulus, (|Z| - |Z_HIT|)/|Z_HIT|
+    max_residual = largest absolute relative residual of the modulus, array
+    '''
+    def __init__(self, re, im, modulus):
+        self.modulus = modulus
+        self.Z_fit = []
+        self.residual_real = []
+        self.residual_imag = []
+        self.residual_modulus = []
+        for i in range(len(modulus)):
+            Z = re[i] - 1j*im[i]
+            self.Z_fit.append(modulus[i]*np.exp(1j*np.angle(Z)))
+            self.residual_real.append(residual_real(re=re[i], fit_re=self.Z_fit[i].real, fit_im=-self.Z_fit[i].imag))
+            self.residual_imag.append(residual_imag(im=im[i], fit_re=self.Z_fit[i].real, fit_im=-self.Z_fit[i].imag))
+            self.residual_modulus.append((np.abs(Z) - modulus[i])/modulus[i])
+        self.max_residual = np.array([np.max(np.abs(residual)) for residual in self.residual_modulus], dtype=float)
+
+    def __len__(self):
+        return len(self.modulus)
+
+    def __repr__(self):
+        return 'Z_HIT_results(spectra='+str(len(self))+')'
+
+def Z_HIT_test(w, re, im, ref_range='none', gamma=-np.pi/6):
+    '''
+    Z-HIT check of a set of spectra, the spectra measured at the same frequencies are reconstructed together, see Z_HIT()
+
+    Inputs
+    -----------
+    w = list of the angular frequencies [1/s] of each spectrum
+    re = list of the real impedances [ohm] of each spectrum
+    im = list of the imaginary impedances, -Z'' [ohm], of each spectrum
+    ref_range, gamma = see Z_HIT()
+
+    Returns
+    -----------
+    Z_HIT_results
+    '''
+    w = [np.asarray(w_i, dtype=float) for w_i in w]
+    re = [np.asarray(re_i, dtype=float) for re_i in re]
+    im = [np.asarray(im_i, dtype=float) for im_i in im]
+    modulus = [None]*len(w)
+    for grid, spectra in KK_grid_groups(w).items():
+        modulus_grid = Z_HIT(w[spectra[0]], np.array([re[i] for i in spectra]), np.array([im[i] for i in spectra]), ref_range, gamma)
+        for i, modulus_i in zip(spectra, modulus_grid):
+            modulus[i] = modulus_i
+    return Z_HIT_results(re, im, modulus)
@@ -1,7 +1,25 @@
 """
+PyEIS is loaded on first use: "from PyEIS import *" and attributes such as PyEIS.EIS_exp import PyEIS.py, including matplotlib
+and seaborn, while the compute-only modules, e.g. "from PyEIS.PyEIS_Lin_KK import KK_test" or
+"from PyEIS.PyEIS_Data_extraction import extract_mpt", can be imported without them, e.g. on headless batch or cluster nodes
 """
+import importlib
 
-from .PyEIS import *
+__version__ = '1.0.11'
 
+def _load():
+    return importlib.import_module('.PyEIS', __name__)
 
-__version__ = '1.0.9'
\ No newline at end of file
+def __getattr__(name):
+    if name.startswith('__') and name != '__all__':
+        raise AttributeError("module "+repr(__name__)+" has no attribute "+repr(name))
+    module = _load()
+    if name == '__all__': #names of "from PyEIS import *", as before PyEIS.py was loaded on first use
+        return [key for key in vars(module) if not key.startswith('_')]
+    try:
+        return getattr(module, name)
+    except AttributeError:
+        raise AttributeError("module "+repr(__name__)+" has no attribute "+repr(name)) from None
+
+def __dir__():
+    return sorted(set(globals()) | set(vars(_load())))
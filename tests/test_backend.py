@@ -0,0 +1,70 @@
+"""
+Parity of the numba backend of PyEIS_Backend.py with the numpy backend
+"""
+import numpy as np
+import pytest
+
+pytest.importorskip('numba')
+
+from PyEIS.PyEIS_Backend import KK_RC_sum, numba_available, scalar_coth, scalar_csch
+from PyEIS.PyEIS_Circuit_builder import R, C, L, Q, W, TLs, TL, Series, Parallel, compile_tree
+from PyEIS.PyEIS_Hyperbolic import coth, csch
+
+w = 2*np.pi*np.logspace(-3, 6, 91)
+
+params = {'Rs': 10.0, 'R': 250.0, 'C': 2e-5, 'L': 3e-7, 'Q': 4e-5, 'n': 0.83, 'sigma': 35.0,
+          'Ri': 120.0, 'Rel': 8.0, 'L_TL': 0.01}
+
+circuits = {
+    'R': Series(R('Rs'), R('R')),
+    'C': Series(R('Rs'), C('C')),
+    'L': Series(R('Rs'), L('L')),
+    'Q': Series(R('Rs'), Q('Q', 'n')),
+    'W': Series(R('Rs'), W('sigma')),
+    'RQ': Series(R('Rs'), Parallel(R('R'), Q('Q', 'n'))),
+    'RC-W': Series(R('Rs'), Parallel(C('C'), Series(R('R'), W('sigma')))),
+    'TLs': Series(R('Rs'), TLs(Q('Q', 'n'), Ri='Ri', L='L_TL')),
+    'TLs-RQ': Series(R('Rs'), TLs(Parallel(R('R'), Q('Q', 'n')), Ri='Ri', L='L_TL')),
+    'TL': Series(R('Rs'), TL(Q('Q', 'n'), Rel='Rel', Ri='Ri', L='L_TL')),
+    'TL-RQ': Series(R('Rs'), TL(Parallel(R('R'), Q('Q', 'n')), Rel='Rel', Ri='Ri', L='L_TL')),
+}
+
+def test_numba_available():
+    assert numba_available
+
+@pytest.mark.parametrize('name', list(circuits))
+def test_circuit_parity(name):
+    tree = circuits[name]
+    circuit_numpy = compile_tree(tree, backend='numpy')
+    circuit_numba = compile_tree(tree, backend='numba')
+    values = dict((key, params[key]) for key in circuit_numpy.param_names)
+    Z_numpy = circuit_numpy(values, w)
+    Z_numba = circuit_numba(values, w)
+    assert Z_numba.dtype == np.complex128
+    np.testing.assert_allclose(Z_numba, Z_numpy, rtol=1e-12, atol=0)
+
+def test_circuit_parity_long_line():
+    #L/Lam > asymptotic_limit, the asymptotic branches of coth() and csch()
+    tree = Series(R('Rs'), TL(Q('Q', 'n'), Rel='Rel', Ri='Ri', L='L_TL'))
+    values = dict(params, L_TL=50.0)
+    Z_numpy = compile_tree(tree, backend='numpy')(values, w)
+    Z_numba = compile_tree(tree, backend='numba')(values, w)
+    assert np.all(np.isfinite(Z_numba))
+    np.testing.assert_allclose(Z_numba, Z_numpy, rtol=1e-12, atol=0)
+
+@pytest.mark.parametrize('num_RC', [1, 7, 40])
+def test_KK_RC_sum_parity(num_RC):
+    rng = np.random.default_rng(num_RC)
+    t_values = np.logspace(-6, 2, num_RC)
+    R_values = rng.normal(scale=100, size=num_RC)
+    Z_numpy = KK_RC_sum(w, 12.5, R_values, t_values, backend='numpy')
+    Z_numba = KK_RC_sum(w, 12.5, R_values, t_values, backend='numba')
+    np.testing.assert_allclose(Z_numba, Z_numpy, rtol=1e-12, atol=1e-12*np.sum(np.abs(R_values)))
+
+x = [complex(sign*re, im) for re in (1e-9, 1e-4, 0.3, 5.0, 18.9, 19.0, 19.1, 40.0, 800.0) for im in (0.0, 1e-7, 0.7, -2.9) for sign in (1, -1)]
+
+@pytest.mark.parametrize('scalar, vectorized', [(scalar_coth, coth), (scalar_csch, csch)], ids=['coth', 'csch'])
+def test_scalar_hyperbolic_parity(scalar, vectorized):
+    expected = vectorized(np.array(x))
+    out = np.array([scalar(x_i) for x_i in x])
+    np.testing.assert_allclose(out, expected, rtol=1e-14, atol=0)
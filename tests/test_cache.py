@@ -0,0 +1,159 @@
+"""
+The on-disk cache of parsed data files of PyEIS_Cache.py
+"""
+import os
+import pathlib
+import shutil
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import PyEIS.PyEIS_Cache as PyEIS_Cache
+from PyEIS.PyEIS_Cache import extract_cached, get_cache, set_cache, cache_key, extract_signature
+from PyEIS.PyEIS_Data_extraction import extract_mpt, extract_dta
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+tutorial_path = os.path.join(root, 'Tutorials', 'data')+os.sep
+
+@pytest.fixture
+def data_path(tmp_path):
+    (tmp_path/'data').mkdir()
+    shutil.copy(tutorial_path+'ex1.mpt', tmp_path/'data')
+    return str(tmp_path/'data')+os.sep
+
+@pytest.fixture
+def cache(tmp_path):
+    return str(tmp_path/'cache')
+
+@pytest.fixture
+def restore_cache():
+    directory, max_size = get_cache()
+    yield
+    set_cache(directory, max_size)
+
+def entries(cache):
+    return sorted(name for name in os.listdir(cache) if name.endswith('.npz')) if os.path.isdir(cache) else []
+
+def counted(extract):
+    #extract function that records its calls, i.e. the cache misses
+    calls = []
+    def extract_counted(**kwargs):
+        calls.append(kwargs['EIS_name'])
+        return extract(**kwargs)
+    return extract_counted, calls
+
+def replace_value(file_path, old, new):
+    #changes a value of a data file without changing its size, and moves its modification time
+    with open(file_path, 'rb') as file:
+        content = file.read()
+    assert len(old) == len(new) and content.count(old) == 1
+    stat = os.stat(file_path)
+    with open(file_path, 'wb') as file:
+        file.write(content.replace(old, new))
+    os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns+10**9))
+
+def test_cache_hit(data_path, cache):
+    extract, calls = counted(extract_mpt)
+    first = extract_cached(extract, path=data_path, EIS_name='ex1.mpt', cache=cache)
+    second = extract_cached(extract, path=data_path, EIS_name='ex1.mpt', cache=cache)
+    assert calls == ['ex1.mpt'] and entries(cache) == [cache_key(data_path+'ex1.mpt', extract)]
+    pd.testing.assert_frame_equal(second, first)
+    pd.testing.assert_frame_equal(second, extract_mpt(path=data_path, EIS_name='ex1.mpt'))
+
+def test_cache_miss_after_modification(data_path, cache):
+    extract, calls = counted(extract_mpt)
+    first = extract_cached(extract, path=data_path, EIS_name='ex1.mpt', cache=cache)
+    stat = os.stat(data_path+'ex1.mpt')
+    os.utime(data_path+'ex1.mpt', ns=(stat.st_atime_ns, stat.st_mtime_ns+10**9)) #touched, but not changed
+    extract_cached(extract, path=data_path, EIS_name='ex1.mpt', cache=cache)
+    assert len(calls) == 1
+
+    replace_value(data_path+'ex1.mpt', b'4.2890558E+002', b'4.2890559E+002') #same size, new modification time
+    second = extract_cached(extract, path=data_path, EIS_name='ex1.mpt', cache=cache)
+    assert len(calls) == 2 and second.re[0] == 428.90559 and first.re[0] == 428.90558
+
+    with open(data_path+'ex1.mpt', 'ab') as file: #new size
+        file.write(b'\n1.0E+000\t1.0\t1.0')
+    third = extract_cached(extract, path=data_path, EIS_name='ex1.mpt', cache=cache)
+    assert len(calls) == 3 and len(third) == len(second)+1
+    pd.testing.assert_frame_equal(extract_cached(extract, path=data_path, EIS_name='ex1.mpt', cache=cache), third)
+    assert len(calls) == 3 and len(entries(cache)) == 1
+
+def test_cache_key(data_path, cache):
+    file_path = data_path+'ex1.mpt'
+    keys = [cache_key(file_path, extract_mpt), cache_key(file_path, extract_mpt, columns='all'),
+            cache_key(file_path, extract_mpt, columns='all', aux_dtype=np.float32), cache_key(file_path, extract_dta)]
+    assert len(set(keys)) == len(keys)
+    assert cache_key(file_path, extract_mpt, columns=['f', 're']) == cache_key(file_path, extract_mpt, columns=('f', 're'))
+    for columns, aux_dtype in [('analysis', np.float64), ('all', np.float64), ('all', np.float32)]:
+        extract_cached(extract_mpt, path=data_path, EIS_name='ex1.mpt', columns=columns, aux_dtype=aux_dtype, cache=cache)
+    assert entries(cache) == sorted(keys[:3])
+
+def test_cache_key_extract_code():
+    #an extract function with changed code, but the same name, does not use the entries of the old code
+    def extract(**kwargs):
+        return 1
+    old = extract_signature(extract)
+    def extract(**kwargs):
+        return 2
+    assert extract_signature(extract) != old and extract_signature(extract).split(':')[0] == old.split(':')[0]
+
+def test_cache_eviction(data_path, cache, restore_cache):
+    for name in ['ex1b.mpt', 'ex1c.mpt']:
+        shutil.copy(data_path+'ex1.mpt', data_path+name)
+    extract, calls = counted(extract_mpt)
+    key = dict((name, cache_key(data_path+name, extract)) for name in ['ex1.mpt', 'ex1b.mpt', 'ex1c.mpt'])
+    extract_cached(extract, path=data_path, EIS_name='ex1.mpt', cache=cache)
+    extract_cached(extract, path=data_path, EIS_name='ex1b.mpt', cache=cache)
+    size = os.path.getsize(os.path.join(cache, key['ex1.mpt']))
+    now = time.time_ns()
+    os.utime(os.path.join(cache, key['ex1.mpt']), ns=(now-2*10**11, now-2*10**11))
+    os.utime(os.path.join(cache, key['ex1b.mpt']), ns=(now-10**11, now-10**11))
+
+    extract_cached(extract, path=data_path, EIS_name='ex1.mpt', cache=cache) #a hit marks ex1.mpt as recently used
+    assert calls == ['ex1.mpt', 'ex1b.mpt']
+    set_cache(max_size=2.5*size)
+    extract_cached(extract, path=data_path, EIS_name='ex1c.mpt', cache=cache)
+    assert entries(cache) == sorted([key['ex1.mpt'], key['ex1c.mpt']]) #the least recently used entry is removed
+    extract_cached(extract, path=data_path, EIS_name='ex1b.mpt', cache=cache)
+    assert calls == ['ex1.mpt', 'ex1b.mpt', 'ex1c.mpt', 'ex1b.mpt']
+
+def test_url_not_cached(data_path, cache):
+    url = pathlib.Path(data_path).as_uri()+'/'
+    data = extract_cached(extract_mpt, path=url, EIS_name='ex1.mpt', cache=cache)
+    pd.testing.assert_frame_equal(data, extract_mpt(path=data_path, EIS_name='ex1.mpt'))
+    assert entries(cache) == []
+
+def test_cache_off_by_default(data_path, cache, restore_cache, monkeypatch):
+    assert get_cache()[0] == 'none'
+    def cache_write(entry, arrays):
+        raise AssertionError('cache entry written to '+entry)
+    monkeypatch.setattr(PyEIS_Cache, 'cache_write', cache_write)
+    extract_cached(extract_mpt, path=data_path, EIS_name='ex1.mpt')
+    monkeypatch.undo()
+    set_cache(cache)
+    extract_cached(extract_mpt, path=data_path, EIS_name='ex1.mpt')
+    assert len(entries(cache)) == 1
+    set_cache('none')
+    extract_cached(extract_mpt, path=data_path, EIS_name='ex1.mpt', columns='all')
+    assert len(entries(cache)) == 1
+
+@pytest.mark.skipif(os.name == 'nt' or os.geteuid() == 0, reason='the permissions of a read-only directory are not enforced')
+def test_read_only_cache(data_path, cache):
+    os.makedirs(cache)
+    os.chmod(cache, 0o555)
+    try:
+        with pytest.warns(UserWarning, match='could not be cached'):
+            data = extract_cached(extract_mpt, path=data_path, EIS_name='ex1.mpt', cache=cache)
+    finally:
+        os.chmod(cache, 0o755)
+    pd.testing.assert_frame_equal(data, extract_mpt(path=data_path, EIS_name='ex1.mpt'))
+    assert entries(cache) == []
+
+def test_unwritable_cache(data_path):
+    cache = os.path.join(data_path, 'ex1.mpt', 'cache') #below a file, i.e. unwritable also for root
+    with pytest.warns(UserWarning, match='could not be cached'):
+        data = extract_cached(extract_mpt, path=data_path, EIS_name='ex1.mpt', cache=cache)
+    pd.testing.assert_frame_equal(data, extract_mpt(path=data_path, EIS_name='ex1.mpt'))
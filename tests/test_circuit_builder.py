@@ -0,0 +1,108 @@
+"""
+Circuit builder of PyEIS_Circuit_builder.py against the built-in circuits, and its simplification rules and Jacobians
+"""
+import numpy as np
+import pytest
+
+from PyEIS.PyEIS import cir_RsRQ, cir_RsRQRQ, cir_RsRCC, cir_Randles_simplified, cir_RsTLsQ, cir_RsTLs, cir_RsTLQ, cir_RsTL
+from PyEIS.PyEIS_Circuit_builder import R, C, L, Q, W, TLs, TL, Series, Parallel, compile_tree
+
+w = 2*np.pi*np.logspace(-2, 5, 50)
+
+values = dict(Rs=10.0, R=100.0, Q=1e-4, n=0.8, R1=80.0, C1=1e-6, R2=50.0, Q2=1e-3, n2=0.7, C=1e-5, sigma=30.0,
+              L=1e-3, Ri=500.0, Rel=20.0, Lind=3e-7)
+
+def RQ(R_name, Q_name, n_name):
+    return Parallel(R(R_name), Q(Q_name, n_name))
+
+builtin = [
+    ('R-RQ', Series(R('Rs'), RQ('R', 'Q', 'n')),
+     lambda p: cir_RsRQ(w, Rs=p['Rs'], R=p['R'], Q=p['Q'], n=p['n'])),
+    ('R-RQ-RQ', Series(R('Rs'), RQ('R', 'Q', 'n'), RQ('R2', 'Q2', 'n2')),
+     lambda p: cir_RsRQRQ(w, Rs=p['Rs'], R=p['R'], Q=p['Q'], n=p['n'], R2=p['R2'], Q2=p['Q2'], n2=p['n2'])),
+    ('R-RC-C', Series(R('Rs'), Parallel(R('R1'), C('C1')), C('C')),
+     lambda p: cir_RsRCC(w, Rs=p['Rs'], R1=p['R1'], C1=p['C1'], C=p['C'])),
+    ('R-(Q(RW))', Series(R('Rs'), Parallel(Q('Q', 'n'), Series(R('R'), W('sigma')))),
+     lambda p: cir_Randles_simplified(w, Rs=p['Rs'], R=p['R'], n=p['n'], sigma=p['sigma'], Q=p['Q'])),
+    ('R-TLsQ', Series(R('Rs'), TLs(Q('Q', 'n'), Ri='Ri', L='L')),
+     lambda p: cir_RsTLsQ(w, Rs=p['Rs'], L=p['L'], Ri=p['Ri'], Q=p['Q'], n=p['n'])),
+    ('R-TLs', Series(R('Rs'), TLs(RQ('R', 'Q', 'n'), Ri='Ri', L='L')),
+     lambda p: cir_RsTLs(w, Rs=p['Rs'], L=p['L'], Ri=p['Ri'], R=p['R'], Q=p['Q'], n=p['n'])),
+    ('R-TLQ', Series(R('Rs'), TL(Q('Q', 'n'), Rel='Rel', Ri='Ri', L='L')),
+     lambda p: cir_RsTLQ(w, L=p['L'], Rs=p['Rs'], Q=p['Q'], n=p['n'], Rel=p['Rel'], Ri=p['Ri'])),
+    ('R-TL', Series(R('Rs'), TL(RQ('R', 'Q', 'n'), Rel='Rel', Ri='Ri', L='L')),
+     lambda p: cir_RsTL(w, L=p['L'], Rs=p['Rs'], R=p['R'], fs='none', n=p['n'], Rel=p['Rel'], Ri=p['Ri'], Q=p['Q'])),
+]
+
+@pytest.mark.parametrize('name, tree, simulate', builtin, ids=[name for name, tree, simulate in builtin])
+def test_builtin_circuits(name, tree, simulate):
+    circuit = compile_tree(tree, backend='numpy')
+    np.testing.assert_allclose(circuit(values, w), simulate(values), rtol=1e-13, atol=0)
+
+def test_series_merge():
+    tree = Series(R('Rs'), R('R1'), L('Lind'), C('C'), Series(L('L'), C('C1')))
+    circuit = compile_tree(tree, backend='numpy')
+    jw = 1j*w
+    expected = values['Rs'] + values['R1'] + (values['Lind'] + values['L'])*jw + (1/values['C'] + 1/values['C1'])/jw
+    np.testing.assert_allclose(circuit(values, w), expected, rtol=1e-13, atol=0)
+    #one term each for the merged resistors, inductors, and capacitors, sharing one jw
+    lines = circuit.source.splitlines()
+    assert circuit.source.count('jw(w)') == 1
+    assert len([line for line in lines if line.startswith('    _t')]) == 5
+
+def test_parallel_merge():
+    tree = Parallel(R('R'), R('R1'), C('C'), C('C1'), L('Lind'))
+    circuit = compile_tree(tree, backend='numpy')
+    jw = 1j*w
+    expected = 1/(1/values['R'] + 1/values['R1'] + (values['C'] + values['C1'])*jw + 1/(values['Lind']*jw))
+    np.testing.assert_allclose(circuit(values, w), expected, rtol=1e-13, atol=0)
+
+def test_cpe_merge():
+    merged = compile_tree(Parallel(Q('Q', 'n'), Q('Q2', 'n')), backend='numpy')
+    np.testing.assert_allclose(merged(values, w), 1/((values['Q'] + values['Q2'])*(1j*w)**values['n']), rtol=1e-13, atol=0)
+    assert merged.source.count('jw_pow') == 1
+    #constant phase elements with different exponents are not merged
+    separate = compile_tree(Parallel(Q('Q', 'n'), Q('Q2', 'n2')), backend='numpy')
+    expected = 1/(values['Q']*(1j*w)**values['n'] + values['Q2']*(1j*w)**values['n2'])
+    np.testing.assert_allclose(separate(values, w), expected, rtol=1e-13, atol=0)
+    assert separate.source.count('jw_pow') == 2
+
+def test_shared_subexpressions():
+    #repeated subcircuits and elements sharing n are evaluated once
+    circuit = compile_tree(Series(R('Rs'), RQ('R', 'Q', 'n'), RQ('R1', 'Q2', 'n')), backend='numpy')
+    assert circuit.source.count('jw_pow') == 1
+    expected = values['Rs'] + 1/(1/values['R'] + values['Q']*(1j*w)**values['n']) + 1/(1/values['R1'] + values['Q2']*(1j*w)**values['n'])
+    np.testing.assert_allclose(circuit(values, w), expected, rtol=1e-13, atol=0)
+
+def test_flatten_and_structure():
+    #connections are compared by their structure, in any order of the children
+    assert Series(R('Rs'), RQ('R', 'Q', 'n')) == Series(Parallel(Q('Q', 'n'), R('R')), R('Rs'))
+    assert Series(R('Rs'), RQ('R', 'Q', 'n')) != Series(R('Rs'), RQ('R', 'Q2', 'n'))
+    nested = Series(Series(R('Rs'), RQ('R', 'Q', 'n')), Series(C('C')))
+    flat = Series(C('C'), R('Rs'), Parallel(Q('Q', 'n'), R('R')))
+    assert compile_tree(nested, backend='numpy').source.count('_t') == compile_tree(flat, backend='numpy').source.count('_t')
+    np.testing.assert_allclose(compile_tree(nested, backend='numpy')(values, w), compile_tree(flat, backend='numpy')(values, w), rtol=1e-14, atol=0)
+
+jac_trees = [tree for name, tree, simulate in builtin] + [
+    Series(R('Rs'), R('R1'), L('Lind'), C('C')),
+    Parallel(Q('Q', 'n'), Q('Q2', 'n'), R('R')),
+    Series(R('Rs'), TL(Parallel(R('R'), Series(Q('Q', 'n'), W('sigma'))), Rel='Rel', Ri='Ri', L='L')),
+]
+
+@pytest.mark.parametrize('tree', jac_trees, ids=[repr(tree) for tree in jac_trees])
+def test_jacobian(tree):
+    circuit = compile_tree(tree, backend='numpy')
+    params = dict((name, values[name]) for name in circuit.param_names)
+    Z, dZ = circuit.jac(params, w)
+    np.testing.assert_allclose(Z, circuit(params, w), rtol=1e-12, atol=0)
+    for name in params:
+        def central(h):
+            plus = dict(params)
+            minus = dict(params)
+            plus[name] += h
+            minus[name] -= h
+            return (circuit(plus, w) - circuit(minus, w))/(2*h)
+        h = abs(params[name])*1e-3
+        expected = (4*central(h/2) - central(h))/3
+        error = np.abs(np.broadcast_to(dZ[name], Z.shape) - expected)*abs(params[name])
+        assert np.all(error <= 1e-7*np.abs(Z) + 1e-6*np.max(np.abs(expected))*abs(params[name])), 'dZ/d'+name
@@ -0,0 +1,32 @@
+"""
+compile_circuit() of PyEIS.py, the cached evaluators of the circuit strings
+"""
+import numpy as np
+import pytest
+
+from PyEIS.PyEIS import compile_circuit
+
+w = 2*np.pi*np.logspace(-2, 5, 40)
+
+@pytest.mark.parametrize('params', [
+    {'Rs': 10.0, 'R': 100.0, 'Q': 1e-4, 'n': 0.8},
+    {'Rs': 10.0, 'R': 100.0, 'fs': 30.0, 'n': 0.8},
+    {'Rs': 10.0, 'Q': 1e-4, 'fs': 30.0, 'n': 0.8},
+], ids=['R-Q-n', 'R-fs-n', 'Q-fs-n'])
+def test_plan_without_param_names(params):
+    #the plan is resolved from the parameter names of the call, so the evaluator and the analytic Jacobian match those of
+    #compile_circuit() with param_names
+    circuit = compile_circuit('R-RQ')
+    circuit_names = compile_circuit('R-RQ', tuple(params))
+    assert circuit is compile_circuit('R-RQ')
+    assert circuit.jac is not None
+    np.testing.assert_array_equal(circuit(params, w), circuit_names(params, w))
+    Z, dZ = circuit.jac(params, w)
+    Z_names, dZ_names = circuit_names.jac(params, w)
+    np.testing.assert_array_equal(Z, Z_names)
+    for name in params:
+        np.testing.assert_array_equal(dZ.get(name, 0), dZ_names.get(name, 0))
+
+def test_unknown_circuit():
+    with pytest.raises(ValueError):
+        compile_circuit('R-XY')
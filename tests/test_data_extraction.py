@@ -0,0 +1,147 @@
+"""
+The extract functions of PyEIS_Data_extraction.py read local files and URLs, e.g. the raw GitHub path of the tutorials, alike, and
+extract_mpr() reads the same coloumns as extract_mpt()
+
+tests/data/ex1.mpr is Tutorials/data/ex1.mpt written in EC-Lab's binary format by write_mpr()
+"""
+import functools
+import os
+import pathlib
+import shutil
+import struct
+import threading
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from PyEIS.PyEIS_Data_extraction import extract_mpt, extract_dta, extract_mpr, mpr_dtype
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+tutorial_path = os.path.join(root, 'Tutorials', 'data')+os.sep
+fixture_path = os.path.join(root, 'tests', 'data')+os.sep
+
+mpr_columns = [ #coloumn ID, struct format, name of extract_mpt() of the '.mpr' layout of a PEIS file
+    (1, 'B', 'flags'), (2, '', 'flags'), (3, '', 'flags'), #mode, ox/red, and error share one byte
+    (32, 'f', 'f'), (37, 'f', 're'), (38, 'f', 'im'), (36, 'f', 'Z_mag'), (35, 'f', 'Z_phase'), (4, 'd', 'times'), (77, 'f', 'E_avg'),
+    (76, 'f', 'I_avg'), (169, 'f', 'Cs/\u00b5F'), (172, 'f', 'Cp/\u00b5F'), (24, 'd', 'cycle_number'), (39, 'H', 'I Range'), (33, 'f', '|Ewe|/V'),
+    (34, 'f', '|I|/A')]
+
+def mpr_module(shortname, longname, data, version, header_v2):
+    if header_v2: #EC-Lab >= 11.50
+        header = struct.pack('<10s25sIIII8s', shortname, longname, 0xffffffff, len(data), version, 0, b'01/02/19')
+    else:
+        header = struct.pack('<10s25sII8s', shortname, longname, len(data), version, b'01/02/19')
+    return b'MODULE'+header+data
+
+def write_mpr(file_path, data, version=3, header_v2=True):
+    #writes the coloumns of mpr_columns of data, e.g. of extract_mpt(columns='all'), as an EC-Lab '.mpr' file
+    column_ids = [column_id for column_id, fmt, name in mpr_columns]
+    if version == 0:
+        head = struct.pack('<IB'+str(len(column_ids))+'B', len(data), len(column_ids), *column_ids).ljust(100, b'\x00')
+    else:
+        head = struct.pack('<IB'+str(len(column_ids))+'H', len(data), len(column_ids), *column_ids).ljust(405 if version == 2 else 406, b'\x00')
+    row_format = '<'+''.join(fmt for column_id, fmt, name in mpr_columns)
+    rows = b''.join(struct.pack(row_format, 3, *[row[name] for column_id, fmt, name in mpr_columns[3:]]) for row in data.to_dict('records'))
+    with open(file_path, 'wb') as file:
+        file.write(b'BIO-LOGIC MODULAR FILE\x1a'.ljust(48)+b'\x00'*4)
+        file.write(mpr_module(b'VMP Set', b'VMP settings', b'\x00'*64, 0, header_v2))
+        file.write(mpr_module(b'VMP data', b'VMP data', head+rows, version, header_v2))
+        file.write(mpr_module(b'VMP LOG', b'VMP log', b'\x00'*16, 0, header_v2))
+
+def dta_text(n_tables=2, n_points=5):
+    #Gamry '.DTA' file with n_tables 'ZCURVE' tables of an -RC- element
+    lines = ['EXPLAIN', 'TAG\tEISPOT', 'TITLE\tLABEL\tPotentiostatic EIS\tTest &Identifier']
+    for k in range(n_tables):
+        lines += ['ZCURVE\tTABLE', '\tPt\tTime\tFreq\tZreal\tZimag\tZmod\tVdc', '\t#\ts\tHz\tohm\tohm\tohm\tV']
+        for j, f in enumerate(np.logspace(5, 0, n_points)):
+            Z = 10 + (100+k)/(1 + 2j*np.pi*f*1e-4)
+            lines.append('\t'+'\t'.join([str(j), str(j+1), repr(f), repr(Z.real), repr(Z.imag), repr(abs(Z)), '0.1']))
+        lines.append('EXPERIMENTABORTED\tTOGGLE\tT\tExperiment Aborted')
+    return '\n'.join(lines)+'\n'
+
+@pytest.fixture(scope='module')
+def data_path(tmp_path_factory):
+    directory = tmp_path_factory.mktemp('data')
+    shutil.copy(tutorial_path+'ex1.mpt', directory)
+    shutil.copy(fixture_path+'ex1.mpr', directory)
+    (directory/'ex.DTA').write_text(dta_text(), encoding='latin1')
+    return str(directory)+os.sep
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+@pytest.fixture(scope='module')
+def http_path(data_path):
+    #serves data_path over http, i.e. a path that is not a local file
+    server = ThreadingHTTPServer(('127.0.0.1', 0), functools.partial(QuietHandler, directory=data_path))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield 'http://127.0.0.1:'+str(server.server_address[1])+'/'
+    server.shutdown()
+    server.server_close()
+
+@pytest.fixture(params=['file', 'http'])
+def url_path(request, data_path, http_path):
+    if request.param == 'file':
+        return pathlib.Path(data_path).as_uri()+'/'
+    return http_path
+
+@pytest.mark.parametrize('columns', ['analysis', 'all'])
+def test_extract_mpt_url(data_path, url_path, columns):
+    local = extract_mpt(path=data_path, EIS_name='ex1.mpt', columns=columns)
+    pd.testing.assert_frame_equal(extract_mpt(path=url_path, EIS_name='ex1.mpt', columns=columns), local)
+
+@pytest.mark.parametrize('columns', ['analysis', 'all'])
+def test_extract_mpr_url(data_path, url_path, columns):
+    local = extract_mpr(path=data_path, EIS_name='ex1.mpr', columns=columns)
+    pd.testing.assert_frame_equal(extract_mpr(path=url_path, EIS_name='ex1.mpr', columns=columns), local)
+
+@pytest.mark.parametrize('columns', ['analysis', 'all'])
+def test_extract_dta_url(data_path, url_path, columns):
+    local = extract_dta(path=data_path, EIS_name='ex.DTA', columns=columns)
+    pd.testing.assert_frame_equal(extract_dta(path=url_path, EIS_name='ex.DTA', columns=columns), local)
+    np.testing.assert_array_equal(local.cycle_number, np.repeat([1.0, 2.0], 5))
+    assert np.all(local.im > 0)
+
+def test_extract_missing_file(http_path):
+    with pytest.raises(FileNotFoundError):
+        extract_mpt(path=tutorial_path, EIS_name='missing.mpt')
+    with pytest.raises(OSError):
+        extract_mpt(path=http_path, EIS_name='missing.mpt')
+    with pytest.raises(OSError):
+        extract_dta(path=http_path, EIS_name='missing.DTA')
+
+### .mpr files
+##
+#
+def test_extract_mpr_equals_mpt():
+    mpt = extract_mpt(path=tutorial_path, EIS_name='ex1.mpt', columns='all')
+    mpr = extract_mpr(path=fixture_path, EIS_name='ex1.mpr', columns='all')
+    assert list(mpr.columns) == [name for column_id, fmt, name in mpr_columns[2:]]
+    np.testing.assert_array_equal(mpr['flags'], 3)
+    for name in mpr.columns[1:]: #the float coloumns of the '.mpr' file are float32
+        np.testing.assert_allclose(mpr[name], mpt[name], rtol=1e-6, err_msg=name)
+
+def test_extract_mpr_analysis():
+    mpt = extract_mpt(path=tutorial_path, EIS_name='ex1.mpt')
+    mpr = extract_mpr(path=fixture_path, EIS_name='ex1.mpr')
+    assert list(mpr.columns) == list(mpt.columns) and all(mpr.dtypes == np.float64)
+    pd.testing.assert_frame_equal(mpr, mpt, rtol=1e-6)
+    mpr = extract_mpr(path=fixture_path, EIS_name='ex1.mpr', columns='all', aux_dtype=np.float32)
+    assert mpr['|Ewe|/V'].dtype == np.float32 and mpr['f'].dtype == np.float64
+
+@pytest.mark.parametrize('version', [0, 2, 3])
+@pytest.mark.parametrize('header_v2', [False, True], ids=['header', 'header_v2'])
+def test_extract_mpr_versions(tmp_path, version, header_v2):
+    data = extract_mpr(path=fixture_path, EIS_name='ex1.mpr', columns='all')
+    write_mpr(str(tmp_path/'ex1.mpr'), data, version, header_v2)
+    pd.testing.assert_frame_equal(extract_mpr(path=str(tmp_path)+os.sep, EIS_name='ex1.mpr', columns='all'), data)
+
+def test_mpr_dtype():
+    assert mpr_dtype([1, 2, 3, 32, 27, 75, 7, 23]).names == ('flags', 'freq/Hz', 'Ewe-Ece/V', 'Analog OUT/V', 'dQ/mA.h', 'dQ/mA.h.1')
+    assert mpr_dtype([1, 2, 3, 32, 27, 75, 7, 23]).itemsize == 1+4*3+8*2
+    with pytest.raises(ValueError, match=r'\[999, 1000\]'):
+        mpr_dtype([32, 999, 37, 1000])
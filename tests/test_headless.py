@@ -0,0 +1,38 @@
+"""
+The compute-only modules of PyEIS can be imported and used without matplotlib, see PyEIS/__init__.py
+"""
+import os
+import subprocess
+import sys
+
+import pytest
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def run(code):
+    env = dict(os.environ, PYTHONPATH=root+os.pathsep+os.environ.get('PYTHONPATH', ''))
+    result = subprocess.run([sys.executable, '-c', code], env=env, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    return result.stdout.strip()
+
+headless = '''
+import sys
+import numpy as np
+from PyEIS.PyEIS_Lin_KK import KK_test, KK_linear_fit
+from PyEIS.PyEIS_Z_HIT import Z_HIT_test
+from PyEIS.PyEIS_Data_extraction import extract_mpt
+w = 2*np.pi*np.logspace(-2, 5, 50)
+Z = 10 + 100/(1 + 1j*w*1e-3)
+results = KK_test([w, w], [Z.real, Z.real], [-Z.imag, -Z.imag], num_RC=5, n_jobs=2)
+assert len(results) == 2 and np.all(results.max_residual < 1e-3)
+Z_HIT_test([w], [Z.real], [-Z.imag])
+print('matplotlib' in sys.modules, 'lmfit' in sys.modules, 'PyEIS.PyEIS' in sys.modules)
+'''
+
+def test_lin_kk_without_matplotlib():
+    assert run(headless) == 'False False False'
+
+def test_star_import_loads_pyeis():
+    pytest.importorskip('matplotlib')
+    out = run('import matplotlib\nmatplotlib.use("Agg")\nfrom PyEIS import *\nprint(EIS_exp.__name__, callable(figure), callable(KK_test))')
+    assert out.splitlines()[-1] == 'EIS_exp True True'
@@ -0,0 +1,54 @@
+"""
+Accuracy of the overflow-safe hyperbolic functions of PyEIS_Hyperbolic.py against mpmath
+"""
+import numpy as np
+import pytest
+
+mpmath = pytest.importorskip('mpmath')
+
+from PyEIS.PyEIS_Hyperbolic import asymptotic_limit, coth, csch, sinh, tanh
+
+mpmath.mp.dps = 50
+
+small = [1e-10, 1e-6, 1e-3, 0.1, 1.0] #expm1() branch near 0
+switch = [asymptotic_limit - 0.1, asymptotic_limit, asymptotic_limit + 0.1] #switch-over to the asymptotic branch
+large = [30.0, 100.0, 700.0] #np.sinh, np.tanh, and np.cosh are close to or beyond overflow
+imag = [0.0, 1e-8, 0.3, 2.5, -1.7]
+
+def points(real):
+    return np.array([complex(sign*re, im) for re in real for im in imag for sign in (1, -1)])
+
+def reference(function, x):
+    return np.array([complex(function(mpmath.mpc(x_i.real, x_i.imag))) for x_i in x])
+
+functions = [(coth, mpmath.coth), (tanh, mpmath.tanh), (csch, mpmath.csch), (sinh, mpmath.sinh)]
+
+@pytest.mark.parametrize('function, mp_function', functions, ids=[function.__name__ for function, mp_function in functions])
+@pytest.mark.parametrize('real, rtol', [(small, 1e-14), (switch, 1e-14), (large, 2e-13)], ids=['small', 'switch', 'large'])
+def test_accuracy(function, mp_function, real, rtol):
+    x = points(real)
+    expected = reference(mp_function, x)
+    out = function(x)
+    assert out.shape == x.shape
+    np.testing.assert_allclose(out, expected, rtol=rtol, atol=0)
+
+def test_real_input():
+    x = np.array([-25.0, -1e-5, 0.5, 19.0, 40.0])
+    for function, mp_function in functions:
+        np.testing.assert_allclose(function(x), reference(mp_function, x.astype(complex)), rtol=1e-14, atol=0)
+
+def test_bounded_beyond_overflow():
+    x = np.array([800+0j, 1e4+1j, -1e4-2j])
+    with np.errstate(all='ignore'):
+        assert np.all(np.isfinite(coth(x))) and np.all(np.isfinite(tanh(x))) and np.all(np.isfinite(csch(x)))
+    np.testing.assert_array_equal(coth(x), [1, 1, -1])
+    np.testing.assert_array_equal(tanh(x), [1, 1, -1])
+    np.testing.assert_array_equal(csch(x), [0, 0, 0])
+
+def test_sinh_overflow():
+    x = np.array([710+1j, -710-1j])
+    np.testing.assert_allclose(sinh(x), reference(mpmath.sinh, x), rtol=2e-13, atol=0)
+    out = sinh(np.array([800+0j, -800+0j]))
+    assert not np.any(np.isnan(out))
+    np.testing.assert_array_equal(out.real, [np.inf, -np.inf])
+    np.testing.assert_array_equal(out.imag, [0, 0])
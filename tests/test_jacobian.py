@@ -0,0 +1,83 @@
+"""
+Analytic Jacobians of PyEIS_Jacobian.py against finite differences of the circuit functions
+"""
+import numpy as np
+import pytest
+
+from PyEIS.PyEIS import compile_circuit
+from PyEIS.PyEIS_Jacobian import circuit_jac_functions
+
+w = 2*np.pi*np.logspace(-2, 5, 50)
+
+values = dict(Rs=10.0, R=100.0, Q=1e-4, n=0.8, R1=80.0, C1=1e-6, Q1=2e-5, n1=0.9, R2=50.0, Q2=1e-3, n2=0.7, C=1e-5,
+              sigma=30.0, Ce=1e-6, Cb=1e-8, Rb=1000.0, Re=200.0, Qe=1e-5, ne=0.85, Qb=1e-7, nb=0.9, L=1e-3, D_s=1e-9,
+              u1=1.0, u2=2.0, Ri=500.0, Rel=20.0, D=1e-10, radius=1e-6, R_w=40.0, n_w=0.5,
+              fs=50.0, fs1=500.0, fs2=5.0, fsb=1e4, fse=50.0)
+
+#parameters of each circuit, with the -RQ-/-RC- elements given by three of R, Q, n, and fs in several ways
+circuit_params = [
+    ('C', ['C']),
+    ('Q', ['Q', 'n']),
+    ('R-C', ['Rs', 'C']),
+    ('R-Q', ['Rs', 'Q', 'n']),
+    ('RC', ['R', 'C']),
+    ('RC', ['R', 'fs']),
+    ('RQ', ['R', 'Q', 'n']),
+    ('RQ', ['Q', 'n', 'fs']),
+    ('R-RQ', ['Rs', 'R', 'Q', 'n']),
+    ('R-RQ', ['Rs', 'R', 'n', 'fs']),
+    ('R-RQ', ['Rs', 'R', 'Q', 'fs']),
+    ('R-RQ-RQ', ['Rs', 'R', 'Q', 'n', 'R2', 'Q2', 'n2']),
+    ('R-RQ-RQ', ['Rs', 'R', 'n', 'fs', 'Q2', 'n2', 'fs2']),
+    ('R-RC-C', ['Rs', 'R1', 'C1', 'C']),
+    ('R-RC-Q', ['Rs', 'R1', 'C1', 'Q', 'n']),
+    ('R-RQ-Q', ['Rs', 'R1', 'Q1', 'n1', 'Q', 'n']),
+    ('R-RQ-Q', ['Rs', 'R1', 'n1', 'fs1', 'Q', 'n']),
+    ('R-RQ-C', ['Rs', 'R1', 'Q1', 'n1', 'C']),
+    ('R-(Q(RW))', ['Rs', 'R', 'Q', 'n', 'sigma']),
+    ('R-(Q(RW))', ['Rs', 'R', 'n', 'fs', 'sigma']),
+    ('C-RC-C', ['Ce', 'Rb', 'Cb']),
+    ('C-RC-C', ['Ce', 'Rb', 'fsb']),
+    ('Q-RQ-Q', ['Qe', 'ne', 'Rb', 'Qb', 'nb']),
+    ('RC-RC-ZD', ['Re', 'Ce', 'Rb', 'fsb', 'L', 'D_s', 'u1', 'u2']),
+    ('R-TLsQ', ['Rs', 'L', 'Ri', 'Q', 'n']),
+    ('R-RQ-TLsQ', ['Rs', 'L', 'Ri', 'Q', 'n', 'R1', 'Q1', 'n1']),
+    ('R-TLs', ['Rs', 'L', 'Ri', 'R', 'Q', 'n']),
+    ('R-TLs', ['Rs', 'L', 'Ri', 'R', 'n', 'fs']),
+    ('R-RQ-TLs', ['Rs', 'L', 'Ri', 'R1', 'Q1', 'n1', 'R2', 'Q2', 'n2']),
+    ('R-TLQ', ['Rs', 'L', 'Ri', 'Rel', 'Q', 'n']),
+    ('R-RQ-TLQ', ['Rs', 'L', 'Ri', 'Rel', 'Q', 'n', 'R1', 'Q1', 'n1']),
+    ('R-TL', ['Rs', 'L', 'Ri', 'Rel', 'R', 'Q', 'n']),
+    ('R-TL', ['Rs', 'L', 'Ri', 'Rel', 'R', 'n', 'fs']),
+    ('R-RQ-TL', ['Rs', 'L', 'Ri', 'Rel', 'R1', 'Q1', 'n1', 'R2', 'Q2', 'n2']),
+    ('R-TL1Dsolid', ['Rs', 'L', 'Ri', 'radius', 'D', 'R', 'Q', 'n', 'R_w', 'n_w', 'Rel']),
+    ('R-RQ-TL1Dsolid', ['Rs', 'L', 'Ri', 'radius', 'D', 'R1', 'Q1', 'n1', 'R2', 'Q2', 'n2', 'R_w', 'n_w', 'Rel']),
+]
+
+def finite_difference(circuit, params, name):
+    #central differences extrapolated from the steps h and h/2 (Richardson), with an error of O(h^4)
+    def central(h):
+        plus = dict(params)
+        minus = dict(params)
+        plus[name] += h
+        minus[name] -= h
+        return (circuit(plus, w) - circuit(minus, w))/(2*h)
+    h = abs(params[name])*1e-3
+    return (4*central(h/2) - central(h))/3
+
+def test_all_circuits_covered():
+    assert set(circuit for circuit, names in circuit_params) == set(circuit_jac_functions)
+
+@pytest.mark.parametrize('circuit_name, names', circuit_params, ids=[circuit+':'+','.join(names) for circuit, names in circuit_params])
+def test_jacobian(circuit_name, names):
+    params = dict((name, values[name]) for name in names)
+    circuit = compile_circuit(circuit_name, tuple(names))
+    Z, dZ = circuit.jac(params, w)
+    np.testing.assert_allclose(Z, circuit(params, w), rtol=1e-12, atol=0)
+    for name in names:
+        expected = finite_difference(circuit, params, name)
+        derivative = np.broadcast_to(dZ.get(name, 0), np.shape(Z))
+        assert np.max(np.abs(expected)) > 0, name+' does not change Z'
+        #the sensitivity, p*dZ/dp, is compared relative to |Z|, as the rounding error of the differences scales with |Z|
+        error = np.abs(derivative - expected)*abs(params[name])
+        assert np.all(error <= 1e-7*np.abs(Z) + 1e-6*np.max(np.abs(expected))*abs(params[name])), 'dZ/d'+name+', largest error '+str(np.max(error/np.abs(Z)))
@@ -0,0 +1,223 @@
+"""
+The linear Lin-KK test of PyEIS_Lin_KK.py against direct least-squares and the serial KK_test()
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from PyEIS.PyEIS_Lin_KK import KK_test, KK_linear_solve, KK_linear_solve_batch, KK_basis, KK_design_matrix, KK_timeconst, KK_weights, KK_stream, KK_admittance, KK_auto_mask
+
+def RQ_RQ(w, Rs=10, R1=100, Q1=1e-5, n1=0.9, R2=200, Q2=1e-3, n2=0.8):
+    return Rs + R1/(1 + R1*Q1*(1j*w)**n1) + R2/(1 + R2*Q2*(1j*w)**n2)
+
+w = 2*np.pi*np.logspace(-2, 5, 71)
+rng = np.random.default_rng(0)
+spectra = [RQ_RQ(w, R1=R1)*(1 + 1e-3*rng.standard_normal(w.size)) for R1 in np.linspace(50, 150, 7)]
+
+def lstsq(w, re, im, t_values, weight_func):
+    #weighted least-squares of the Lin-KK circuit, one column per element, by np.linalg.lstsq
+    columns = [np.ones(w.size, dtype=complex)] + [1/(1 + 1j*w*t) for t in t_values]
+    weight_re, weight_im = KK_weights(re, im, weight_func)
+    A = np.array([np.concatenate([c.real*weight_re**0.5, -c.imag*weight_im**0.5]) for c in columns]).T
+    b = np.concatenate([re*weight_re**0.5, im*weight_im**0.5])
+    x = np.linalg.lstsq(A, b, rcond=None)[0]
+    return x, np.sum((A @ x - b)**2)
+
+### KK_linear_solve
+##
+#
+@pytest.mark.parametrize('weight_func', ['Boukamp', 'modulus', 'proportional', 'unity'])
+def test_KK_linear_solve_exact_circuit(weight_func):
+    t_values = np.array(KK_timeconst(w=w, num_RC=12))
+    R_values = np.linspace(-5, 60, t_values.size)
+    Z = 10 + np.sum(R_values/(1 + 1j*np.multiply.outer(w, t_values)), axis=1)
+    fit = KK_linear_solve(w, Z.real, -Z.imag, t_values, weight_func)
+    np.testing.assert_allclose(fit.Rs, 10, rtol=1e-8)
+    np.testing.assert_allclose(fit.R_values, R_values, rtol=1e-6, atol=1e-6)
+    assert fit.chisqr < 1e-12
+
+@pytest.mark.parametrize('weight_func', ['Boukamp', 'modulus', 'proportional', 'unity'])
+@pytest.mark.parametrize('num_RC', [3, 21])
+def test_KK_linear_solve_equals_lstsq(weight_func, num_RC):
+    t_values = np.array(KK_timeconst(w=w, num_RC=num_RC))
+    fit = KK_linear_solve(w, spectra[0].real, -spectra[0].imag, t_values, weight_func)
+    x, chisqr = lstsq(w, spectra[0].real, -spectra[0].imag, t_values, weight_func)
+    np.testing.assert_allclose(np.concatenate([[fit.Rs], fit.R_values]), x, rtol=1e-6, atol=1e-6*np.max(np.abs(x)))
+    np.testing.assert_allclose(fit.chisqr, chisqr, rtol=1e-6)
+
+### KK_linear_solve_batch
+##
+#
+def normal_equations(w, re, im, num_RC, weight_func):
+    #True for the spectra that KK_linear_solve_batch() solves by the normal equations, False for the stacked SVD
+    A_cond = KK_basis(w, num_RC, weight_func)[3]
+    weight_re, weight_im = KK_weights(re, im, weight_func)
+    scale = np.concatenate([weight_re, weight_im], axis=1)**0.5
+    return A_cond*np.max(scale, axis=1)/np.min(scale, axis=1) < 1e6
+
+def assert_batch_equals_lstsq(re, im, num_RC, weight_func):
+    fits = KK_linear_solve_batch(w, re, im, num_RC, weight_func)
+    t_values = KK_basis(w, num_RC, weight_func)[0]
+    for fit, re_i, im_i in zip(fits, re, im):
+        x, chisqr = lstsq(w, re_i, im_i, t_values, weight_func)
+        Z_fit = KK_design_matrix(w, t_values) @ np.concatenate([[fit.Rs], fit.R_values])
+        Z_lstsq = KK_design_matrix(w, t_values) @ x
+        np.testing.assert_allclose(fit.chisqr, chisqr, rtol=1e-6)
+        np.testing.assert_allclose(Z_fit, Z_lstsq, rtol=1e-8, atol=1e-8*np.max(np.abs(Z_lstsq)))
+
+@pytest.mark.parametrize('weight_func', ['Boukamp', 'modulus'])
+@pytest.mark.parametrize('num_RC, normal', [(5, True), (20, True), (40, False), (70, False)], ids=['well-5', 'well-20', 'ill-40', 'ill-70'])
+def test_KK_linear_solve_batch_equals_lstsq(weight_func, num_RC, normal):
+    re = np.array([Z.real for Z in spectra])
+    im = np.array([-Z.imag for Z in spectra])
+    assert np.all(normal_equations(w, re, im, num_RC, weight_func) == normal)
+    assert_batch_equals_lstsq(re, im, num_RC, weight_func)
+
+def test_KK_linear_solve_batch_mixed_paths():
+    re = np.array([Z.real for Z in spectra])
+    im = np.array([-Z.imag for Z in spectra])
+    im[::2, 0] *= 1e-4 #large Boukamp weight of one point, i.e. an ill-conditioned weighted design matrix
+    normal = normal_equations(w, re, im, 20, 'Boukamp')
+    assert np.any(normal) and not np.all(normal)
+    assert_batch_equals_lstsq(re, im, 20, 'Boukamp')
+
+@pytest.mark.parametrize('num_RC', [5, 70])
+def test_KK_linear_solve_batch_unity(num_RC):
+    re = np.array([Z.real for Z in spectra])
+    im = np.array([-Z.imag for Z in spectra])
+    assert KK_basis(w, num_RC, 'unity')[2] is not None
+    assert_batch_equals_lstsq(re, im, num_RC, 'unity')
+
+def test_KK_basis_shared_by_grids():
+    t_values, A_real, A_pinv, A_cond = KK_basis(w, 9, 'Boukamp')
+    assert KK_basis(w.copy(), 9, 'modulus')[1] is A_real #data dependent weights share the basis
+    assert KK_basis(w, 9, 'unity')[1] is not A_real
+    assert A_pinv is None and not A_real.flags.writeable and not t_values.flags.writeable
+    np.testing.assert_array_equal(t_values, KK_timeconst(w=w, num_RC=9))
+
+### KK_stream
+##
+#
+def stream(Z, weight_func='Boukamp', **kwargs):
+    f = w/(2*np.pi)
+    kk = KK_stream(f_start=f[-1], f_stop=f[0], num_RC=3, weight_func=weight_func, **kwargs)
+    valid = [kk.add(f[i], Z.real[i], -Z.imag[i]) for i in range(w.size)[::-1]] #high to low frequency
+    return kk, valid
+
+@pytest.mark.parametrize('weight_func', ['Boukamp', 'modulus', 'proportional', 'unity'])
+def test_KK_stream_converges_to_batch(weight_func):
+    kk, valid = stream(spectra[0], weight_func)
+    fit = KK_linear_solve(w, spectra[0].real, -spectra[0].imag, kk.t_values, weight_func)
+    x = np.concatenate([[fit.Rs], fit.R_values])
+    np.testing.assert_allclose(np.concatenate([[kk.Rs], kk.R_values]), x, rtol=0, atol=1e-4*np.max(np.abs(x)))
+    np.testing.assert_allclose(kk.chisqr, fit.chisqr, rtol=1e-2)
+    assert all(valid) and len(kk) == w.size
+
+def test_KK_stream_prior():
+    #the RLS prior is a ridge penalty, a weaker penalty is closer to the batch fit
+    errors = []
+    for prior in [1e2, 1e4, 1e6]:
+        kk, valid = stream(spectra[0], prior=prior)
+        fit = KK_linear_solve(w, spectra[0].real, -spectra[0].imag, kk.t_values)
+        errors.append(np.max(np.abs(kk.R_values - fit.R_values)))
+    assert errors[0] > errors[1] > errors[2]
+
+def test_KK_stream_flags_drift():
+    Z = spectra[0].copy()
+    Z[:8] *= np.linspace(1.3, 1.05, 8) #drift at the low frequency end, i.e. the last points of the sweep
+    kk, valid = stream(Z)
+    assert all(valid[:-8]) and not valid[-1] and not kk.valid
+    assert np.min(kk.f) in kk.f[kk.violations]
+
+### Impedance and admittance
+##
+#
+def test_KK_test_admittance_fit():
+    Z = spectra[0]
+    results = KK_test([w], [Z.real], [-Z.imag], num_RC=5, representation='Y')
+    Y_re, Y_im = KK_admittance(Z.real, -Z.imag)
+    np.testing.assert_allclose(1/(Y_re - 1j*Y_im), Z, rtol=1e-12)
+    fit = KK_linear_solve(w, Y_re, Y_im, results.t_values[0])
+    np.testing.assert_allclose(results.R_values[0], fit.R_values, rtol=1e-6, atol=1e-6*np.max(np.abs(fit.R_values)))
+    Y_fit = KK_design_matrix(w, fit.t_values) @ np.concatenate([[fit.Rs], fit.R_values])
+    np.testing.assert_allclose(results.Z_fit[0], 1/Y_fit, rtol=1e-6)
+    assert results.representation == ['Y'] and results.max_residual[0] < 5e-3
+
+@pytest.mark.parametrize('num_RC', ['auto', 5])
+def test_KK_test_both(num_RC):
+    Z = spectra[:3] + [RQ_RQ(w) + 1/(1j*w*1e-2)] #a capacitive tail, i.e. a blocking electrode, is KK compliant in Y
+    re = [Z_i.real for Z_i in Z]
+    im = [-Z_i.imag for Z_i in Z]
+    results = KK_test([w]*len(Z), re, im, num_RC=num_RC, representation='both')
+    results_Z = KK_test([w]*len(Z), re, im, num_RC=num_RC, representation='Z')
+    results_Y = KK_test([w]*len(Z), re, im, num_RC=num_RC, representation='Y')
+    np.testing.assert_allclose(results.results_Z.max_residual, results_Z.max_residual, rtol=1e-10)
+    np.testing.assert_allclose(results.results_Y.max_residual, results_Y.max_residual, rtol=1e-10)
+    np.testing.assert_allclose(results.max_residual, np.minimum(results_Z.max_residual, results_Y.max_residual), rtol=1e-10)
+    assert results.representation[-1] == 'Y' and results_Z.max_residual[-1] > 0.1
+
+def test_KK_test_invalid_representation():
+    with pytest.raises(ValueError, match='representation'):
+        KK_test([w], [spectra[0].real], [-spectra[0].imag], representation='Q')
+
+### KK_auto_mask
+##
+#
+def corrupted(low=6, high=5):
+    Z = RQ_RQ(w)
+    Z[:low] *= 1 + 0.3j*np.linspace(1, 0.2, low) #drift at the low frequency end
+    Z[w.size-high:] -= 2e-6j*w[w.size-high:] #inductance of the leads at the high frequency end
+    return Z
+
+@pytest.mark.parametrize('low, high', [(6, 0), (0, 5), (6, 5)])
+def test_KK_auto_mask_trims_corrupted_ends(low, high):
+    Z = corrupted(low, high)
+    mask = KK_auto_mask([w], [Z.real], [-Z.imag])[0]
+    np.testing.assert_array_equal(np.flatnonzero(~mask), np.r_[0:low, w.size-high:w.size])
+    results = KK_test([w[mask]], [Z.real[mask]], [-Z.imag[mask]], num_RC=3)
+    assert results.max_residual[0] < 0.01
+
+def test_KK_auto_mask_spectra():
+    Z = [RQ_RQ(w), corrupted(), corrupted()[::-1], RQ_RQ(w[10:])]
+    w_list = [w, w, w[::-1], w[10:]]
+    masks = KK_auto_mask(w_list, [Z_i.real for Z_i in Z], [-Z_i.imag for Z_i in Z])
+    assert np.all(masks[0]) and np.all(masks[3]) and len(masks[3]) == w.size-10
+    np.testing.assert_array_equal(masks[2], masks[1][::-1]) #independent of the frequency order
+
+def test_KK_auto_mask_min_points():
+    Z = corrupted()
+    assert np.all(KK_auto_mask([w], [Z.real], [-Z.imag], min_points=w.size-1)[0])
+    assert np.sum(KK_auto_mask([w], [Z.real], [-Z.imag], min_points=w.size-4)[0]) >= w.size-4
+    assert np.sum(~KK_auto_mask([w], [Z.real], [-Z.imag], max_iter=2)[0]) == 4
+
+### n_jobs
+##
+#
+@pytest.mark.parametrize('num_RC', ['auto', 5])
+@pytest.mark.parametrize('representation', ['Z', 'Y', 'both'])
+def test_KK_test_n_jobs_equals_serial(num_RC, representation):
+    w_list = [w]*len(spectra) + [w[5:]]
+    re = [Z.real for Z in spectra] + [spectra[0].real[5:]]
+    im = [-Z.imag for Z in spectra] + [-spectra[0].imag[5:]]
+    serial = KK_test(w_list, re, im, num_RC=num_RC, representation=representation)
+    parallel = KK_test(w_list, re, im, num_RC=num_RC, representation=representation, n_jobs=2)
+    for fit_serial, fit_parallel in zip(serial.fits, parallel.fits):
+        np.testing.assert_allclose(fit_parallel.R_values, fit_serial.R_values, rtol=1e-10, atol=1e-10)
+    np.testing.assert_allclose(parallel.max_residual, serial.max_residual, rtol=1e-10)
+
+def test_KK_test_given_executor():
+    re = [Z.real for Z in spectra]
+    im = [-Z.imag for Z in spectra]
+    serial = KK_test([w]*len(spectra), re, im, num_RC=5)
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        parallel = KK_test([w]*len(spectra), re, im, num_RC=5, n_jobs=3, executor=pool)
+    np.testing.assert_allclose(parallel.max_residual, serial.max_residual, rtol=1e-10)
+
+@pytest.mark.parametrize('n_jobs', [0, -2, 1.5, 'two', True])
+def test_KK_test_invalid_n_jobs(n_jobs):
+    with pytest.raises(ValueError, match='n_jobs'):
+        KK_test([w], [spectra[0].real], [-spectra[0].imag], n_jobs=n_jobs)
+    with ThreadPoolExecutor(max_workers=2) as pool: #a given executor does not skip the check
+        with pytest.raises(ValueError, match='n_jobs'):
+            KK_test([w], [spectra[0].real], [-spectra[0].imag], n_jobs=n_jobs, executor=pool)
@@ -0,0 +1,46 @@
+"""
+The Z-HIT reconstruction of PyEIS_Z_HIT.py against the modulus of synthetic KK compliant spectra
+"""
+import numpy as np
+import pytest
+
+from PyEIS.PyEIS_Z_HIT import Z_HIT, Z_HIT_test
+
+def RQ_RQ(w, Rs=10, R1=100, Q1=1e-5, n1=0.9, R2=200, Q2=1e-3, n2=0.8):
+    return Rs + R1/(1 + R1*Q1*(1j*w)**n1) + R2/(1 + R2*Q2*(1j*w)**n2)
+
+w = 2*np.pi*np.logspace(-2, 5, 71)
+
+@pytest.mark.parametrize('params', [{}, dict(R1=50, R2=500), dict(n1=0.7, n2=0.95)], ids=['default', 'resistances', 'exponents'])
+def test_Z_HIT_modulus(params):
+    Z = RQ_RQ(w, **params)
+    modulus = Z_HIT(w, Z.real, -Z.imag)
+    np.testing.assert_allclose(modulus, np.abs(Z), rtol=0.02)
+
+def test_Z_HIT_frequency_order():
+    Z = RQ_RQ(w)
+    modulus = Z_HIT(w, Z.real, -Z.imag)
+    np.testing.assert_allclose(Z_HIT(w[::-1], Z.real[::-1], -Z.imag[::-1]), modulus[::-1], rtol=1e-12)
+    shuffle = np.random.default_rng(0).permutation(w.size)
+    np.testing.assert_allclose(Z_HIT(w[shuffle], Z.real[shuffle], -Z.imag[shuffle]), modulus[shuffle], rtol=1e-12)
+
+def test_Z_HIT_test_equals_single_spectra():
+    Z = [RQ_RQ(w, R1=R1) for R1 in [50, 100, 150]] + [RQ_RQ(w[10:])]
+    w_list = [w, w, w, w[10:]]
+    results = Z_HIT_test(w_list, [Z_i.real for Z_i in Z], [-Z_i.imag for Z_i in Z])
+    assert len(results) == 4
+    for i in range(4):
+        np.testing.assert_allclose(results.modulus[i], Z_HIT(w_list[i], Z[i].real, -Z[i].imag), rtol=1e-12)
+    assert np.all(results.max_residual < 0.02)
+
+def test_Z_HIT_test_flags_drift():
+    Z = RQ_RQ(w)
+    Z_drift = Z.copy()
+    Z_drift[:10] *= 1.1 #the modulus changes at the low frequency end, but the phase does not
+    results = Z_HIT_test([w, w], [Z.real, Z_drift.real], [-Z.imag, -Z_drift.imag], ref_range=[10, 1e4])
+    assert results.max_residual[0] < 0.02 and results.max_residual[1] > 0.05
+
+def test_Z_HIT_ref_range():
+    Z = RQ_RQ(w)
+    with pytest.raises(ValueError, match='ref_range'):
+        Z_HIT(w, Z.real, -Z.imag, ref_range=[1e6, 1e7])